@@ -8,7 +8,8 @@
 """Corpus reader for the XML version of the British National Corpus."""
 
 from nltk.corpus.reader.util import concat
-from nltk.corpus.reader.xmldocs import XMLCorpusReader, XMLCorpusView, ElementTree
+from nltk.corpus.reader.xmldocs import (XMLCorpusReader, StreamingXMLCorpusView,
+                                         ElementTree)
 
 
 class BNCCorpusReader(XMLCorpusReader):
@@ -152,7 +153,7 @@ class BNCSentence(list):
         list.__init__(self, items)
 
 
-class BNCWordView(XMLCorpusView):
+class BNCWordView(StreamingXMLCorpusView):
     """
     A stream backed corpus view specialized for use with the BNC corpus.
     """
@@ -188,7 +189,7 @@ class BNCWordView(XMLCorpusView):
         self.editor = None  #: Editor
         self.resps = None  #: Statement of responsibility
 
-        XMLCorpusView.__init__(self, fileid, tagspec)
+        StreamingXMLCorpusView.__init__(self, fileid, tagspec)
 
         # Read in a tasty header.
         self._open()
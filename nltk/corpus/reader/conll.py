@@ -13,13 +13,15 @@ Read CoNLL-style chunk fileids.
 from __future__ import unicode_literals
 
 import os
+import re
 import codecs
 import textwrap
 
 from nltk import compat
 from nltk.tree import Tree
-from nltk.util import LazyMap, LazyConcatenation
+from nltk.util import LazyMap, LazyConcatenation, LRUCache
 from nltk.tag import map_tag
+from nltk.data import SeekableUnicodeStreamReader
 
 from nltk.corpus.reader.util import *
 from nltk.corpus.reader.api import *
@@ -35,12 +37,14 @@ class ConllCorpusReader(CorpusReader):
     therefore takes an argument, ``columntypes``, which is used to
     specify the columns that are used by a given corpus.
 
+    Each grid is stored by column: it is a tuple containing one tuple of
+    values for each column.  A single corpus view of the grids of each
+    file is shared by all of the data access methods, and it keeps the
+    grids of recently read blocks, so that (for example) ``words()`` and
+    ``parsed_sents()`` can both use the same parse of a file.
+
     @todo: Add support for reading from corpora where different
         parallel files contain different columns.
-    @todo: Possibly add caching of the grid corpus view?  This would
-        allow the same grid view to be used by different data access
-        methods (eg words() and parsed_sents() could both share the
-        same grid corpus view object).
     @todo: Better support for -DOCSTART-.  Currently, we just ignore
         it, but it could be used to define methods that retrieve a
         document at a time (eg parsed_documents()).
@@ -68,7 +72,13 @@ class ConllCorpusReader(CorpusReader):
     def __init__(self, root, fileids, columntypes,
                  chunk_types=None, root_label='S', pos_in_tree=False,
                  srl_includes_roleset=True, encoding='utf8',
-                 tree_class=Tree, tagset=None):
+                 tree_class=Tree, tagset=None, grid_cache_size=64):
+        """
+        :param grid_cache_size: The number of blocks (of about
+            ``ConllGridView.BLOCK_SIZE`` characters each) whose grids
+            are kept by the corpus view of each file.  If None, the
+            grids of each file are kept once they have been read.
+        """
         for columntype in columntypes:
             if columntype not in self.COLUMN_TYPES:
                 raise ValueError('Bad column type %r' % columntype)
@@ -82,6 +92,8 @@ class ConllCorpusReader(CorpusReader):
         self._tree_class = tree_class
         CorpusReader.__init__(self, root, fileids, encoding)
         self._tagset = tagset
+        self._grid_cache_size = grid_cache_size
+        self._grid_views = {}   # fileid -> ConllGridView
 
     #/////////////////////////////////////////////////////////////////
     # Data Access Methods
@@ -179,34 +191,50 @@ class ConllCorpusReader(CorpusReader):
     #/////////////////////////////////////////////////////////////////
 
     def _grids(self, fileids=None):
-        # n.b.: we could cache the object returned here (keyed on
-        # fileids), which would let us reuse the same corpus view for
-        # different things (eg srl and parse trees).
-        return concat([StreamBackedCorpusView(fileid, self._read_grid_block,
-                                              encoding=enc)
-                       for (fileid, enc) in self.abspaths(fileids, True)])
+        # The corpus view of each file is shared by all of the data
+        # access methods (eg srl and parse trees).
+        return concat([self._grid_view(path, enc, fileid)
+                       for (path, enc, fileid)
+                       in self.abspaths(fileids, True, True)])
+
+    def _grid_view(self, path, encoding, fileid):
+        view = self._grid_views.get(fileid)
+        if view is None:
+            view = self._grid_views.setdefault(fileid, ConllGridView(
+                path, self._read_grid_block, encoding,
+                self._grid_cache_size))
+        return view
 
     def _read_grid_block(self, stream):
         grids = []
-        for block in read_blankline_block(stream):
-            block = block.strip()
-            if not block: continue
-
-            grid = [line.split() for line in block.split('\n')]
-
-            # If there's a docstart row, then discard. ([xx] eventually it
-            # would be good to actually use it)
-            if grid[0][self._colmap.get('words', 0)] == '-DOCSTART-':
-                del grid[0]
-
-            # Check that the grid is consistent.
-            for row in grid:
-                if len(row) != len(grid[0]):
-                    raise ValueError('Inconsistent number of columns:\n%s'
-                                     % block)
-            grids.append(grid)
+        for block in read_conll_grid_block(stream):
+            grid = self._parse_grid(block)
+            if grid is not None:
+                grids.append(grid)
         return grids
 
+    def _parse_grid(self, block):
+        """
+        Return the grid of one sentence, as a tuple of columns, or None
+        if ``block`` is empty.
+        """
+        block = block.strip()
+        if not block: return None
+
+        rows = [line.split() for line in block.split('\n')]
+
+        # If there's a docstart row, then discard. ([xx] eventually it
+        # would be good to actually use it)
+        if rows[0][self._colmap.get('words', 0)] == '-DOCSTART-':
+            del rows[0]
+            if not rows: return ()
+
+        # Check that the grid is consistent.
+        if len(set(map(len, rows))) != 1:
+            raise ValueError('Inconsistent number of columns:\n%s'
+                             % block)
+        return tuple(zip(*rows))
+
     #/////////////////////////////////////////////////////////////////
     # Transforms
     #/////////////////////////////////////////////////////////////////
@@ -367,7 +395,82 @@ class ConllCorpusReader(CorpusReader):
 
     @staticmethod
     def _get_column(grid, column_index):
-        return [grid[i][column_index] for i in range(len(grid))]
+        if not grid:
+            return []
+        return list(grid[column_index])
+
+
+######################################################################
+#{ Grid Reading
+######################################################################
+
+_BLANK_LINE = re.compile(r'\n[^\S\n]*(?:\n|$)')
+
+def read_conll_grid_block(stream, size=None):
+    """
+    Read a block of about ``size`` characters from ``stream``, ending at
+    a blank line (or at the end of the file), and return the list of
+    sentences it contains, each as a string of lines.  This reads the
+    same sentences as repeatedly calling ``read_blankline_block()``, but
+    reads many lines at once.
+    """
+    if size is None:
+        size = ConllGridView.BLOCK_SIZE
+    startpos = stream.tell()
+    text = stream.read(size)
+    if not text:
+        return []
+
+    # Keep reading until the block contains a blank line.
+    search_from = 0
+    while True:
+        ends = [m.end() for m in _BLANK_LINE.finditer(text, search_from)]
+        if ends and ends[-1] < len(text):
+            end = ends[-1]
+            break
+        more = stream.read(size)
+        if not more:
+            end = len(text)
+            break
+        # A blank line might span the two reads.
+        search_from = max(0, len(text) - 1)
+        text += more
+
+    # Move the stream to the end of the block.
+    if end < len(text):
+        if isinstance(stream, SeekableUnicodeStreamReader):
+            stream.seek(startpos)
+            stream.char_seek_forward(end)
+        else:
+            stream.seek(startpos + end)
+    return [sent for sent in _BLANK_LINE.split(text[:end]) if sent.strip()]
+
+
+class ConllGridView(StreamBackedCorpusView):
+    """
+    A corpus view of the grids of a CoNLL file, which keeps the grids of
+    the most recently read blocks, so that they can be shared by the
+    data access methods of ``ConllCorpusReader``.
+    """
+
+    BLOCK_SIZE = 32768
+    """The approximate number of characters in each block."""
+
+    def __init__(self, fileid, grid_reader, encoding='utf8', cache_size=64):
+        StreamBackedCorpusView.__init__(self, fileid, encoding=encoding)
+        self._grid_reader = grid_reader
+        self._block_cache = LRUCache(cache_size)
+
+    def read_block(self, stream):
+        filepos = stream.tell()
+        cached = self._block_cache.get(filepos)
+        if cached is not None:
+            grids, endpos = cached
+            stream.seek(endpos)
+            return grids
+        grids = self._grid_reader(stream)
+        self._block_cache[filepos] = (grids, stream.tell())
+        return grids
 
 
 @compat.python_2_unicode_compatible
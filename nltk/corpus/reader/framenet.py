@@ -13,15 +13,19 @@ Corpus reader for the Framenet 1.5 Corpus.
 
 __docformat__ = 'epytext en'
 
+import json
 import os, sys
 import re
+import sqlite3
 import textwrap
+import threading
 from collections import defaultdict
 from pprint import pprint, pformat
 from nltk.internals import ElementWrapper
 from nltk.corpus.reader import XMLCorpusReader, XMLCorpusView
+from nltk.corpus.reader.xmldocs import ElementTree
 from nltk.compat import text_type, string_types, python_2_unicode_compatible
-from nltk.util import AbstractLazySequence, LazyMap
+from nltk.util import AbstractLazySequence, LazyMap, LRUCache
 
 
 def _pretty_longstring(defstr, prefix='', wrap_at=65):
@@ -448,6 +452,10 @@ class PrettyLazyMap(LazyMap):
         else:
             return "[%s]" % text_type(', ').join(pieces)
 
+def _local_name(tag):
+    """Return an XML tag without its namespace."""
+    return tag.rsplit('}', 1)[-1]
+
 class FramenetCorpusReader(XMLCorpusReader):
     """A corpus reader for the Framenet Corpus.
 
@@ -468,9 +476,35 @@ class FramenetCorpusReader(XMLCorpusReader):
     in the XML index.
     """
 
-    def __init__(self, root, fileids):
+    _INDEX_CACHE_FILE = 'index-cache.sqlite'
+    """
+    The name of the file in which the index records are kept, in the
+    ``index_dir`` given to ``__init__()``.
+    """
+
+    _INDEX_CACHE_VERSION = 1
+    """
+    The version of the index record format.  Caches written with another
+    version are emptied when they are opened.
+    """
+
+    def __init__(self, root, fileids, index_dir=None, frame_cache_size=None):
+        """
+        :param index_dir: the directory in which to keep a cache of the
+            index entries, relations and semantic types, and of the FEs and
+            LUs of each frame, so that their XML files are only read again
+            when they change.  The cache is stored as JSON in an SQLite
+            database.  If None (the default), nothing is written to disk.
+        :param frame_cache_size: the number of frames (with their FEs and
+            LUs) to keep once they have been built.  If None, all of the
+            frames that are looked up are kept.
+        """
         XMLCorpusReader.__init__(self, root, fileids)
 
+        self._index_dir = index_dir
+        self._index_db = None
+        self._index_lock = threading.Lock()
+
         # framenet corpus sub dirs
         # sub dir containing the xml files for frames
         self._frame_dir = "frame"
@@ -481,6 +515,7 @@ class FramenetCorpusReader(XMLCorpusReader):
 
         # Indexes used for faster look-ups
         self._frame_idx = None
+        self._frame_cache = LRUCache(frame_cache_size)  # ID -> frame
         self._cached_frames = {}    # name -> ID
         self._lu_idx = None
         self._fulltext_idx = None
@@ -497,48 +532,53 @@ class FramenetCorpusReader(XMLCorpusReader):
             self._buildrelationindex()  # always load frame relations before frames,
             # otherwise weird ordering effects might result in incomplete information
         self._frame_idx = {}
-        for f in XMLCorpusView(self.abspath("frameIndex.xml"),
-                               'frameIndex/frame', self._handle_elt):
-            self._frame_idx[f['ID']] = f
+        for f in self._records("frameIndex.xml", 'frameIndex/frame',
+                               self._handle_elt):
+            self._frame_idx[f['ID']] = AttrDict(f)
 
     def _buildcorpusindex(self):
         # The total number of fulltext annotated documents in Framenet
         # is fairly small (~90) so this index should not be very large
         self._fulltext_idx = {}
-        for doclist in XMLCorpusView(self.abspath("fulltextIndex.xml"),
-                                     'fulltextIndex/corpus',
+        for doclist in self._records("fulltextIndex.xml", 'fulltextIndex/corpus',
                                      self._handle_fulltextindex_elt):
             for doc in doclist:
-                self._fulltext_idx[doc.ID] = doc
+                self._fulltext_idx[doc['ID']] = AttrDict(doc)
 
     def _buildluindex(self):
         # The number of LUs in Framenet is about 13,000 so this index
         # should not be very large
         self._lu_idx = {}
-        for lu in XMLCorpusView(self.abspath("luIndex.xml"),
-                                'luIndex/lu', self._handle_elt):
-            self._lu_idx[lu['ID']] = lu # populate with LU index entries. if any of these
-            # are looked up they will be replaced by full LU objects.
+        for lu in self._records("luIndex.xml", 'luIndex/lu', self._handle_elt):
+            self._lu_idx[lu['ID']] = AttrDict(lu) # populate with LU index entries. if any of these
+            # are looked up the full LU objects are found in their frames.
 
     def _buildrelationindex(self):
         #print('building relation index...', file=sys.stderr)
-        freltypes = PrettyList(x for x in XMLCorpusView(self.abspath("frRelation.xml"),
-                                            'frameRelations/frameRelationType',
-                                            self._handle_framerelationtype_elt))
         self._freltyp_idx = {}
         self._frel_idx = {}
         self._frel_f_idx = defaultdict(set)
         self._ferel_idx = {}
 
-        for freltyp in freltypes:
+        for freltyp in self._records("frRelation.xml",
+                                     'frameRelations/frameRelationType',
+                                     self._handle_framerelationtype_elt):
+            freltyp = AttrDict(freltyp)
+            freltyp['frameRelations'] = PrettyList(
+                AttrDict(frel) for frel in freltyp.frameRelations)
             self._freltyp_idx[freltyp.ID] = freltyp
             for frel in freltyp.frameRelations:
+                frel['type'] = freltyp   # backpointer
+                frel['feRelations'] = PrettyList(
+                    AttrDict(ferel) for ferel in frel.feRelations)
                 supF = frel.superFrame = frel[freltyp.superFrameName] = Future((lambda fID: lambda: self.frame_by_id(fID))(frel.supID))
                 subF = frel.subFrame = frel[freltyp.subFrameName] = Future((lambda fID: lambda: self.frame_by_id(fID))(frel.subID))
                 self._frel_idx[frel.ID] = frel
                 self._frel_f_idx[frel.supID].add(frel.ID)
                 self._frel_f_idx[frel.subID].add(frel.ID)
                 for ferel in frel.feRelations:
+                    ferel['type'] = freltyp
+                    ferel['frameRelation'] = frel   # backpointer
                     ferel.superFrame = supF
                     ferel.subFrame = subF
                     ferel.superFE = Future((lambda fer: lambda: fer.superFrame.FE[fer.superFEName])(ferel))
@@ -546,6 +586,97 @@ class FramenetCorpusReader(XMLCorpusReader):
                     self._ferel_idx[ferel.ID] = ferel
         #print('...done building relation index', file=sys.stderr)
 
+    def _index_cursor(self):
+        """
+        Return a cursor for the index cache database, creating it if
+        necessary, or None if no cache is kept.  Must be called with
+        ``_index_lock`` held.
+        """
+        if self._index_dir is None:
+            return None
+        if self._index_db is None:
+            try:
+                self._index_db = sqlite3.connect(
+                    os.path.join(self._index_dir, self._INDEX_CACHE_FILE),
+                    check_same_thread=False, isolation_level=None)
+                # This is only a cache, so there is no need to wait for
+                # each update to reach the disk.
+                self._index_db.execute('PRAGMA synchronous = OFF')
+                self._index_db.execute('PRAGMA journal_mode = MEMORY')
+                version = self._index_db.execute('PRAGMA user_version').fetchone()[0]
+                if version != self._INDEX_CACHE_VERSION:
+                    self._index_db.execute('DROP TABLE IF EXISTS records')
+                    self._index_db.execute('PRAGMA user_version = %d'
+                                           % self._INDEX_CACHE_VERSION)
+                self._index_db.execute(
+                    'CREATE TABLE IF NOT EXISTS records (path TEXT, tagspec TEXT, '
+                    'mtime REAL, size INTEGER, data TEXT, PRIMARY KEY (path, tagspec))')
+            except sqlite3.Error:
+                # e.g. the directory is not writable: do without the cache.
+                self._index_dir = self._index_db = None
+                return None
+        return self._index_db.cursor()
+
+    def _records(self, fileid, tagspec, handler):
+        """
+        Return the list of records made by ``handler`` from the XML
+        elements of the file ``fileid`` (relative to the corpus root) that
+        match ``tagspec``.  The records are made of dicts, lists, strings
+        and numbers.  If an ``index_dir`` was given, they are kept there
+        as JSON, and read back instead of the XML until the file changes.
+        """
+        pointer = self.abspath(fileid)
+        path = getattr(pointer, 'path', None)
+        if self._index_dir is None or path is None:
+            return self._parse_records(pointer, tagspec, handler)
+
+        stat = os.stat(path)
+        key = (fileid, tagspec, stat.st_mtime, stat.st_size)
+        with self._index_lock:
+            cursor = self._index_cursor()
+            if cursor is not None:
+                cursor.execute('SELECT data FROM records WHERE path=? AND tagspec=? '
+                               'AND mtime=? AND size=?', key)
+                row = cursor.fetchone()
+                if row is not None:
+                    return json.loads(row[0])
+
+        records = self._parse_records(pointer, tagspec, handler)
+
+        with self._index_lock:
+            cursor = self._index_cursor()
+            if cursor is not None:
+                try:
+                    cursor.execute('INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?)',
+                                   key + (json.dumps(records),))
+                except sqlite3.Error:
+                    pass
+        return records
+
+    def _parse_records(self, pointer, tagspec, handler):
+        """
+        Parse the XML file ``pointer`` and return the records made by
+        ``handler`` from its elements that match ``tagspec``.  The index
+        and frame files are small enough to be parsed in one go, which
+        is much faster than reading them with an ``XMLCorpusView``; other
+        tag specifications are left to the corpus view.
+        """
+        names = tagspec.split('/')
+        if len(names) > 2 or not all(re.match(r'\w+$', name) for name in names):
+            return list(XMLCorpusView(pointer, tagspec, handler))
+
+        stream = pointer.open()
+        try:
+            root = ElementTree.parse(stream).getroot()
+        finally:
+            stream.close()
+        if _local_name(root.tag) != names[0]:
+            return []
+        if len(names) == 1:
+            return [handler(root, tagspec)]
+        return [handler(elt, tagspec) for elt in root
+                if _local_name(elt.tag) == names[1]]
+
     def readme(self):
         """
         Return the contents of the corpus README.txt (or README) file.
@@ -661,11 +792,11 @@ class FramenetCorpusReader(XMLCorpusReader):
         """
 
         # get the name of the frame with this id number
+        fentry = self._frame_cache.get(fn_fid)
+        if fentry is not None:
+            return fentry   # full frame object is cached
         try:
-            fentry = self._frame_idx[fn_fid]
-            if '_type' in fentry:
-                return fentry   # full frame object is cached
-            name = fentry['name']
+            name = self._frame_idx[fn_fid]['name']
         except TypeError:
             self._buildframeindex()
             name = self._frame_idx[fn_fid]['name']
@@ -702,21 +833,20 @@ class FramenetCorpusReader(XMLCorpusReader):
         """
 
         if check_cache and fn_fname in self._cached_frames:
-            return self._frame_idx[self._cached_frames[fn_fname]]
-        elif not self._frame_idx:
+            fentry = self._frame_cache.get(self._cached_frames[fn_fname])
+            if fentry is not None:
+                return fentry
+        if not self._frame_idx:
             self._buildframeindex()
 
-        # construct the path name for the xml file containing the Frame info
-        locpath = os.path.join(
-            "{0}".format(self._root), self._frame_dir, fn_fname + ".xml")
-        #print(locpath, file=sys.stderr)
         # Grab the xml for the frame
         try:
-            elt = XMLCorpusView(locpath, 'frame')[0]
-        except IOError:
+            frinfo = self._records(self._frame_dir + '/' + fn_fname + ".xml",
+                                   'frame', self._handle_frame_elt)[0]
+        except (IOError, OSError):
             raise FramenetError('Unknown frame: {0}'.format(fn_fname))
 
-        fentry = self._handle_frame_elt(elt, ignorekeys)
+        fentry = self._build_frame(frinfo, ignorekeys)
         assert fentry
 
         # INFERENCE RULE: propagate lexical semtypes from the frame to all its LUs
@@ -727,7 +857,7 @@ class FramenetCorpusReader(XMLCorpusReader):
                         lu.semTypes.append(st)
 
 
-        self._frame_idx[fentry.ID] = fentry
+        self._frame_cache[fentry.ID] = fentry
         self._cached_frames[fentry.name] = fentry.ID
         '''
         # now set up callables to resolve the LU pointers lazily.
@@ -960,10 +1090,10 @@ class FramenetCorpusReader(XMLCorpusReader):
         if not self._lu_idx:
             self._buildluindex()
         luinfo = self._lu_idx[fn_luid]
-        if '_type' not in luinfo:
-            # we only have an index entry for the LU. loading the frame will replace this.
-            f = self.frame_by_id(luinfo.frameID)
-            luinfo = self._lu_idx[fn_luid]
+        # the index only has an entry for the LU; the full LU is loaded with its frame.
+        # (LUs with a bad status are not loaded, and only have an index entry.)
+        f = self.frame_by_id(luinfo.frameID)
+        luinfo = f.lexUnit.get(luinfo.name, luinfo)
         if ignorekeys:
             return AttrDict(dict((k, v) for k, v in luinfo.items() if k not in ignorekeys))
 
@@ -995,10 +1125,11 @@ class FramenetCorpusReader(XMLCorpusReader):
     def _loadsemtypes(self):
         """Create the semantic types index."""
         self._semtypes = AttrDict()
-        semtypeXML = [x for x in XMLCorpusView(self.abspath("semTypes.xml"),
-                                             'semTypes/semType',
-                                             self._handle_semtype_elt)]
+        semtypeXML = self._records("semTypes.xml", 'semTypes/semType',
+                                   self._handle_semtype_elt)
         for st in semtypeXML:
+            st = AttrDict(st)
+            st['subTypes'] = PrettyList()
             n = st['name']
             a = st['abbrev']
             i = st['ID']
@@ -1011,7 +1142,7 @@ class FramenetCorpusReader(XMLCorpusReader):
         roots = []
         for st in self.semtypes():
             if st.superType:
-                st.superType = self.semtype(st.superType.supID)
+                st.superType = self.semtype(st.superType['supID'])
                 st.superType.subTypes.append(st)
             else:
                 if st not in roots: roots.append(st)
@@ -1577,12 +1708,12 @@ class FramenetCorpusReader(XMLCorpusReader):
             return d
 
         # Ignore these attributes when loading attributes from an xml node
-        ignore_attrs = ['cBy', 'cDate', 'mDate', 'xsi',
-                        'schemaLocation', 'xmlns', 'bgColor', 'fgColor']
+        ignore_attrs = ('cBy', 'cDate', 'mDate', 'xsi',
+                        'schemaLocation', 'xmlns', 'bgColor', 'fgColor')
 
         for attr in attr_dict:
 
-            if any(attr.endswith(x) for x in ignore_attrs):
+            if attr.endswith(ignore_attrs):
                 continue
 
             val = attr_dict[attr]
@@ -1663,12 +1794,41 @@ class FramenetCorpusReader(XMLCorpusReader):
 
         return retlist
 
-    def _handle_frame_elt(self, elt, ignorekeys=[]):
-        """Load the info for a Frame from an frame xml file"""
+    def _handle_frame_elt(self, elt, tagspec=None):
+        """
+        Load the info for a Frame from an frame xml file, as a record that
+        ``_build_frame()`` turns into a Frame.  FEs, LUs and core sets are
+        kept in lists, and semantic types by their IDs.
+        """
         frinfo = self._load_xml_attributes(AttrDict(), elt)
 
         frinfo['_type'] = 'frame'
         frinfo['definition'] = ""
+        frinfo['FE'] = []
+        frinfo['FEcoreSets'] = []
+        frinfo['lexUnit'] = []
+        frinfo['semTypes'] = []
+
+        for sub in elt:
+            if sub.tag.endswith('definition'):
+                frinfo['definition'] = self._strip_tags(sub.text)
+            elif sub.tag.endswith('FE'):
+                frinfo['FE'].append(self._handle_fe_elt(sub))
+            elif sub.tag.endswith('FEcoreSet'):
+                coreset = self._handle_fecoreset_elt(sub)
+                frinfo['FEcoreSets'].append([fe.name for fe in coreset])
+            elif sub.tag.endswith('lexUnit'):
+                frinfo['lexUnit'].append(self._handle_framelexunit_elt(sub))
+            elif sub.tag.endswith('semType'):
+                semtypeinfo = self._load_xml_attributes(AttrDict(), sub)
+                frinfo['semTypes'].append(semtypeinfo.ID)
+
+        return frinfo
+
+    def _build_frame(self, record, ignorekeys=[]):
+        """Build a Frame from the output of ``_handle_frame_elt()``."""
+        frinfo = AttrDict(record)
+
         frinfo['FE'] = PrettyDict()
         frinfo['FEcoreSets'] = []
         frinfo['lexUnit'] = PrettyDict()
@@ -1677,31 +1837,34 @@ class FramenetCorpusReader(XMLCorpusReader):
             if k in frinfo:
                 del frinfo[k]
 
-        for sub in elt:
-            if sub.tag.endswith('definition') and 'definition' not in ignorekeys:
-                frinfo['definition'] = self._strip_tags(sub.text)
-            elif sub.tag.endswith('FE') and 'FE' not in ignorekeys:
-                feinfo = self._handle_fe_elt(sub)
+        if 'FE' not in ignorekeys:
+            for feinfo in record['FE']:
+                feinfo = AttrDict(feinfo)
+                if feinfo.semType is not None:
+                    feinfo['semType'] = self.semtype(feinfo.semType)
+                for key in ('requiresFE', 'excludesFE'):
+                    if feinfo[key] is not None:
+                        feinfo[key] = AttrDict(feinfo[key])
                 frinfo['FE'][feinfo.name] = feinfo
                 feinfo['frame'] = frinfo    # backpointer
-            elif sub.tag.endswith('FEcoreSet') and 'FEcoreSet' not in ignorekeys:
-                coreset = self._handle_fecoreset_elt(sub)
-                # assumes all FEs have been loaded before coresets
-                frinfo['FEcoreSets'].append(PrettyList(frinfo['FE'][fe.name] for fe in coreset))
-            elif sub.tag.endswith('lexUnit') and 'lexUnit' not in ignorekeys:
-                luentry = self._handle_framelexunit_elt(sub)
+        if 'FEcoreSet' not in ignorekeys:
+            # assumes all FEs have been loaded before coresets
+            for names in record['FEcoreSets']:
+                frinfo['FEcoreSets'].append(PrettyList(frinfo['FE'][name] for name in names))
+        if 'lexUnit' not in ignorekeys:
+            for luentry in record['lexUnit']:
                 if luentry['status'] in self._bad_statuses:
                     # problematic LU entry; ignore it
                     continue
+                luentry = AttrDict(luentry)
+                luentry['sentenceCount'] = PrettyDict(luentry.sentenceCount)
+                luentry['lexemes'] = PrettyList(PrettyDict(lexeme) for lexeme in luentry.lexemes)
+                luentry['semTypes'] = PrettyList(self.semtype(ID) for ID in luentry.semTypes)
                 luentry['frame'] = frinfo
                 luentry['subCorpus'] = Future((lambda lu: lambda: self._lu_file(lu))(luentry))
                 frinfo['lexUnit'][luentry.name] = luentry
-                if not self._lu_idx:
-                    self._buildluindex()
-                self._lu_idx[luentry.ID] = luentry
-            elif sub.tag.endswith('semType') and 'semTypes' not in ignorekeys:
-                semtypeinfo = self._load_xml_attributes(AttrDict(), sub)
-                frinfo['semTypes'].append(self.semtype(semtypeinfo.ID))
+        if 'semTypes' not in ignorekeys:
+            frinfo['semTypes'] = [self.semtype(ID) for ID in record['semTypes']]
 
         frinfo['frameRelations'] = self.frame_relations(frame=frinfo)
 
@@ -1735,11 +1898,7 @@ class FramenetCorpusReader(XMLCorpusReader):
 
         for sub in elt:
             if sub.tag.endswith('frameRelation'):
-                frel = self._handle_framerelation_elt(sub)
-                frel['type'] = info   # backpointer
-                for ferel in frel.feRelations:
-                    ferel['type'] = info
-                info['frameRelations'].append(frel)
+                info['frameRelations'].append(self._handle_framerelation_elt(sub))
 
         return info
 
@@ -1754,7 +1913,6 @@ class FramenetCorpusReader(XMLCorpusReader):
             if sub.tag.endswith('FERelation'):
                 ferel = self._handle_elt(sub)
                 ferel['_type'] = 'ferelation'
-                ferel['frameRelation'] = info   # backpointer
                 info['feRelations'].append(ferel)
 
         return info
@@ -1824,7 +1982,10 @@ class FramenetCorpusReader(XMLCorpusReader):
         return info
 
     def _handle_framelexunit_elt(self, elt):
-        """Load the lexical unit info from an xml element in a frame's xml file."""
+        """
+        Load the lexical unit info from an xml element in a frame's xml file.
+        Semantic types are given by their IDs.
+        """
         luinfo = AttrDict()
         luinfo['_type'] = 'lu'
         luinfo = self._load_xml_attributes(luinfo, elt)
@@ -1843,7 +2004,7 @@ class FramenetCorpusReader(XMLCorpusReader):
                 luinfo['lexemes'].append(self._load_xml_attributes(PrettyDict(), sub))
             elif sub.tag.endswith('semType'):
                 semtypeinfo = self._load_xml_attributes(PrettyDict(), sub)
-                luinfo['semTypes'].append(self.semtype(semtypeinfo.ID))
+                luinfo['semTypes'].append(semtypeinfo.ID)
 
         return luinfo
 
@@ -1951,7 +2112,7 @@ class FramenetCorpusReader(XMLCorpusReader):
                 feinfo['definition'] = self._strip_tags(sub.text)
             elif sub.tag.endswith('semType'):
                 stinfo = self._load_xml_attributes(AttrDict(), sub)
-                feinfo['semType'] = self.semtype(stinfo.ID)
+                feinfo['semType'] = stinfo.ID
             elif sub.tag.endswith('requiresFE'):
                 feinfo['requiresFE'] = self._load_xml_attributes(AttrDict(), sub)
             elif sub.tag.endswith('excludesFE'):
@@ -6,11 +6,29 @@
 # For license information, see LICENSE.txt
 from __future__ import print_function
 
+import os
 import re
-from collections import defaultdict
+import tempfile
 from functools import reduce
 
 from nltk.corpus.reader import CorpusReader
+from nltk.corpus.reader.util import (CompiledLookupTable, pack_lookup_table,
+                                     read_index_sections, write_index_sections)
+from nltk.util import LRUCache
+
+# The magic string of a compiled thesaurus index.  Each index has a
+# 'sources' section, recording the thesaurus file it was built from,
+# and a 'words' section, mapping each entry's key to its neighbours and
+# their scores, as tab-separated lines in the order of the thesaurus
+# file.
+_INDEX_MAGIC = b'NLTKLIN1'
+
+
+def _unpack_neighbours(value):
+    if not value:
+        return []
+    return [(ngram, float(score)) for ngram, score in
+            (line.split('\t') for line in value.decode('utf8').split('\n'))]
 
 
 class LinThesaurusCorpusReader(CorpusReader):
@@ -20,42 +38,143 @@ class LinThesaurusCorpusReader(CorpusReader):
     # thesaurus entry
     _key_re = re.compile(r'\("?([^"]+)"? \(desc [0-9.]+\).+')
 
-    @staticmethod
-    def __defaultdict_factory():
-        ''' Factory for creating defaultdict of defaultdict(dict)s '''
-        return defaultdict(dict)
-
-    def __init__(self, root, badscore=0.0):
+    def __init__(self, root, badscore=0.0, index_dir=None, cache_size=1024):
         '''
         Initialize the thesaurus.
 
+        Each thesaurus file is compiled into an index the first time it
+        is used, which is searched in place, so that the entries are only
+        decoded when they are looked up.
+
         :param root: root directory containing thesaurus LISP files
         :type root: C{string}
         :param badscore: the score to give to words which do not appear in each other's sets of synonyms
         :type badscore: C{float}
+        :param index_dir: the directory in which to keep the compiled index of each
+            thesaurus file, which is memory-mapped, so that it is only built again when
+            the file changes.  If None (the default), nothing is written to disk, and the
+            indexes are built in memory each time the reader is created.
+        :type index_dir: C{string}
+        :param cache_size: the number of entries whose decoded neighbours are kept in
+            memory, so that repeated lookups of the same ngram are dictionary lookups.
+            If None, every entry that is looked up is kept.
+        :type cache_size: C{int}
         '''
 
         super(LinThesaurusCorpusReader, self).__init__(root, r'sim[A-Z]\.lsp')
-        self._thesaurus = defaultdict(LinThesaurusCorpusReader.__defaultdict_factory)
         self._badscore = badscore
-        for path, encoding, fileid in self.abspaths(include_encoding=True, include_fileid=True):
-            with open(path) as lin_file:
-                first = True
-                for line in lin_file:
-                    line = line.strip()
-                    # Start of entry
-                    if first:
-                        key = LinThesaurusCorpusReader._key_re.sub(r'\1', line)
-                        first = False
-                    # End of entry
-                    elif line == '))':
-                        first = True
-                    # Lines with pairs of ngrams and scores
-                    else:
-                        split_line = line.split('\t')
-                        if len(split_line) == 2:
-                            ngram, score = split_line
-                            self._thesaurus[fileid][key][ngram.strip('"')] = float(score)
+        self._index_dir = index_dir
+        # Map from fileid -> CompiledLookupTable
+        self._thesaurus = {}
+        # Map from (fileid, ngram) -> (list of (synonym, score), dict of scores)
+        self._entry_cache = LRUCache(cache_size)
+
+    def _read_entries(self, fileid):
+        '''
+        Return the entries of a thesaurus file, as a list of pairs of keys and lists of
+        (ngram, score) lines, with scores left as strings.
+        '''
+        entries = []
+        with open(self.abspath(fileid).path) as lin_file:
+            first = True
+            for line in lin_file:
+                line = line.strip()
+                # Start of entry
+                if first:
+                    key = LinThesaurusCorpusReader._key_re.sub(r'\1', line)
+                    neighbours = []
+                    entries.append((key, neighbours))
+                    first = False
+                # End of entry
+                elif line == '))':
+                    first = True
+                # Lines with pairs of ngrams and scores
+                else:
+                    split_line = line.split('\t')
+                    if len(split_line) == 2:
+                        ngram, score = split_line
+                        neighbours.append((ngram.strip('"'), score))
+        return entries
+
+    def _pack_index(self, fileid):
+        '''
+        Return the sections of the compiled index of a thesaurus file.
+        '''
+        # Merge repeated keys, keeping the last score of repeated neighbours.
+        neighbour_lists = {}
+        for key, neighbours in self._read_entries(fileid):
+            neighbour_lists.setdefault(key, []).extend(neighbours)
+        items = []
+        for key, neighbours in neighbour_lists.items():
+            scores = dict(neighbours)
+            seen = set()
+            lines = []
+            for ngram, _ in neighbours:
+                if ngram not in seen:
+                    seen.add(ngram)
+                    lines.append('%s\t%s' % (ngram, scores[ngram]))
+            items.append((key.encode('utf8'), '\n'.join(lines).encode('utf8')))
+        return [(b'sources', self._index_sources(fileid)),
+                (b'words', pack_lookup_table(items))]
+
+    def _index_sources(self, fileid):
+        stat = os.stat(self.abspath(fileid).path)
+        return ('%s:%r:%d' % (fileid, stat.st_mtime, stat.st_size)).encode('utf8')
+
+    def _load_index(self, fileid):
+        '''
+        Return the lookup table of a thesaurus file, compiling its index first if it is
+        missing or out of date.
+        '''
+        if self._index_dir is None:
+            sections = self._pack_index(fileid)
+            return CompiledLookupTable(sections[1][1], 0, _unpack_neighbours)
+
+        filename = os.path.join(self._index_dir, fileid + '.idx')
+        for attempt in range(2):
+            if os.path.exists(filename):
+                buf, sections = read_index_sections(filename, _INDEX_MAGIC)
+                if buf is not None:
+                    start, length = sections['sources']
+                    if buf[start:start+length] == self._index_sources(fileid):
+                        return CompiledLookupTable(buf, sections['words'][0],
+                                                   _unpack_neighbours)
+            # Write to a temporary file, and then move it into place, so that readers
+            # never see a partially written index.
+            fd, tmpname = tempfile.mkstemp(dir=self._index_dir)
+            os.close(fd)
+            write_index_sections(tmpname, _INDEX_MAGIC, self._pack_index(fileid))
+            if os.path.exists(filename):
+                os.remove(filename)
+            os.rename(tmpname, filename)
+        raise IOError('could not load the thesaurus index %s' % filename)
+
+    def _table(self, fileid):
+        table = self._thesaurus.get(fileid)
+        if table is None:
+            table = self._thesaurus.setdefault(fileid, self._load_index(fileid))
+        return table
+
+    def _entry(self, fileid, ngram):
+        '''
+        Return the list of (synonym, score) pairs of an ngram in one thesaurus file,
+        and a dict mapping each synonym to its score.
+        '''
+        key = (fileid, ngram)
+        entry = self._entry_cache.get(key)
+        if entry is None:
+            neighbours = self._table(fileid).get(ngram, [])
+            entry = self._entry_cache[key] = (neighbours, dict(neighbours))
+        return entry
+
+    def _neighbours(self, fileid, ngram):
+        '''
+        Return the list of (synonym, score) pairs of an ngram in one thesaurus file.
+        '''
+        return list(self._entry(fileid, ngram)[0])
+
+    def _score(self, fileid, ngram1, ngram2):
+        return self._entry(fileid, ngram1)[1].get(ngram2, self._badscore)
 
     def similarity(self, ngram1, ngram2, fileid=None):
         '''
@@ -78,10 +197,9 @@ class LinThesaurusCorpusReader(CorpusReader):
                 return [(fid, 1.0) for fid in self._fileids]
         else:
             if fileid:
-                return self._thesaurus[fileid][ngram1][ngram2] if ngram2 in self._thesaurus[fileid][ngram1] else self._badscore
+                return self._score(fileid, ngram1, ngram2)
             else:
-                return [(fid, (self._thesaurus[fid][ngram1][ngram2] if ngram2 in self._thesaurus[fid][ngram1]
-                                  else self._badscore)) for fid in self._fileids]
+                return [(fid, self._score(fid, ngram1, ngram2)) for fid in self._fileids]
 
     def scored_synonyms(self, ngram, fileid=None):
         '''
@@ -96,9 +214,9 @@ class LinThesaurusCorpusReader(CorpusReader):
                  scores and synonyms.
         '''
         if fileid:
-            return self._thesaurus[fileid][ngram].items()
+            return self._neighbours(fileid, ngram)
         else:
-            return [(fileid, self._thesaurus[fileid][ngram].items()) for fileid in self._fileids]
+            return [(fileid, self._neighbours(fileid, ngram)) for fileid in self._fileids]
 
     def synonyms(self, ngram, fileid=None):
         '''
@@ -112,9 +230,10 @@ class LinThesaurusCorpusReader(CorpusReader):
                  lists, where inner lists contain synonyms.
         '''
         if fileid:
-            return self._thesaurus[fileid][ngram].keys()
+            return [synonym for synonym, _ in self._neighbours(fileid, ngram)]
         else:
-            return [(fileid, self._thesaurus[fileid][ngram].keys()) for fileid in self._fileids]
+            return [(fileid, [synonym for synonym, _ in self._neighbours(fileid, ngram)])
+                    for fileid in self._fileids]
 
     def __contains__(self, ngram):
         '''
@@ -124,7 +243,8 @@ class LinThesaurusCorpusReader(CorpusReader):
         :type ngram: C{string}
         :return: whether the given ngram is in the thesaurus.
         '''
-        return reduce(lambda accum, fileid: accum or (ngram in self._thesaurus[fileid]), self._fileids, False)
+        return reduce(lambda accum, fileid: accum or (ngram in self._table(fileid)),
+                      self._fileids, False)
 
 
 ######################################################################
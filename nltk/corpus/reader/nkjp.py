@@ -9,9 +9,10 @@ import functools
 import os
 import tempfile
 from nltk import compat
+from nltk.internals import deprecated
 
 from nltk.corpus.reader.util import concat
-from nltk.corpus.reader.xmldocs import XMLCorpusReader, XMLCorpusView
+from nltk.corpus.reader.xmldocs import XMLCorpusReader, StreamingXMLCorpusView
 import re
 
 
@@ -143,7 +144,7 @@ class NKJPCorpusReader(XMLCorpusReader):
                        for fileid in fileids])
 
 
-class NKJPCorpus_Header_View(XMLCorpusView):
+class NKJPCorpus_Header_View(StreamingXMLCorpusView):
 
     def __init__(self, filename, **kwargs):
         """
@@ -152,13 +153,13 @@ class NKJPCorpus_Header_View(XMLCorpusView):
         header.xml files in NKJP corpus.
         """
         self.tagspec = ".*/sourceDesc$"
-        XMLCorpusView.__init__(self, filename + 'header.xml', self.tagspec)
+        StreamingXMLCorpusView.__init__(self, filename + 'header.xml', self.tagspec)
 
     def handle_query(self):
         self._open()
         header = []
         while True:
-            segm = XMLCorpusView.read_block(self, self._stream)
+            segm = StreamingXMLCorpusView.read_block(self, self._stream)
             if len(segm) == 0:
                 break
             header.extend(segm)
@@ -206,6 +207,8 @@ class XML_Tool():
     That's needed because the XMLCorpusView assumes that one can find short substrings
     of XML that are valid XML, which is not true if a namespace is declared at top level
     """
+    @deprecated('The NKJP corpus views read the files directly, and no longer '
+                'need a preprocessed copy.')
     def __init__(self, root, filename):
         self.read_file = os.path.join(root, filename)
         self.write_file = tempfile.NamedTemporaryFile(delete=False)
@@ -240,21 +243,24 @@ class XML_Tool():
         pass
 
 
-class NKJPCorpus_Segmentation_View(XMLCorpusView):
+class NKJPCorpus_Segmentation_View(StreamingXMLCorpusView):
     """
     A stream backed corpus view specialized for use with
     ann_segmentation.xml files in NKJP corpus.
     """
 
+    #: Elements that group the segments of a sentence; their segments
+    #: are read as if they were children of the sentence.
+    GROUP_TAGS = ('nkjp:paren', 'choice')
+
     def __init__(self, filename, **kwargs):
         self.tagspec = '.*p/.*s'
         #intersperse NKJPCorpus_Text_View
         self.text_view = NKJPCorpus_Text_View(filename, mode=NKJPCorpus_Text_View.SENTS_MODE)
         self.text_view.handle_query()
-        #xml preprocessing
-        self.xml_tool = XML_Tool(filename, 'ann_segmentation.xml')
         #base class init
-        XMLCorpusView.__init__(self, self.xml_tool.build_preprocessed_file(), self.tagspec)
+        StreamingXMLCorpusView.__init__(self, os.path.join(filename, 'ann_segmentation.xml'),
+                                        self.tagspec)
 
     def get_segm_id(self, example_word):
         return example_word.split('(')[1].split(',')[0]
@@ -291,31 +297,35 @@ class NKJPCorpus_Segmentation_View(XMLCorpusView):
         return ret
 
     def handle_query(self):
-        try:
-            self._open()
-            sentences = []
-            while True:
-                sent_segm = XMLCorpusView.read_block(self, self._stream)
-                if len(sent_segm) == 0:
-                    break
-                for segm in sent_segm:
-                    segm = self.remove_choice(segm)
-                    sentences.append(self.get_sentences(segm))
-            self.close()
-            self.xml_tool.remove_preprocessed_file()
-            return sentences
-        except Exception:
-            self.xml_tool.remove_preprocessed_file()
-            raise Exception
+        self._open()
+        sentences = []
+        while True:
+            sent_segm = StreamingXMLCorpusView.read_block(self, self._stream)
+            if len(sent_segm) == 0:
+                break
+            for segm in sent_segm:
+                segm = self.remove_choice(segm)
+                sentences.append(self.get_sentences(segm))
+        self.close()
+        return sentences
+
+    def get_segments(self, elt):
+        #yield segments, looking inside the elements that group them
+        for child in elt:
+            if child.tag in self.GROUP_TAGS:
+                for seg in self.get_segments(child):
+                    yield seg
+            else:
+                yield child
 
     def handle_elt(self, elt, context):
         ret = []
-        for seg in elt:
+        for seg in self.get_segments(elt):
             ret.append(seg.get('corresp'))
         return ret
 
 
-class NKJPCorpus_Text_View(XMLCorpusView):
+class NKJPCorpus_Text_View(StreamingXMLCorpusView):
     """
     A stream backed corpus view specialized for use with
     text.xml files in NKJP corpus.
@@ -327,21 +337,14 @@ class NKJPCorpus_Text_View(XMLCorpusView):
         self.mode = kwargs.pop('mode', 0)
         self.tagspec = '.*/div/ab'
         self.segm_dict = dict()
-        #xml preprocessing
-        self.xml_tool = XML_Tool(filename, 'text.xml')
         #base class init
-        XMLCorpusView.__init__(self, self.xml_tool.build_preprocessed_file(), self.tagspec)
+        StreamingXMLCorpusView.__init__(self, os.path.join(filename, 'text.xml'), self.tagspec)
 
     def handle_query(self):
-        try:
-            self._open()
-            x = self.read_block(self._stream)
-            self.close()
-            self.xml_tool.remove_preprocessed_file()
-            return x
-        except Exception:
-            self.xml_tool.remove_preprocessed_file()
-            raise Exception
+        self._open()
+        x = self.read_block(self._stream)
+        self.close()
+        return x
 
     def read_block(self, stream, tagspec=None, elt_handler=None):
         """
@@ -349,7 +352,7 @@ class NKJPCorpus_Text_View(XMLCorpusView):
         """
         txt = []
         while True:
-            segm = XMLCorpusView.read_block(self, stream)
+            segm = StreamingXMLCorpusView.read_block(self, stream)
             if len(segm) == 0:
                 break
             for part in segm:
@@ -369,7 +372,7 @@ class NKJPCorpus_Text_View(XMLCorpusView):
         return elt.text
 
 
-class NKJPCorpus_Morph_View(XMLCorpusView):
+class NKJPCorpus_Morph_View(StreamingXMLCorpusView):
     """
     A stream backed corpus view specialized for use with
     ann_morphosyntax.xml files in NKJP corpus.
@@ -378,26 +381,21 @@ class NKJPCorpus_Morph_View(XMLCorpusView):
     def __init__(self, filename, **kwargs):
         self.tags = kwargs.pop('tags', None)
         self.tagspec = '.*/seg/fs'
-        self.xml_tool = XML_Tool(filename, 'ann_morphosyntax.xml')
-        XMLCorpusView.__init__(self, self.xml_tool.build_preprocessed_file(), self.tagspec)
+        StreamingXMLCorpusView.__init__(self, os.path.join(filename, 'ann_morphosyntax.xml'),
+                                        self.tagspec)
 
     def handle_query(self):
-        try:
-            self._open()
-            words = []
-            while True:
-                segm = XMLCorpusView.read_block(self, self._stream)
-                if len(segm) == 0:
-                    break
-                for part in segm:
-                    if part is not None:
-                        words.append(part)
-            self.close()
-            self.xml_tool.remove_preprocessed_file()
-            return words
-        except Exception:
-            self.xml_tool.remove_preprocessed_file()
-            raise Exception
+        self._open()
+        words = []
+        while True:
+            segm = StreamingXMLCorpusView.read_block(self, self._stream)
+            if len(segm) == 0:
+                break
+            for part in segm:
+                if part is not None:
+                    words.append(part)
+        self.close()
+        return words
 
     def handle_elt(self, elt, context):
         word = ''
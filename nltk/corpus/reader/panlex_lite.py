@@ -9,12 +9,23 @@
 CorpusReader for PanLex Lite, a stripped down version of PanLex distributed
 as an SQLite database. See the README.txt in the panlex_lite corpus directory
 for more information on PanLex Lite.
+
+The reader can be shared between threads: each query runs on a connection
+checked out of a small pool, so the number of open connections is bounded
+however many threads use the reader.  Lists of expressions can be looked up in a single
+query with ``meanings_many()`` and ``translations_many()``.
 """
 
 import os
 import sqlite3
+import threading
 
 from nltk.corpus.reader.api import CorpusReader
+from nltk.util import LRUCache
+
+# The maximum number of expressions looked up by one batch query, which keeps
+# the number of query parameters below SQLite's limit.
+_BATCH_SIZE = 500
 
 class PanLexLiteCorpusReader(CorpusReader):
     MEANING_Q = """
@@ -27,6 +38,16 @@ class PanLexLiteCorpusReader(CorpusReader):
         ORDER BY dnx2.uq DESC
     """
 
+    MEANINGS_Q = """
+        SELECT ex.tt, dnx2.mn, dnx2.uq, dnx2.ap, dnx2.ui, ex2.tt, ex2.lv
+        FROM dnx
+        JOIN ex ON (ex.ex = dnx.ex)
+        JOIN dnx dnx2 ON (dnx2.mn = dnx.mn)
+        JOIN ex ex2 ON (ex2.ex = dnx2.ex)
+        WHERE dnx.ex != dnx2.ex AND ex.tt IN (%s) AND ex.lv = ?
+        ORDER BY ex.tt, dnx2.uq DESC
+    """
+
     TRANSLATION_Q = """
         SELECT s.tt, sum(s.uq) AS trq FROM (
             SELECT ex2.tt, max(dnx.uq) AS uq
@@ -41,16 +62,103 @@ class PanLexLiteCorpusReader(CorpusReader):
         ORDER BY trq DESC, s.tt
     """
 
-    def __init__(self, root):
-        self._c = sqlite3.connect(os.path.join(root, 'db.sqlite')).cursor()
+    TRANSLATIONS_Q = """
+        SELECT s.src, s.tt, sum(s.uq) AS trq FROM (
+            SELECT ex.tt AS src, ex2.tt, max(dnx.uq) AS uq
+            FROM dnx
+            JOIN ex ON (ex.ex = dnx.ex)
+            JOIN dnx dnx2 ON (dnx2.mn = dnx.mn)
+            JOIN ex ex2 ON (ex2.ex = dnx2.ex)
+            WHERE dnx.ex != dnx2.ex AND ex.lv = ? AND ex.tt IN (%s) AND ex2.lv = ?
+            GROUP BY ex.tt, ex2.tt, dnx.ui
+        ) s
+        GROUP BY s.src, s.tt
+        ORDER BY s.src, trq DESC, s.tt
+    """
+
+    def __init__(self, root, cache_size=0, pool_size=4):
+        """
+        :param root: the directory containing ``db.sqlite``.
+        :param cache_size: the number of ``meanings()`` and ``translations()``
+            results to remember, keyed by expression and language varieties.
+            If 0 (the default), nothing is cached; if None, the cache is
+            unbounded.
+        :param pool_size: the maximum number of database connections that
+            are open at once.  Queries from more threads than this wait for
+            a connection to be returned to the pool.
+        """
+        self._db_path = os.path.join(root, 'db.sqlite')
+
+        # The connections are opened when they are first needed, and are
+        # not tied to a thread: a query checks an idle connection out of
+        # the pool, and returns it when its rows have been fetched.
+        self._pool_size = pool_size
+        self._connections = set()
+        self._idle = []
+        self._available = threading.Condition(threading.Lock())
+
+        self._cache = LRUCache(cache_size)
 
         self._uid_lv = {}
         self._lv_uid = {}
 
-        for row in self._c.execute('SELECT uid, lv FROM lv'):
+        for row in self._execute('SELECT uid, lv FROM lv'):
             self._uid_lv[row[0]] = row[1]
             self._lv_uid[row[1]] = row[0]
 
+    def _execute(self, query, params=()):
+        """
+        Run a query on a connection from the pool.
+
+        :return: all the rows of the result.
+        :rtype: list(tuple)
+        """
+        connection = self._checkout()
+        try:
+            return connection.execute(query, params).fetchall()
+        finally:
+            self._checkin(connection)
+
+    def _checkout(self):
+        with self._available:
+            while not self._idle and len(self._connections) >= self._pool_size:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+            connection = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._connections.add(connection)
+            return connection
+
+    def _checkin(self, connection):
+        with self._available:
+            if connection in self._connections:
+                self._idle.append(connection)
+                self._available.notify()
+                return
+        # The pool was closed while the connection was in use.
+        connection.close()
+
+    def close(self):
+        """
+        Close all the database connections.  Connections that are running a
+        query are closed when the query finishes.  The reader opens new
+        connections if it is used again.
+        """
+        with self._available:
+            idle, self._idle = self._idle, []
+            self._connections = set()
+            self._available.notify_all()
+        for connection in idle:
+            connection.close()
+
+    def cache_info(self):
+        """
+        :return: the hits, misses, maximum size and current size of the
+            result cache.
+        :rtype: CacheInfo
+        """
+        return self._cache.info()
+
     def language_varieties(self, lc=None):
         """
         Return a list of PanLex language varieties.
@@ -64,9 +172,9 @@ class PanLexLiteCorpusReader(CorpusReader):
         """
 
         if lc == None:
-            return self._c.execute('SELECT uid, tt FROM lv ORDER BY uid').fetchall()
+            return self._execute('SELECT uid, tt FROM lv ORDER BY uid')
         else:
-            return self._c.execute('SELECT uid, tt FROM lv WHERE lc = ? ORDER BY uid', (lc,)).fetchall()
+            return self._execute('SELECT uid, tt FROM lv WHERE lc = ? ORDER BY uid', (lc,))
 
     def meanings(self, expr_uid, expr_tt):
         """
@@ -79,23 +187,66 @@ class PanLexLiteCorpusReader(CorpusReader):
         :rtype: list(Meaning)
         """
 
-        expr_lv = self._uid_lv[expr_uid]
+        key = ('meanings', expr_uid, expr_tt)
+        result = self._cache.get(key)
+        if result is None:
+            expr_lv = self._uid_lv[expr_uid]
+            rows = self._execute(self.MEANING_Q, (expr_tt, expr_lv))
+            result = self._meanings_from_rows(expr_uid, expr_tt, rows)
+            self._cache[key] = result
+        return list(result)
 
+    def _meanings_from_rows(self, expr_uid, expr_tt, rows):
         mn_info = {}
+        mn_order = []
 
-        for i in self._c.execute(self.MEANING_Q, (expr_tt, expr_lv)):
+        for i in rows:
             mn = i[0]
             uid = self._lv_uid[i[5]]
 
             if not mn in mn_info:
                 mn_info[mn] = { 'uq': i[1], 'ap': i[2], 'ui': i[3], 'ex': { expr_uid: [expr_tt] } }
+                mn_order.append(mn)
 
             if not uid in mn_info[mn]['ex']:
                 mn_info[mn]['ex'][uid] = []
 
             mn_info[mn]['ex'][uid].append(i[4])
 
-        return [ Meaning(mn, mn_info[mn]) for mn in mn_info ]
+        return [ Meaning(mn, mn_info[mn]) for mn in mn_order ]
+
+    def meanings_many(self, expr_uid, expr_tts):
+        """
+        Return the meanings of several expressions of one language variety,
+        looked up with one query for each batch of expressions.
+
+        :param expr_uid: the expressions' language variety, as a
+            seven-character uniform identifier.
+        :param expr_tts: the expressions' texts.
+        :return: a dictionary mapping each expression's text to a list of
+            Meaning objects, as returned by ``meanings()``.
+        :rtype: dict
+        """
+        expr_lv = self._uid_lv[expr_uid]
+        results = {}
+        missing = []
+        for tt in expr_tts:
+            result = self._cache.get(('meanings', expr_uid, tt))
+            if result is None:
+                missing.append(tt)
+            else:
+                results[tt] = list(result)
+
+        for batch in self._batches(missing):
+            rows = {}
+            query = self.MEANINGS_Q % ', '.join('?' * len(batch))
+            for row in self._execute(query, batch + [expr_lv]):
+                rows.setdefault(row[0], []).append(row[1:])
+            for tt in batch:
+                result = self._meanings_from_rows(expr_uid, tt, rows.get(tt, []))
+                self._cache[('meanings', expr_uid, tt)] = result
+                results[tt] = list(result)
+        return results
 
     def translations(self, from_uid, from_tt, to_uid):
         """
@@ -112,10 +263,58 @@ class PanLexLiteCorpusReader(CorpusReader):
         :rtype: list(tuple)
         """
 
+        key = ('translations', from_uid, from_tt, to_uid)
+        result = self._cache.get(key)
+        if result is None:
+            from_lv = self._uid_lv[from_uid]
+            to_lv = self._uid_lv[to_uid]
+
+            result = self._execute(self.TRANSLATION_Q, (from_lv, from_tt, to_lv))
+            self._cache[key] = result
+        return list(result)
+
+    def translations_many(self, from_uid, from_tts, to_uid):
+        """
+        Return the translations of several expressions of one language variety
+            into a single language variety, looked up with one query for each
+            batch of expressions.
+
+        :param from_uid: the source expressions' language variety, as a
+            seven-character uniform identifier.
+        :param from_tts: the source expressions' texts.
+        :param to_uid: the target language variety, as a seven-character
+            uniform identifier.
+        :return: a dictionary mapping each source expression's text to a list of
+            translation tuples, as returned by ``translations()``.
+        :rtype: dict
+        """
         from_lv = self._uid_lv[from_uid]
         to_lv = self._uid_lv[to_uid]
+        results = {}
+        missing = []
+        for tt in from_tts:
+            result = self._cache.get(('translations', from_uid, tt, to_uid))
+            if result is None:
+                missing.append(tt)
+            else:
+                results[tt] = list(result)
+
+        for batch in self._batches(missing):
+            rows = {}
+            query = self.TRANSLATIONS_Q % ', '.join('?' * len(batch))
+            for row in self._execute(query, [from_lv] + batch + [to_lv]):
+                rows.setdefault(row[0], []).append(row[1:])
+            for tt in batch:
+                result = rows.get(tt, [])
+                self._cache[('translations', from_uid, tt, to_uid)] = result
+                results[tt] = list(result)
+        return results
 
-        return self._c.execute(self.TRANSLATION_Q, (from_lv, from_tt, to_lv)).fetchall()
+    @staticmethod
+    def _batches(tts):
+        tts = sorted(set(tts))
+        for start in range(0, len(tts), _BATCH_SIZE):
+            yield tts[start:start+_BATCH_SIZE]
 
 class Meaning(dict):
     """
@@ -8,7 +8,9 @@
 
 import os
 import bisect
+import mmap
 import re
+import struct
 import tempfile
 from functools import reduce
 try:
@@ -20,7 +22,7 @@ except ImportError:
 try: from xml.etree import cElementTree as ElementTree
 except ImportError: from xml.etree import ElementTree
 
-from nltk.compat import string_types, text_type
+from nltk.compat import string_types, text_type, xrange
 from nltk.tokenize import wordpunct_tokenize
 from nltk.internals import slice_bounds
 from nltk.data import PathPointer, FileSystemPathPointer, ZipFilePathPointer
@@ -775,6 +777,144 @@ def _path_from(parent, child):
         assert os.path.split(child)[0] != child
     return path
 
+######################################################################
+#{ Compiled Lookup Tables
+######################################################################
+
+# Corpus readers can save their lookup tables in compiled index files,
+# which are memory-mapped and searched in place instead of being parsed
+# into dictionaries.  An index file starts with a header:
+#
+#   magic (8 bytes), number of sections (uint32), and for each section
+#   its name (8 bytes, NUL padded), start and length (uint32, uint32).
+#
+# Lookup tables are stored as a count n (uint32), n+1 key offsets and
+# n+1 value offsets (uint32), followed by the concatenated UTF-8 keys
+# (in sorted order) and the concatenated values.  All integers are
+# little-endian.
+
+def write_index_sections(filename, magic, sections):
+    """
+    Write a compiled index file, with the given magic string and
+    ``(name, bytes)`` sections, to ``filename``.
+    """
+    header_size = len(magic) + 4 + 16*len(sections)
+    header = [magic, struct.pack('<I', len(sections))]
+    start = header_size
+    for name, data in sections:
+        header.append(struct.pack('<8sII', name, start, len(data)))
+        start += len(data)
+    with open(filename, 'wb') as outfile:
+        outfile.write(b''.join(header))
+        for name, data in sections:
+            outfile.write(data)
+
+def read_index_sections(filename, magic):
+    """
+    Memory-map a compiled index file, and return the map and a
+    dictionary from section names to ``(start, length)`` pairs, or
+    ``(None, None)`` if the file does not start with ``magic``.
+    """
+    with open(filename, 'rb') as infile:
+        buf = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+    if buf[:len(magic)] != magic:
+        return None, None
+    n_sections, = struct.unpack_from('<I', buf, len(magic))
+    sections = {}
+    for i in range(n_sections):
+        name, start, length = struct.unpack_from(
+            '<8sII', buf, len(magic) + 4 + 16*i)
+        sections[name.rstrip(b'\0').decode('ascii')] = (start, length)
+    return buf, sections
+
+def pack_lookup_table(items):
+    """
+    Return the bytes of a lookup table holding the given ``(key,
+    value)`` pairs, where each key is a UTF-8 encoded string and each
+    value is a byte string.
+    """
+    items = sorted(items)
+    key_offsets, value_offsets = [0], [0]
+    for key, value in items:
+        key_offsets.append(key_offsets[-1] + len(key))
+        value_offsets.append(value_offsets[-1] + len(value))
+    n = len(items)
+    return b''.join([struct.pack('<I', n),
+                     struct.pack('<%dI' % (n+1), *key_offsets),
+                     struct.pack('<%dI' % (n+1), *value_offsets)] +
+                    [key for key, _ in items] +
+                    [value for _, value in items])
+
+class CompiledLookupTable(object):
+    """
+    A read-only mapping over a lookup table written by
+    ``pack_lookup_table()``.  ``buf`` is any buffer holding the table at
+    ``start``, usually a memory-mapped index file.  Keys are found by
+    binary search, and values are decoded on demand with ``decode``.
+    """
+    def __init__(self, buf, start, decode):
+        self._buf = buf
+        self._decode = decode
+        self._n, = struct.unpack_from('<I', buf, start)
+        self._key_offsets = start + 4
+        self._value_offsets = self._key_offsets + 4*(self._n+1)
+        self._keys_start = self._value_offsets + 4*(self._n+1)
+        end_of_keys, = struct.unpack_from('<I', buf,
+                                          self._value_offsets - 4)
+        self._values_start = self._keys_start + end_of_keys
+
+    def _slice(self, table, data_start, i):
+        start, end = struct.unpack_from('<II', self._buf, table + 4*i)
+        return self._buf[data_start+start:data_start+end]
+
+    def _key(self, i):
+        return self._slice(self._key_offsets, self._keys_start, i)
+
+    def _find(self, key):
+        key = key.encode('utf8')
+        lo, hi = 0, self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._n and self._key(lo) == key:
+            return lo
+        return -1
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def __getitem__(self, key):
+        i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        return self._decode(self._slice(self._value_offsets,
+                                        self._values_start, i))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __len__(self):
+        return self._n
+
+    def __iter__(self):
+        for i in xrange(self._n):
+            yield self._key(i).decode('utf8')
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return [(self._key(i).decode('utf8'),
+                 self._decode(self._slice(self._value_offsets,
+                                          self._values_start, i)))
+                for i in xrange(self._n)]
+
 ######################################################################
 #{ Paragraph structure in Treebank files
 ######################################################################
@@ -32,13 +32,19 @@ http://compling.hss.ntu.edu.sg/omw/
 from __future__ import print_function, unicode_literals
 
 import math
+import os
 import re
+import struct
+import threading
 from itertools import islice, chain
 from operator import itemgetter, attrgetter
 from collections import defaultdict, deque
 
 from nltk.corpus.reader import CorpusReader
-from nltk.util import binary_search_file as _binary_search_file
+from nltk.corpus.reader.util import (CompiledLookupTable, pack_lookup_table,
+                                     read_index_sections, write_index_sections)
+from nltk.util import binary_search_file as _binary_search_file, LRUCache
+from nltk.data import ZipFilePathPointer
 from nltk.probability import FreqDist
 from nltk.compat import (iteritems, python_2_unicode_compatible,
                          total_ordering, xrange)
@@ -51,6 +57,8 @@ from nltk.compat import (iteritems, python_2_unicode_compatible,
 ##   - WordNetError
 ##   - Lemma
 ##   - Synset
+## - Ancestor Index
+## - Compiled WordNet Index
 ## - WordNet Corpus Reader
 ## - WordNet Information Content Corpus Reader
 ## - Similarity Metrics
@@ -367,8 +375,7 @@ class Synset(_WordNetObject):
     __slots__ = ['_pos', '_offset', '_name', '_frame_ids',
                  '_lemmas', '_lemma_names',
                  '_definition', '_examples', '_lexname',
-                 '_pointers', '_lemma_pointers', '_max_depth',
-                 '_min_depth']
+                 '_pointers', '_lemma_pointers']
 
     def __init__(self, wordnet_corpus_reader):
         self._wordnet_corpus_reader = wordnet_corpus_reader
@@ -384,7 +391,6 @@ class Synset(_WordNetObject):
         self._definition = None
         self._examples = []
         self._lexname = None # lexicographer name
-        self._all_hypernyms = None
 
         self._pointers = defaultdict(set)
         self._lemma_pointers = defaultdict(set)
@@ -427,10 +433,7 @@ class Synset(_WordNetObject):
             self._wordnet_corpus_reader._load_lang_data(lang)
 
             i = self._wordnet_corpus_reader.ss2of(self)
-            if i in self._wordnet_corpus_reader._lang_data[lang][0]:
-                return self._wordnet_corpus_reader._lang_data[lang][0][i]
-            else:
-                return []
+            return list(self._wordnet_corpus_reader._lang_data[lang][0].get(i, []))
                 
     def lemmas(self, lang='eng'):
         '''Return all the lemma objects associated with the synset'''
@@ -477,28 +480,18 @@ class Synset(_WordNetObject):
         :return: The length of the longest hypernym path from this
         synset to the root.
         """
-
-        if "_max_depth" not in self.__dict__:
-            hypernyms = self.hypernyms() + self.instance_hypernyms()
-            if not hypernyms:
-                self._max_depth = 0
-            else:
-                self._max_depth = 1 + max(h.max_depth() for h in hypernyms)
-        return self._max_depth
+        if self._name == '*ROOT*':
+            return 0
+        return self._ancestor_index().max_depth(self._offset)
 
     def min_depth(self):
         """
         :return: The length of the shortest hypernym path from this
         synset to the root.
         """
-
-        if "_min_depth" not in self.__dict__:
-            hypernyms = self.hypernyms() + self.instance_hypernyms()
-            if not hypernyms:
-                self._min_depth = 0
-            else:
-                self._min_depth = 1 + min(h.min_depth() for h in hypernyms)
-        return self._min_depth
+        if self._name == '*ROOT*':
+            return 0
+        return self._ancestor_index().min_depth(self._offset)
 
     def closure(self, rel, depth=-1):
         """Return the transitive closure of source under the rel
@@ -554,15 +547,34 @@ class Synset(_WordNetObject):
         :param other: other input synset.
         :return: The synsets that are hypernyms of both synsets.
         """
-        if not self._all_hypernyms:
-            self._all_hypernyms = set(self_synset
-                                       for self_synsets in self._iter_hypernym_lists()
-                                       for self_synset in self_synsets)
-        if not other._all_hypernyms:
-            other._all_hypernyms = set(other_synset
-                                        for other_synsets in other._iter_hypernym_lists()
-                                        for other_synset in other_synsets)
-        return list(self._all_hypernyms.intersection(other._all_hypernyms))
+        if not self._shares_taxonomy(other):
+            # The simulated root is its own only hypernym.
+            if self._name == other._name == '*ROOT*':
+                return [self]
+            return []
+        index = self._ancestor_index()
+        return [index.synset(offset)
+                for offset in self._common_hypernym_offsets(other)]
+
+    def _ancestor_index(self):
+        return self._wordnet_corpus_reader._ancestor_index(self._pos)
+
+    def _shares_taxonomy(self, other):
+        """
+        Return True if this synset and ``other`` are real synsets whose
+        hypernyms are recorded in the same ancestor index.
+        """
+        if self._name == '*ROOT*' or other._name == '*ROOT*':
+            return False
+        return (self._pos == other._pos or
+                (self._pos in (ADJ, ADJ_SAT) and other._pos in (ADJ, ADJ_SAT)))
+
+    def _common_hypernym_offsets(self, other):
+        if not self._shares_taxonomy(other):
+            return set()
+        distances1 = self._ancestor_index().distances(self._offset)
+        distances2 = other._ancestor_index().distances(other._offset)
+        return set(distances1).intersection(distances2)
 
     def lowest_common_hypernyms(self, other, simulate_root=False, use_min_depth=False):
         """
@@ -600,24 +612,28 @@ class Synset(_WordNetObject):
             (eg: 'chef.n.01', 'fireman.n.01') but is retained for backwards compatibility
         :return: The synsets that are the lowest common hypernyms of both synsets
         """
-        synsets = self.common_hypernyms(other)
-        if simulate_root:
-            fake_synset = Synset(None)
-            fake_synset._name = '*ROOT*'
-            fake_synset.hypernyms = lambda: []
-            fake_synset.instance_hypernyms = lambda: []
-            synsets.append(fake_synset)
-
-        try:
-            if use_min_depth:
-                max_depth = max(s.min_depth() for s in synsets)
-                unsorted_lch = [s for s in synsets if s.min_depth() == max_depth]
-            else:
-                max_depth = max(s.max_depth() for s in synsets)
-                unsorted_lch = [s for s in synsets if s.max_depth() == max_depth]
+        if not self._shares_taxonomy(other):
+            unsorted_lch = self.common_hypernyms(other)
+            if simulate_root:
+                unsorted_lch.append(_fake_root())
             return sorted(unsorted_lch)
-        except ValueError:
-            return []
+
+        index = self._ancestor_index()
+        offsets = self._common_hypernym_offsets(other)
+        if use_min_depth:
+            depth = index.min_depth
+        else:
+            depth = index.max_depth
+
+        # The simulated root has depth 0, like the real roots.
+        unsorted_lch = []
+        max_depth = max(depth(offset) for offset in offsets) if offsets else 0
+        if offsets:
+            unsorted_lch = [index.synset(offset) for offset in offsets
+                            if depth(offset) == max_depth]
+        if simulate_root and max_depth == 0:
+            unsorted_lch.append(_fake_root())
+        return sorted(unsorted_lch)
 
     def hypernym_distances(self, distance=0, simulate_root=False):
         """
@@ -631,12 +647,13 @@ class Synset(_WordNetObject):
         :return: A set of ``(Synset, int)`` tuples where each ``Synset`` is
            a hypernym of the first ``Synset``.
         """
-        distances = set([(self, distance)])
-        for hypernym in self._hypernyms() + self._instance_hypernyms():
-            distances |= hypernym.hypernym_distances(distance+1, simulate_root=False)
+        if self._name == '*ROOT*':
+            return set([(self, distance)])
+        index = self._ancestor_index()
+        distances = set((index.synset(offset), distance + d) for offset, d
+                        in index.path_distances(self._offset))
         if simulate_root:
-            fake_synset = Synset(None)
-            fake_synset._name = '*ROOT*'
+            fake_synset = _fake_root()
             fake_synset_distance = max(distances, key=itemgetter(1))[1]
             distances.add((fake_synset, fake_synset_distance+1))
         return distances
@@ -645,26 +662,26 @@ class Synset(_WordNetObject):
         if self._name == '*ROOT*':
             return {self: 0}
 
-        queue = deque([(self, 0)])
-        path = {}
-
-        while queue:
-            s, depth = queue.popleft()
-            if s in path:
-                continue
-            path[s] = depth
-
-            depth += 1
-            queue.extend((hyp, depth) for hyp in s._hypernyms())
-            queue.extend((hyp, depth) for hyp in s._instance_hypernyms())
+        index = self._ancestor_index()
+        path = dict((index.synset(offset), depth) for offset, depth
+                    in iteritems(index.distances(self._offset)))
 
         if simulate_root:
-            fake_synset = Synset(None)
-            fake_synset._name = '*ROOT*'
+            fake_synset = _fake_root()
             path[fake_synset] = max(path.values()) + 1
 
         return path
 
+    def _root_distance(self):
+        """
+        :return: The distance from this synset to the simulated root,
+        along the shortest hypernym paths.
+        """
+        if self._name == '*ROOT*':
+            return 0
+        distances = self._ancestor_index().distances(self._offset)
+        return max(distances.values()) + 1
+
     def shortest_path_distance(self, other, simulate_root=False):
         """
         Returns the distance of the shortest path linking the two synsets (if
@@ -683,17 +700,24 @@ class Synset(_WordNetObject):
         if self == other:
             return 0
 
-        dist_dict1 = self._shortest_hypernym_paths(simulate_root)
-        dist_dict2 = other._shortest_hypernym_paths(simulate_root)
+        inf = float('inf')
+        path_distance = inf
 
         # For each ancestor synset common to both subject synsets, find the
         # connecting path length. Return the shortest of these.
-
-        inf = float('inf')
-        path_distance = inf
-        for synset, d1 in iteritems(dist_dict1):
-            d2 = dist_dict2.get(synset, inf)
-            path_distance = min(path_distance, d1 + d2)
+        if self._shares_taxonomy(other):
+            dist_dict1 = self._ancestor_index().distances(self._offset)
+            dist_dict2 = other._ancestor_index().distances(other._offset)
+            if len(dist_dict1) > len(dist_dict2):
+                dist_dict1, dist_dict2 = dist_dict2, dist_dict1
+            for offset, d1 in iteritems(dist_dict1):
+                d2 = dist_dict2.get(offset, inf)
+                path_distance = min(path_distance, d1 + d2)
+
+        # The simulated root is a common ancestor of all synsets.
+        if simulate_root:
+            path_distance = min(path_distance,
+                                self._root_distance() + other._root_distance())
 
         return None if math.isinf(path_distance) else path_distance
 
@@ -982,6 +1006,183 @@ class Synset(_WordNetObject):
         return r
 
 
+######################################################################
+## Ancestor Index
+######################################################################
+
+def _fake_root():
+    """
+    Return a synset that is used to simulate a root node connecting
+    all the taxonomies.
+    """
+    fake_synset = Synset(None)
+    fake_synset._name = '*ROOT*'
+    fake_synset.hypernyms = lambda: []
+    fake_synset.instance_hypernyms = lambda: []
+    return fake_synset
+
+class _AncestorIndex(object):
+    """
+    An index of the hypernym ancestors of the synsets of one part of
+    speech, keyed by synset offset, which is used by the similarity
+    metrics.  For each synset, it records the shortest distance to each
+    of its ancestors (following both hypernyms and instance hypernyms),
+    the distances along all hypernym paths, and the minimum and maximum
+    depth of the synset.  Each entry is computed once, the first time
+    it is needed, and shared by all later comparisons.
+    """
+    def __init__(self, wordnet_corpus_reader, pos):
+        self._get_synset = wordnet_corpus_reader._synset_from_pos_and_offset
+        self._pos = pos
+        self._parents = {}
+        self._distances = {}
+        self._path_distances = {}
+        self._hypernym_counts = {}
+        self._max_depth = {}
+        self._min_depth = {}
+
+    def synset(self, offset):
+        return self._get_synset(self._pos, offset)
+
+    def parents(self, offset):
+        """
+        :return: The offsets of the hypernyms and instance hypernyms of
+        the synset at ``offset``.
+        """
+        parents = self._parents.get(offset)
+        if parents is None:
+            pointers = self.synset(offset)._pointers
+            parents = tuple(set(hyp_offset for symbol in ('@', '@i')
+                                for _, hyp_offset in pointers.get(symbol, ())))
+            self._parents[offset] = parents
+        return parents
+
+    def distances(self, offset):
+        """
+        :return: A dictionary mapping the offsets of the synset at
+        ``offset`` and of all its ancestors to their shortest distance
+        from that synset.
+        """
+        distances = self._distances.get(offset)
+        if distances is None:
+            distances = {}
+            queue = deque([(offset, 0)])
+            while queue:
+                ancestor, depth = queue.popleft()
+                if ancestor in distances:
+                    continue
+                distances[ancestor] = depth
+                depth += 1
+                queue.extend((parent, depth) for parent
+                             in self.parents(ancestor))
+            self._distances[offset] = distances
+        return distances
+
+    def path_distances(self, offset):
+        """
+        :return: A set of ``(offset, distance)`` pairs, giving the
+        distance of each ancestor of the synset at ``offset`` along
+        every hypernym path (so an ancestor may occur more than once).
+        """
+        distances = self._path_distances.get(offset)
+        if distances is None:
+            distances = set([(offset, 0)])
+            for parent in self.parents(offset):
+                distances.update((ancestor, distance + 1) for ancestor, distance
+                                 in self.path_distances(parent))
+            distances = frozenset(distances)
+            self._path_distances[offset] = distances
+        return distances
+
+    def hypernym_counts(self, offset):
+        """
+        :return: A tuple of ``(offset, count)`` pairs for the synset at
+        ``offset`` and its ancestors, counting each ancestor once for
+        every time it occurs in ``Synset._iter_hypernym_lists()``.  This
+        is how often ``WordNetCorpusReader.ic()`` adds the synset's
+        weight to the ancestor.
+        """
+        counts = self._hypernym_counts.get(offset)
+        if counts is None:
+            counts = defaultdict(int)
+            todo = [offset]
+            seen = set()
+            while todo:
+                seen.update(todo)
+                for ancestor in todo:
+                    counts[ancestor] += 1
+                todo = [hyp_offset
+                        for ancestor in todo
+                        for symbol in ('@', '@i')
+                        for _, hyp_offset
+                        in self.synset(ancestor)._pointers[symbol]
+                        if hyp_offset not in seen]
+            counts = tuple(iteritems(counts))
+            self._hypernym_counts[offset] = counts
+        return counts
+
+    def max_depth(self, offset):
+        depth = self._max_depth.get(offset)
+        if depth is None:
+            parents = self.parents(offset)
+            depth = 1 + max(self.max_depth(p) for p in parents) if parents else 0
+            self._max_depth[offset] = depth
+        return depth
+
+    def min_depth(self, offset):
+        depth = self._min_depth.get(offset)
+        if depth is None:
+            parents = self.parents(offset)
+            depth = 1 + min(self.min_depth(p) for p in parents) if parents else 0
+            self._min_depth[offset] = depth
+        return depth
+
+
+######################################################################
+## Compiled WordNet Index
+######################################################################
+
+# A compiled index is a file of sections (see ``write_index_sections()``
+# in nltk.corpus.reader.util) holding the lemma index, the exception
+# lists, the lexicographer file names and the offsets of the synset
+# lines of a WordNet database, so that it can be memory-mapped and
+# searched in place.
+
+_INDEX_MAGIC = b'NLTKWNI1'
+_LANG_INDEX_MAGIC = b'NLTKOMW1'
+
+def _pack_offsets(pos_offsets):
+    return b''.join(pos.encode('ascii') + struct.pack('<H', len(offsets)) +
+                    struct.pack('<%dI' % len(offsets), *offsets)
+                    for pos, offsets in pos_offsets)
+
+def _unpack_offsets(value):
+    result = {}
+    i = 0
+    while i < len(value):
+        pos = value[i:i+1].decode('ascii')
+        n, = struct.unpack_from('<H', value, i+1)
+        result[pos] = list(struct.unpack_from('<%dI' % n, value, i+3))
+        i += 3 + 4*n
+    if ADJ in result:
+        result[ADJ_SAT] = result[ADJ]
+    return result
+
+def _unpack_words(value):
+    return value.decode('utf8').split(' ')
+
+def _source_stamp(pointer):
+    """
+    Return the modification time and size of the file identified by a
+    path pointer, as recorded in the 'sources' section of an index.
+    """
+    if isinstance(pointer, ZipFilePathPointer):
+        mtime = '%04d%02d%02d%02d%02d%02d' % (
+            pointer.zipfile.getinfo(pointer.entry).date_time)
+    else:
+        mtime = repr(os.stat(pointer.path).st_mtime)
+    return '%s:%d' % (mtime, pointer.file_size())
+
 ######################################################################
 ## WordNet Corpus Reader
 ######################################################################
@@ -1013,10 +1214,31 @@ class WordNetCorpusReader(CorpusReader):
               'data.adj', 'data.adv', 'data.noun', 'data.verb',
               'adj.exc', 'adv.exc', 'noun.exc', 'verb.exc', )
 
-    def __init__(self, root, omw_reader):
+    def __init__(self, root, omw_reader, synset_cache_size=None,
+                 index_file=None, morphy_cache_size=100000,
+                 lang_index_dir=None):
         """
         Construct a new wordnet corpus reader, with the given root
         directory.
+
+        :param synset_cache_size: The maximum number of synsets to keep
+            in memory once they have been read.  If None (the default),
+            every synset that is read stays cached.  Cache statistics
+            are available from ``synset_cache_info()``.
+        :param index_file: The filename of a compiled index, written by
+            ``compile_index()``.  If given, the index is memory-mapped
+            instead of parsing the ``index.*`` and exception files,
+            which makes the reader much faster to construct, and lets
+            processes share the index pages.
+        :param morphy_cache_size: The maximum number of ``(form, pos)``
+            analyses that ``morphy()`` remembers.  If None, the cache is
+            unbounded; if 0, nothing is cached.  Cache statistics are
+            available from ``morphy_cache_info()``.
+        :param lang_index_dir: A directory for compiled indexes of the
+            Open Multilingual Wordnet languages.  If given, the first
+            time a language is used its index is compiled into this
+            directory with ``compile_lang_index()``, and from then on it
+            is memory-mapped instead of reading the language's tab file.
         """
         super(WordNetCorpusReader, self).__init__(root, self._FILES,
                                                   encoding=self._ENCODING)
@@ -1026,24 +1248,48 @@ class WordNetCorpusReader(CorpusReader):
         self._lemma_pos_offset_map = defaultdict(dict)
 
         # A cache so we don't have to reconstuct synsets
-        # Map from pos -> offset -> synset
-        self._synset_offset_cache = defaultdict(dict)
+        # Map from (pos, offset) -> synset
+        self._synset_offset_cache = LRUCache(synset_cache_size)
+
+        # A cache of morphological analyses.
+        # Map from (form, pos) -> tuple of base forms
+        self._morphy_cache = LRUCache(morphy_cache_size)
 
         # A lookup for the maximum depth of each part of speech.  Useful for
         # the lch similarity metric.
         self._max_depth = defaultdict(dict)
 
+        # Indexes of hypernym ancestors and depths, used by the
+        # similarity metrics.  Map from pos -> _AncestorIndex
+        self._ancestor_indexes = {}
+
         # Corpus reader containing omw data.
         self._omw_reader = omw_reader
 
         # A cache to store the wordnet data of multiple languages
+        # Map from lang -> [offset-pos -> lemmas, lemma -> offset-pos list]
         self._lang_data = defaultdict(list)
 
-        self._data_file_map = {}
+        # The directory of compiled language indexes, if any.
+        self._lang_index_dir = lang_index_dir
+
+        # File pointers used for random access lookups, opened
+        # separately by each thread, since lookups move them around.
+        self._thread_files = threading.local()
+
         self._exception_map = {}
         self._lexnames = []
-        self._key_count_file = None
-        self._key_synset_file = None
+
+        # The offsets of the synset lines in each data file, if they
+        # are known from a compiled index.  Map from pos -> offsets
+        self._synset_offsets = {}
+
+        # The compiled index that this reader uses, if any.
+        self._index_file = index_file
+
+        if index_file is not None:
+            self._load_compiled_index(index_file)
+            return
 
         # Load the lexnames
         for i, line in enumerate(self.open('lexnames')):
@@ -1077,19 +1323,92 @@ class WordNetCorpusReader(CorpusReader):
         if lang in self._lang_data.keys():
             return
 
-        f = self._omw_reader.open('{0:}/wn-data-{0:}.tab'.format(lang))
+        # Build the maps before publishing them, so that other threads
+        # never see a partially loaded language.
+        if self._lang_index_dir is not None:
+            lang_data = self._load_lang_index(lang)
+        else:
+            lang_data = self._read_lang_data(lang)
+        self._lang_data[lang] = lang_data
+
+    def _lang_fileid(self, lang):
+        return '{0:}/wn-data-{0:}.tab'.format(lang)
+
+    def _read_lang_data(self, lang):
+        """
+        Read the tab file of a language, and return a list of two
+        dictionaries, mapping from synset offsets (such as
+        ``'02084071-n'``) to lemma names, and from lemma names to
+        synset offsets.
+        """
+        f = self._omw_reader.open(self._lang_fileid(lang))
+
+        lang_data = [defaultdict(list), defaultdict(list)]
 
-        self._lang_data[lang].append(defaultdict(list))
-        self._lang_data[lang].append(defaultdict(list))
-            
         for l in f.readlines():
             l = l.replace('\n', '')
             l = l.replace(' ', '_')
             if l[0] != '#':                
                 word = l.split('\t')
-                self._lang_data[lang][0][word[0]].append(word[2])
-                self._lang_data[lang][1][word[2]].append(word[0])
+                lang_data[0][word[0]].append(word[2])
+                lang_data[1][word[2]].append(word[0])
         f.close()
+        return lang_data
+
+    def _lang_index_sources(self, lang):
+        fileid = self._lang_fileid(lang)
+        return '%s:%s' % (fileid, _source_stamp(self._omw_reader.abspath(fileid)))
+
+    def compile_lang_index(self, lang, filename):
+        """
+        Write a compiled index of an Open Multilingual Wordnet language
+        to ``filename``.  The index holds the maps from synsets to
+        lemma names and from lemma names to synsets, in the binary
+        format used by ``compile_index()``, so that each of them can be
+        memory-mapped and searched in place.  It is used by readers
+        constructed with ``lang_index_dir``.
+        """
+        if lang not in self.langs():
+            raise WordNetError("Language is not supported.")
+        synset_lemmas, lemma_synsets = self._read_lang_data(lang)
+        sections = []
+        for name, table in ((b'synsets', synset_lemmas),
+                            (b'lemmas', lemma_synsets)):
+            items = [(key.encode('utf8'), ' '.join(values).encode('utf8'))
+                     for key, values in iteritems(table)]
+            sections.append((name, pack_lookup_table(items)))
+        sections.append((b'sources',
+                         self._lang_index_sources(lang).encode('utf8')))
+        write_index_sections(filename, _LANG_INDEX_MAGIC, sections)
+
+    def _load_lang_index(self, lang):
+        """
+        Return the memory-mapped lookup tables of a language, compiling
+        its index into ``lang_index_dir`` first if it is missing or out
+        of date.  The pages of each table are only read when it is used.
+        """
+        import os, tempfile
+        filename = os.path.join(self._lang_index_dir, 'omw-%s.idx' % lang)
+        for attempt in range(2):
+            if os.path.exists(filename):
+                buf, sections = read_index_sections(filename, _LANG_INDEX_MAGIC)
+                if buf is not None:
+                    start, length = sections['sources']
+                    sources = buf[start:start+length].decode('utf8')
+                    if sources == self._lang_index_sources(lang):
+                        return [CompiledLookupTable(buf, sections['synsets'][0],
+                                               _unpack_words),
+                                CompiledLookupTable(buf, sections['lemmas'][0],
+                                               _unpack_words)]
+            # Compile to a temporary file, and then move it into place,
+            # so that readers never see a partially written index.
+            fd, tmpname = tempfile.mkstemp(dir=self._lang_index_dir)
+            os.close(fd)
+            self.compile_lang_index(lang, tmpname)
+            if os.path.exists(filename):
+                os.remove(filename)
+            os.rename(tmpname, filename)
+        raise WordNetError('could not load the compiled index %s' % filename)
 
     def langs(self):
         ''' return a list of languages supported by Multilingual Wordnet '''
@@ -1157,6 +1476,100 @@ class WordNetCorpusReader(CorpusReader):
                 self._exception_map[pos][terms[0]] = terms[1:]
         self._exception_map[ADJ_SAT] = self._exception_map[ADJ]
 
+    def compile_index(self, filename):
+        """
+        Write a compiled index for this WordNet database to
+        ``filename``.  The compiled index contains the lemma index,
+        the exception lists, the lexicographer file names and the
+        offsets of all synset lines, in a binary format that can be
+        memory-mapped by passing ``index_file=filename`` to the
+        ``WordNetCorpusReader`` constructor.  The index records the
+        sizes of the files it was built from, and is rejected if they
+        change.
+        """
+        sections = []
+
+        lemma_items = []
+        for lemma in self._lemma_pos_offset_map:
+            pos_offsets = sorted(
+                (pos, offsets) for pos, offsets
+                in self._lemma_pos_offset_map[lemma].items()
+                if pos != ADJ_SAT)
+            lemma_items.append((lemma.encode('utf8'),
+                                _pack_offsets(pos_offsets)))
+        sections.append((b'lemmas', pack_lookup_table(lemma_items)))
+
+        for pos in self._FILEMAP:
+            exceptions = self._exception_map[pos]
+            exc_items = [(form.encode('utf8'),
+                          ' '.join(exceptions[form]).encode('utf8'))
+                         for form in exceptions]
+            sections.append((('exc.' + pos).encode('ascii'),
+                             pack_lookup_table(exc_items)))
+
+        sections.append((b'lexnames',
+                         ' '.join(self._lexnames).encode('utf8')))
+
+        for pos in self._FILEMAP:
+            data_file = self.open('data.%s' % self._FILEMAP[pos])
+            try:
+                offsets = [offset for offset, line
+                           in self._synset_lines(pos, data_file)]
+            finally:
+                data_file.close()
+            sections.append((('offs.' + pos).encode('ascii'),
+                             struct.pack('<%dI' % len(offsets), *offsets)))
+
+        sections.append((b'sources', self._index_sources().encode('utf8')))
+        write_index_sections(filename, _INDEX_MAGIC, sections)
+
+    def _index_sources(self):
+        """
+        Return a description of the files that a compiled index is
+        built from, used to detect out-of-date indexes.
+        """
+        fileids = ['lexnames']
+        for suffix in sorted(self._FILEMAP.values()):
+            fileids += ['index.%s' % suffix, 'data.%s' % suffix,
+                        '%s.exc' % suffix]
+        return ' '.join('%s:%s' % (fileid, _source_stamp(self.abspath(fileid)))
+                        for fileid in fileids)
+
+    def _load_compiled_index(self, filename):
+        buf, sections = read_index_sections(filename, _INDEX_MAGIC)
+        if buf is None:
+            raise WordNetError('%s is not a compiled WordNet index' %
+                               filename)
+
+        def section_bytes(name):
+            start, length = sections[name]
+            return buf[start:start+length]
+
+        if section_bytes('sources').decode('utf8') != self._index_sources():
+            raise WordNetError('compiled index %s is out of date; rebuild '
+                               'it with compile_index()' % filename)
+
+        self._lemma_pos_offset_map = CompiledLookupTable(
+            buf, sections['lemmas'][0], _unpack_offsets)
+        for pos in self._FILEMAP:
+            self._exception_map[pos] = CompiledLookupTable(
+                buf, sections['exc.' + pos][0], _unpack_words)
+        self._exception_map[ADJ_SAT] = self._exception_map[ADJ]
+        self._lexnames = section_bytes('lexnames').decode('utf8').split(' ')
+        for pos in self._FILEMAP:
+            start, length = sections['offs.' + pos]
+            self._synset_offsets[pos] = struct.unpack_from(
+                '<%dI' % (length // 4), buf, start)
+
+    def _ancestor_index(self, pos):
+        if pos == ADJ_SAT:
+            pos = ADJ
+        index = self._ancestor_indexes.get(pos)
+        if index is None:
+            index = self._ancestor_indexes.setdefault(
+                pos, _AncestorIndex(self, pos))
+        return index
+
     def _compute_max_depth(self, pos, simulate_root):
         """
         Compute the max depth for the given part of speech.  This is
@@ -1204,12 +1617,9 @@ class WordNetCorpusReader(CorpusReader):
         pos_number, lexname_index, lex_id, _, _ = lex_sense.split(':')
         pos = self._pos_names[int(pos_number)]
 
-        # open the key -> synset file if necessary
-        if self._key_synset_file is None:
-            self._key_synset_file = self.open('index.sense')
-
         # Find the synset for the lemma.
-        synset_line = _binary_search_file(self._key_synset_file, key)
+        key_synset_file = self._thread_file('index.sense')
+        synset_line = _binary_search_file(key_synset_file, key)
         if not synset_line:
             raise WordNetError("No synset found for key %r" % key)
         offset = int(synset_line.split()[1])
@@ -1257,6 +1667,17 @@ class WordNetCorpusReader(CorpusReader):
         # Return the synset object.
         return synset
 
+    def _thread_file(self, fileid):
+        """
+        Return an open file pointer for ``fileid`` that is owned by
+        the current thread.  Random access lookups ``seek()`` these
+        file pointers, so they can't be shared between threads.
+        """
+        files = self._thread_files.__dict__
+        if fileid not in files:
+            files[fileid] = self.open(fileid)
+        return files[fileid]
+
     def _data_file(self, pos):
         """
         Return an open file pointer for the data file for the given
@@ -1264,24 +1685,29 @@ class WordNetCorpusReader(CorpusReader):
         """
         if pos == ADJ_SAT:
             pos = ADJ
-        if self._data_file_map.get(pos) is None:
-            fileid = 'data.%s' % self._FILEMAP[pos]
-            self._data_file_map[pos] = self.open(fileid)
-        return self._data_file_map[pos]
+        return self._thread_file('data.%s' % self._FILEMAP[pos])
 
     def _synset_from_pos_and_offset(self, pos, offset):
         # Check to see if the synset is in the cache
-        if offset in self._synset_offset_cache[pos]:
-            return self._synset_offset_cache[pos][offset]
+        synset = self._synset_offset_cache.get((pos, offset))
+        if synset is not None:
+            return synset
 
         data_file = self._data_file(pos)
         data_file.seek(offset)
         data_file_line = data_file.readline()
         synset = self._synset_from_pos_and_line(pos, data_file_line)
         assert synset._offset == offset
-        self._synset_offset_cache[pos][offset] = synset
+        self._synset_offset_cache[pos, offset] = synset
         return synset
 
+    def synset_cache_info(self):
+        """
+        Return a ``CacheInfo`` tuple reporting the hits, misses,
+        maximum size and current size of the synset cache.
+        """
+        return self._synset_offset_cache.info()
+
     def _synset_from_pos_and_line(self, pos, data_file_line):
         # Construct a new (empty) synset.
         synset = Synset(self)
@@ -1428,7 +1854,7 @@ class WordNetCorpusReader(CorpusReader):
         else:
             self._load_lang_data(lang)
             synset_list = []
-            for l in self._lang_data[lang][1][lemma]:
+            for l in self._lang_data[lang][1].get(lemma, []):
                 if pos is not None and l[-1] != pos:
                     continue
                 synset_list.append(self.of2ss(l))
@@ -1473,10 +1899,10 @@ class WordNetCorpusReader(CorpusReader):
         else:
             self._load_lang_data(lang)
             lemma = []
-            for i in self._lang_data[lang][0]:
+            for i, names in self._lang_data[lang][0].items():
                 if pos is not None and i[-1] != pos:
                     continue
-                lemma.extend(self._lang_data[lang][0][i])
+                lemma.extend(names)
                        
             lemma = list(set(lemma))
             return lemma
@@ -1497,7 +1923,7 @@ class WordNetCorpusReader(CorpusReader):
         # generate all synsets for each part of speech
         for pos_tag in pos_tags:
             # Open the file for reading.  Note that we can not re-use
-            # the file poitners from self._data_file_map here, because
+            # the file pointers from self._data_file() here, because
             # we're defining an iterator, and those file pointers might
             # be moved while we're not looking.
             if pos_tag == ADJ_SAT:
@@ -1507,30 +1933,24 @@ class WordNetCorpusReader(CorpusReader):
 
             try:
                 # generate synsets for each line in the POS file
-                offset = data_file.tell()
-                line = data_file.readline()
-                while line:
-                    if not line[0].isspace():
-                        if offset in cache[pos_tag]:
-                            # See if the synset is cached
-                            synset = cache[pos_tag][offset]
-                        else:
-                            # Otherwise, parse the line
-                            synset = from_pos_and_line(pos_tag, line)
-                            cache[pos_tag][offset] = synset
-
-                        # adjective satellites are in the same file as
-                        # adjectives so only yield the synset if it's actually
-                        # a satellite
-                        if synset._pos == ADJ_SAT:
-                            yield synset
-
-                        # for all other POS tags, yield all synsets (this means
-                        # that adjectives also include adjective satellites)
-                        else:
-                            yield synset
-                    offset = data_file.tell()
-                    line = data_file.readline()
+                for offset, line in self._synset_lines(pos_tag, data_file):
+                    # See if the synset is cached
+                    synset = cache.get((pos_tag, offset))
+                    if synset is None:
+                        # Otherwise, parse the line
+                        synset = from_pos_and_line(pos_tag, line)
+                        cache[pos_tag, offset] = synset
+
+                    # adjective satellites are in the same file as
+                    # adjectives so only yield the synset if it's actually
+                    # a satellite
+                    if synset._pos == ADJ_SAT:
+                        yield synset
+
+                    # for all other POS tags, yield all synsets (this means
+                    # that adjectives also include adjective satellites)
+                    else:
+                        yield synset
 
             # close the extra file handle we opened
             except:
@@ -1539,6 +1959,28 @@ class WordNetCorpusReader(CorpusReader):
             else:
                 data_file.close()
 
+    def _synset_lines(self, pos, data_file):
+        """
+        Generate ``(offset, line)`` pairs for the synset lines in
+        ``data_file``.  If a compiled index provides the offsets, the
+        (slow) calls to ``tell()`` are avoided.
+        """
+        offsets = self._synset_offsets.get(pos)
+        if offsets is not None:
+            offsets = iter(offsets)
+            for line in iter(data_file.readline, ''):
+                if not line[0].isspace():
+                    yield next(offsets), line
+            return
+
+        offset = data_file.tell()
+        line = data_file.readline()
+        while line:
+            if not line[0].isspace():
+                yield offset, line
+            offset = data_file.tell()
+            line = data_file.readline()
+
     def words(self, lang='eng'):
         """return lemmas of the given language as list of words"""
         return self.all_lemma_names(lang=lang)
@@ -1592,11 +2034,9 @@ class WordNetCorpusReader(CorpusReader):
         # Currently, count is only work for English
         if lemma._lang != 'eng':
             return 0
-        # open the count file if we haven't already
-        if self._key_count_file is None:
-            self._key_count_file = self.open('cntlist.rev')
         # find the key in the counts file and return the count
-        line = _binary_search_file(self._key_count_file, lemma._key)
+        key_count_file = self._thread_file('cntlist.rev')
+        line = _binary_search_file(key_count_file, lemma._key)
         if line:
             return int(line.rsplit(' ', 1)[-1])
         else:
@@ -1626,6 +2066,83 @@ class WordNetCorpusReader(CorpusReader):
         return synset1.lin_similarity(synset2, ic, verbose)
     lin_similarity.__doc__ = Synset.lin_similarity.__doc__
 
+    def similarity_matrix(self, synsets1, synsets2=None, measure='path',
+                          ic=None, simulate_root=True, num_workers=1):
+        """
+        Return a matrix of the similarity of every synset in ``synsets1``
+        to every synset in ``synsets2``, as a NumPy array whose entry
+        ``[i, j]`` is ``synsets1[i].<measure>_similarity(synsets2[j])``.
+        Scores that are None (no connecting path was found) are
+        represented as NaN.
+
+        All the comparisons share this reader's index of hypernym
+        ancestors and depths, so the hypernyms of each synset are only
+        traversed once, however many synsets it is compared to.
+
+            >>> from nltk.corpus import wordnet as wn
+            >>> dog, cat, car = wn.synsets('dog')[0], wn.synsets('cat')[0], wn.synsets('car')[0]
+            >>> wn.similarity_matrix([dog, cat], [cat, car]) # doctest: +SKIP
+            array([[ 0.2       ,  0.07692308],
+                   [ 1.        ,  0.05555556]])
+
+        :type synsets1: list(Synset)
+        :param synsets1: The synsets for the rows of the matrix.
+        :type synsets2: list(Synset)
+        :param synsets2: The synsets for the columns of the matrix.  If
+            None, ``synsets1`` is used.
+        :param measure: The name of the similarity measure: one of
+            ``'path'``, ``'lch'``, ``'wup'``, ``'res'``, ``'jcn'`` or
+            ``'lin'``.
+        :param ic: An information content object (as returned by
+            ``nltk.corpus.wordnet_ic.ic()``), required by the ``'res'``,
+            ``'jcn'`` and ``'lin'`` measures.
+        :param simulate_root: Passed to the ``'path'``, ``'lch'`` and
+            ``'wup'`` measures.
+        :param num_workers: The number of processes that compute rows of
+            the matrix.  With more than one worker, each process builds
+            its own reader over this reader's corpus root.
+        :rtype: numpy.ndarray
+        """
+        import numpy
+
+        if measure not in _SIMILARITY_MEASURES:
+            raise ValueError('Unknown similarity measure %r; expected one of '
+                             '%s' % (measure, ', '.join(_SIMILARITY_MEASURES)))
+        if measure in _IC_SIMILARITY_MEASURES:
+            if ic is None:
+                raise ValueError('The %s similarity measure requires an '
+                                 'information content object' % measure)
+            args = (ic,)
+        else:
+            args = (False, simulate_root)
+
+        synsets1 = list(synsets1)
+        synsets2 = synsets1 if synsets2 is None else list(synsets2)
+        matrix = numpy.empty((len(synsets1), len(synsets2)))
+
+        if num_workers > 1 and len(synsets1) > 1:
+            import multiprocessing
+            keys1 = [(s._pos, s._offset) for s in synsets1]
+            keys2 = [(s._pos, s._offset) for s in synsets2]
+            chunk_size = max(1, len(keys1) // (num_workers * 4))
+            chunks = [(start, keys1[start:start+chunk_size])
+                      for start in xrange(0, len(keys1), chunk_size)]
+            pool = multiprocessing.Pool(
+                num_workers, _init_worker,
+                (self._root, self._index_file,
+                 dict(keys2=keys2, measure=measure, args=args)))
+            try:
+                for start, rows in pool.imap_unordered(_similarity_rows,
+                                                       chunks):
+                    matrix[start:start+len(rows)] = rows
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            for i, synset1 in enumerate(synsets1):
+                matrix[i] = _similarity_row(synset1, synsets2, measure, args)
+        return matrix
+
     #////////////////////////////////////////////////////////////
     # Morphy
     #////////////////////////////////////////////////////////////
@@ -1677,6 +2194,22 @@ class WordNetCorpusReader(CorpusReader):
     MORPHOLOGICAL_SUBSTITUTIONS[ADJ_SAT] = MORPHOLOGICAL_SUBSTITUTIONS[ADJ]
 
     def _morphy(self, form, pos):
+        key = (form, pos)
+        analyses = self._morphy_cache.get(key)
+        if analyses is None:
+            analyses = tuple(self._apply_morphy(form, pos))
+            self._morphy_cache[key] = analyses
+        return list(analyses)
+
+    def morphy_cache_info(self):
+        """
+        Return a ``CacheInfo`` tuple reporting the hits, misses,
+        maximum size and current size of the cache of morphological
+        analyses used by ``morphy()``.
+        """
+        return self._morphy_cache.info()
+
+    def _apply_morphy(self, form, pos):
         # from jordanbg:
         # Given an original string x
         # 1. Apply rules once to the input to get y1, y2, y3, etc.
@@ -1729,7 +2262,8 @@ class WordNetCorpusReader(CorpusReader):
     #////////////////////////////////////////////////////////////
     # Create information content from corpus
     #////////////////////////////////////////////////////////////
-    def ic(self, corpus, weight_senses_equally = False, smoothing = 1.0):
+    def ic(self, corpus, weight_senses_equally = False, smoothing = 1.0,
+           num_workers=1):
         """
         Creates an information content lookup dictionary from a corpus.
 
@@ -1744,11 +2278,18 @@ class WordNetCorpusReader(CorpusReader):
         it is true.)
         :param smoothing: How much do we smooth synset counts (default is 1.0)
         :type smoothing: float
+        :param num_workers: The number of processes that look up the
+        synsets of the corpus vocabulary.  The vocabulary is split into
+        shards, and the counts from each shard are added up at the end
+        (so the results may differ from a single process in the last
+        decimal places).
+        :type num_workers: int
         :return: An information content dictionary
         """
         counts = FreqDist()
         for ww in corpus.words():
             counts[ww] += 1
+        word_counts = list(iteritems(counts))
 
         ic = {}
         for pp in POS_LIST:
@@ -1762,27 +2303,50 @@ class WordNetCorpusReader(CorpusReader):
                     pos = ADJ
                 ic[pos][ss._offset] = smoothing
 
-        for ww in counts:
-            possible_synsets = self.synsets(ww)
-            if len(possible_synsets) == 0:
-                continue
-
-            # Distribute weight among possible synsets
-            weight = float(counts[ww])
-            if not weight_senses_equally:
-                weight /= float(len(possible_synsets))
-
-            for ss in possible_synsets:
-                pos = ss._pos
-                if pos == ADJ_SAT:
-                    pos = ADJ
-                for level in ss._iter_hypernym_lists():
-                    for hh in level:
-                        ic[pos][hh._offset] += weight
-                # Add the weight to the root
-                ic[pos][0] += weight
+        if num_workers > 1 and len(word_counts) > 1:
+            import multiprocessing
+            shard_size = max(1, len(word_counts) // (num_workers * 4))
+            shards = [word_counts[start:start+shard_size]
+                      for start in xrange(0, len(word_counts), shard_size)]
+            pool = multiprocessing.Pool(
+                num_workers, _init_worker,
+                (self._root, self._index_file,
+                 dict(weight_senses_equally=weight_senses_equally)))
+            try:
+                for shard_ic in pool.imap(_ic_counts, shards):
+                    for pos, shard_counts in iteritems(shard_ic):
+                        icpos = ic[pos]
+                        for offset, count in iteritems(shard_counts):
+                            icpos[offset] += count
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            _add_ic_counts(self, ic, word_counts, weight_senses_equally)
         return ic
 
+    def write_ic(self, ic, stream):
+        """
+        Write the noun and verb counts of an information content
+        dictionary (as returned by ``ic()``) to ``stream``, in the format
+        read by ``WordNetICCorpusReader``: a header line, followed by one
+        line per synset giving its offset and part of speech, its count,
+        and ``ROOT`` if it has no hypernyms.
+
+        :param ic: An information content dictionary.
+        :param stream: A file-like object opened for writing text.
+        """
+        stream.write('wnver::%s\n' % self.get_version())
+        for pos in (NOUN, VERB):
+            index = self._ancestor_index(pos)
+            for offset in sorted(ic[pos]):
+                if offset == 0:
+                    continue
+                line = '%d%s %r' % (offset, pos, ic[pos][offset])
+                if not index.parents(offset):
+                    line += ' ROOT'
+                stream.write(line + '\n')
+
 
 ######################################################################
 ## WordNet Information Content Corpus Reader
@@ -1905,6 +2469,84 @@ def _lcs_ic(synset1, synset2, ic, verbose=False):
     return ic1, ic2, subsumer_ic
 
 
+# Batch similarity
+
+_SIMILARITY_MEASURES = ('path', 'lch', 'wup', 'res', 'jcn', 'lin')
+_IC_SIMILARITY_MEASURES = ('res', 'jcn', 'lin')
+
+def _similarity_row(synset1, synsets2, measure, args):
+    """
+    :return: The scores of ``synset1`` against each of ``synsets2``,
+    with NaN in place of None.
+    """
+    similarity = getattr(synset1, measure + '_similarity')
+    nan = float('nan')
+    row = []
+    for synset2 in synsets2:
+        score = similarity(synset2, *args)
+        row.append(nan if score is None else score)
+    return row
+
+def _similarity_rows(chunk):
+    start, keys1 = chunk
+    worker = _worker
+    synset = worker['reader']._synset_from_pos_and_offset
+    if 'synsets2' not in worker:
+        worker['synsets2'] = [synset(pos, offset)
+                              for pos, offset in worker['keys2']]
+    rows = [_similarity_row(synset(pos, offset), worker['synsets2'],
+                            worker['measure'], worker['args'])
+            for pos, offset in keys1]
+    return start, rows
+
+
+# Information content
+
+def _add_ic_counts(reader, ic, word_counts, weight_senses_equally):
+    """
+    Add the counts of the words in ``word_counts``, a list of
+    ``(word, count)`` pairs, to the information content dictionary
+    ``ic``: each word's count is divided among its synsets, and each
+    synset's share is added to the synset, to all of its hypernyms,
+    and to the root count of its part of speech.
+    """
+    for word, count in word_counts:
+        possible_synsets = reader.synsets(word)
+        if len(possible_synsets) == 0:
+            continue
+
+        # Distribute weight among possible synsets
+        weight = float(count)
+        if not weight_senses_equally:
+            weight /= float(len(possible_synsets))
+
+        for ss in possible_synsets:
+            pos = ss._pos
+            if pos == ADJ_SAT:
+                pos = ADJ
+            icpos = ic[pos]
+            for offset, count in ss._ancestor_index().hypernym_counts(ss._offset):
+                for _ in xrange(count):
+                    icpos[offset] += weight
+            # Add the weight to the root
+            icpos[0] += weight
+
+def _ic_counts(word_counts):
+    ic = dict((pos, defaultdict(float)) for pos in POS_LIST)
+    _add_ic_counts(_worker['reader'], ic, word_counts,
+                   _worker['weight_senses_equally'])
+    return dict((pos, dict(counts)) for pos, counts in iteritems(ic))
+
+
+# The state of a worker process, used by similarity_matrix() and ic().
+_worker = {}
+
+def _init_worker(root, index_file, state):
+    _worker.clear()
+    _worker.update(state)
+    _worker['reader'] = WordNetCorpusReader(root, None, index_file=index_file)
+
+
 # Utility functions
 
 def information_content(synset, ic):
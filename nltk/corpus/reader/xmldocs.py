@@ -13,6 +13,8 @@ Corpus reader for corpora whose documents are xml files.
 from __future__ import print_function, unicode_literals
 
 import codecs
+import re
+from xml.parsers import expat
 
 # Use the c version of ElementTree, which is faster, if possible:
 try: from xml.etree import cElementTree as ElementTree
@@ -39,11 +41,15 @@ class XMLCorpusReader(CorpusReader):
         CorpusReader.__init__(self, root, fileids)
 
     def xml(self, fileid=None):
-        # Make sure we have exactly one file -- no concatenating XML.
-        if fileid is None and len(self._fileids) == 1:
-            fileid = self._fileids[0]
-        if not isinstance(fileid, compat.string_types):
-            raise TypeError('Expected a single file identifier string')
+        """
+        Return the root element of the given file.  Like the
+        ``words()`` method, fileid can only specify one file.
+
+        The whole file is parsed into memory, since the element tree is
+        returned; to read the elements of a large file one at a time,
+        use a ``StreamingXMLCorpusView`` instead.
+        """
+        fileid = self._single_fileid(fileid)
         # Read the XML in using ElementTree.
         elt = ElementTree.parse(self.abspath(fileid).open()).getroot()
         # If requested, wrap it.
@@ -52,29 +58,62 @@ class XMLCorpusReader(CorpusReader):
         # Return the ElementTree element.
         return elt
 
+    def _single_fileid(self, fileid):
+        # Make sure we have exactly one file -- no concatenating XML.
+        if fileid is None and len(self._fileids) == 1:
+            fileid = self._fileids[0]
+        if not isinstance(fileid, compat.string_types):
+            raise TypeError('Expected a single file identifier string')
+        return fileid
+
     def words(self, fileid=None):
         """
         Returns all of the words and punctuation symbols in the specified file
         that were in text nodes -- ie, tags are ignored. Like the xml() method,
         fileid can only specify one file.
 
+        The file is parsed incrementally, and each element is discarded
+        once it is closed, so only the elements that are still open are
+        kept in memory.
+
         :return: the given file's text nodes as a list of words and punctuation symbols
         :rtype: list(str)
         """
 
-        elt = self.xml(fileid)
+        fileid = self._single_fileid(fileid)
         encoding = self.encoding(fileid)
         word_tokenizer=WordPunctTokenizer()
-        iterator = elt.getiterator()
         out = []
 
-        for node in iterator:
+        def add_text(node):
             text = node.text
             if text is not None:
                 if isinstance(text, bytes):
                     text = text.decode(encoding)
                 toks = word_tokenizer.tokenize(text)
                 out.extend(toks)
+
+        # The text of an element is complete once its first child starts,
+        # or else once it ends.  Each entry of open_elts is a list of an
+        # open element and whether its text has been added yet.
+        open_elts = []
+        stream = self.abspath(fileid).open()
+        try:
+            for event, node in ElementTree.iterparse(stream, ('start', 'end')):
+                if event == 'start':
+                    if open_elts and not open_elts[-1][1]:
+                        add_text(open_elts[-1][0])
+                        open_elts[-1][1] = True
+                    open_elts.append([node, False])
+                else:
+                    if not open_elts[-1][1]:
+                        add_text(node)
+                    open_elts.pop()
+                    node.clear()
+                    if open_elts:
+                        open_elts[-1][0].remove(node)
+        finally:
+            stream.close()
         return out
 
     def raw(self, fileids=None):
@@ -385,3 +424,162 @@ class XMLCorpusView(StreamBackedCorpusView):
                                   elt.encode('ascii', 'xmlcharrefreplace')),
                             context)
                 for (elt, context) in elts]
+
+
+class StreamingXMLCorpusView(XMLCorpusView):
+    """
+    An ``XMLCorpusView`` that finds the selected elements with an
+    incremental (expat) parser, instead of scanning the file for tags
+    with regular expressions and re-parsing each element.  Only the
+    selected elements are built, and each one is discarded once it
+    has been passed to ``handle_elt()``, so memory use does not depend
+    on the size of the file.
+
+    The tag specification, the ``elt_handler`` contract and random
+    access by block are the same as for ``XMLCorpusView``.  Each block
+    is parsed starting from its file position, after re-opening the
+    tags that enclose that position.  Element tags and attribute names
+    are given as they are written in the file: namespace prefixes are
+    not resolved.
+
+    Files in encodings that expat can not read directly (anything but
+    UTF-8, UTF-16, ISO-8859-1 and ASCII) are read with
+    ``XMLCorpusView``'s tag scanner instead.
+    """
+
+    #: The number of bytes fed to the parser at a time.
+    _BLOCK_SIZE = 16384
+
+    #: The names that expat uses for the encodings it can read, keyed
+    #: by the names returned by ``_detect_encoding()``.
+    _EXPAT_ENCODINGS = {
+        'utf-8': 'UTF-8', 'utf8': 'UTF-8',
+        'us-ascii': 'US-ASCII', 'ascii': 'US-ASCII',
+        'iso-8859-1': 'ISO-8859-1', 'latin-1': 'ISO-8859-1',
+        'latin1': 'ISO-8859-1',
+        'utf-16-le': 'UTF-16LE', 'utf-16-be': 'UTF-16BE',
+    }
+
+    def __init__(self, fileid, tagspec, elt_handler=None):
+        XMLCorpusView.__init__(self, fileid, tagspec, elt_handler)
+        self._expat_encoding = self._EXPAT_ENCODINGS.get(
+            self._encoding.lower())
+        if self._expat_encoding is not None:
+            # Read the file as bytes, and let expat decode it.
+            self._xml_encoding = self._encoding
+            self._encoding = None
+
+    def read_block(self, stream, tagspec=None, elt_handler=None):
+        """
+        Read from ``stream`` until we find at least one element that
+        matches ``tagspec``, and return the result of applying
+        ``elt_handler`` to each element found.
+        """
+        if self._expat_encoding is None:
+            return XMLCorpusView.read_block(self, stream, tagspec,
+                                            elt_handler)
+        if tagspec is None: tagspec = self._tagspec
+        if elt_handler is None: elt_handler = self.handle_elt
+
+        filepos = stream.tell()
+
+        # Re-open the enclosing tags, so that the parser is in the
+        # right context.  File positions are found by subtracting the
+        # length of this prefix from the parser's byte index.
+        if filepos == 0:
+            parser = expat.ParserCreate()
+            prefix = b''
+        else:
+            parser = expat.ParserCreate(self._expat_encoding)
+            prefix = ''.join('<%s>' % name for name in
+                             self._tag_context[filepos])
+            prefix = prefix.encode(self._xml_encoding)
+        offset = filepos - len(prefix)
+
+        # Use a stack of strings to keep track of our context; it is
+        # filled in by parsing the prefix.
+        context = []
+
+        elts = []       # (element, context) pairs
+        state = dict(builder=None, depth=None, done=None, end=None)
+
+        # When a selected element ends, its end position is only known
+        # when the parser reports whatever comes next.  The block ends
+        # after the last element whose end position is known once a
+        # whole chunk has been parsed.
+        def mark_end():
+            if state['done'] is not None:
+                state['end'] = (offset + parser.CurrentByteIndex,
+                                state['done'])
+                state['done'] = None
+
+        def start(name, attrs):
+            mark_end()
+            context.append(name)
+            if state['builder'] is not None:
+                state['builder'].start(name, attrs)
+            elif re.match(tagspec, '/'.join(context)):
+                state['builder'] = ElementTree.TreeBuilder()
+                state['builder'].start(name, attrs)
+                state['depth'] = len(context)
+
+        def end(name):
+            mark_end()
+            if state['builder'] is not None:
+                state['builder'].end(name)
+                if state['depth'] == len(context):
+                    elts.append((state['builder'].close(),
+                                 '/'.join(context)))
+                    state['builder'] = None
+                    context.pop()
+                    state['done'] = (len(elts), tuple(context))
+                    return
+            context.pop()
+
+        def data(text):
+            mark_end()
+            if state['builder'] is not None:
+                state['builder'].data(text)
+
+        def other(*args):
+            mark_end()
+
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = data
+        parser.CommentHandler = other
+        parser.ProcessingInstructionHandler = other
+        parser.StartCdataSectionHandler = other
+        parser.EndCdataSectionHandler = other
+
+        try:
+            if prefix:
+                parser.Parse(prefix, False)
+            while state['end'] is None:
+                xml_block = stream.read(self._BLOCK_SIZE)
+                if not xml_block:
+                    # Anything after the root element is ignored.
+                    if context:
+                        parser.Parse(b'', True)
+                    if state['done'] is not None:
+                        state['end'] = (stream.tell(), state['done'])
+                    break
+                parser.Parse(xml_block, False)
+        except expat.ExpatError as e:
+            raise ValueError('Unable to parse %s: %s' % (self._fileid, e))
+
+        if state['end'] is None:
+            # End of file, without finding any more elements.
+            end_pos, num_elts, end_context = stream.tell(), 0, ()
+        else:
+            end_pos, (num_elts, end_context) = state['end']
+        stream.seek(end_pos)
+
+        # Update the _tag_context dict.
+        if end_pos in self._tag_context:
+            assert end_context == self._tag_context[end_pos]
+        else:
+            self._tag_context[end_pos] = end_context
+
+        return [elt_handler(elt, elt_context)
+                for (elt, elt_context) in elts[:num_elts]]
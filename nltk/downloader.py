@@ -58,13 +58,28 @@ loaded from ``https://raw.githubusercontent.com/nltk/nltk_data/gh-pages/index.xm
 If necessary, it is possible to create a new ``Downloader`` object,
 specifying a different URL for the package index file.
 
+Parallel Downloads
+==================
+When a list of packages or a collection is downloaded, the package
+files can be fetched by several worker threads at once; each package
+is unzipped as soon as its own file has arrived, while the remaining
+files are still being fetched.  Use the ``num_workers`` argument when
+creating a ``Downloader`` (or the ``-j`` command line option) to set
+the number of concurrent downloads.
+
+Package files are first written to a ``.part`` file next to their
+final location, and their MD5 checksum is computed as they are
+downloaded.  If a download is interrupted, the next attempt resumes
+from the end of the ``.part`` file, using an HTTP range request when
+the server supports it.
+
 Usage::
 
-    python nltk/downloader.py [-d DATADIR] [-q] [-f] [-k] PACKAGE_IDS
+    python nltk/downloader.py [-d DATADIR] [-q] [-f] [-k] [-j WORKERS] PACKAGE_IDS
 
 or::
 
-    python -m nltk.downloader [-d DATADIR] [-q] [-f] [-k] PACKAGE_IDS
+    python -m nltk.downloader [-d DATADIR] [-q] [-f] [-k] [-j WORKERS] PACKAGE_IDS
 """
 #----------------------------------------------------------------------
 from __future__ import print_function, division, unicode_literals
@@ -173,6 +188,11 @@ except:
     TKINTER = False
     TclError = ValueError
 
+try:
+    import queue as q
+except ImportError:
+    import Queue as q
+
 from xml.etree import ElementTree
 import nltk
 from nltk import compat
@@ -403,7 +423,8 @@ class Downloader(object):
     # Cosntructor
     #/////////////////////////////////////////////////////////////////
 
-    def __init__(self, server_index_url=None, download_dir=None):
+    def __init__(self, server_index_url=None, download_dir=None,
+                 num_workers=1):
         self._url = server_index_url or self.DEFAULT_URL
         """The URL for the data server's index file."""
 
@@ -432,6 +453,15 @@ class Downloader(object):
         self._errors = None
         """Flag for telling if all packages got successfully downloaded or not."""
 
+        self._num_workers = max(1, num_workers)
+        """The number of package files that are fetched concurrently
+           when a list of packages or a collection is downloaded."""
+
+        self._fetches = None
+        """Dictionary from package identifier to the ``_PackageFetch``
+           that is downloading its file in the background, while a
+           parallel download is in progress."""
+
         # decide where we're going to save things to.
         if self._download_dir is None:
             self._download_dir = self.default_download_dir()
@@ -561,21 +591,70 @@ class Downloader(object):
                 yield ErrorMessage(items[i], e)
                 return
 
-        # Download each item, re-scaling their progress.
-        num_packages = sum(self._num_packages(item) for item in items)
-        progress = 0
-        for i, item in enumerate(items):
+        # If we're allowed to use several workers, then start fetching
+        # the package files in the background.  (Nested calls, used
+        # for collections, reuse the fetches started by the outermost
+        # call.)
+        fetcher = None
+        if self._num_workers > 1 and self._fetches is None:
+            fetcher = self._start_fetches(items, download_dir, force)
+
+        try:
+            # Download each item, re-scaling their progress.
+            num_packages = sum(self._num_packages(item) for item in items)
+            progress = 0
+            for i, item in enumerate(items):
+                if isinstance(item, Package):
+                    delta = 1./num_packages
+                else:
+                    delta = len(item.packages)/num_packages
+                for msg in self.incr_download(item, download_dir, force):
+                    if isinstance(msg, ProgressMessage):
+                        yield ProgressMessage(progress + msg.progress*delta)
+                    else:
+                        yield msg
+
+                progress += 100*delta
+        finally:
+            if fetcher is not None:
+                fetcher.stop()
+                self._fetches = None
+
+    def _start_fetches(self, items, download_dir, force):
+        """
+        Start fetching the files of all packages in ``items`` (and in
+        any collections they contain) that need to be downloaded,
+        using ``self._num_workers`` background threads.  Files are
+        fetched in the order in which ``_download_list`` will install
+        them, so each package can be unzipped while the following
+        ones are still being downloaded.
+        """
+        fetcher = _PackageFetcher(self._num_workers)
+        self._fetches = {}
+        for info in self._walk_packages(items, set()):
+            if not force and self.status(info, download_dir) == self.INSTALLED:
+                continue
+            self._make_package_dirs(info, download_dir)
+            filepath = os.path.join(download_dir, info.filename)
+            self._fetches[info.id] = fetcher.submit(info, filepath)
+        fetcher.start()
+        return fetcher
+
+    def _walk_packages(self, items, seen):
+        for item in items:
+            if item.id in seen: continue
+            seen.add(item.id)
             if isinstance(item, Package):
-                delta = 1./num_packages
+                yield item
             else:
-                delta = len(item.packages)/num_packages
-            for msg in self.incr_download(item, download_dir, force):
-                if isinstance(msg, ProgressMessage):
-                    yield ProgressMessage(progress + msg.progress*delta)
-                else:
-                    yield msg
+                for info in self._walk_packages(item.children, seen):
+                    yield info
 
-            progress += 100*delta
+    def _make_package_dirs(self, info, download_dir):
+        if not os.path.exists(download_dir):
+            os.mkdir(download_dir)
+        if not os.path.exists(os.path.join(download_dir, info.subdir)):
+            os.mkdir(os.path.join(download_dir, info.subdir))
 
     def _download_package(self, info, download_dir, force):
         yield StartPackageMessage(info)
@@ -600,31 +679,25 @@ class Downloader(object):
             os.remove(filepath)
 
         # Ensure the download_dir exists
-        if not os.path.exists(download_dir):
-            os.mkdir(download_dir)
-        if not os.path.exists(os.path.join(download_dir, info.subdir)):
-            os.mkdir(os.path.join(download_dir, info.subdir))
+        self._make_package_dirs(info, download_dir)
 
-        # Download the file.  This will raise an IOError if the url
-        # is not found.
+        # Download the file, unless a background worker is already
+        # doing so.  The file is written to a ".part" file, which is
+        # only moved into place once its checksum has been verified.
         yield StartDownloadMessage(info)
         yield ProgressMessage(5)
-        try:
-            infile = compat.urlopen(info.url)
-            with open(filepath, 'wb') as outfile:
-                #print info.size
-                num_blocks = max(1, info.size/(1024*16))
-                for block in itertools.count():
-                    s = infile.read(1024*16) # 16k blocks.
-                    outfile.write(s)
-                    if not s: break
-                    if block % 2 == 0: # how often?
-                        yield ProgressMessage(min(80, 5+75*(block/num_blocks)))
-            infile.close()
-        except IOError as e:
-            yield ErrorMessage(info, 'Error downloading %r from <%s>:'
-                               '\n  %s' % (info.id, info.url, e))
-            return
+        fetch = None
+        if self._fetches is not None:
+            fetch = self._fetches.pop(info.id, None)
+        if fetch is not None:
+            fetch_messages = fetch.messages()
+        else:
+            fetch_messages = _fetch_package(info, filepath)
+        for msg in fetch_messages:
+            yield msg
+            if isinstance(msg, ErrorMessage):
+                return
+        os.rename(filepath+'.part', filepath)
         yield FinishDownloadMessage(info)
         yield ProgressMessage(80)
 
@@ -1979,6 +2052,133 @@ def _md5_hexdigest(fp):
     return md5_digest.hexdigest()
 
 
+def _fetch_package(info, filepath):
+    """
+    Download the file for the package ``info`` to ``filepath+'.part'``,
+    yielding ``ProgressMessage``s as it goes, or an ``ErrorMessage`` if
+    the download fails.  If a partial download already exists, then
+    resume it with an HTTP range request (or start over, if the server
+    does not honour the range).  The file's MD5 checksum is computed
+    while it is being written, and the ``.part`` file is discarded if
+    it does not match ``info.checksum``.
+    """
+    partpath = filepath + '.part'
+    md5_digest = md5()
+    offset = 0
+    if os.path.exists(partpath):
+        with open(partpath, 'rb') as infile:
+            while True:
+                block = infile.read(1024*16)
+                if not block: break
+                md5_digest.update(block)
+                offset += len(block)
+        if offset >= info.size:
+            if offset == info.size and (not info.checksum or
+                                        md5_digest.hexdigest() == info.checksum):
+                return # A previous download completed.
+            md5_digest = md5()
+            offset = 0
+
+    try:
+        request = compat.Request(info.url)
+        if offset:
+            request.add_header('Range', 'bytes=%d-' % offset)
+        infile = compat.urlopen(request)
+        if offset and infile.getcode() != 206:
+            # The server sent the whole file.
+            md5_digest = md5()
+            offset = 0
+        with open(partpath, 'ab' if offset else 'wb') as outfile:
+            num_blocks = max(1, (info.size-offset)/(1024*16))
+            for block in itertools.count():
+                s = infile.read(1024*16) # 16k blocks.
+                if not s: break
+                outfile.write(s)
+                md5_digest.update(s)
+                if block % 2 == 0: # how often?
+                    yield ProgressMessage(min(80, 5+75*(block/num_blocks)))
+        infile.close()
+    except IOError as e:
+        if getattr(e, 'code', None) == 416: # Range Not Satisfiable
+            os.remove(partpath)
+        yield ErrorMessage(info, 'Error downloading %r from <%s>:'
+                           '\n  %s' % (info.id, info.url, e))
+        return
+
+    if info.checksum and md5_digest.hexdigest() != info.checksum:
+        os.remove(partpath)
+        yield ErrorMessage(info, 'Error downloading %r from <%s>:'
+                           '\n  checksum mismatch' % (info.id, info.url))
+
+class _PackageFetch(object):
+    """
+    The download of a single package file by a ``_PackageFetcher``
+    worker thread.
+    """
+    def __init__(self, info, filepath):
+        self.info = info
+        self.filepath = filepath
+        self.queue = q.Queue()
+
+    def messages(self):
+        """
+        Yield the messages generated while downloading the package
+        file, blocking until each one becomes available.
+        """
+        while True:
+            msg = self.queue.get()
+            if msg is None: return
+            yield msg
+
+class _PackageFetcher(object):
+    """
+    A pool of worker threads that download package files in the
+    order in which they were submitted.
+    """
+    def __init__(self, num_workers):
+        self._jobs = q.Queue()
+        self._abort = threading.Event()
+        self._threads = []
+        for i in range(num_workers):
+            thread = threading.Thread(target=self._work)
+            thread.daemon = True
+            self._threads.append(thread)
+
+    def submit(self, info, filepath):
+        fetch = _PackageFetch(info, filepath)
+        self._jobs.put(fetch)
+        return fetch
+
+    def start(self):
+        for thread in self._threads:
+            self._jobs.put(None)
+            thread.start()
+
+    def stop(self):
+        """
+        Abandon any downloads that are still in progress (keeping
+        their ``.part`` files, so they can be resumed later), and
+        wait for the worker threads to exit.
+        """
+        self._abort.set()
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self):
+        while not self._abort.is_set():
+            fetch = self._jobs.get()
+            if fetch is None: return
+            messages = _fetch_package(fetch.info, fetch.filepath)
+            try:
+                for msg in messages:
+                    if self._abort.is_set(): break
+                    fetch.queue.put(msg)
+            except Exception as e:
+                fetch.queue.put(ErrorMessage(fetch.info, e))
+            finally:
+                messages.close()
+                fetch.queue.put(None)
+
 # change this to periodically yield progress messages?
 # [xx] get rid of topdir parameter -- we should be checking
 # this when we build the index, anyway.
@@ -2256,12 +2456,19 @@ if __name__ == '__main__':
         default=False, help="exit if an error occurs")
     parser.add_option("-u", "--url", dest="server_index_url",
         default=None, help="download server index url")
+    parser.add_option("-j", "--jobs", dest="num_workers", type="int",
+        default=1, help="number of packages to download concurrently")
 
     (options, args) = parser.parse_args()
 
-    downloader = Downloader(server_index_url = options.server_index_url)
+    downloader = Downloader(server_index_url = options.server_index_url,
+                            num_workers = options.num_workers)
 
-    if args:
+    if args and options.num_workers > 1:
+        downloader.download(info_or_id=args, download_dir=options.dir,
+            quiet=options.quiet, force=options.force,
+            halt_on_error=options.halt_on_error)
+    elif args:
         for pkg_id in args:
             rv = downloader.download(info_or_id=pkg_id, download_dir=options.dir,
                 quiet=options.quiet, force=options.force,
@@ -7,6 +7,8 @@
 # URL: <http://nltk.org/>
 # For license information, see LICENSE.TXT
 
+from nltk.util import LRUCache
+
 class StemmerI(object):
     """
     A processing interface for removing morphological affixes from
@@ -22,4 +24,62 @@ class StemmerI(object):
         """
         raise NotImplementedError()
 
+    def stem_many(self, tokens):
+        """
+        Return the stems of a sequence of tokens.  Each distinct token
+        is only stemmed once.
+
+        :param tokens: The tokens that should be stemmed.
+        :type tokens: iter(str)
+        :rtype: list(str)
+        """
+        tokens = list(tokens)
+        stems = dict((token, self.stem(token)) for token in set(tokens))
+        return [stems[token] for token in tokens]
+
+
+class CachedStemmer(StemmerI):
+    """
+    A stemmer which remembers the stems that another stemmer has found
+    for the most recently used tokens, so that the stems of frequent
+    tokens are only worked out once.
+
+        >>> from nltk.stem import CachedStemmer, PorterStemmer
+        >>> stemmer = CachedStemmer(PorterStemmer(), maxsize=1000)
+        >>> stemmer.stem('running')
+        'run'
+        >>> stemmer.stem_many(['cats', 'running', 'cats'])
+        ['cat', 'run', 'cat']
+        >>> stemmer.cache.info()
+        CacheInfo(hits=1, misses=2, maxsize=1000, currsize=2)
+
+    The cache is an ``nltk.util.LRUCache``, which may be shared by the
+    threads of a pipeline.  A cached stemmer can be pickled along with
+    its cache, to start the stemmers of worker processes with the
+    stems found so far; the caches of the workers can be merged back
+    with ``cache.update()``.
+
+    :param stemmer: The stemmer whose stems are cached.
+    :type stemmer: StemmerI
+    :param maxsize: The maximum number of stems to keep.  If None, the
+        cache is unbounded.
+    :type maxsize: int
+    :param cache: The cache to keep the stems in, if not a new one.  It
+        should only hold stems found by the same kind of stemmer.
+    :type cache: LRUCache
+    """
+    def __init__(self, stemmer, maxsize=100000, cache=None):
+        self.stemmer = stemmer
+        if cache is None:
+            cache = LRUCache(maxsize)
+        self.cache = cache
+
+    def stem(self, token):
+        stem = self.cache.get(token)
+        if stem is None:
+            stem = self.stemmer.stem(token)
+            self.cache[token] = stem
+        return stem
 
+    def __repr__(self):
+        return 'CachedStemmer(%r)' % (self.stemmer,)
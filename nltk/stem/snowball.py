@@ -28,6 +28,59 @@ from nltk.stem.util import suffix_replace
 from nltk.stem.api import StemmerI
 
 
+class _SuffixTable(tuple):
+
+    """
+    A tuple of suffixes that can be searched by the ending of a word.
+
+    The suffixes are indexed by their lengths and final letters when
+    the table is built, so `matches` only has to look up one ending of
+    the word for each suffix length, rather than test every suffix in
+    turn; most words are rejected by their final letter alone.
+
+        >>> table = _SuffixTable(("heden", "ene", "en", "se", "s"))
+        >>> table.matches("mogelijkheden")
+        ['heden', 'en']
+        >>> table.matches("huis")
+        ['s']
+
+    """
+
+    def __new__(cls, suffixes):
+        table = tuple.__new__(cls, suffixes)
+        table._index = dict((suffix, i) for i, suffix in enumerate(table))
+        table._lengths = sorted(set(len(suffix) for suffix in table),
+                                reverse=True)
+        table._finals = frozenset(suffix[-1] for suffix in table)
+        table._longest_first = all(len(suffix) >= len(next_suffix)
+                                   for suffix, next_suffix
+                                   in zip(table, table[1:]))
+        return table
+
+    def matches(self, word):
+        """
+        Return the suffixes in the table that the word ends with,
+        in the order in which they appear in the table.
+
+        :param word: The word (or word region) to match.
+        :type word: str or unicode
+        :return: The matching suffixes.
+        :rtype: list
+
+        """
+        if word[-1:] not in self._finals:
+            return []
+        index = self._index
+        found = []
+        for length in self._lengths:
+            ending = word[-length:]
+            if ending in index and len(ending) == length:
+                found.append(ending)
+        if not self._longest_first and len(found) > 1:
+            found.sort(key=index.__getitem__)
+        return found
+
+
 class SnowballStemmer(StemmerI):
 
     """
@@ -318,15 +371,15 @@ class DanishStemmer(_ScandinavianStemmer):
 
     # The different suffixes, divided into the algorithm's steps
     # and organized by length, are listed in tuples.
-    __step1_suffixes = ("erendes", "erende", "hedens", "ethed",
-                        "erede", "heden", "heder", "endes",
-                        "ernes", "erens", "erets", "ered",
-                        "ende", "erne", "eren", "erer", "heds",
-                        "enes", "eres", "eret", "hed", "ene", "ere",
-                        "ens", "ers", "ets", "en", "er", "es", "et",
-                        "e", "s")
-    __step2_suffixes = ("gd", "dt", "gt", "kt")
-    __step3_suffixes = ("elig", "l\xF8st", "lig", "els", "ig")
+    __step1_suffixes = _SuffixTable(("erendes", "erende", "hedens", "ethed",
+                                     "erede", "heden", "heder", "endes",
+                                     "ernes", "erens", "erets", "ered", "ende",
+                                     "erne", "eren", "erer", "heds", "enes",
+                                     "eres", "eret", "hed", "ene", "ere",
+                                     "ens", "ers", "ets", "en", "er", "es",
+                                     "et", "e", "s"))
+    __step2_suffixes = _SuffixTable(("gd", "dt", "gt", "kt"))
+    __step3_suffixes = _SuffixTable(("elig", "l\xF8st", "lig", "els", "ig"))
 
     def stem(self, word):
         """
@@ -353,42 +406,39 @@ class DanishStemmer(_ScandinavianStemmer):
         # according to the descriptions on the Snowball website.
 
         # STEP 1
-        for suffix in self.__step1_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "s":
-                    if word[-2] in self.__s_ending:
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                break
+        for suffix in self.__step1_suffixes.matches(r1):
+            if suffix == "s":
+                if word[-2] in self.__s_ending:
+                    word = word[:-1]
+                    r1 = r1[:-1]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+            break
 
         # STEP 2
-        for suffix in self.__step2_suffixes:
-            if r1.endswith(suffix):
-                word = word[:-1]
-                r1 = r1[:-1]
-                break
+        for suffix in self.__step2_suffixes.matches(r1):
+            word = word[:-1]
+            r1 = r1[:-1]
+            break
 
         # STEP 3
         if r1.endswith("igst"):
             word = word[:-2]
             r1 = r1[:-2]
 
-        for suffix in self.__step3_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "l\xF8st":
+        for suffix in self.__step3_suffixes.matches(r1):
+            if suffix == "l\xF8st":
+                word = word[:-1]
+                r1 = r1[:-1]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+
+                if r1.endswith(self.__step2_suffixes):
                     word = word[:-1]
                     r1 = r1[:-1]
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-
-                    if r1.endswith(self.__step2_suffixes):
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                break
+            break
 
         # STEP 4: Undouble
         for double_cons in self.__double_consonants:
@@ -418,8 +468,9 @@ class DutchStemmer(_StandardStemmer):
     """
 
     __vowels = "aeiouy\xE8"
-    __step1_suffixes = ("heden", "ene", "en", "se", "s")
-    __step3b_suffixes = ("baar", "lijk", "bar", "end", "ing", "ig")
+    __step1_suffixes = _SuffixTable(("heden", "ene", "en", "se", "s"))
+    __step3b_suffixes = _SuffixTable(("baar", "lijk", "bar", "end", "ing",
+                                      "ig"))
 
     def stem(self, word):
         """
@@ -473,33 +524,32 @@ class DutchStemmer(_StandardStemmer):
                 break
 
         # STEP 1
-        for suffix in self.__step1_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "heden":
-                    word = suffix_replace(word, suffix, "heid")
-                    r1 = suffix_replace(r1, suffix, "heid")
-                    if r2.endswith("heden"):
-                        r2 = suffix_replace(r2, suffix, "heid")
-
-                elif (suffix in ("ene", "en") and
-                      not word.endswith("heden") and
-                      word[-len(suffix)-1] not in self.__vowels and
-                      word[-len(suffix)-3:-len(suffix)] != "gem"):
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                    r2 = r2[:-len(suffix)]
-                    if word.endswith(("kk", "dd", "tt")):
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                        r2 = r2[:-1]
+        for suffix in self.__step1_suffixes.matches(r1):
+            if suffix == "heden":
+                word = suffix_replace(word, suffix, "heid")
+                r1 = suffix_replace(r1, suffix, "heid")
+                if r2.endswith("heden"):
+                    r2 = suffix_replace(r2, suffix, "heid")
+
+            elif (suffix in ("ene", "en") and
+                  not word.endswith("heden") and
+                  word[-len(suffix)-1] not in self.__vowels and
+                  word[-len(suffix)-3:-len(suffix)] != "gem"):
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+                if word.endswith(("kk", "dd", "tt")):
+                    word = word[:-1]
+                    r1 = r1[:-1]
+                    r2 = r2[:-1]
 
-                elif (suffix in ("se", "s") and
-                      word[-len(suffix)-1] not in self.__vowels and
-                      word[-len(suffix)-1] != "j"):
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                    r2 = r2[:-len(suffix)]
-                break
+            elif (suffix in ("se", "s") and
+                  word[-len(suffix)-1] not in self.__vowels and
+                  word[-len(suffix)-1] != "j"):
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+            break
 
         # STEP 2
         if r1.endswith("e") and word[-2] not in self.__vowels:
@@ -531,36 +581,35 @@ class DutchStemmer(_StandardStemmer):
                     r2 = r2[:-1]
 
         # STEP 3b: Derivational suffixes
-        for suffix in self.__step3b_suffixes:
-            if r2.endswith(suffix):
-                if suffix in ("end", "ing"):
-                    word = word[:-3]
-                    r2 = r2[:-3]
-
-                    if r2.endswith("ig") and word[-3] != "e":
-                        word = word[:-2]
-                    else:
-                        if word.endswith(("kk", "dd", "tt")):
-                            word = word[:-1]
+        for suffix in self.__step3b_suffixes.matches(r2):
+            if suffix in ("end", "ing"):
+                word = word[:-3]
+                r2 = r2[:-3]
 
-                elif suffix == "ig" and word[-3] != "e":
+                if r2.endswith("ig") and word[-3] != "e":
                     word = word[:-2]
+                else:
+                    if word.endswith(("kk", "dd", "tt")):
+                        word = word[:-1]
 
-                elif suffix == "lijk":
-                    word = word[:-4]
-                    r1 = r1[:-4]
+            elif suffix == "ig" and word[-3] != "e":
+                word = word[:-2]
+
+            elif suffix == "lijk":
+                word = word[:-4]
+                r1 = r1[:-4]
 
-                    if r1.endswith("e") and word[-2] not in self.__vowels:
+                if r1.endswith("e") and word[-2] not in self.__vowels:
+                    word = word[:-1]
+                    if word.endswith(("kk", "dd", "tt")):
                         word = word[:-1]
-                        if word.endswith(("kk", "dd", "tt")):
-                            word = word[:-1]
 
-                elif suffix == "baar":
-                    word = word[:-4]
+            elif suffix == "baar":
+                word = word[:-4]
 
-                elif suffix == "bar" and step2_success:
-                    word = word[:-3]
-                break
+            elif suffix == "bar" and step2_success:
+                word = word[:-3]
+            break
 
         # STEP 4: Undouble vowel
         if len(word) >= 4:
@@ -614,20 +663,23 @@ class EnglishStemmer(_StandardStemmer):
     __double_consonants = ("bb", "dd", "ff", "gg", "mm", "nn",
                            "pp", "rr", "tt")
     __li_ending = "cdeghkmnrt"
-    __step0_suffixes = ("'s'", "'s", "'")
-    __step1a_suffixes = ("sses", "ied", "ies", "us", "ss", "s")
-    __step1b_suffixes = ("eedly", "ingly", "edly", "eed", "ing", "ed")
-    __step2_suffixes = ('ization', 'ational', 'fulness', 'ousness',
-                        'iveness', 'tional', 'biliti', 'lessli',
-                        'entli', 'ation', 'alism', 'aliti', 'ousli',
-                        'iviti', 'fulli', 'enci', 'anci', 'abli',
-                        'izer', 'ator', 'alli', 'bli', 'ogi', 'li')
-    __step3_suffixes = ('ational', 'tional', 'alize', 'icate', 'iciti',
-                        'ative', 'ical', 'ness', 'ful')
-    __step4_suffixes = ('ement', 'ance', 'ence', 'able', 'ible', 'ment',
-                        'ant', 'ent', 'ism', 'ate', 'iti', 'ous',
-                        'ive', 'ize', 'ion', 'al', 'er', 'ic')
-    __step5_suffixes = ("e", "l")
+    __step0_suffixes = _SuffixTable(("'s'", "'s", "'"))
+    __step1a_suffixes = _SuffixTable(("sses", "ied", "ies", "us", "ss", "s"))
+    __step1b_suffixes = _SuffixTable(("eedly", "ingly", "edly", "eed", "ing",
+                                      "ed"))
+    __step2_suffixes = _SuffixTable(('ization', 'ational', 'fulness',
+                                     'ousness', 'iveness', 'tional', 'biliti',
+                                     'lessli', 'entli', 'ation', 'alism',
+                                     'aliti', 'ousli', 'iviti', 'fulli',
+                                     'enci', 'anci', 'abli', 'izer', 'ator',
+                                     'alli', 'bli', 'ogi', 'li'))
+    __step3_suffixes = _SuffixTable(('ational', 'tional', 'alize', 'icate',
+                                     'iciti', 'ative', 'ical', 'ness', 'ful'))
+    __step4_suffixes = _SuffixTable(('ement', 'ance', 'ence', 'able', 'ible',
+                                     'ment', 'ant', 'ent', 'ism', 'ate', 'iti',
+                                     'ous', 'ive', 'ize', 'ion', 'al', 'er',
+                                     'ic'))
+    __step5_suffixes = _SuffixTable(("e", "l"))
     __special_words = {"skis" : "ski",
                        "skies" : "sky",
                        "dying" : "die",
@@ -724,102 +776,99 @@ class EnglishStemmer(_StandardStemmer):
 
 
         # STEP 0
-        for suffix in self.__step0_suffixes:
-            if word.endswith(suffix):
-                word = word[:-len(suffix)]
-                r1 = r1[:-len(suffix)]
-                r2 = r2[:-len(suffix)]
-                break
+        for suffix in self.__step0_suffixes.matches(word):
+            word = word[:-len(suffix)]
+            r1 = r1[:-len(suffix)]
+            r2 = r2[:-len(suffix)]
+            break
 
         # STEP 1a
-        for suffix in self.__step1a_suffixes:
-            if word.endswith(suffix):
+        for suffix in self.__step1a_suffixes.matches(word):
+
+            if suffix == "sses":
+                word = word[:-2]
+                r1 = r1[:-2]
+                r2 = r2[:-2]
 
-                if suffix == "sses":
+            elif suffix in ("ied", "ies"):
+                if len(word[:-len(suffix)]) > 1:
                     word = word[:-2]
                     r1 = r1[:-2]
                     r2 = r2[:-2]
+                else:
+                    word = word[:-1]
+                    r1 = r1[:-1]
+                    r2 = r2[:-1]
 
-                elif suffix in ("ied", "ies"):
-                    if len(word[:-len(suffix)]) > 1:
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+            elif suffix == "s":
+                for letter in word[:-2]:
+                    if letter in self.__vowels:
+                        step1a_vowel_found = True
+                        break
+
+                if step1a_vowel_found:
+                    word = word[:-1]
+                    r1 = r1[:-1]
+                    r2 = r2[:-1]
+            break
+
+        # STEP 1b
+        for suffix in self.__step1b_suffixes.matches(word):
+            if suffix in ("eed", "eedly"):
+
+                if r1.endswith(suffix):
+                    word = suffix_replace(word, suffix, "ee")
+
+                    if len(r1) >= len(suffix):
+                        r1 = suffix_replace(r1, suffix, "ee")
                     else:
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                        r2 = r2[:-1]
+                        r1 = ""
 
-                elif suffix == "s":
-                    for letter in word[:-2]:
-                        if letter in self.__vowels:
-                            step1a_vowel_found = True
-                            break
+                    if len(r2) >= len(suffix):
+                        r2 = suffix_replace(r2, suffix, "ee")
+                    else:
+                        r2 = ""
+            else:
+                for letter in word[:-len(suffix)]:
+                    if letter in self.__vowels:
+                        step1b_vowel_found = True
+                        break
 
-                    if step1a_vowel_found:
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                        r2 = r2[:-1]
-                break
+                if step1b_vowel_found:
+                    word = word[:-len(suffix)]
+                    r1 = r1[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
 
-        # STEP 1b
-        for suffix in self.__step1b_suffixes:
-            if word.endswith(suffix):
-                if suffix in ("eed", "eedly"):
+                    if word.endswith(("at", "bl", "iz")):
+                        word = "".join((word, "e"))
+                        r1 = "".join((r1, "e"))
 
-                    if r1.endswith(suffix):
-                        word = suffix_replace(word, suffix, "ee")
+                        if len(word) > 5 or len(r1) >=3:
+                            r2 = "".join((r2, "e"))
 
-                        if len(r1) >= len(suffix):
-                            r1 = suffix_replace(r1, suffix, "ee")
-                        else:
-                            r1 = ""
+                    elif word.endswith(self.__double_consonants):
+                        word = word[:-1]
+                        r1 = r1[:-1]
+                        r2 = r2[:-1]
 
-                        if len(r2) >= len(suffix):
-                            r2 = suffix_replace(r2, suffix, "ee")
-                        else:
-                            r2 = ""
-                else:
-                    for letter in word[:-len(suffix)]:
-                        if letter in self.__vowels:
-                            step1b_vowel_found = True
-                            break
+                    elif ((r1 == "" and len(word) >= 3 and
+                           word[-1] not in self.__vowels and
+                           word[-1] not in "wxY" and
+                           word[-2] in self.__vowels and
+                           word[-3] not in self.__vowels)
+                          or
+                          (r1 == "" and len(word) == 2 and
+                           word[0] in self.__vowels and
+                           word[1] not in self.__vowels)):
 
-                    if step1b_vowel_found:
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
+                        word = "".join((word, "e"))
 
-                        if word.endswith(("at", "bl", "iz")):
-                            word = "".join((word, "e"))
+                        if len(r1) > 0:
                             r1 = "".join((r1, "e"))
 
-                            if len(word) > 5 or len(r1) >=3:
-                                r2 = "".join((r2, "e"))
-
-                        elif word.endswith(self.__double_consonants):
-                            word = word[:-1]
-                            r1 = r1[:-1]
-                            r2 = r2[:-1]
-
-                        elif ((r1 == "" and len(word) >= 3 and
-                               word[-1] not in self.__vowels and
-                               word[-1] not in "wxY" and
-                               word[-2] in self.__vowels and
-                               word[-3] not in self.__vowels)
-                              or
-                              (r1 == "" and len(word) == 2 and
-                               word[0] in self.__vowels and
-                               word[1] not in self.__vowels)):
-
-                            word = "".join((word, "e"))
-
-                            if len(r1) > 0:
-                                r1 = "".join((r1, "e"))
-
-                            if len(r2) > 0:
-                                r2 = "".join((r2, "e"))
-                break
+                        if len(r2) > 0:
+                            r2 = "".join((r2, "e"))
+            break
 
         # STEP 1c
         if len(word) > 2 and word[-1] in "yY" and word[-2] not in self.__vowels:
@@ -835,199 +884,196 @@ class EnglishStemmer(_StandardStemmer):
                 r2 = ""
 
         # STEP 2
-        for suffix in self.__step2_suffixes:
-            if word.endswith(suffix):
-                if r1.endswith(suffix):
-                    if suffix == "tional":
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+        for suffix in self.__step2_suffixes.matches(word):
+            if r1.endswith(suffix):
+                if suffix == "tional":
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
 
-                    elif suffix in ("enci", "anci", "abli"):
-                        word = "".join((word[:-1], "e"))
+                elif suffix in ("enci", "anci", "abli"):
+                    word = "".join((word[:-1], "e"))
 
-                        if len(r1) >= 1:
-                            r1 = "".join((r1[:-1], "e"))
-                        else:
-                            r1 = ""
+                    if len(r1) >= 1:
+                        r1 = "".join((r1[:-1], "e"))
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= 1:
-                            r2 = "".join((r2[:-1], "e"))
-                        else:
-                            r2 = ""
+                    if len(r2) >= 1:
+                        r2 = "".join((r2[:-1], "e"))
+                    else:
+                        r2 = ""
 
-                    elif suffix == "entli":
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+                elif suffix == "entli":
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
 
-                    elif suffix in ("izer", "ization"):
-                        word = suffix_replace(word, suffix, "ize")
+                elif suffix in ("izer", "ization"):
+                    word = suffix_replace(word, suffix, "ize")
 
-                        if len(r1) >= len(suffix):
-                            r1 = suffix_replace(r1, suffix, "ize")
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = suffix_replace(r1, suffix, "ize")
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = suffix_replace(r2, suffix, "ize")
-                        else:
-                            r2 = ""
+                    if len(r2) >= len(suffix):
+                        r2 = suffix_replace(r2, suffix, "ize")
+                    else:
+                        r2 = ""
 
-                    elif suffix in ("ational", "ation", "ator"):
-                        word = suffix_replace(word, suffix, "ate")
+                elif suffix in ("ational", "ation", "ator"):
+                    word = suffix_replace(word, suffix, "ate")
 
-                        if len(r1) >= len(suffix):
-                            r1 = suffix_replace(r1, suffix, "ate")
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = suffix_replace(r1, suffix, "ate")
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = suffix_replace(r2, suffix, "ate")
-                        else:
-                            r2 = "e"
+                    if len(r2) >= len(suffix):
+                        r2 = suffix_replace(r2, suffix, "ate")
+                    else:
+                        r2 = "e"
 
-                    elif suffix in ("alism", "aliti", "alli"):
-                        word = suffix_replace(word, suffix, "al")
+                elif suffix in ("alism", "aliti", "alli"):
+                    word = suffix_replace(word, suffix, "al")
 
-                        if len(r1) >= len(suffix):
-                            r1 = suffix_replace(r1, suffix, "al")
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = suffix_replace(r1, suffix, "al")
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = suffix_replace(r2, suffix, "al")
-                        else:
-                            r2 = ""
+                    if len(r2) >= len(suffix):
+                        r2 = suffix_replace(r2, suffix, "al")
+                    else:
+                        r2 = ""
 
-                    elif suffix == "fulness":
-                        word = word[:-4]
-                        r1 = r1[:-4]
-                        r2 = r2[:-4]
+                elif suffix == "fulness":
+                    word = word[:-4]
+                    r1 = r1[:-4]
+                    r2 = r2[:-4]
 
-                    elif suffix in ("ousli", "ousness"):
-                        word = suffix_replace(word, suffix, "ous")
+                elif suffix in ("ousli", "ousness"):
+                    word = suffix_replace(word, suffix, "ous")
 
-                        if len(r1) >= len(suffix):
-                            r1 = suffix_replace(r1, suffix, "ous")
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = suffix_replace(r1, suffix, "ous")
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = suffix_replace(r2, suffix, "ous")
-                        else:
-                            r2 = ""
+                    if len(r2) >= len(suffix):
+                        r2 = suffix_replace(r2, suffix, "ous")
+                    else:
+                        r2 = ""
 
-                    elif suffix in ("iveness", "iviti"):
-                        word = suffix_replace(word, suffix, "ive")
+                elif suffix in ("iveness", "iviti"):
+                    word = suffix_replace(word, suffix, "ive")
 
-                        if len(r1) >= len(suffix):
-                            r1 = suffix_replace(r1, suffix, "ive")
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = suffix_replace(r1, suffix, "ive")
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = suffix_replace(r2, suffix, "ive")
-                        else:
-                            r2 = "e"
+                    if len(r2) >= len(suffix):
+                        r2 = suffix_replace(r2, suffix, "ive")
+                    else:
+                        r2 = "e"
 
-                    elif suffix in ("biliti", "bli"):
-                        word = suffix_replace(word, suffix, "ble")
+                elif suffix in ("biliti", "bli"):
+                    word = suffix_replace(word, suffix, "ble")
 
-                        if len(r1) >= len(suffix):
-                            r1 = suffix_replace(r1, suffix, "ble")
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = suffix_replace(r1, suffix, "ble")
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = suffix_replace(r2, suffix, "ble")
-                        else:
-                            r2 = ""
+                    if len(r2) >= len(suffix):
+                        r2 = suffix_replace(r2, suffix, "ble")
+                    else:
+                        r2 = ""
 
-                    elif suffix == "ogi" and word[-4] == "l":
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                        r2 = r2[:-1]
+                elif suffix == "ogi" and word[-4] == "l":
+                    word = word[:-1]
+                    r1 = r1[:-1]
+                    r2 = r2[:-1]
 
-                    elif suffix in ("fulli", "lessli"):
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+                elif suffix in ("fulli", "lessli"):
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
 
-                    elif suffix == "li" and word[-3] in self.__li_ending:
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
-                break
+                elif suffix == "li" and word[-3] in self.__li_ending:
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
+            break
 
         # STEP 3
-        for suffix in self.__step3_suffixes:
-            if word.endswith(suffix):
-                if r1.endswith(suffix):
-                    if suffix == "tional":
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+        for suffix in self.__step3_suffixes.matches(word):
+            if r1.endswith(suffix):
+                if suffix == "tional":
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
 
-                    elif suffix == "ational":
-                        word = suffix_replace(word, suffix, "ate")
+                elif suffix == "ational":
+                    word = suffix_replace(word, suffix, "ate")
 
-                        if len(r1) >= len(suffix):
-                            r1 = suffix_replace(r1, suffix, "ate")
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = suffix_replace(r1, suffix, "ate")
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = suffix_replace(r2, suffix, "ate")
-                        else:
-                            r2 = ""
+                    if len(r2) >= len(suffix):
+                        r2 = suffix_replace(r2, suffix, "ate")
+                    else:
+                        r2 = ""
 
-                    elif suffix == "alize":
-                        word = word[:-3]
-                        r1 = r1[:-3]
-                        r2 = r2[:-3]
+                elif suffix == "alize":
+                    word = word[:-3]
+                    r1 = r1[:-3]
+                    r2 = r2[:-3]
 
-                    elif suffix in ("icate", "iciti", "ical"):
-                        word = suffix_replace(word, suffix, "ic")
+                elif suffix in ("icate", "iciti", "ical"):
+                    word = suffix_replace(word, suffix, "ic")
 
-                        if len(r1) >= len(suffix):
-                            r1 = suffix_replace(r1, suffix, "ic")
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = suffix_replace(r1, suffix, "ic")
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = suffix_replace(r2, suffix, "ic")
-                        else:
-                            r2 = ""
+                    if len(r2) >= len(suffix):
+                        r2 = suffix_replace(r2, suffix, "ic")
+                    else:
+                        r2 = ""
 
-                    elif suffix in ("ful", "ness"):
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
+                elif suffix in ("ful", "ness"):
+                    word = word[:-len(suffix)]
+                    r1 = r1[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
 
-                    elif suffix == "ative" and r2.endswith(suffix):
-                        word = word[:-5]
-                        r1 = r1[:-5]
-                        r2 = r2[:-5]
-                break
+                elif suffix == "ative" and r2.endswith(suffix):
+                    word = word[:-5]
+                    r1 = r1[:-5]
+                    r2 = r2[:-5]
+            break
 
         # STEP 4
-        for suffix in self.__step4_suffixes:
-            if word.endswith(suffix):
-                if r2.endswith(suffix):
-                    if suffix == "ion":
-                        if word[-4] in "st":
-                            word = word[:-3]
-                            r1 = r1[:-3]
-                            r2 = r2[:-3]
-                    else:
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                break
-
-        # STEP 5
-        if r2.endswith("l") and word[-2] == "l":
+        for suffix in self.__step4_suffixes.matches(word):
+            if r2.endswith(suffix):
+                if suffix == "ion":
+                    if word[-4] in "st":
+                        word = word[:-3]
+                        r1 = r1[:-3]
+                        r2 = r2[:-3]
+                else:
+                    word = word[:-len(suffix)]
+                    r1 = r1[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+            break
+
+        # STEP 5
+        if r2.endswith("l") and word[-2] == "l":
             word = word[:-1]
         elif r2.endswith("e"):
             word = word[:-1]
@@ -1082,20 +1128,19 @@ class FinnishStemmer(_StandardStemmer):
     __double_consonants = ("bb", "cc", "dd", "ff", "gg", "hh", "jj",
                            "kk", "ll", "mm", "nn", "pp", "qq", "rr",
                            "ss", "tt", "vv", "ww", "xx", "zz")
-    __step1_suffixes = ('kaan', 'k\xE4\xE4n', 'sti', 'kin', 'han',
-                        'h\xE4n', 'ko', 'k\xF6', 'pa', 'p\xE4')
-    __step2_suffixes = ('nsa', 'ns\xE4', 'mme', 'nne', 'si', 'ni',
-                        'an', '\xE4n', 'en')
-    __step3_suffixes = ('siin', 'tten', 'seen', 'han', 'hen', 'hin',
-                        'hon', 'h\xE4n', 'h\xF6n', 'den', 'tta',
-                        'tt\xE4', 'ssa', 'ss\xE4', 'sta',
-                        'st\xE4', 'lla', 'll\xE4', 'lta',
-                        'lt\xE4', 'lle', 'ksi', 'ine', 'ta',
-                        't\xE4', 'na', 'n\xE4', 'a', '\xE4',
-                        'n')
-    __step4_suffixes = ('impi', 'impa', 'imp\xE4', 'immi', 'imma',
-                        'imm\xE4', 'mpi', 'mpa', 'mp\xE4', 'mmi',
-                        'mma', 'mm\xE4', 'eja', 'ej\xE4')
+    __step1_suffixes = _SuffixTable(('kaan', 'k\xE4\xE4n', 'sti', 'kin', 'han',
+                                     'h\xE4n', 'ko', 'k\xF6', 'pa', 'p\xE4'))
+    __step2_suffixes = _SuffixTable(('nsa', 'ns\xE4', 'mme', 'nne', 'si', 'ni',
+                                     'an', '\xE4n', 'en'))
+    __step3_suffixes = _SuffixTable(('siin', 'tten', 'seen', 'han', 'hen',
+                                     'hin', 'hon', 'h\xE4n', 'h\xF6n', 'den',
+                                     'tta', 'tt\xE4', 'ssa', 'ss\xE4', 'sta',
+                                     'st\xE4', 'lla', 'll\xE4', 'lta',
+                                     'lt\xE4', 'lle', 'ksi', 'ine', 'ta',
+                                     't\xE4', 'na', 'n\xE4', 'a', '\xE4', 'n'))
+    __step4_suffixes = _SuffixTable(('impi', 'impa', 'imp\xE4', 'immi', 'imma',
+                                     'imm\xE4', 'mpi', 'mpa', 'mp\xE4', 'mmi',
+                                     'mma', 'mm\xE4', 'eja', 'ej\xE4'))
 
     def stem(self, word):
         """
@@ -1117,148 +1162,144 @@ class FinnishStemmer(_StandardStemmer):
         r1, r2 = self._r1r2_standard(word, self.__vowels)
 
         # STEP 1: Particles etc.
-        for suffix in self.__step1_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "sti":
-                    if suffix in r2:
-                        word = word[:-3]
-                        r1 = r1[:-3]
-                        r2 = r2[:-3]
-                else:
-                    if word[-len(suffix)-1] in "ntaeiouy\xE4\xF6":
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                break
+        for suffix in self.__step1_suffixes.matches(r1):
+            if suffix == "sti":
+                if suffix in r2:
+                    word = word[:-3]
+                    r1 = r1[:-3]
+                    r2 = r2[:-3]
+            else:
+                if word[-len(suffix)-1] in "ntaeiouy\xE4\xF6":
+                    word = word[:-len(suffix)]
+                    r1 = r1[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+            break
 
         # STEP 2: Possessives
-        for suffix in self.__step2_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "si":
-                    if word[-3] != "k":
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
-
-                elif suffix == "ni":
+        for suffix in self.__step2_suffixes.matches(r1):
+            if suffix == "si":
+                if word[-3] != "k":
                     word = word[:-2]
                     r1 = r1[:-2]
                     r2 = r2[:-2]
-                    if word.endswith("kse"):
-                        word = suffix_replace(word, "kse", "ksi")
 
-                    if r1.endswith("kse"):
-                        r1 = suffix_replace(r1, "kse", "ksi")
+            elif suffix == "ni":
+                word = word[:-2]
+                r1 = r1[:-2]
+                r2 = r2[:-2]
+                if word.endswith("kse"):
+                    word = suffix_replace(word, "kse", "ksi")
 
-                    if r2.endswith("kse"):
-                        r2 = suffix_replace(r2, "kse", "ksi")
+                if r1.endswith("kse"):
+                    r1 = suffix_replace(r1, "kse", "ksi")
 
-                elif suffix == "an":
-                    if (word[-4:-2] in ("ta", "na") or
-                        word[-5:-2] in ("ssa", "sta", "lla", "lta")):
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+                if r2.endswith("kse"):
+                    r2 = suffix_replace(r2, "kse", "ksi")
 
-                elif suffix == "\xE4n":
-                    if (word[-4:-2] in ("t\xE4", "n\xE4") or
-                        word[-5:-2] in ("ss\xE4", "st\xE4",
-                                        "ll\xE4", "lt\xE4")):
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+            elif suffix == "an":
+                if (word[-4:-2] in ("ta", "na") or
+                    word[-5:-2] in ("ssa", "sta", "lla", "lta")):
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
 
-                elif suffix == "en":
-                    if word[-5:-2] in ("lle", "ine"):
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
-                else:
+            elif suffix == "\xE4n":
+                if (word[-4:-2] in ("t\xE4", "n\xE4") or
+                    word[-5:-2] in ("ss\xE4", "st\xE4",
+                                    "ll\xE4", "lt\xE4")):
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
+
+            elif suffix == "en":
+                if word[-5:-2] in ("lle", "ine"):
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
+            else:
+                word = word[:-3]
+                r1 = r1[:-3]
+                r2 = r2[:-3]
+            break
+
+        # STEP 3: Cases
+        for suffix in self.__step3_suffixes.matches(r1):
+            if suffix in ("han", "hen", "hin", "hon", "h\xE4n",
+                          "h\xF6n"):
+                if ((suffix == "han" and word[-4] == "a") or
+                    (suffix == "hen" and word[-4] == "e") or
+                    (suffix == "hin" and word[-4] == "i") or
+                    (suffix == "hon" and word[-4] == "o") or
+                    (suffix == "h\xE4n" and word[-4] == "\xE4") or
+                    (suffix == "h\xF6n" and word[-4] == "\xF6")):
                     word = word[:-3]
                     r1 = r1[:-3]
                     r2 = r2[:-3]
-                break
-
-        # STEP 3: Cases
-        for suffix in self.__step3_suffixes:
-            if r1.endswith(suffix):
-                if suffix in ("han", "hen", "hin", "hon", "h\xE4n",
-                              "h\xF6n"):
-                    if ((suffix == "han" and word[-4] == "a") or
-                        (suffix == "hen" and word[-4] == "e") or
-                        (suffix == "hin" and word[-4] == "i") or
-                        (suffix == "hon" and word[-4] == "o") or
-                        (suffix == "h\xE4n" and word[-4] == "\xE4") or
-                        (suffix == "h\xF6n" and word[-4] == "\xF6")):
-                        word = word[:-3]
-                        r1 = r1[:-3]
-                        r2 = r2[:-3]
-                        step3_success = True
-
-                elif suffix in ("siin", "den", "tten"):
-                    if (word[-len(suffix)-1] == "i" and
-                        word[-len(suffix)-2] in self.__restricted_vowels):
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        step3_success = True
-                    else:
-                        continue
-
-                elif suffix == "seen":
-                    if word[-6:-4] in self.__long_vowels:
-                        word = word[:-4]
-                        r1 = r1[:-4]
-                        r2 = r2[:-4]
-                        step3_success = True
-                    else:
-                        continue
+                    step3_success = True
 
-                elif suffix in ("a", "\xE4"):
-                    if word[-2] in self.__vowels and word[-3] in self.__consonants:
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                        r2 = r2[:-1]
-                        step3_success = True
+            elif suffix in ("siin", "den", "tten"):
+                if (word[-len(suffix)-1] == "i" and
+                    word[-len(suffix)-2] in self.__restricted_vowels):
+                    word = word[:-len(suffix)]
+                    r1 = r1[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    step3_success = True
+                else:
+                    continue
 
-                elif suffix in ("tta", "tt\xE4"):
-                    if word[-4] == "e":
-                        word = word[:-3]
-                        r1 = r1[:-3]
-                        r2 = r2[:-3]
-                        step3_success = True
+            elif suffix == "seen":
+                if word[-6:-4] in self.__long_vowels:
+                    word = word[:-4]
+                    r1 = r1[:-4]
+                    r2 = r2[:-4]
+                    step3_success = True
+                else:
+                    continue
 
-                elif suffix == "n":
+            elif suffix in ("a", "\xE4"):
+                if word[-2] in self.__vowels and word[-3] in self.__consonants:
                     word = word[:-1]
                     r1 = r1[:-1]
                     r2 = r2[:-1]
                     step3_success = True
 
-                    if word[-2:] == "ie" or word[-2:] in self.__long_vowels:
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                        r2 = r2[:-1]
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                    r2 = r2[:-len(suffix)]
+            elif suffix in ("tta", "tt\xE4"):
+                if word[-4] == "e":
+                    word = word[:-3]
+                    r1 = r1[:-3]
+                    r2 = r2[:-3]
                     step3_success = True
-                break
+
+            elif suffix == "n":
+                word = word[:-1]
+                r1 = r1[:-1]
+                r2 = r2[:-1]
+                step3_success = True
+
+                if word[-2:] == "ie" or word[-2:] in self.__long_vowels:
+                    word = word[:-1]
+                    r1 = r1[:-1]
+                    r2 = r2[:-1]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+                step3_success = True
+            break
 
         # STEP 4: Other endings
-        for suffix in self.__step4_suffixes:
-            if r2.endswith(suffix):
-                if suffix in ("mpi", "mpa", "mp\xE4", "mmi", "mma",
-                              "mm\xE4"):
-                    if word[-5:-3] != "po":
-                        word = word[:-3]
-                        r1 = r1[:-3]
-                        r2 = r2[:-3]
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                    r2 = r2[:-len(suffix)]
-                break
+        for suffix in self.__step4_suffixes.matches(r2):
+            if suffix in ("mpi", "mpa", "mp\xE4", "mmi", "mma",
+                          "mm\xE4"):
+                if word[-5:-3] != "po":
+                    word = word[:-3]
+                    r1 = r1[:-3]
+                    r2 = r2[:-3]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+            break
 
         # STEP 5: Plurals
         if step3_success and len(r1) >= 1 and r1[-1] in "ij":
@@ -1335,33 +1376,36 @@ class FrenchStemmer(_StandardStemmer):
     """
 
     __vowels = "aeiouy\xE2\xE0\xEB\xE9\xEA\xE8\xEF\xEE\xF4\xFB\xF9"
-    __step1_suffixes = ('issements', 'issement', 'atrices', 'atrice',
-                        'ateurs', 'ations', 'logies', 'usions',
-                        'utions', 'ements', 'amment', 'emment',
-                        'ances', 'iqUes', 'ismes', 'ables', 'istes',
-                        'ateur', 'ation', 'logie', 'usion', 'ution',
-                        'ences', 'ement', 'euses', 'ments', 'ance',
-                        'iqUe', 'isme', 'able', 'iste', 'ence',
-                        'it\xE9s', 'ives', 'eaux', 'euse', 'ment',
-                        'eux', 'it\xE9', 'ive', 'ifs', 'aux', 'if')
-    __step2a_suffixes = ('issaIent', 'issantes', 'iraIent', 'issante',
-                         'issants', 'issions', 'irions', 'issais',
-                         'issait', 'issant', 'issent', 'issiez', 'issons',
-                         'irais', 'irait', 'irent', 'iriez', 'irons',
-                         'iront', 'isses', 'issez', '\xEEmes',
-                         '\xEEtes', 'irai', 'iras', 'irez', 'isse',
-                         'ies', 'ira', '\xEEt', 'ie', 'ir', 'is',
-                         'it', 'i')
-    __step2b_suffixes = ('eraIent', 'assions', 'erions', 'assent',
-                         'assiez', '\xE8rent', 'erais', 'erait',
-                         'eriez', 'erons', 'eront', 'aIent', 'antes',
-                         'asses', 'ions', 'erai', 'eras', 'erez',
-                         '\xE2mes', '\xE2tes', 'ante', 'ants',
-                         'asse', '\xE9es', 'era', 'iez', 'ais',
-                         'ait', 'ant', '\xE9e', '\xE9s', 'er',
-                         'ez', '\xE2t', 'ai', 'as', '\xE9', 'a')
-    __step4_suffixes = ('i\xE8re', 'I\xE8re', 'ion', 'ier', 'Ier',
-                        'e', '\xEB')
+    __step1_suffixes = _SuffixTable(('issements', 'issement', 'atrices',
+                                     'atrice', 'ateurs', 'ations', 'logies',
+                                     'usions', 'utions', 'ements', 'amment',
+                                     'emment', 'ances', 'iqUes', 'ismes',
+                                     'ables', 'istes', 'ateur', 'ation',
+                                     'logie', 'usion', 'ution', 'ences',
+                                     'ement', 'euses', 'ments', 'ance', 'iqUe',
+                                     'isme', 'able', 'iste', 'ence', 'it\xE9s',
+                                     'ives', 'eaux', 'euse', 'ment', 'eux',
+                                     'it\xE9', 'ive', 'ifs', 'aux', 'if'))
+    __step2a_suffixes = _SuffixTable(('issaIent', 'issantes', 'iraIent',
+                                      'issante', 'issants', 'issions',
+                                      'irions', 'issais', 'issait', 'issant',
+                                      'issent', 'issiez', 'issons', 'irais',
+                                      'irait', 'irent', 'iriez', 'irons',
+                                      'iront', 'isses', 'issez', '\xEEmes',
+                                      '\xEEtes', 'irai', 'iras', 'irez',
+                                      'isse', 'ies', 'ira', '\xEEt', 'ie',
+                                      'ir', 'is', 'it', 'i'))
+    __step2b_suffixes = _SuffixTable(('eraIent', 'assions', 'erions', 'assent',
+                                      'assiez', '\xE8rent', 'erais', 'erait',
+                                      'eriez', 'erons', 'eront', 'aIent',
+                                      'antes', 'asses', 'ions', 'erai', 'eras',
+                                      'erez', '\xE2mes', '\xE2tes', 'ante',
+                                      'ants', 'asse', '\xE9es', 'era', 'iez',
+                                      'ais', 'ait', 'ant', '\xE9e', '\xE9s',
+                                      'er', 'ez', '\xE2t', 'ai', 'as', '\xE9',
+                                      'a'))
+    __step4_suffixes = _SuffixTable(('i\xE8re', 'I\xE8re', 'ion', 'ier', 'Ier',
+                                     'e', '\xEB'))
 
     def stem(self, word):
         """
@@ -1408,174 +1452,171 @@ class FrenchStemmer(_StandardStemmer):
         rv = self.__rv_french(word, self.__vowels)
 
         # STEP 1: Standard suffix removal
-        for suffix in self.__step1_suffixes:
-            if word.endswith(suffix):
-                if suffix == "eaux":
-                    word = word[:-1]
+        for suffix in self.__step1_suffixes.matches(word):
+            if suffix == "eaux":
+                word = word[:-1]
+                step1_success = True
+
+            elif suffix in ("euse", "euses"):
+                if suffix in r2:
+                    word = word[:-len(suffix)]
                     step1_success = True
 
-                elif suffix in ("euse", "euses"):
-                    if suffix in r2:
-                        word = word[:-len(suffix)]
-                        step1_success = True
+                elif suffix in r1:
+                    word = suffix_replace(word, suffix, "eux")
+                    step1_success = True
 
-                    elif suffix in r1:
-                        word = suffix_replace(word, suffix, "eux")
-                        step1_success = True
+            elif suffix in ("ement", "ements") and suffix in rv:
+                word = word[:-len(suffix)]
+                step1_success = True
 
-                elif suffix in ("ement", "ements") and suffix in rv:
-                    word = word[:-len(suffix)]
-                    step1_success = True
+                if word[-2:] == "iv" and "iv" in r2:
+                    word = word[:-2]
 
-                    if word[-2:] == "iv" and "iv" in r2:
+                    if word[-2:] == "at" and "at" in r2:
                         word = word[:-2]
 
-                        if word[-2:] == "at" and "at" in r2:
-                            word = word[:-2]
+                elif word[-3:] == "eus":
+                    if "eus" in r2:
+                        word = word[:-3]
+                    elif "eus" in r1:
+                        word = "".join((word[:-1], "x"))
 
-                    elif word[-3:] == "eus":
-                        if "eus" in r2:
-                            word = word[:-3]
-                        elif "eus" in r1:
-                            word = "".join((word[:-1], "x"))
+                elif word[-3:] in ("abl", "iqU"):
+                    if "abl" in r2 or "iqU" in r2:
+                        word = word[:-3]
 
-                    elif word[-3:] in ("abl", "iqU"):
-                        if "abl" in r2 or "iqU" in r2:
-                            word = word[:-3]
+                elif word[-3:] in ("i\xE8r", "I\xE8r"):
+                    if "i\xE8r" in rv or "I\xE8r" in rv:
+                        word = "".join((word[:-3], "i"))
 
-                    elif word[-3:] in ("i\xE8r", "I\xE8r"):
-                        if "i\xE8r" in rv or "I\xE8r" in rv:
-                            word = "".join((word[:-3], "i"))
+            elif suffix == "amment" and suffix in rv:
+                word = suffix_replace(word, "amment", "ant")
+                rv = suffix_replace(rv, "amment", "ant")
+                rv_ending_found = True
 
-                elif suffix == "amment" and suffix in rv:
-                    word = suffix_replace(word, "amment", "ant")
-                    rv = suffix_replace(rv, "amment", "ant")
-                    rv_ending_found = True
+            elif suffix == "emment" and suffix in rv:
+                word = suffix_replace(word, "emment", "ent")
+                rv_ending_found = True
 
-                elif suffix == "emment" and suffix in rv:
-                    word = suffix_replace(word, "emment", "ent")
-                    rv_ending_found = True
+            elif (suffix in ("ment", "ments") and suffix in rv and
+                  not rv.startswith(suffix) and
+                  rv[rv.rindex(suffix)-1] in self.__vowels):
+                word = word[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+                rv_ending_found = True
 
-                elif (suffix in ("ment", "ments") and suffix in rv and
-                      not rv.startswith(suffix) and
-                      rv[rv.rindex(suffix)-1] in self.__vowels):
-                    word = word[:-len(suffix)]
-                    rv = rv[:-len(suffix)]
-                    rv_ending_found = True
+            elif suffix == "aux" and suffix in r1:
+                word = "".join((word[:-2], "l"))
+                step1_success = True
 
-                elif suffix == "aux" and suffix in r1:
-                    word = "".join((word[:-2], "l"))
-                    step1_success = True
+            elif (suffix in ("issement", "issements") and suffix in r1
+                  and word[-len(suffix)-1] not in self.__vowels):
+                word = word[:-len(suffix)]
+                step1_success = True
 
-                elif (suffix in ("issement", "issements") and suffix in r1
-                      and word[-len(suffix)-1] not in self.__vowels):
-                    word = word[:-len(suffix)]
-                    step1_success = True
+            elif suffix in ("ance", "iqUe", "isme", "able", "iste",
+                          "eux", "ances", "iqUes", "ismes",
+                          "ables", "istes") and suffix in r2:
+                word = word[:-len(suffix)]
+                step1_success = True
 
-                elif suffix in ("ance", "iqUe", "isme", "able", "iste",
-                              "eux", "ances", "iqUes", "ismes",
-                              "ables", "istes") and suffix in r2:
-                    word = word[:-len(suffix)]
-                    step1_success = True
+            elif suffix in ("atrice", "ateur", "ation", "atrices",
+                            "ateurs", "ations") and suffix in r2:
+                word = word[:-len(suffix)]
+                step1_success = True
 
-                elif suffix in ("atrice", "ateur", "ation", "atrices",
-                                "ateurs", "ations") and suffix in r2:
-                    word = word[:-len(suffix)]
-                    step1_success = True
+                if word[-2:] == "ic":
+                    if "ic" in r2:
+                        word = word[:-2]
+                    else:
+                        word = "".join((word[:-2], "iqU"))
 
-                    if word[-2:] == "ic":
-                        if "ic" in r2:
-                            word = word[:-2]
-                        else:
-                            word = "".join((word[:-2], "iqU"))
+            elif suffix in ("logie", "logies") and suffix in r2:
+                word = suffix_replace(word, suffix, "log")
+                step1_success = True
 
-                elif suffix in ("logie", "logies") and suffix in r2:
-                    word = suffix_replace(word, suffix, "log")
-                    step1_success = True
+            elif (suffix in ("usion", "ution", "usions", "utions") and
+                  suffix in r2):
+                word = suffix_replace(word, suffix, "u")
+                step1_success = True
 
-                elif (suffix in ("usion", "ution", "usions", "utions") and
-                      suffix in r2):
-                    word = suffix_replace(word, suffix, "u")
-                    step1_success = True
+            elif suffix in ("ence", "ences") and suffix in r2:
+                word = suffix_replace(word, suffix, "ent")
+                step1_success = True
 
-                elif suffix in ("ence", "ences") and suffix in r2:
-                    word = suffix_replace(word, suffix, "ent")
-                    step1_success = True
+            elif suffix in ("it\xE9", "it\xE9s") and suffix in r2:
+                word = word[:-len(suffix)]
+                step1_success = True
 
-                elif suffix in ("it\xE9", "it\xE9s") and suffix in r2:
-                    word = word[:-len(suffix)]
-                    step1_success = True
+                if word[-4:] == "abil":
+                    if "abil" in r2:
+                        word = word[:-4]
+                    else:
+                        word = "".join((word[:-2], "l"))
 
-                    if word[-4:] == "abil":
-                        if "abil" in r2:
-                            word = word[:-4]
-                        else:
-                            word = "".join((word[:-2], "l"))
+                elif word[-2:] == "ic":
+                    if "ic" in r2:
+                        word = word[:-2]
+                    else:
+                        word = "".join((word[:-2], "iqU"))
+
+                elif word[-2:] == "iv":
+                    if "iv" in r2:
+                        word = word[:-2]
+
+            elif (suffix in ("if", "ive", "ifs", "ives") and
+                  suffix in r2):
+                word = word[:-len(suffix)]
+                step1_success = True
 
-                    elif word[-2:] == "ic":
+                if word[-2:] == "at" and "at" in r2:
+                    word = word[:-2]
+
+                    if word[-2:] == "ic":
                         if "ic" in r2:
                             word = word[:-2]
                         else:
                             word = "".join((word[:-2], "iqU"))
-
-                    elif word[-2:] == "iv":
-                        if "iv" in r2:
-                            word = word[:-2]
-
-                elif (suffix in ("if", "ive", "ifs", "ives") and
-                      suffix in r2):
-                    word = word[:-len(suffix)]
-                    step1_success = True
-
-                    if word[-2:] == "at" and "at" in r2:
-                        word = word[:-2]
-
-                        if word[-2:] == "ic":
-                            if "ic" in r2:
-                                word = word[:-2]
-                            else:
-                                word = "".join((word[:-2], "iqU"))
-                break
+            break
 
         # STEP 2a: Verb suffixes beginning 'i'
         if not step1_success or rv_ending_found:
-            for suffix in self.__step2a_suffixes:
-                if word.endswith(suffix):
-                    if (suffix in rv and len(rv) > len(suffix) and
-                        rv[rv.rindex(suffix)-1] not in self.__vowels):
-                        word = word[:-len(suffix)]
-                        step2a_success = True
-                    break
+            for suffix in self.__step2a_suffixes.matches(word):
+                if (suffix in rv and len(rv) > len(suffix) and
+                    rv[rv.rindex(suffix)-1] not in self.__vowels):
+                    word = word[:-len(suffix)]
+                    step2a_success = True
+                break
 
         # STEP 2b: Other verb suffixes
             if not step2a_success:
-                for suffix in self.__step2b_suffixes:
-                    if rv.endswith(suffix):
-                        if suffix == "ions" and "ions" in r2:
-                            word = word[:-4]
-                            step2b_success = True
-
-                        elif suffix in ('eraIent', 'erions', '\xE8rent',
-                                        'erais', 'erait', 'eriez',
-                                        'erons', 'eront', 'erai', 'eras',
-                                        'erez', '\xE9es', 'era', 'iez',
-                                        '\xE9e', '\xE9s', 'er', 'ez',
-                                        '\xE9'):
-                            word = word[:-len(suffix)]
-                            step2b_success = True
-
-                        elif suffix in ('assions', 'assent', 'assiez',
-                                        'aIent', 'antes', 'asses',
-                                        '\xE2mes', '\xE2tes', 'ante',
-                                        'ants', 'asse', 'ais', 'ait',
-                                        'ant', '\xE2t', 'ai', 'as',
-                                        'a'):
-                            word = word[:-len(suffix)]
-                            rv = rv[:-len(suffix)]
-                            step2b_success = True
-                            if rv.endswith("e"):
-                                word = word[:-1]
-                        break
+                for suffix in self.__step2b_suffixes.matches(rv):
+                    if suffix == "ions" and "ions" in r2:
+                        word = word[:-4]
+                        step2b_success = True
+
+                    elif suffix in ('eraIent', 'erions', '\xE8rent',
+                                    'erais', 'erait', 'eriez',
+                                    'erons', 'eront', 'erai', 'eras',
+                                    'erez', '\xE9es', 'era', 'iez',
+                                    '\xE9e', '\xE9s', 'er', 'ez',
+                                    '\xE9'):
+                        word = word[:-len(suffix)]
+                        step2b_success = True
+
+                    elif suffix in ('assions', 'assent', 'assiez',
+                                    'aIent', 'antes', 'asses',
+                                    '\xE2mes', '\xE2tes', 'ante',
+                                    'ants', 'asse', 'ais', 'ait',
+                                    'ant', '\xE2t', 'ai', 'as',
+                                    'a'):
+                        word = word[:-len(suffix)]
+                        rv = rv[:-len(suffix)]
+                        step2b_success = True
+                        if rv.endswith("e"):
+                            word = word[:-1]
+                    break
 
         # STEP 3
         if step1_success or step2a_success or step2b_success:
@@ -1590,23 +1631,22 @@ class FrenchStemmer(_StandardStemmer):
                 word[-2] not in "aiou\xE8s"):
                 word = word[:-1]
 
-            for suffix in self.__step4_suffixes:
-                if word.endswith(suffix):
-                    if suffix in rv:
-                        if (suffix == "ion" and suffix in r2 and
-                            rv[-4] in "st"):
-                            word = word[:-3]
+            for suffix in self.__step4_suffixes.matches(word):
+                if suffix in rv:
+                    if (suffix == "ion" and suffix in r2 and
+                        rv[-4] in "st"):
+                        word = word[:-3]
 
-                        elif suffix in ("ier", "i\xE8re", "Ier",
-                                        "I\xE8re"):
-                            word = suffix_replace(word, suffix, "i")
+                    elif suffix in ("ier", "i\xE8re", "Ier",
+                                    "I\xE8re"):
+                        word = suffix_replace(word, suffix, "i")
 
-                        elif suffix == "e":
-                            word = word[:-1]
+                    elif suffix == "e":
+                        word = word[:-1]
 
-                        elif suffix == "\xEB" and word[-3:-1] == "gu":
-                            word = word[:-1]
-                        break
+                    elif suffix == "\xEB" and word[-3:-1] == "gu":
+                        word = word[:-1]
+                    break
 
         # STEP 5: Undouble
         if word.endswith(("enn", "onn", "ett", "ell", "eill")):
@@ -1694,10 +1734,10 @@ class GermanStemmer(_StandardStemmer):
     __s_ending = "bdfghklmnrt"
     __st_ending = "bdfghklmnt"
 
-    __step1_suffixes = ("ern", "em", "er", "en", "es", "e", "s")
-    __step2_suffixes = ("est", "en", "er", "st")
-    __step3_suffixes = ("isch", "lich", "heit", "keit",
-                          "end", "ung", "ig", "ik")
+    __step1_suffixes = _SuffixTable(("ern", "em", "er", "en", "es", "e", "s"))
+    __step2_suffixes = _SuffixTable(("est", "en", "er", "st"))
+    __step3_suffixes = _SuffixTable(("isch", "lich", "heit", "keit",
+                                       "end", "ung", "ig", "ik"))
 
     def stem(self, word):
         """
@@ -1739,69 +1779,66 @@ class GermanStemmer(_StandardStemmer):
                 break
 
         # STEP 1
-        for suffix in self.__step1_suffixes:
-            if r1.endswith(suffix):
-                if (suffix in ("en", "es", "e") and
-                    word[-len(suffix)-4:-len(suffix)] == "niss"):
-                    word = word[:-len(suffix)-1]
-                    r1 = r1[:-len(suffix)-1]
-                    r2 = r2[:-len(suffix)-1]
-
-                elif suffix == "s":
-                    if word[-2] in self.__s_ending:
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                        r2 = r2[:-1]
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                    r2 = r2[:-len(suffix)]
-                break
+        for suffix in self.__step1_suffixes.matches(r1):
+            if (suffix in ("en", "es", "e") and
+                word[-len(suffix)-4:-len(suffix)] == "niss"):
+                word = word[:-len(suffix)-1]
+                r1 = r1[:-len(suffix)-1]
+                r2 = r2[:-len(suffix)-1]
+
+            elif suffix == "s":
+                if word[-2] in self.__s_ending:
+                    word = word[:-1]
+                    r1 = r1[:-1]
+                    r2 = r2[:-1]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+            break
 
         # STEP 2
-        for suffix in self.__step2_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "st":
-                    if word[-3] in self.__st_ending and len(word[:-3]) >= 3:
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+        for suffix in self.__step2_suffixes.matches(r1):
+            if suffix == "st":
+                if word[-3] in self.__st_ending and len(word[:-3]) >= 3:
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+            break
+
+        # STEP 3: Derivational suffixes
+        for suffix in self.__step3_suffixes.matches(r2):
+            if suffix in ("end", "ung"):
+                if ("ig" in r2[-len(suffix)-2:-len(suffix)] and
+                    "e" not in r2[-len(suffix)-3:-len(suffix)-2]):
+                    word = word[:-len(suffix)-2]
                 else:
                     word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                    r2 = r2[:-len(suffix)]
-                break
 
-        # STEP 3: Derivational suffixes
-        for suffix in self.__step3_suffixes:
-            if r2.endswith(suffix):
-                if suffix in ("end", "ung"):
-                    if ("ig" in r2[-len(suffix)-2:-len(suffix)] and
-                        "e" not in r2[-len(suffix)-3:-len(suffix)-2]):
-                        word = word[:-len(suffix)-2]
-                    else:
-                        word = word[:-len(suffix)]
+            elif (suffix in ("ig", "ik", "isch") and
+                  "e" not in r2[-len(suffix)-1:-len(suffix)]):
+                word = word[:-len(suffix)]
 
-                elif (suffix in ("ig", "ik", "isch") and
-                      "e" not in r2[-len(suffix)-1:-len(suffix)]):
+            elif suffix in ("lich", "heit"):
+                if ("er" in r1[-len(suffix)-2:-len(suffix)] or
+                    "en" in r1[-len(suffix)-2:-len(suffix)]):
+                    word = word[:-len(suffix)-2]
+                else:
                     word = word[:-len(suffix)]
 
-                elif suffix in ("lich", "heit"):
-                    if ("er" in r1[-len(suffix)-2:-len(suffix)] or
-                        "en" in r1[-len(suffix)-2:-len(suffix)]):
-                        word = word[:-len(suffix)-2]
-                    else:
-                        word = word[:-len(suffix)]
-
-                elif suffix == "keit":
-                    if "lich" in r2[-len(suffix)-4:-len(suffix)]:
-                        word = word[:-len(suffix)-4]
+            elif suffix == "keit":
+                if "lich" in r2[-len(suffix)-4:-len(suffix)]:
+                    word = word[:-len(suffix)-4]
 
-                    elif "ig" in r2[-len(suffix)-2:-len(suffix)]:
-                        word = word[:-len(suffix)-2]
-                    else:
-                        word = word[:-len(suffix)]
-                break
+                elif "ig" in r2[-len(suffix)-2:-len(suffix)]:
+                    word = word[:-len(suffix)-2]
+                else:
+                    word = word[:-len(suffix)]
+            break
 
         # Umlaut accents are removed and
         # 'u' and 'y' are put back into lower case.
@@ -1856,43 +1893,43 @@ class HungarianStemmer(_LanguageSpecificStemmer):
                              "nn", "nny", "pp", "rr", "ss", "ssz",
                              "tt", "tty", "vv", "zz", "zzs")
 
-    __step1_suffixes = ("al", "el")
-    __step2_suffixes = ('k\xE9ppen', 'onk\xE9nt', 'enk\xE9nt',
-                        'ank\xE9nt', 'k\xE9pp', 'k\xE9nt', 'ban',
-                        'ben', 'nak', 'nek', 'val', 'vel', 't\xF3l',
-                        't\xF5l', 'r\xF3l', 'r\xF5l', 'b\xF3l',
-                        'b\xF5l', 'hoz', 'hez', 'h\xF6z',
-                        'n\xE1l', 'n\xE9l', '\xE9rt', 'kor',
-                        'ba', 'be', 'ra', 're', 'ig', 'at', 'et',
-                        'ot', '\xF6t', 'ul', '\xFCl', 'v\xE1',
-                        'v\xE9', 'en', 'on', 'an', '\xF6n',
-                        'n', 't')
-    __step3_suffixes = ("\xE1nk\xE9nt", "\xE1n", "\xE9n")
-    __step4_suffixes = ('astul', 'est\xFCl', '\xE1stul',
-                        '\xE9st\xFCl', 'stul', 'st\xFCl')
-    __step5_suffixes = ("\xE1", "\xE9")
-    __step6_suffixes = ('ok\xE9', '\xF6k\xE9', 'ak\xE9',
-                        'ek\xE9', '\xE1k\xE9', '\xE1\xE9i',
-                        '\xE9k\xE9', '\xE9\xE9i', 'k\xE9',
-                        '\xE9i', '\xE9\xE9', '\xE9')
-    __step7_suffixes = ('\xE1juk', '\xE9j\xFCk', '\xFCnk',
-                        'unk', 'juk', 'j\xFCk', '\xE1nk',
-                        '\xE9nk', 'nk', 'uk', '\xFCk', 'em',
-                        'om', 'am', 'od', 'ed', 'ad', '\xF6d',
-                        'ja', 'je', '\xE1m', '\xE1d', '\xE9m',
-                        '\xE9d', 'm', 'd', 'a', 'e', 'o',
-                        '\xE1', '\xE9')
-    __step8_suffixes = ('jaitok', 'jeitek', 'jaink', 'jeink', 'aitok',
-                        'eitek', '\xE1itok', '\xE9itek', 'jaim',
-                        'jeim', 'jaid', 'jeid', 'eink', 'aink',
-                        'itek', 'jeik', 'jaik', '\xE1ink',
-                        '\xE9ink', 'aim', 'eim', 'aid', 'eid',
-                        'jai', 'jei', 'ink', 'aik', 'eik',
-                        '\xE1im', '\xE1id', '\xE1ik', '\xE9im',
-                        '\xE9id', '\xE9ik', 'im', 'id', 'ai',
-                        'ei', 'ik', '\xE1i', '\xE9i', 'i')
-    __step9_suffixes = ("\xE1k", "\xE9k", "\xF6k", "ok",
-                        "ek", "ak", "k")
+    __step1_suffixes = _SuffixTable(("al", "el"))
+    __step2_suffixes = _SuffixTable(('k\xE9ppen', 'onk\xE9nt', 'enk\xE9nt',
+                                     'ank\xE9nt', 'k\xE9pp', 'k\xE9nt', 'ban',
+                                     'ben', 'nak', 'nek', 'val', 'vel',
+                                     't\xF3l', 't\xF5l', 'r\xF3l', 'r\xF5l',
+                                     'b\xF3l', 'b\xF5l', 'hoz', 'hez',
+                                     'h\xF6z', 'n\xE1l', 'n\xE9l', '\xE9rt',
+                                     'kor', 'ba', 'be', 'ra', 're', 'ig', 'at',
+                                     'et', 'ot', '\xF6t', 'ul', '\xFCl',
+                                     'v\xE1', 'v\xE9', 'en', 'on', 'an',
+                                     '\xF6n', 'n', 't'))
+    __step3_suffixes = _SuffixTable(("\xE1nk\xE9nt", "\xE1n", "\xE9n"))
+    __step4_suffixes = _SuffixTable(('astul', 'est\xFCl', '\xE1stul',
+                                     '\xE9st\xFCl', 'stul', 'st\xFCl'))
+    __step5_suffixes = _SuffixTable(("\xE1", "\xE9"))
+    __step6_suffixes = _SuffixTable(('ok\xE9', '\xF6k\xE9', 'ak\xE9',
+                                     'ek\xE9', '\xE1k\xE9', '\xE1\xE9i',
+                                     '\xE9k\xE9', '\xE9\xE9i', 'k\xE9',
+                                     '\xE9i', '\xE9\xE9', '\xE9'))
+    __step7_suffixes = _SuffixTable(('\xE1juk', '\xE9j\xFCk', '\xFCnk',
+                                     'unk', 'juk', 'j\xFCk', '\xE1nk',
+                                     '\xE9nk', 'nk', 'uk', '\xFCk', 'em',
+                                     'om', 'am', 'od', 'ed', 'ad', '\xF6d',
+                                     'ja', 'je', '\xE1m', '\xE1d', '\xE9m',
+                                     '\xE9d', 'm', 'd', 'a', 'e', 'o',
+                                     '\xE1', '\xE9'))
+    __step8_suffixes = _SuffixTable(('jaitok', 'jeitek', 'jaink', 'jeink',
+                                     'aitok', 'eitek', '\xE1itok', '\xE9itek',
+                                     'jaim', 'jeim', 'jaid', 'jeid', 'eink',
+                                     'aink', 'itek', 'jeik', 'jaik', '\xE1ink',
+                                     '\xE9ink', 'aim', 'eim', 'aid', 'eid',
+                                     'jai', 'jei', 'ink', 'aik', 'eik',
+                                     '\xE1im', '\xE1id', '\xE1ik', '\xE9im',
+                                     '\xE9id', '\xE9ik', 'im', 'id', 'ai',
+                                     'ei', 'ik', '\xE1i', '\xE9i', 'i'))
+    __step9_suffixes = _SuffixTable(("\xE1k", "\xE9k", "\xF6k", "ok",
+                                     "ek", "ak", "k"))
 
     def stem(self, word):
         """
@@ -1922,46 +1959,43 @@ class HungarianStemmer(_LanguageSpecificStemmer):
                     break
 
         # STEP 2: Remove frequent cases
-        for suffix in self.__step2_suffixes:
-            if word.endswith(suffix):
-                if r1.endswith(suffix):
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
+        for suffix in self.__step2_suffixes.matches(word):
+            if r1.endswith(suffix):
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
 
-                    if r1.endswith("\xE1"):
-                        word = "".join((word[:-1], "a"))
-                        r1 = suffix_replace(r1, "\xE1", "a")
+                if r1.endswith("\xE1"):
+                    word = "".join((word[:-1], "a"))
+                    r1 = suffix_replace(r1, "\xE1", "a")
 
-                    elif r1.endswith("\xE9"):
-                        word = "".join((word[:-1], "e"))
-                        r1 = suffix_replace(r1, "\xE9", "e")
-                break
+                elif r1.endswith("\xE9"):
+                    word = "".join((word[:-1], "e"))
+                    r1 = suffix_replace(r1, "\xE9", "e")
+            break
 
         # STEP 3: Remove special cases
-        for suffix in self.__step3_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "\xE9n":
-                    word = suffix_replace(word, suffix, "e")
-                    r1 = suffix_replace(r1, suffix, "e")
-                else:
-                    word = suffix_replace(word, suffix, "a")
-                    r1 = suffix_replace(r1, suffix, "a")
-                break
+        for suffix in self.__step3_suffixes.matches(r1):
+            if suffix == "\xE9n":
+                word = suffix_replace(word, suffix, "e")
+                r1 = suffix_replace(r1, suffix, "e")
+            else:
+                word = suffix_replace(word, suffix, "a")
+                r1 = suffix_replace(r1, suffix, "a")
+            break
 
         # STEP 4: Remove other cases
-        for suffix in self.__step4_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "\xE1stul":
-                    word = suffix_replace(word, suffix, "a")
-                    r1 = suffix_replace(r1, suffix, "a")
-
-                elif suffix == "\xE9st\xFCl":
-                    word = suffix_replace(word, suffix, "e")
-                    r1 = suffix_replace(r1, suffix, "e")
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                break
+        for suffix in self.__step4_suffixes.matches(r1):
+            if suffix == "\xE1stul":
+                word = suffix_replace(word, suffix, "a")
+                r1 = suffix_replace(r1, suffix, "a")
+
+            elif suffix == "\xE9st\xFCl":
+                word = suffix_replace(word, suffix, "e")
+                r1 = suffix_replace(r1, suffix, "e")
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+            break
 
         # STEP 5: Remove factive case
         for suffix in self.__step5_suffixes:
@@ -1975,68 +2009,64 @@ class HungarianStemmer(_LanguageSpecificStemmer):
                         break
 
         # STEP 6: Remove owned
-        for suffix in self.__step6_suffixes:
+        for suffix in self.__step6_suffixes.matches(r1):
+            if suffix in ("\xE1k\xE9", "\xE1\xE9i"):
+                word = suffix_replace(word, suffix, "a")
+                r1 = suffix_replace(r1, suffix, "a")
+
+            elif suffix in ("\xE9k\xE9", "\xE9\xE9i",
+                            "\xE9\xE9"):
+                word = suffix_replace(word, suffix, "e")
+                r1 = suffix_replace(r1, suffix, "e")
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+            break
+
+        # STEP 7: Remove singular owner suffixes
+        for suffix in self.__step7_suffixes.matches(word):
             if r1.endswith(suffix):
-                if suffix in ("\xE1k\xE9", "\xE1\xE9i"):
+                if suffix in ("\xE1nk", "\xE1juk", "\xE1m",
+                              "\xE1d", "\xE1"):
                     word = suffix_replace(word, suffix, "a")
                     r1 = suffix_replace(r1, suffix, "a")
 
-                elif suffix in ("\xE9k\xE9", "\xE9\xE9i",
-                                "\xE9\xE9"):
+                elif suffix in ("\xE9nk", "\xE9j\xFCk",
+                                "\xE9m", "\xE9d", "\xE9"):
                     word = suffix_replace(word, suffix, "e")
                     r1 = suffix_replace(r1, suffix, "e")
                 else:
                     word = word[:-len(suffix)]
                     r1 = r1[:-len(suffix)]
-                break
-
-        # STEP 7: Remove singular owner suffixes
-        for suffix in self.__step7_suffixes:
-            if word.endswith(suffix):
-                if r1.endswith(suffix):
-                    if suffix in ("\xE1nk", "\xE1juk", "\xE1m",
-                                  "\xE1d", "\xE1"):
-                        word = suffix_replace(word, suffix, "a")
-                        r1 = suffix_replace(r1, suffix, "a")
-
-                    elif suffix in ("\xE9nk", "\xE9j\xFCk",
-                                    "\xE9m", "\xE9d", "\xE9"):
-                        word = suffix_replace(word, suffix, "e")
-                        r1 = suffix_replace(r1, suffix, "e")
-                    else:
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                break
+            break
 
         # STEP 8: Remove plural owner suffixes
-        for suffix in self.__step8_suffixes:
-            if word.endswith(suffix):
-                if r1.endswith(suffix):
-                    if suffix in ("\xE1im", "\xE1id", "\xE1i",
-                                  "\xE1ink", "\xE1itok", "\xE1ik"):
-                        word = suffix_replace(word, suffix, "a")
-                        r1 = suffix_replace(r1, suffix, "a")
-
-                    elif suffix in ("\xE9im", "\xE9id", "\xE9i",
-                                    "\xE9ink", "\xE9itek", "\xE9ik"):
-                        word = suffix_replace(word, suffix, "e")
-                        r1 = suffix_replace(r1, suffix, "e")
-                    else:
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                break
+        for suffix in self.__step8_suffixes.matches(word):
+            if r1.endswith(suffix):
+                if suffix in ("\xE1im", "\xE1id", "\xE1i",
+                              "\xE1ink", "\xE1itok", "\xE1ik"):
+                    word = suffix_replace(word, suffix, "a")
+                    r1 = suffix_replace(r1, suffix, "a")
+
+                elif suffix in ("\xE9im", "\xE9id", "\xE9i",
+                                "\xE9ink", "\xE9itek", "\xE9ik"):
+                    word = suffix_replace(word, suffix, "e")
+                    r1 = suffix_replace(r1, suffix, "e")
+                else:
+                    word = word[:-len(suffix)]
+                    r1 = r1[:-len(suffix)]
+            break
 
         # STEP 9: Remove plural suffixes
-        for suffix in self.__step9_suffixes:
-            if word.endswith(suffix):
-                if r1.endswith(suffix):
-                    if suffix == "\xE1k":
-                        word = suffix_replace(word, suffix, "a")
-                    elif suffix == "\xE9k":
-                        word = suffix_replace(word, suffix, "e")
-                    else:
-                        word = word[:-len(suffix)]
-                break
+        for suffix in self.__step9_suffixes.matches(word):
+            if r1.endswith(suffix):
+                if suffix == "\xE1k":
+                    word = suffix_replace(word, suffix, "a")
+                elif suffix == "\xE9k":
+                    word = suffix_replace(word, suffix, "e")
+                else:
+                    word = word[:-len(suffix)]
+            break
 
 
         return word
@@ -2109,42 +2139,44 @@ class ItalianStemmer(_StandardStemmer):
     """
 
     __vowels = "aeiou\xE0\xE8\xEC\xF2\xF9"
-    __step0_suffixes = ('gliela', 'gliele', 'glieli', 'glielo',
-                        'gliene', 'sene', 'mela', 'mele', 'meli',
-                        'melo', 'mene', 'tela', 'tele', 'teli',
-                        'telo', 'tene', 'cela', 'cele', 'celi',
-                        'celo', 'cene', 'vela', 'vele', 'veli',
-                        'velo', 'vene', 'gli', 'ci', 'la', 'le',
-                        'li', 'lo', 'mi', 'ne', 'si', 'ti', 'vi')
-    __step1_suffixes = ('atrice', 'atrici', 'azione', 'azioni',
-                        'uzione', 'uzioni', 'usione', 'usioni',
-                        'amento', 'amenti', 'imento', 'imenti',
-                        'amente', 'abile', 'abili', 'ibile', 'ibili',
-                        'mente', 'atore', 'atori', 'logia', 'logie',
-                        'anza', 'anze', 'iche', 'ichi', 'ismo',
-                        'ismi', 'ista', 'iste', 'isti', 'ist\xE0',
-                        'ist\xE8', 'ist\xEC', 'ante', 'anti',
-                        'enza', 'enze', 'ico', 'ici', 'ica', 'ice',
-                        'oso', 'osi', 'osa', 'ose', 'it\xE0',
-                        'ivo', 'ivi', 'iva', 'ive')
-    __step2_suffixes = ('erebbero', 'irebbero', 'assero', 'assimo',
-                        'eranno', 'erebbe', 'eremmo', 'ereste',
-                        'eresti', 'essero', 'iranno', 'irebbe',
-                        'iremmo', 'ireste', 'iresti', 'iscano',
-                        'iscono', 'issero', 'arono', 'avamo', 'avano',
-                        'avate', 'eremo', 'erete', 'erono', 'evamo',
-                        'evano', 'evate', 'iremo', 'irete', 'irono',
-                        'ivamo', 'ivano', 'ivate', 'ammo', 'ando',
-                        'asse', 'assi', 'emmo', 'enda', 'ende',
-                        'endi', 'endo', 'erai', 'erei', 'Yamo',
-                        'iamo', 'immo', 'irai', 'irei', 'isca',
-                        'isce', 'isci', 'isco', 'ano', 'are', 'ata',
-                        'ate', 'ati', 'ato', 'ava', 'avi', 'avo',
-                        'er\xE0', 'ere', 'er\xF2', 'ete', 'eva',
-                        'evi', 'evo', 'ir\xE0', 'ire', 'ir\xF2',
-                        'ita', 'ite', 'iti', 'ito', 'iva', 'ivi',
-                        'ivo', 'ono', 'uta', 'ute', 'uti', 'uto',
-                        'ar', 'ir')
+    __step0_suffixes = _SuffixTable(('gliela', 'gliele', 'glieli', 'glielo',
+                                     'gliene', 'sene', 'mela', 'mele', 'meli',
+                                     'melo', 'mene', 'tela', 'tele', 'teli',
+                                     'telo', 'tene', 'cela', 'cele', 'celi',
+                                     'celo', 'cene', 'vela', 'vele', 'veli',
+                                     'velo', 'vene', 'gli', 'ci', 'la', 'le',
+                                     'li', 'lo', 'mi', 'ne', 'si', 'ti', 'vi'))
+    __step1_suffixes = _SuffixTable(('atrice', 'atrici', 'azione', 'azioni',
+                                     'uzione', 'uzioni', 'usione', 'usioni',
+                                     'amento', 'amenti', 'imento', 'imenti',
+                                     'amente', 'abile', 'abili', 'ibile',
+                                     'ibili', 'mente', 'atore', 'atori',
+                                     'logia', 'logie', 'anza', 'anze', 'iche',
+                                     'ichi', 'ismo', 'ismi', 'ista', 'iste',
+                                     'isti', 'ist\xE0', 'ist\xE8', 'ist\xEC',
+                                     'ante', 'anti', 'enza', 'enze', 'ico',
+                                     'ici', 'ica', 'ice', 'oso', 'osi', 'osa',
+                                     'ose', 'it\xE0', 'ivo', 'ivi', 'iva',
+                                     'ive'))
+    __step2_suffixes = _SuffixTable(('erebbero', 'irebbero', 'assero',
+                                     'assimo', 'eranno', 'erebbe', 'eremmo',
+                                     'ereste', 'eresti', 'essero', 'iranno',
+                                     'irebbe', 'iremmo', 'ireste', 'iresti',
+                                     'iscano', 'iscono', 'issero', 'arono',
+                                     'avamo', 'avano', 'avate', 'eremo',
+                                     'erete', 'erono', 'evamo', 'evano',
+                                     'evate', 'iremo', 'irete', 'irono',
+                                     'ivamo', 'ivano', 'ivate', 'ammo', 'ando',
+                                     'asse', 'assi', 'emmo', 'enda', 'ende',
+                                     'endi', 'endo', 'erai', 'erei', 'Yamo',
+                                     'iamo', 'immo', 'irai', 'irei', 'isca',
+                                     'isce', 'isci', 'isco', 'ano', 'are',
+                                     'ata', 'ate', 'ati', 'ato', 'ava', 'avi',
+                                     'avo', 'er\xE0', 'ere', 'er\xF2', 'ete',
+                                     'eva', 'evi', 'evo', 'ir\xE0', 'ire',
+                                     'ir\xF2', 'ita', 'ite', 'iti', 'ito',
+                                     'iva', 'ivi', 'ivo', 'ono', 'uta', 'ute',
+                                     'uti', 'uto', 'ar', 'ir'))
 
     def stem(self, word):
         """
@@ -2190,117 +2222,114 @@ class ItalianStemmer(_StandardStemmer):
         rv = self._rv_standard(word, self.__vowels)
 
         # STEP 0: Attached pronoun
-        for suffix in self.__step0_suffixes:
-            if rv.endswith(suffix):
-                if rv[-len(suffix)-4:-len(suffix)] in ("ando", "endo"):
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                    r2 = r2[:-len(suffix)]
-                    rv = rv[:-len(suffix)]
-
-                elif (rv[-len(suffix)-2:-len(suffix)] in
-                      ("ar", "er", "ir")):
-                    word = suffix_replace(word, suffix, "e")
-                    r1 = suffix_replace(r1, suffix, "e")
-                    r2 = suffix_replace(r2, suffix, "e")
-                    rv = suffix_replace(rv, suffix, "e")
-                break
+        for suffix in self.__step0_suffixes.matches(rv):
+            if rv[-len(suffix)-4:-len(suffix)] in ("ando", "endo"):
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+
+            elif (rv[-len(suffix)-2:-len(suffix)] in
+                  ("ar", "er", "ir")):
+                word = suffix_replace(word, suffix, "e")
+                r1 = suffix_replace(r1, suffix, "e")
+                r2 = suffix_replace(r2, suffix, "e")
+                rv = suffix_replace(rv, suffix, "e")
+            break
 
         # STEP 1: Standard suffix removal
-        for suffix in self.__step1_suffixes:
-            if word.endswith(suffix):
-                if suffix == "amente" and r1.endswith(suffix):
-                    step1_success = True
-                    word = word[:-6]
-                    r2 = r2[:-6]
-                    rv = rv[:-6]
-
-                    if r2.endswith("iv"):
-                        word = word[:-2]
-                        r2 = r2[:-2]
-                        rv = rv[:-2]
+        for suffix in self.__step1_suffixes.matches(word):
+            if suffix == "amente" and r1.endswith(suffix):
+                step1_success = True
+                word = word[:-6]
+                r2 = r2[:-6]
+                rv = rv[:-6]
 
-                        if r2.endswith("at"):
-                            word = word[:-2]
-                            rv = rv[:-2]
+                if r2.endswith("iv"):
+                    word = word[:-2]
+                    r2 = r2[:-2]
+                    rv = rv[:-2]
 
-                    elif r2.endswith(("os", "ic")):
+                    if r2.endswith("at"):
                         word = word[:-2]
                         rv = rv[:-2]
 
-                    elif r2 .endswith("abil"):
-                        word = word[:-4]
-                        rv = rv[:-4]
+                elif r2.endswith(("os", "ic")):
+                    word = word[:-2]
+                    rv = rv[:-2]
 
-                elif (suffix in ("amento", "amenti",
-                                 "imento", "imenti") and
-                      rv.endswith(suffix)):
-                    step1_success = True
-                    word = word[:-6]
-                    rv = rv[:-6]
+                elif r2 .endswith("abil"):
+                    word = word[:-4]
+                    rv = rv[:-4]
 
-                elif r2.endswith(suffix):
-                    step1_success = True
-                    if suffix in ("azione", "azioni", "atore", "atori"):
-                        word = word[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
+            elif (suffix in ("amento", "amenti",
+                             "imento", "imenti") and
+                  rv.endswith(suffix)):
+                step1_success = True
+                word = word[:-6]
+                rv = rv[:-6]
 
-                        if r2.endswith("ic"):
-                            word = word[:-2]
-                            rv = rv[:-2]
+            elif r2.endswith(suffix):
+                step1_success = True
+                if suffix in ("azione", "azioni", "atore", "atori"):
+                    word = word[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
 
-                    elif suffix in ("logia", "logie"):
+                    if r2.endswith("ic"):
                         word = word[:-2]
-                        rv = word[:-2]
+                        rv = rv[:-2]
 
-                    elif suffix in ("uzione", "uzioni",
-                                    "usione", "usioni"):
-                        word = word[:-5]
-                        rv = rv[:-5]
+                elif suffix in ("logia", "logie"):
+                    word = word[:-2]
+                    rv = word[:-2]
 
-                    elif suffix in ("enza", "enze"):
-                        word = suffix_replace(word, suffix, "te")
-                        rv = suffix_replace(rv, suffix, "te")
+                elif suffix in ("uzione", "uzioni",
+                                "usione", "usioni"):
+                    word = word[:-5]
+                    rv = rv[:-5]
 
-                    elif suffix == "it\xE0":
-                        word = word[:-3]
-                        r2 = r2[:-3]
-                        rv = rv[:-3]
+                elif suffix in ("enza", "enze"):
+                    word = suffix_replace(word, suffix, "te")
+                    rv = suffix_replace(rv, suffix, "te")
 
-                        if r2.endswith(("ic", "iv")):
-                            word = word[:-2]
-                            rv = rv[:-2]
+                elif suffix == "it\xE0":
+                    word = word[:-3]
+                    r2 = r2[:-3]
+                    rv = rv[:-3]
 
-                        elif r2.endswith("abil"):
-                            word = word[:-4]
-                            rv = rv[:-4]
+                    if r2.endswith(("ic", "iv")):
+                        word = word[:-2]
+                        rv = rv[:-2]
 
-                    elif suffix in ("ivo", "ivi", "iva", "ive"):
-                        word = word[:-3]
-                        r2 = r2[:-3]
-                        rv = rv[:-3]
+                    elif r2.endswith("abil"):
+                        word = word[:-4]
+                        rv = rv[:-4]
 
-                        if r2.endswith("at"):
-                            word = word[:-2]
-                            r2 = r2[:-2]
-                            rv = rv[:-2]
+                elif suffix in ("ivo", "ivi", "iva", "ive"):
+                    word = word[:-3]
+                    r2 = r2[:-3]
+                    rv = rv[:-3]
 
-                            if r2.endswith("ic"):
-                                word = word[:-2]
-                                rv = rv[:-2]
-                    else:
-                        word = word[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-                break
+                    if r2.endswith("at"):
+                        word = word[:-2]
+                        r2 = r2[:-2]
+                        rv = rv[:-2]
 
-        # STEP 2: Verb suffixes
-        if not step1_success:
-            for suffix in self.__step2_suffixes:
-                if rv.endswith(suffix):
+                        if r2.endswith("ic"):
+                            word = word[:-2]
+                            rv = rv[:-2]
+                else:
                     word = word[:-len(suffix)]
                     rv = rv[:-len(suffix)]
-                    break
+            break
+
+        # STEP 2: Verb suffixes
+        if not step1_success:
+            for suffix in self.__step2_suffixes.matches(rv):
+                word = word[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+                break
 
         # STEP 3a
         if rv.endswith(("a", "e", "i", "o", "\xE0", "\xE8",
@@ -2346,16 +2375,17 @@ class NorwegianStemmer(_ScandinavianStemmer):
 
     __vowels = "aeiouy\xE6\xE5\xF8"
     __s_ending = "bcdfghjlmnoprtvyz"
-    __step1_suffixes = ("hetenes", "hetene", "hetens", "heter",
-                        "heten", "endes", "ande", "ende", "edes",
-                        "enes", "erte", "ede", "ane", "ene", "ens",
-                        "ers", "ets", "het", "ast", "ert", "en",
-                        "ar", "er", "as", "es", "et", "a", "e", "s")
+    __step1_suffixes = _SuffixTable(("hetenes", "hetene", "hetens", "heter",
+                                     "heten", "endes", "ande", "ende", "edes",
+                                     "enes", "erte", "ede", "ane", "ene",
+                                     "ens", "ers", "ets", "het", "ast", "ert",
+                                     "en", "ar", "er", "as", "es", "et", "a",
+                                     "e", "s"))
 
-    __step2_suffixes = ("dt", "vt")
+    __step2_suffixes = _SuffixTable(("dt", "vt"))
 
-    __step3_suffixes = ("hetslov", "eleg", "elig", "elov", "slov",
-                          "leg", "eig", "lig", "els", "lov", "ig")
+    __step3_suffixes = _SuffixTable(("hetslov", "eleg", "elig", "elov", "slov",
+                                     "leg", "eig", "lig", "els", "lov", "ig"))
 
     def stem(self, word):
         """
@@ -2375,34 +2405,31 @@ class NorwegianStemmer(_ScandinavianStemmer):
         r1 = self._r1_scandinavian(word, self.__vowels)
 
         # STEP 1
-        for suffix in self.__step1_suffixes:
-            if r1.endswith(suffix):
-                if suffix in ("erte", "ert"):
-                    word = suffix_replace(word, suffix, "er")
-                    r1 = suffix_replace(r1, suffix, "er")
-
-                elif suffix == "s":
-                    if (word[-2] in self.__s_ending or
-                        (word[-2] == "k" and word[-3] not in self.__vowels)):
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                break
+        for suffix in self.__step1_suffixes.matches(r1):
+            if suffix in ("erte", "ert"):
+                word = suffix_replace(word, suffix, "er")
+                r1 = suffix_replace(r1, suffix, "er")
+
+            elif suffix == "s":
+                if (word[-2] in self.__s_ending or
+                    (word[-2] == "k" and word[-3] not in self.__vowels)):
+                    word = word[:-1]
+                    r1 = r1[:-1]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+            break
 
         # STEP 2
-        for suffix in self.__step2_suffixes:
-            if r1.endswith(suffix):
-                word = word[:-1]
-                r1 = r1[:-1]
-                break
+        for suffix in self.__step2_suffixes.matches(r1):
+            word = word[:-1]
+            r1 = r1[:-1]
+            break
 
         # STEP 3
-        for suffix in self.__step3_suffixes:
-            if r1.endswith(suffix):
-                word = word[:-len(suffix)]
-                break
+        for suffix in self.__step3_suffixes.matches(r1):
+            word = word[:-len(suffix)]
+            break
 
 
         return word
@@ -2429,46 +2456,46 @@ class PortugueseStemmer(_StandardStemmer):
     """
 
     __vowels = "aeiou\xE1\xE9\xED\xF3\xFA\xE2\xEA\xF4"
-    __step1_suffixes = ('amentos', 'imentos', 'uço~es', 'amento',
-                        'imento', 'adoras', 'adores', 'a\xE7o~es',
-                        'logias', '\xEAncias', 'amente',
-                        'idades', 'an\xE7as', 'ismos', 'istas', 'adora',
-                        'a\xE7a~o', 'antes', '\xE2ncia',
-                        'logia', 'uça~o', '\xEAncia',
-                        'mente', 'idade', 'an\xE7a', 'ezas', 'icos', 'icas',
-                        'ismo', '\xE1vel', '\xEDvel', 'ista',
-                        'osos', 'osas', 'ador', 'ante', 'ivas',
-                        'ivos', 'iras', 'eza', 'ico', 'ica',
-                        'oso', 'osa', 'iva', 'ivo', 'ira')
-    __step2_suffixes = ('ar\xEDamos', 'er\xEDamos', 'ir\xEDamos',
-                        '\xE1ssemos', '\xEAssemos', '\xEDssemos',
-                        'ar\xEDeis', 'er\xEDeis', 'ir\xEDeis',
-                        '\xE1sseis', '\xE9sseis', '\xEDsseis',
-                        '\xE1ramos', '\xE9ramos', '\xEDramos',
-                        '\xE1vamos', 'aremos', 'eremos', 'iremos',
-                        'ariam', 'eriam', 'iriam', 'assem', 'essem',
-                        'issem', 'ara~o', 'era~o', 'ira~o', 'arias',
-                        'erias', 'irias', 'ardes', 'erdes', 'irdes',
-                        'asses', 'esses', 'isses', 'astes', 'estes',
-                        'istes', '\xE1reis', 'areis', '\xE9reis',
-                        'ereis', '\xEDreis', 'ireis', '\xE1veis',
-                        '\xEDamos', 'armos', 'ermos', 'irmos',
-                        'aria', 'eria', 'iria', 'asse', 'esse',
-                        'isse', 'aste', 'este', 'iste', 'arei',
-                        'erei', 'irei', 'aram', 'eram', 'iram',
-                        'avam', 'arem', 'erem', 'irem',
-                        'ando', 'endo', 'indo', 'adas', 'idas',
-                        'ar\xE1s', 'aras', 'er\xE1s', 'eras',
-                        'ir\xE1s', 'avas', 'ares', 'eres', 'ires',
-                        '\xEDeis', 'ados', 'idos', '\xE1mos',
-                        'amos', 'emos', 'imos', 'iras', 'ada', 'ida',
-                        'ar\xE1', 'ara', 'er\xE1', 'era',
-                        'ir\xE1', 'ava', 'iam', 'ado', 'ido',
-                        'ias', 'ais', 'eis', 'ira', 'ia', 'ei', 'am',
-                        'em', 'ar', 'er', 'ir', 'as',
-                        'es', 'is', 'eu', 'iu', 'ou')
-    __step4_suffixes = ("os", "a", "i", "o", "\xE1",
-                        "\xED", "\xF3")
+    __step1_suffixes = _SuffixTable(('amentos', 'imentos', 'uço~es', 'amento',
+                                     'imento', 'adoras', 'adores', 'a\xE7o~es',
+                                     'logias', '\xEAncias', 'amente', 'idades',
+                                     'an\xE7as', 'ismos', 'istas', 'adora',
+                                     'a\xE7a~o', 'antes', '\xE2ncia', 'logia',
+                                     'uça~o', '\xEAncia', 'mente', 'idade',
+                                     'an\xE7a', 'ezas', 'icos', 'icas', 'ismo',
+                                     '\xE1vel', '\xEDvel', 'ista', 'osos',
+                                     'osas', 'ador', 'ante', 'ivas', 'ivos',
+                                     'iras', 'eza', 'ico', 'ica', 'oso', 'osa',
+                                     'iva', 'ivo', 'ira'))
+    __step2_suffixes = _SuffixTable(('ar\xEDamos', 'er\xEDamos', 'ir\xEDamos',
+                                     '\xE1ssemos', '\xEAssemos', '\xEDssemos',
+                                     'ar\xEDeis', 'er\xEDeis', 'ir\xEDeis',
+                                     '\xE1sseis', '\xE9sseis', '\xEDsseis',
+                                     '\xE1ramos', '\xE9ramos', '\xEDramos',
+                                     '\xE1vamos', 'aremos', 'eremos', 'iremos',
+                                     'ariam', 'eriam', 'iriam', 'assem',
+                                     'essem', 'issem', 'ara~o', 'era~o',
+                                     'ira~o', 'arias', 'erias', 'irias',
+                                     'ardes', 'erdes', 'irdes', 'asses',
+                                     'esses', 'isses', 'astes', 'estes',
+                                     'istes', '\xE1reis', 'areis', '\xE9reis',
+                                     'ereis', '\xEDreis', 'ireis', '\xE1veis',
+                                     '\xEDamos', 'armos', 'ermos', 'irmos',
+                                     'aria', 'eria', 'iria', 'asse', 'esse',
+                                     'isse', 'aste', 'este', 'iste', 'arei',
+                                     'erei', 'irei', 'aram', 'eram', 'iram',
+                                     'avam', 'arem', 'erem', 'irem', 'ando',
+                                     'endo', 'indo', 'adas', 'idas', 'ar\xE1s',
+                                     'aras', 'er\xE1s', 'eras', 'ir\xE1s',
+                                     'avas', 'ares', 'eres', 'ires', '\xEDeis',
+                                     'ados', 'idos', '\xE1mos', 'amos', 'emos',
+                                     'imos', 'iras', 'ada', 'ida', 'ar\xE1',
+                                     'ara', 'er\xE1', 'era', 'ir\xE1', 'ava',
+                                     'iam', 'ado', 'ido', 'ias', 'ais', 'eis',
+                                     'ira', 'ia', 'ei', 'am', 'em', 'ar', 'er',
+                                     'ir', 'as', 'es', 'is', 'eu', 'iu', 'ou'))
+    __step4_suffixes = _SuffixTable(("os", "a", "i", "o", "\xE1",
+                                     "\xED", "\xF3"))
 
     def stem(self, word):
         """
@@ -2497,94 +2524,92 @@ class PortugueseStemmer(_StandardStemmer):
         rv = self._rv_standard(word, self.__vowels)
 
         # STEP 1: Standard suffix removal
-        for suffix in self.__step1_suffixes:
-            if word.endswith(suffix):
-                if suffix == "amente" and r1.endswith(suffix):
-                    step1_success = True
-
-                    word = word[:-6]
-                    r2 = r2[:-6]
-                    rv = rv[:-6]
+        for suffix in self.__step1_suffixes.matches(word):
+            if suffix == "amente" and r1.endswith(suffix):
+                step1_success = True
 
-                    if r2.endswith("iv"):
-                        word = word[:-2]
-                        r2 = r2[:-2]
-                        rv = rv[:-2]
+                word = word[:-6]
+                r2 = r2[:-6]
+                rv = rv[:-6]
 
-                        if r2.endswith("at"):
-                            word = word[:-2]
-                            rv = rv[:-2]
+                if r2.endswith("iv"):
+                    word = word[:-2]
+                    r2 = r2[:-2]
+                    rv = rv[:-2]
 
-                    elif r2.endswith(("os", "ic", "ad")):
+                    if r2.endswith("at"):
                         word = word[:-2]
                         rv = rv[:-2]
 
-                elif (suffix in ("ira", "iras") and rv.endswith(suffix) and
-                      word[-len(suffix)-1:-len(suffix)] == "e"):
-                    step1_success = True
+                elif r2.endswith(("os", "ic", "ad")):
+                    word = word[:-2]
+                    rv = rv[:-2]
 
-                    word = suffix_replace(word, suffix, "ir")
-                    rv = suffix_replace(rv, suffix, "ir")
+            elif (suffix in ("ira", "iras") and rv.endswith(suffix) and
+                  word[-len(suffix)-1:-len(suffix)] == "e"):
+                step1_success = True
 
-                elif r2.endswith(suffix):
-                    step1_success = True
+                word = suffix_replace(word, suffix, "ir")
+                rv = suffix_replace(rv, suffix, "ir")
 
-                    if suffix in ("logia", "logias"):
-                        word = suffix_replace(word, suffix, "log")
-                        rv = suffix_replace(rv, suffix, "log")
+            elif r2.endswith(suffix):
+                step1_success = True
 
-                    elif suffix in ("uça~o", "uço~es"):
-                        word = suffix_replace(word, suffix, "u")
-                        rv = suffix_replace(rv, suffix, "u")
+                if suffix in ("logia", "logias"):
+                    word = suffix_replace(word, suffix, "log")
+                    rv = suffix_replace(rv, suffix, "log")
 
-                    elif suffix in ("\xEAncia", "\xEAncias"):
-                        word = suffix_replace(word, suffix, "ente")
-                        rv = suffix_replace(rv, suffix, "ente")
+                elif suffix in ("uça~o", "uço~es"):
+                    word = suffix_replace(word, suffix, "u")
+                    rv = suffix_replace(rv, suffix, "u")
 
-                    elif suffix == "mente":
-                        word = word[:-5]
-                        r2 = r2[:-5]
-                        rv = rv[:-5]
+                elif suffix in ("\xEAncia", "\xEAncias"):
+                    word = suffix_replace(word, suffix, "ente")
+                    rv = suffix_replace(rv, suffix, "ente")
 
-                        if r2.endswith(("ante", "avel", "ivel")):
-                            word = word[:-4]
-                            rv = rv[:-4]
+                elif suffix == "mente":
+                    word = word[:-5]
+                    r2 = r2[:-5]
+                    rv = rv[:-5]
 
-                    elif suffix in ("idade", "idades"):
-                        word = word[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
+                    if r2.endswith(("ante", "avel", "ivel")):
+                        word = word[:-4]
+                        rv = rv[:-4]
 
-                        if r2.endswith(("ic", "iv")):
-                            word = word[:-2]
-                            rv = rv[:-2]
+                elif suffix in ("idade", "idades"):
+                    word = word[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
 
-                        elif r2.endswith("abil"):
-                            word = word[:-4]
-                            rv = rv[:-4]
+                    if r2.endswith(("ic", "iv")):
+                        word = word[:-2]
+                        rv = rv[:-2]
 
-                    elif suffix in ("iva", "ivo", "ivas", "ivos"):
-                        word = word[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
+                    elif r2.endswith("abil"):
+                        word = word[:-4]
+                        rv = rv[:-4]
 
-                        if r2.endswith("at"):
-                            word = word[:-2]
-                            rv = rv[:-2]
-                    else:
-                        word = word[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-                break
+                elif suffix in ("iva", "ivo", "ivas", "ivos"):
+                    word = word[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
+
+                    if r2.endswith("at"):
+                        word = word[:-2]
+                        rv = rv[:-2]
+                else:
+                    word = word[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
+            break
 
         # STEP 2: Verb suffixes
         if not step1_success:
-            for suffix in self.__step2_suffixes:
-                if rv.endswith(suffix):
-                    step2_success = True
+            for suffix in self.__step2_suffixes.matches(rv):
+                step2_success = True
 
-                    word = word[:-len(suffix)]
-                    rv = rv[:-len(suffix)]
-                    break
+                word = word[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+                break
 
         # STEP 3
         if step1_success or step2_success:
@@ -2594,11 +2619,10 @@ class PortugueseStemmer(_StandardStemmer):
 
         ### STEP 4: Residual suffix
         if not step1_success and not step2_success:
-            for suffix in self.__step4_suffixes:
-                if rv.endswith(suffix):
-                    word = word[:-len(suffix)]
-                    rv = rv[:-len(suffix)]
-                    break
+            for suffix in self.__step4_suffixes.matches(rv):
+                word = word[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+                break
 
         # STEP 5
         if rv.endswith(("e", "\xE9", "\xEA")):
@@ -2641,64 +2665,72 @@ class RomanianStemmer(_StandardStemmer):
     """
 
     __vowels = "aeiou\u0103\xE2\xEE"
-    __step0_suffixes = ('iilor', 'ului', 'elor', 'iile', 'ilor',
-                        'atei', 'a\u0163ie', 'a\u0163ia', 'aua',
-                        'ele', 'iua', 'iei', 'ile', 'ul', 'ea',
-                        'ii')
-    __step1_suffixes = ('abilitate', 'abilitati', 'abilit\u0103\u0163i',
-                        'ibilitate', 'abilit\u0103i', 'ivitate',
-                        'ivitati', 'ivit\u0103\u0163i', 'icitate',
-                        'icitati', 'icit\u0103\u0163i', 'icatori',
-                        'ivit\u0103i', 'icit\u0103i', 'icator',
-                        'a\u0163iune', 'atoare', '\u0103toare',
-                        'i\u0163iune', 'itoare', 'iciva', 'icive',
-                        'icivi', 'iciv\u0103', 'icala', 'icale',
-                        'icali', 'ical\u0103', 'ativa', 'ative',
-                        'ativi', 'ativ\u0103', 'atori', '\u0103tori',
-                        'itiva', 'itive', 'itivi', 'itiv\u0103',
-                        'itori', 'iciv', 'ical', 'ativ', 'ator',
-                        '\u0103tor', 'itiv', 'itor')
-    __step2_suffixes = ('abila', 'abile', 'abili', 'abil\u0103',
-                        'ibila', 'ibile', 'ibili', 'ibil\u0103',
-                        'atori', 'itate', 'itati', 'it\u0103\u0163i',
-                        'abil', 'ibil', 'oasa', 'oas\u0103', 'oase',
-                        'anta', 'ante', 'anti', 'ant\u0103', 'ator',
-                        'it\u0103i', 'iune', 'iuni', 'isme', 'ista',
-                        'iste', 'isti', 'ist\u0103', 'i\u015Fti',
-                        'ata', 'at\u0103', 'ati', 'ate', 'uta',
-                        'ut\u0103', 'uti', 'ute', 'ita', 'it\u0103',
-                        'iti', 'ite', 'ica', 'ice', 'ici', 'ic\u0103',
-                        'osi', 'o\u015Fi', 'ant', 'iva', 'ive', 'ivi',
-                        'iv\u0103', 'ism', 'ist', 'at', 'ut', 'it',
-                        'ic', 'os', 'iv')
-    __step3_suffixes = ('seser\u0103\u0163i', 'aser\u0103\u0163i',
-                        'iser\u0103\u0163i', '\xE2ser\u0103\u0163i',
-                        'user\u0103\u0163i', 'seser\u0103m',
-                        'aser\u0103m', 'iser\u0103m', '\xE2ser\u0103m',
-                        'user\u0103m', 'ser\u0103\u0163i', 'sese\u015Fi',
-                        'seser\u0103', 'easc\u0103', 'ar\u0103\u0163i',
-                        'ur\u0103\u0163i', 'ir\u0103\u0163i',
-                        '\xE2r\u0103\u0163i', 'ase\u015Fi',
-                        'aser\u0103', 'ise\u015Fi', 'iser\u0103',
-                        '\xe2se\u015Fi', '\xE2ser\u0103',
-                        'use\u015Fi', 'user\u0103', 'ser\u0103m',
-                        'sesem', 'indu', '\xE2ndu', 'eaz\u0103',
-                        'e\u015Fti', 'e\u015Fte', '\u0103\u015Fti',
-                        '\u0103\u015Fte', 'ea\u0163i', 'ia\u0163i',
-                        'ar\u0103m', 'ur\u0103m', 'ir\u0103m',
-                        '\xE2r\u0103m', 'asem', 'isem',
-                        '\xE2sem', 'usem', 'se\u015Fi', 'ser\u0103',
-                        'sese', 'are', 'ere', 'ire', '\xE2re',
-                        'ind', '\xE2nd', 'eze', 'ezi', 'esc',
-                        '\u0103sc', 'eam', 'eai', 'eau', 'iam',
-                        'iai', 'iau', 'a\u015Fi', 'ar\u0103',
-                        'u\u015Fi', 'ur\u0103', 'i\u015Fi', 'ir\u0103',
-                        '\xE2\u015Fi', '\xe2r\u0103', 'ase',
-                        'ise', '\xE2se', 'use', 'a\u0163i',
-                        'e\u0163i', 'i\u0163i', '\xe2\u0163i', 'sei',
-                        'ez', 'am', 'ai', 'au', 'ea', 'ia', 'ui',
-                        '\xE2i', '\u0103m', 'em', 'im', '\xE2m',
-                        'se')
+    __step0_suffixes = _SuffixTable(('iilor', 'ului', 'elor', 'iile', 'ilor',
+                                     'atei', 'a\u0163ie', 'a\u0163ia', 'aua',
+                                     'ele', 'iua', 'iei', 'ile', 'ul', 'ea',
+                                     'ii'))
+    __step1_suffixes = _SuffixTable(('abilitate', 'abilitati',
+                                     'abilit\u0103\u0163i', 'ibilitate',
+                                     'abilit\u0103i', 'ivitate', 'ivitati',
+                                     'ivit\u0103\u0163i', 'icitate', 'icitati',
+                                     'icit\u0103\u0163i', 'icatori',
+                                     'ivit\u0103i', 'icit\u0103i', 'icator',
+                                     'a\u0163iune', 'atoare', '\u0103toare',
+                                     'i\u0163iune', 'itoare', 'iciva', 'icive',
+                                     'icivi', 'iciv\u0103', 'icala', 'icale',
+                                     'icali', 'ical\u0103', 'ativa', 'ative',
+                                     'ativi', 'ativ\u0103', 'atori',
+                                     '\u0103tori', 'itiva', 'itive', 'itivi',
+                                     'itiv\u0103', 'itori', 'iciv', 'ical',
+                                     'ativ', 'ator', '\u0103tor', 'itiv',
+                                     'itor'))
+    __step2_suffixes = _SuffixTable(('abila', 'abile', 'abili', 'abil\u0103',
+                                     'ibila', 'ibile', 'ibili', 'ibil\u0103',
+                                     'atori', 'itate', 'itati',
+                                     'it\u0103\u0163i', 'abil', 'ibil', 'oasa',
+                                     'oas\u0103', 'oase', 'anta', 'ante',
+                                     'anti', 'ant\u0103', 'ator', 'it\u0103i',
+                                     'iune', 'iuni', 'isme', 'ista', 'iste',
+                                     'isti', 'ist\u0103', 'i\u015Fti', 'ata',
+                                     'at\u0103', 'ati', 'ate', 'uta',
+                                     'ut\u0103', 'uti', 'ute', 'ita',
+                                     'it\u0103', 'iti', 'ite', 'ica', 'ice',
+                                     'ici', 'ic\u0103', 'osi', 'o\u015Fi',
+                                     'ant', 'iva', 'ive', 'ivi', 'iv\u0103',
+                                     'ism', 'ist', 'at', 'ut', 'it', 'ic',
+                                     'os', 'iv'))
+    __step3_suffixes = _SuffixTable(('seser\u0103\u0163i', 'aser\u0103\u0163i',
+                                     'iser\u0103\u0163i',
+                                     '\xE2ser\u0103\u0163i',
+                                     'user\u0103\u0163i', 'seser\u0103m',
+                                     'aser\u0103m', 'iser\u0103m',
+                                     '\xE2ser\u0103m', 'user\u0103m',
+                                     'ser\u0103\u0163i', 'sese\u015Fi',
+                                     'seser\u0103', 'easc\u0103',
+                                     'ar\u0103\u0163i', 'ur\u0103\u0163i',
+                                     'ir\u0103\u0163i', '\xE2r\u0103\u0163i',
+                                     'ase\u015Fi', 'aser\u0103', 'ise\u015Fi',
+                                     'iser\u0103', '\xe2se\u015Fi',
+                                     '\xE2ser\u0103', 'use\u015Fi',
+                                     'user\u0103', 'ser\u0103m', 'sesem',
+                                     'indu', '\xE2ndu', 'eaz\u0103',
+                                     'e\u015Fti', 'e\u015Fte',
+                                     '\u0103\u015Fti', '\u0103\u015Fte',
+                                     'ea\u0163i', 'ia\u0163i', 'ar\u0103m',
+                                     'ur\u0103m', 'ir\u0103m', '\xE2r\u0103m',
+                                     'asem', 'isem', '\xE2sem', 'usem',
+                                     'se\u015Fi', 'ser\u0103', 'sese', 'are',
+                                     'ere', 'ire', '\xE2re', 'ind', '\xE2nd',
+                                     'eze', 'ezi', 'esc', '\u0103sc', 'eam',
+                                     'eai', 'eau', 'iam', 'iai', 'iau',
+                                     'a\u015Fi', 'ar\u0103', 'u\u015Fi',
+                                     'ur\u0103', 'i\u015Fi', 'ir\u0103',
+                                     '\xE2\u015Fi', '\xe2r\u0103', 'ase',
+                                     'ise', '\xE2se', 'use', 'a\u0163i',
+                                     'e\u0163i', 'i\u0163i', '\xe2\u0163i',
+                                     'sei', 'ez', 'am', 'ai', 'au', 'ea', 'ia',
+                                     'ui', '\xE2i', '\u0103m', 'em', 'im',
+                                     '\xE2m', 'se'))
 
     def stem(self, word):
         """
@@ -2730,136 +2762,132 @@ class RomanianStemmer(_StandardStemmer):
         rv = self._rv_standard(word, self.__vowels)
 
         # STEP 0: Removal of plurals and other simplifications
-        for suffix in self.__step0_suffixes:
-            if word.endswith(suffix):
-                if suffix in r1:
-                    if suffix in ("ul", "ului"):
-                        word = word[:-len(suffix)]
+        for suffix in self.__step0_suffixes.matches(word):
+            if suffix in r1:
+                if suffix in ("ul", "ului"):
+                    word = word[:-len(suffix)]
 
-                        if suffix in rv:
-                            rv = rv[:-len(suffix)]
-                        else:
-                            rv = ""
+                    if suffix in rv:
+                        rv = rv[:-len(suffix)]
+                    else:
+                        rv = ""
 
-                    elif (suffix == "aua" or suffix == "atei" or
-                          (suffix == "ile" and word[-5:-3] != "ab")):
-                        word = word[:-2]
+                elif (suffix == "aua" or suffix == "atei" or
+                      (suffix == "ile" and word[-5:-3] != "ab")):
+                    word = word[:-2]
 
-                    elif suffix in ("ea", "ele", "elor"):
-                        word = suffix_replace(word, suffix, "e")
+                elif suffix in ("ea", "ele", "elor"):
+                    word = suffix_replace(word, suffix, "e")
 
-                        if suffix in rv:
-                            rv = suffix_replace(rv, suffix, "e")
-                        else:
-                            rv = ""
+                    if suffix in rv:
+                        rv = suffix_replace(rv, suffix, "e")
+                    else:
+                        rv = ""
 
-                    elif suffix in ("ii", "iua", "iei",
-                                    "iile", "iilor", "ilor"):
-                        word = suffix_replace(word, suffix, "i")
+                elif suffix in ("ii", "iua", "iei",
+                                "iile", "iilor", "ilor"):
+                    word = suffix_replace(word, suffix, "i")
 
-                        if suffix in rv:
-                            rv = suffix_replace(rv, suffix, "i")
-                        else:
-                            rv = ""
+                    if suffix in rv:
+                        rv = suffix_replace(rv, suffix, "i")
+                    else:
+                        rv = ""
 
-                    elif suffix in ("a\u0163ie", "a\u0163ia"):
-                        word = word[:-1]
-                break
+                elif suffix in ("a\u0163ie", "a\u0163ia"):
+                    word = word[:-1]
+            break
 
         # STEP 1: Reduction of combining suffixes
         while True:
 
             replacement_done = False
 
-            for suffix in self.__step1_suffixes:
-                if word.endswith(suffix):
-                    if suffix in r1:
-                        step1_success = True
-                        replacement_done = True
-
-                        if suffix in ("abilitate", "abilitati",
-                                      "abilit\u0103i",
-                                      "abilit\u0103\u0163i"):
-                            word = suffix_replace(word, suffix, "abil")
-
-                        elif suffix == "ibilitate":
-                            word = word[:-5]
-
-                        elif suffix in ("ivitate", "ivitati",
-                                        "ivit\u0103i",
-                                        "ivit\u0103\u0163i"):
-                            word = suffix_replace(word, suffix, "iv")
-
-                        elif suffix in ("icitate", "icitati", "icit\u0103i",
-                                        "icit\u0103\u0163i", "icator",
-                                        "icatori", "iciv", "iciva",
-                                        "icive", "icivi", "iciv\u0103",
-                                        "ical", "icala", "icale", "icali",
-                                        "ical\u0103"):
-                            word = suffix_replace(word, suffix, "ic")
-
-                        elif suffix in ("ativ", "ativa", "ative", "ativi",
-                                        "ativ\u0103", "a\u0163iune",
-                                        "atoare", "ator", "atori",
-                                        "\u0103toare",
-                                        "\u0103tor", "\u0103tori"):
-                            word = suffix_replace(word, suffix, "at")
-
-                            if suffix in r2:
-                                r2 = suffix_replace(r2, suffix, "at")
-
-                        elif suffix in ("itiv", "itiva", "itive", "itivi",
-                                        "itiv\u0103", "i\u0163iune",
-                                        "itoare", "itor", "itori"):
-                            word = suffix_replace(word, suffix, "it")
-
-                            if suffix in r2:
-                                r2 = suffix_replace(r2, suffix, "it")
-                    else:
-                        step1_success = False
-                    break
+            for suffix in self.__step1_suffixes.matches(word):
+                if suffix in r1:
+                    step1_success = True
+                    replacement_done = True
+
+                    if suffix in ("abilitate", "abilitati",
+                                  "abilit\u0103i",
+                                  "abilit\u0103\u0163i"):
+                        word = suffix_replace(word, suffix, "abil")
+
+                    elif suffix == "ibilitate":
+                        word = word[:-5]
+
+                    elif suffix in ("ivitate", "ivitati",
+                                    "ivit\u0103i",
+                                    "ivit\u0103\u0163i"):
+                        word = suffix_replace(word, suffix, "iv")
+
+                    elif suffix in ("icitate", "icitati", "icit\u0103i",
+                                    "icit\u0103\u0163i", "icator",
+                                    "icatori", "iciv", "iciva",
+                                    "icive", "icivi", "iciv\u0103",
+                                    "ical", "icala", "icale", "icali",
+                                    "ical\u0103"):
+                        word = suffix_replace(word, suffix, "ic")
+
+                    elif suffix in ("ativ", "ativa", "ative", "ativi",
+                                    "ativ\u0103", "a\u0163iune",
+                                    "atoare", "ator", "atori",
+                                    "\u0103toare",
+                                    "\u0103tor", "\u0103tori"):
+                        word = suffix_replace(word, suffix, "at")
+
+                        if suffix in r2:
+                            r2 = suffix_replace(r2, suffix, "at")
+
+                    elif suffix in ("itiv", "itiva", "itive", "itivi",
+                                    "itiv\u0103", "i\u0163iune",
+                                    "itoare", "itor", "itori"):
+                        word = suffix_replace(word, suffix, "it")
+
+                        if suffix in r2:
+                            r2 = suffix_replace(r2, suffix, "it")
+                else:
+                    step1_success = False
+                break
 
             if not replacement_done:
                 break
 
         # STEP 2: Removal of standard suffixes
-        for suffix in self.__step2_suffixes:
-            if word.endswith(suffix):
-                if suffix in r2:
-                    step2_success = True
+        for suffix in self.__step2_suffixes.matches(word):
+            if suffix in r2:
+                step2_success = True
 
-                    if suffix in ("iune", "iuni"):
-                        if word[-5] == "\u0163":
-                            word = "".join((word[:-5], "t"))
+                if suffix in ("iune", "iuni"):
+                    if word[-5] == "\u0163":
+                        word = "".join((word[:-5], "t"))
 
-                    elif suffix in ("ism", "isme", "ist", "ista", "iste",
-                                    "isti", "ist\u0103", "i\u015Fti"):
-                        word = suffix_replace(word, suffix, "ist")
+                elif suffix in ("ism", "isme", "ist", "ista", "iste",
+                                "isti", "ist\u0103", "i\u015Fti"):
+                    word = suffix_replace(word, suffix, "ist")
 
-                    else:
-                        word = word[:-len(suffix)]
-                break
+                else:
+                    word = word[:-len(suffix)]
+            break
 
         # STEP 3: Removal of verb suffixes
         if not step1_success and not step2_success:
-            for suffix in self.__step3_suffixes:
-                if word.endswith(suffix):
-                    if suffix in rv:
-                        if suffix in ('seser\u0103\u0163i', 'seser\u0103m',
-                                      'ser\u0103\u0163i', 'sese\u015Fi',
-                                      'seser\u0103', 'ser\u0103m', 'sesem',
-                                      'se\u015Fi', 'ser\u0103', 'sese',
-                                      'a\u0163i', 'e\u0163i', 'i\u0163i',
-                                      '\xE2\u0163i', 'sei', '\u0103m',
-                                      'em', 'im', '\xE2m', 'se'):
+            for suffix in self.__step3_suffixes.matches(word):
+                if suffix in rv:
+                    if suffix in ('seser\u0103\u0163i', 'seser\u0103m',
+                                  'ser\u0103\u0163i', 'sese\u015Fi',
+                                  'seser\u0103', 'ser\u0103m', 'sesem',
+                                  'se\u015Fi', 'ser\u0103', 'sese',
+                                  'a\u0163i', 'e\u0163i', 'i\u0163i',
+                                  '\xE2\u0163i', 'sei', '\u0103m',
+                                  'em', 'im', '\xE2m', 'se'):
+                        word = word[:-len(suffix)]
+                        rv = rv[:-len(suffix)]
+                    else:
+                        if (not rv.startswith(suffix) and
+                            rv[rv.index(suffix)-1] not in
+                            "aeio\u0103\xE2\xEE"):
                             word = word[:-len(suffix)]
-                            rv = rv[:-len(suffix)]
-                        else:
-                            if (not rv.startswith(suffix) and
-                                rv[rv.index(suffix)-1] not in
-                                "aeio\u0103\xE2\xEE"):
-                                word = word[:-len(suffix)]
-                        break
+                    break
 
         # STEP 4: Removal of final vowel
         for suffix in ("ie", "a", "e", "i", "\u0103"):
@@ -2900,97 +2928,107 @@ class RussianStemmer(_LanguageSpecificStemmer):
 
     """
 
-    __perfective_gerund_suffixes = ("ivshis'", "yvshis'", "vshis'",
-                                      "ivshi", "yvshi", "vshi", "iv",
-                                      "yv", "v")
-    __adjectival_suffixes = ('ui^ushchi^ui^u', 'ui^ushchi^ai^a',
-                               'ui^ushchimi', 'ui^ushchymi', 'ui^ushchego',
-                               'ui^ushchogo', 'ui^ushchemu', 'ui^ushchomu',
-                               'ui^ushchikh', 'ui^ushchykh',
-                               'ui^ushchui^u', 'ui^ushchaia',
-                               'ui^ushchoi^u', 'ui^ushchei^u',
-                               'i^ushchi^ui^u', 'i^ushchi^ai^a',
-                               'ui^ushchee', 'ui^ushchie',
-                               'ui^ushchye', 'ui^ushchoe', 'ui^ushchei`',
-                               'ui^ushchii`', 'ui^ushchyi`',
-                               'ui^ushchoi`', 'ui^ushchem', 'ui^ushchim',
-                               'ui^ushchym', 'ui^ushchom', 'i^ushchimi',
-                               'i^ushchymi', 'i^ushchego', 'i^ushchogo',
-                               'i^ushchemu', 'i^ushchomu', 'i^ushchikh',
-                               'i^ushchykh', 'i^ushchui^u', 'i^ushchai^a',
-                               'i^ushchoi^u', 'i^ushchei^u', 'i^ushchee',
-                               'i^ushchie', 'i^ushchye', 'i^ushchoe',
-                               'i^ushchei`', 'i^ushchii`',
-                               'i^ushchyi`', 'i^ushchoi`', 'i^ushchem',
-                               'i^ushchim', 'i^ushchym', 'i^ushchom',
-                               'shchi^ui^u', 'shchi^ai^a', 'ivshi^ui^u',
-                               'ivshi^ai^a', 'yvshi^ui^u', 'yvshi^ai^a',
-                               'shchimi', 'shchymi', 'shchego', 'shchogo',
-                               'shchemu', 'shchomu', 'shchikh', 'shchykh',
-                               'shchui^u', 'shchai^a', 'shchoi^u',
-                               'shchei^u', 'ivshimi', 'ivshymi',
-                               'ivshego', 'ivshogo', 'ivshemu', 'ivshomu',
-                               'ivshikh', 'ivshykh', 'ivshui^u',
-                               'ivshai^a', 'ivshoi^u', 'ivshei^u',
-                               'yvshimi', 'yvshymi', 'yvshego', 'yvshogo',
-                               'yvshemu', 'yvshomu', 'yvshikh', 'yvshykh',
-                               'yvshui^u', 'yvshai^a', 'yvshoi^u',
-                               'yvshei^u', 'vshi^ui^u', 'vshi^ai^a',
-                               'shchee', 'shchie', 'shchye', 'shchoe',
-                               'shchei`', 'shchii`', 'shchyi`', 'shchoi`',
-                               'shchem', 'shchim', 'shchym', 'shchom',
-                               'ivshee', 'ivshie', 'ivshye', 'ivshoe',
-                               'ivshei`', 'ivshii`', 'ivshyi`',
-                               'ivshoi`', 'ivshem', 'ivshim', 'ivshym',
-                               'ivshom', 'yvshee', 'yvshie', 'yvshye',
-                               'yvshoe', 'yvshei`', 'yvshii`',
-                               'yvshyi`', 'yvshoi`', 'yvshem',
-                               'yvshim', 'yvshym', 'yvshom', 'vshimi',
-                               'vshymi', 'vshego', 'vshogo', 'vshemu',
-                               'vshomu', 'vshikh', 'vshykh', 'vshui^u',
-                               'vshai^a', 'vshoi^u', 'vshei^u',
-                               'emi^ui^u', 'emi^ai^a', 'nni^ui^u',
-                               'nni^ai^a', 'vshee',
-                               'vshie', 'vshye', 'vshoe', 'vshei`',
-                               'vshii`', 'vshyi`', 'vshoi`',
-                               'vshem', 'vshim', 'vshym', 'vshom',
-                               'emimi', 'emymi', 'emego', 'emogo',
-                               'ememu', 'emomu', 'emikh', 'emykh',
-                               'emui^u', 'emai^a', 'emoi^u', 'emei^u',
-                               'nnimi', 'nnymi', 'nnego', 'nnogo',
-                               'nnemu', 'nnomu', 'nnikh', 'nnykh',
-                               'nnui^u', 'nnai^a', 'nnoi^u', 'nnei^u',
-                               'emee', 'emie', 'emye', 'emoe',
-                               'emei`', 'emii`', 'emyi`',
-                               'emoi`', 'emem', 'emim', 'emym',
-                               'emom', 'nnee', 'nnie', 'nnye', 'nnoe',
-                               'nnei`', 'nnii`', 'nnyi`',
-                               'nnoi`', 'nnem', 'nnim', 'nnym',
-                               'nnom', 'i^ui^u', 'i^ai^a', 'imi', 'ymi',
-                               'ego', 'ogo', 'emu', 'omu', 'ikh',
-                               'ykh', 'ui^u', 'ai^a', 'oi^u', 'ei^u',
-                               'ee', 'ie', 'ye', 'oe', 'ei`',
-                               'ii`', 'yi`', 'oi`', 'em',
-                               'im', 'ym', 'om')
-    __reflexive_suffixes = ("si^a", "s'")
-    __verb_suffixes = ("esh'", 'ei`te', 'ui`te', 'ui^ut',
-                         "ish'", 'ete', 'i`te', 'i^ut', 'nno',
-                         'ila', 'yla', 'ena', 'ite', 'ili', 'yli',
-                         'ilo', 'ylo', 'eno', 'i^at', 'uet', 'eny',
-                         "it'", "yt'", 'ui^u', 'la', 'na', 'li',
-                         'em', 'lo', 'no', 'et', 'ny', "t'",
-                         'ei`', 'ui`', 'il', 'yl', 'im',
-                         'ym', 'en', 'it', 'yt', 'i^u', 'i`',
-                         'l', 'n')
-    __noun_suffixes = ('ii^ami', 'ii^akh', 'i^ami', 'ii^am', 'i^akh',
-                         'ami', 'iei`', 'i^am', 'iem', 'akh',
-                         'ii^u', "'i^u", 'ii^a', "'i^a", 'ev', 'ov',
-                         'ie', "'e", 'ei', 'ii', 'ei`',
-                         'oi`', 'ii`', 'em', 'am', 'om',
-                         'i^u', 'i^a', 'a', 'e', 'i', 'i`',
-                         'o', 'u', 'y', "'")
-    __superlative_suffixes = ("ei`she", "ei`sh")
-    __derivational_suffixes = ("ost'", "ost")
+    __perfective_gerund_suffixes = _SuffixTable(("ivshis'", "yvshis'",
+                                                 "vshis'", "ivshi", "yvshi",
+                                                 "vshi", "iv", "yv", "v"))
+    __adjectival_suffixes = _SuffixTable(('ui^ushchi^ui^u', 'ui^ushchi^ai^a',
+                                          'ui^ushchimi', 'ui^ushchymi',
+                                          'ui^ushchego', 'ui^ushchogo',
+                                          'ui^ushchemu', 'ui^ushchomu',
+                                          'ui^ushchikh', 'ui^ushchykh',
+                                          'ui^ushchui^u', 'ui^ushchaia',
+                                          'ui^ushchoi^u', 'ui^ushchei^u',
+                                          'i^ushchi^ui^u', 'i^ushchi^ai^a',
+                                          'ui^ushchee', 'ui^ushchie',
+                                          'ui^ushchye', 'ui^ushchoe',
+                                          'ui^ushchei`', 'ui^ushchii`',
+                                          'ui^ushchyi`', 'ui^ushchoi`',
+                                          'ui^ushchem', 'ui^ushchim',
+                                          'ui^ushchym', 'ui^ushchom',
+                                          'i^ushchimi', 'i^ushchymi',
+                                          'i^ushchego', 'i^ushchogo',
+                                          'i^ushchemu', 'i^ushchomu',
+                                          'i^ushchikh', 'i^ushchykh',
+                                          'i^ushchui^u', 'i^ushchai^a',
+                                          'i^ushchoi^u', 'i^ushchei^u',
+                                          'i^ushchee', 'i^ushchie',
+                                          'i^ushchye', 'i^ushchoe',
+                                          'i^ushchei`', 'i^ushchii`',
+                                          'i^ushchyi`', 'i^ushchoi`',
+                                          'i^ushchem', 'i^ushchim',
+                                          'i^ushchym', 'i^ushchom',
+                                          'shchi^ui^u', 'shchi^ai^a',
+                                          'ivshi^ui^u', 'ivshi^ai^a',
+                                          'yvshi^ui^u', 'yvshi^ai^a',
+                                          'shchimi', 'shchymi', 'shchego',
+                                          'shchogo', 'shchemu', 'shchomu',
+                                          'shchikh', 'shchykh', 'shchui^u',
+                                          'shchai^a', 'shchoi^u', 'shchei^u',
+                                          'ivshimi', 'ivshymi', 'ivshego',
+                                          'ivshogo', 'ivshemu', 'ivshomu',
+                                          'ivshikh', 'ivshykh', 'ivshui^u',
+                                          'ivshai^a', 'ivshoi^u', 'ivshei^u',
+                                          'yvshimi', 'yvshymi', 'yvshego',
+                                          'yvshogo', 'yvshemu', 'yvshomu',
+                                          'yvshikh', 'yvshykh', 'yvshui^u',
+                                          'yvshai^a', 'yvshoi^u', 'yvshei^u',
+                                          'vshi^ui^u', 'vshi^ai^a', 'shchee',
+                                          'shchie', 'shchye', 'shchoe',
+                                          'shchei`', 'shchii`', 'shchyi`',
+                                          'shchoi`', 'shchem', 'shchim',
+                                          'shchym', 'shchom', 'ivshee',
+                                          'ivshie', 'ivshye', 'ivshoe',
+                                          'ivshei`', 'ivshii`', 'ivshyi`',
+                                          'ivshoi`', 'ivshem', 'ivshim',
+                                          'ivshym', 'ivshom', 'yvshee',
+                                          'yvshie', 'yvshye', 'yvshoe',
+                                          'yvshei`', 'yvshii`', 'yvshyi`',
+                                          'yvshoi`', 'yvshem', 'yvshim',
+                                          'yvshym', 'yvshom', 'vshimi',
+                                          'vshymi', 'vshego', 'vshogo',
+                                          'vshemu', 'vshomu', 'vshikh',
+                                          'vshykh', 'vshui^u', 'vshai^a',
+                                          'vshoi^u', 'vshei^u', 'emi^ui^u',
+                                          'emi^ai^a', 'nni^ui^u', 'nni^ai^a',
+                                          'vshee', 'vshie', 'vshye', 'vshoe',
+                                          'vshei`', 'vshii`', 'vshyi`',
+                                          'vshoi`', 'vshem', 'vshim', 'vshym',
+                                          'vshom', 'emimi', 'emymi', 'emego',
+                                          'emogo', 'ememu', 'emomu', 'emikh',
+                                          'emykh', 'emui^u', 'emai^a',
+                                          'emoi^u', 'emei^u', 'nnimi', 'nnymi',
+                                          'nnego', 'nnogo', 'nnemu', 'nnomu',
+                                          'nnikh', 'nnykh', 'nnui^u', 'nnai^a',
+                                          'nnoi^u', 'nnei^u', 'emee', 'emie',
+                                          'emye', 'emoe', 'emei`', 'emii`',
+                                          'emyi`', 'emoi`', 'emem', 'emim',
+                                          'emym', 'emom', 'nnee', 'nnie',
+                                          'nnye', 'nnoe', 'nnei`', 'nnii`',
+                                          'nnyi`', 'nnoi`', 'nnem', 'nnim',
+                                          'nnym', 'nnom', 'i^ui^u', 'i^ai^a',
+                                          'imi', 'ymi', 'ego', 'ogo', 'emu',
+                                          'omu', 'ikh', 'ykh', 'ui^u', 'ai^a',
+                                          'oi^u', 'ei^u', 'ee', 'ie', 'ye',
+                                          'oe', 'ei`', 'ii`', 'yi`', 'oi`',
+                                          'em', 'im', 'ym', 'om'))
+    __reflexive_suffixes = _SuffixTable(("si^a", "s'"))
+    __verb_suffixes = _SuffixTable(("esh'", 'ei`te', 'ui`te', 'ui^ut', "ish'",
+                                    'ete', 'i`te', 'i^ut', 'nno', 'ila', 'yla',
+                                    'ena', 'ite', 'ili', 'yli', 'ilo', 'ylo',
+                                    'eno', 'i^at', 'uet', 'eny', "it'", "yt'",
+                                    'ui^u', 'la', 'na', 'li', 'em', 'lo', 'no',
+                                    'et', 'ny', "t'", 'ei`', 'ui`', 'il', 'yl',
+                                    'im', 'ym', 'en', 'it', 'yt', 'i^u', 'i`',
+                                    'l', 'n'))
+    __noun_suffixes = _SuffixTable(('ii^ami', 'ii^akh', 'i^ami', 'ii^am',
+                                    'i^akh', 'ami', 'iei`', 'i^am', 'iem',
+                                    'akh', 'ii^u', "'i^u", 'ii^a', "'i^a",
+                                    'ev', 'ov', 'ie', "'e", 'ei', 'ii', 'ei`',
+                                    'oi`', 'ii`', 'em', 'am', 'om', 'i^u',
+                                    'i^a', 'a', 'e', 'i', 'i`', 'o', 'u', 'y',
+                                    "'"))
+    __superlative_suffixes = _SuffixTable(("ei`she", "ei`sh"))
+    __derivational_suffixes = _SuffixTable(("ost'", "ost"))
 
     def stem(self, word):
         """
@@ -3023,110 +3061,105 @@ class RussianStemmer(_LanguageSpecificStemmer):
         rv, r2 = self.__regions_russian(word)
 
         # Step 1
-        for suffix in self.__perfective_gerund_suffixes:
-            if rv.endswith(suffix):
-                if suffix in ("v", "vshi", "vshis'"):
-                    if (rv[-len(suffix)-3:-len(suffix)] == "i^a" or
-                        rv[-len(suffix)-1:-len(suffix)] == "a"):
-                        word = word[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-                        step1_success = True
-                        break
-                else:
+        for suffix in self.__perfective_gerund_suffixes.matches(rv):
+            if suffix in ("v", "vshi", "vshis'"):
+                if (rv[-len(suffix)-3:-len(suffix)] == "i^a" or
+                    rv[-len(suffix)-1:-len(suffix)] == "a"):
                     word = word[:-len(suffix)]
                     r2 = r2[:-len(suffix)]
                     rv = rv[:-len(suffix)]
                     step1_success = True
                     break
+            else:
+                word = word[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+                step1_success = True
+                break
 
         if not step1_success:
-            for suffix in self.__reflexive_suffixes:
-                if rv.endswith(suffix):
+            for suffix in self.__reflexive_suffixes.matches(rv):
+                word = word[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+                break
+
+            for suffix in self.__adjectival_suffixes.matches(rv):
+                if suffix in ('i^ushchi^ui^u', 'i^ushchi^ai^a',
+                          'i^ushchui^u', 'i^ushchai^a', 'i^ushchoi^u',
+                          'i^ushchei^u', 'i^ushchimi', 'i^ushchymi',
+                          'i^ushchego', 'i^ushchogo', 'i^ushchemu',
+                          'i^ushchomu', 'i^ushchikh', 'i^ushchykh',
+                          'shchi^ui^u', 'shchi^ai^a', 'i^ushchee',
+                          'i^ushchie', 'i^ushchye', 'i^ushchoe',
+                          'i^ushchei`', 'i^ushchii`', 'i^ushchyi`',
+                          'i^ushchoi`', 'i^ushchem', 'i^ushchim',
+                          'i^ushchym', 'i^ushchom', 'vshi^ui^u',
+                          'vshi^ai^a', 'shchui^u', 'shchai^a',
+                          'shchoi^u', 'shchei^u', 'emi^ui^u',
+                          'emi^ai^a', 'nni^ui^u', 'nni^ai^a',
+                          'shchimi', 'shchymi', 'shchego', 'shchogo',
+                          'shchemu', 'shchomu', 'shchikh', 'shchykh',
+                          'vshui^u', 'vshai^a', 'vshoi^u', 'vshei^u',
+                          'shchee', 'shchie', 'shchye', 'shchoe',
+                          'shchei`', 'shchii`', 'shchyi`', 'shchoi`',
+                          'shchem', 'shchim', 'shchym', 'shchom',
+                          'vshimi', 'vshymi', 'vshego', 'vshogo',
+                          'vshemu', 'vshomu', 'vshikh', 'vshykh',
+                          'emui^u', 'emai^a', 'emoi^u', 'emei^u',
+                          'nnui^u', 'nnai^a', 'nnoi^u', 'nnei^u',
+                          'vshee', 'vshie', 'vshye', 'vshoe',
+                          'vshei`', 'vshii`', 'vshyi`', 'vshoi`',
+                          'vshem', 'vshim', 'vshym', 'vshom',
+                          'emimi', 'emymi', 'emego', 'emogo',
+                          'ememu', 'emomu', 'emikh', 'emykh',
+                          'nnimi', 'nnymi', 'nnego', 'nnogo',
+                          'nnemu', 'nnomu', 'nnikh', 'nnykh',
+                          'emee', 'emie', 'emye', 'emoe', 'emei`',
+                          'emii`', 'emyi`', 'emoi`', 'emem', 'emim',
+                          'emym', 'emom', 'nnee', 'nnie', 'nnye',
+                          'nnoe', 'nnei`', 'nnii`', 'nnyi`', 'nnoi`',
+                          'nnem', 'nnim', 'nnym', 'nnom'):
+                    if (rv[-len(suffix)-3:-len(suffix)] == "i^a" or
+                        rv[-len(suffix)-1:-len(suffix)] == "a"):
+                        word = word[:-len(suffix)]
+                        r2 = r2[:-len(suffix)]
+                        rv = rv[:-len(suffix)]
+                        adjectival_removed = True
+                        break
+                else:
                     word = word[:-len(suffix)]
                     r2 = r2[:-len(suffix)]
                     rv = rv[:-len(suffix)]
+                    adjectival_removed = True
                     break
 
-            for suffix in self.__adjectival_suffixes:
-                if rv.endswith(suffix):
-                    if suffix in ('i^ushchi^ui^u', 'i^ushchi^ai^a',
-                              'i^ushchui^u', 'i^ushchai^a', 'i^ushchoi^u',
-                              'i^ushchei^u', 'i^ushchimi', 'i^ushchymi',
-                              'i^ushchego', 'i^ushchogo', 'i^ushchemu',
-                              'i^ushchomu', 'i^ushchikh', 'i^ushchykh',
-                              'shchi^ui^u', 'shchi^ai^a', 'i^ushchee',
-                              'i^ushchie', 'i^ushchye', 'i^ushchoe',
-                              'i^ushchei`', 'i^ushchii`', 'i^ushchyi`',
-                              'i^ushchoi`', 'i^ushchem', 'i^ushchim',
-                              'i^ushchym', 'i^ushchom', 'vshi^ui^u',
-                              'vshi^ai^a', 'shchui^u', 'shchai^a',
-                              'shchoi^u', 'shchei^u', 'emi^ui^u',
-                              'emi^ai^a', 'nni^ui^u', 'nni^ai^a',
-                              'shchimi', 'shchymi', 'shchego', 'shchogo',
-                              'shchemu', 'shchomu', 'shchikh', 'shchykh',
-                              'vshui^u', 'vshai^a', 'vshoi^u', 'vshei^u',
-                              'shchee', 'shchie', 'shchye', 'shchoe',
-                              'shchei`', 'shchii`', 'shchyi`', 'shchoi`',
-                              'shchem', 'shchim', 'shchym', 'shchom',
-                              'vshimi', 'vshymi', 'vshego', 'vshogo',
-                              'vshemu', 'vshomu', 'vshikh', 'vshykh',
-                              'emui^u', 'emai^a', 'emoi^u', 'emei^u',
-                              'nnui^u', 'nnai^a', 'nnoi^u', 'nnei^u',
-                              'vshee', 'vshie', 'vshye', 'vshoe',
-                              'vshei`', 'vshii`', 'vshyi`', 'vshoi`',
-                              'vshem', 'vshim', 'vshym', 'vshom',
-                              'emimi', 'emymi', 'emego', 'emogo',
-                              'ememu', 'emomu', 'emikh', 'emykh',
-                              'nnimi', 'nnymi', 'nnego', 'nnogo',
-                              'nnemu', 'nnomu', 'nnikh', 'nnykh',
-                              'emee', 'emie', 'emye', 'emoe', 'emei`',
-                              'emii`', 'emyi`', 'emoi`', 'emem', 'emim',
-                              'emym', 'emom', 'nnee', 'nnie', 'nnye',
-                              'nnoe', 'nnei`', 'nnii`', 'nnyi`', 'nnoi`',
-                              'nnem', 'nnim', 'nnym', 'nnom'):
+            if not adjectival_removed:
+                for suffix in self.__verb_suffixes.matches(rv):
+                    if suffix in ("la", "na", "ete", "i`te", "li",
+                                  "i`", "l", "em", "n", "lo", "no",
+                                  "et", "i^ut", "ny", "t'", "esh'",
+                                  "nno"):
                         if (rv[-len(suffix)-3:-len(suffix)] == "i^a" or
                             rv[-len(suffix)-1:-len(suffix)] == "a"):
                             word = word[:-len(suffix)]
                             r2 = r2[:-len(suffix)]
                             rv = rv[:-len(suffix)]
-                            adjectival_removed = True
+                            verb_removed = True
                             break
                     else:
                         word = word[:-len(suffix)]
                         r2 = r2[:-len(suffix)]
                         rv = rv[:-len(suffix)]
-                        adjectival_removed = True
+                        verb_removed = True
                         break
 
-            if not adjectival_removed:
-                for suffix in self.__verb_suffixes:
-                    if rv.endswith(suffix):
-                        if suffix in ("la", "na", "ete", "i`te", "li",
-                                      "i`", "l", "em", "n", "lo", "no",
-                                      "et", "i^ut", "ny", "t'", "esh'",
-                                      "nno"):
-                            if (rv[-len(suffix)-3:-len(suffix)] == "i^a" or
-                                rv[-len(suffix)-1:-len(suffix)] == "a"):
-                                word = word[:-len(suffix)]
-                                r2 = r2[:-len(suffix)]
-                                rv = rv[:-len(suffix)]
-                                verb_removed = True
-                                break
-                        else:
-                            word = word[:-len(suffix)]
-                            r2 = r2[:-len(suffix)]
-                            rv = rv[:-len(suffix)]
-                            verb_removed = True
-                            break
-
             if not adjectival_removed and not verb_removed:
-                for suffix in self.__noun_suffixes:
-                    if rv.endswith(suffix):
-                        word = word[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-                        break
+                for suffix in self.__noun_suffixes.matches(rv):
+                    word = word[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
+                    break
 
         # Step 2
         if rv.endswith("i"):
@@ -3134,10 +3167,9 @@ class RussianStemmer(_LanguageSpecificStemmer):
             r2 = r2[:-1]
 
         # Step 3
-        for suffix in self.__derivational_suffixes:
-            if r2.endswith(suffix):
-                word = word[:-len(suffix)]
-                break
+        for suffix in self.__derivational_suffixes.matches(r2):
+            word = word[:-len(suffix)]
+            break
 
         # Step 4
         if word.endswith("nn"):
@@ -3145,11 +3177,10 @@ class RussianStemmer(_LanguageSpecificStemmer):
             undouble_success = True
 
         if not undouble_success:
-            for suffix in self.__superlative_suffixes:
-                if word.endswith(suffix):
-                    word = word[:-len(suffix)]
-                    superlative_removed = True
-                    break
+            for suffix in self.__superlative_suffixes.matches(word):
+                word = word[:-len(suffix)]
+                superlative_removed = True
+                break
             if word.endswith("nn"):
                 word = word[:-1]
 
@@ -3339,50 +3370,50 @@ class SpanishStemmer(_StandardStemmer):
     """
 
     __vowels = "aeiou\xE1\xE9\xED\xF3\xFA\xFC"
-    __step0_suffixes = ("selas", "selos", "sela", "selo", "las",
-                        "les", "los", "nos", "me", "se", "la", "le",
-                        "lo")
-    __step1_suffixes = ('amientos', 'imientos', 'amiento', 'imiento',
-                        'aciones', 'uciones', 'adoras', 'adores',
-                        'ancias', 'log\xEDas', 'encias', 'amente',
-                        'idades', 'anzas', 'ismos', 'ables', 'ibles',
-                        'istas', 'adora', 'aci\xF3n', 'antes',
-                        'ancia', 'log\xEDa', 'uci\xf3n', 'encia',
-                        'mente', 'anza', 'icos', 'icas', 'ismo',
-                        'able', 'ible', 'ista', 'osos', 'osas',
-                        'ador', 'ante', 'idad', 'ivas', 'ivos',
-                        'ico',
-                        'ica', 'oso', 'osa', 'iva', 'ivo')
-    __step2a_suffixes = ('yeron', 'yendo', 'yamos', 'yais', 'yan',
-                         'yen', 'yas', 'yes', 'ya', 'ye', 'yo',
-                         'y\xF3')
-    __step2b_suffixes = ('ar\xEDamos', 'er\xEDamos', 'ir\xEDamos',
-                         'i\xE9ramos', 'i\xE9semos', 'ar\xEDais',
-                         'aremos', 'er\xEDais', 'eremos',
-                         'ir\xEDais', 'iremos', 'ierais', 'ieseis',
-                         'asteis', 'isteis', '\xE1bamos',
-                         '\xE1ramos', '\xE1semos', 'ar\xEDan',
-                         'ar\xEDas', 'ar\xE9is', 'er\xEDan',
-                         'er\xEDas', 'er\xE9is', 'ir\xEDan',
-                         'ir\xEDas', 'ir\xE9is',
-                         'ieran', 'iesen', 'ieron', 'iendo', 'ieras',
-                         'ieses', 'abais', 'arais', 'aseis',
-                         '\xE9amos', 'ar\xE1n', 'ar\xE1s',
-                         'ar\xEDa', 'er\xE1n', 'er\xE1s',
-                         'er\xEDa', 'ir\xE1n', 'ir\xE1s',
-                         'ir\xEDa', 'iera', 'iese', 'aste', 'iste',
-                         'aban', 'aran', 'asen', 'aron', 'ando',
-                         'abas', 'adas', 'idas', 'aras', 'ases',
-                         '\xEDais', 'ados', 'idos', 'amos', 'imos',
-                         'emos', 'ar\xE1', 'ar\xE9', 'er\xE1',
-                         'er\xE9', 'ir\xE1', 'ir\xE9', 'aba',
-                         'ada', 'ida', 'ara', 'ase', '\xEDan',
-                         'ado', 'ido', '\xEDas', '\xE1is',
-                         '\xE9is', '\xEDa', 'ad', 'ed', 'id',
-                         'an', 'i\xF3', 'ar', 'er', 'ir', 'as',
-                         '\xEDs', 'en', 'es')
-    __step3_suffixes = ("os", "a", "e", "o", "\xE1",
-                        "\xE9", "\xED", "\xF3")
+    __step0_suffixes = _SuffixTable(("selas", "selos", "sela", "selo", "las",
+                                     "les", "los", "nos", "me", "se", "la",
+                                     "le", "lo"))
+    __step1_suffixes = _SuffixTable(('amientos', 'imientos', 'amiento',
+                                     'imiento', 'aciones', 'uciones', 'adoras',
+                                     'adores', 'ancias', 'log\xEDas', 'encias',
+                                     'amente', 'idades', 'anzas', 'ismos',
+                                     'ables', 'ibles', 'istas', 'adora',
+                                     'aci\xF3n', 'antes', 'ancia', 'log\xEDa',
+                                     'uci\xf3n', 'encia', 'mente', 'anza',
+                                     'icos', 'icas', 'ismo', 'able', 'ible',
+                                     'ista', 'osos', 'osas', 'ador', 'ante',
+                                     'idad', 'ivas', 'ivos', 'ico', 'ica',
+                                     'oso', 'osa', 'iva', 'ivo'))
+    __step2a_suffixes = _SuffixTable(('yeron', 'yendo', 'yamos', 'yais', 'yan',
+                                      'yen', 'yas', 'yes', 'ya', 'ye', 'yo',
+                                      'y\xF3'))
+    __step2b_suffixes = _SuffixTable(('ar\xEDamos', 'er\xEDamos', 'ir\xEDamos',
+                                      'i\xE9ramos', 'i\xE9semos', 'ar\xEDais',
+                                      'aremos', 'er\xEDais', 'eremos',
+                                      'ir\xEDais', 'iremos', 'ierais',
+                                      'ieseis', 'asteis', 'isteis',
+                                      '\xE1bamos', '\xE1ramos', '\xE1semos',
+                                      'ar\xEDan', 'ar\xEDas', 'ar\xE9is',
+                                      'er\xEDan', 'er\xEDas', 'er\xE9is',
+                                      'ir\xEDan', 'ir\xEDas', 'ir\xE9is',
+                                      'ieran', 'iesen', 'ieron', 'iendo',
+                                      'ieras', 'ieses', 'abais', 'arais',
+                                      'aseis', '\xE9amos', 'ar\xE1n',
+                                      'ar\xE1s', 'ar\xEDa', 'er\xE1n',
+                                      'er\xE1s', 'er\xEDa', 'ir\xE1n',
+                                      'ir\xE1s', 'ir\xEDa', 'iera', 'iese',
+                                      'aste', 'iste', 'aban', 'aran', 'asen',
+                                      'aron', 'ando', 'abas', 'adas', 'idas',
+                                      'aras', 'ases', '\xEDais', 'ados',
+                                      'idos', 'amos', 'imos', 'emos', 'ar\xE1',
+                                      'ar\xE9', 'er\xE1', 'er\xE9', 'ir\xE1',
+                                      'ir\xE9', 'aba', 'ada', 'ida', 'ara',
+                                      'ase', '\xEDan', 'ado', 'ido', '\xEDas',
+                                      '\xE1is', '\xE9is', '\xEDa', 'ad', 'ed',
+                                      'id', 'an', 'i\xF3', 'ar', 'er', 'ir',
+                                      'as', '\xEDs', 'en', 'es'))
+    __step3_suffixes = _SuffixTable(("os", "a", "e", "o", "\xE1",
+                                     "\xE9", "\xED", "\xF3"))
 
     def stem(self, word):
         """
@@ -3405,10 +3436,7 @@ class SpanishStemmer(_StandardStemmer):
         rv = self._rv_standard(word, self.__vowels)
 
         # STEP 0: Attached pronoun
-        for suffix in self.__step0_suffixes:
-            if not (word.endswith(suffix) and rv.endswith(suffix)):
-                continue
-
+        for suffix in self.__step0_suffixes.matches(rv):
             if ((rv[:-len(suffix)].endswith(("ando", "\xE1ndo",
                                              "ar", "\xE1r",
                                              "er", "\xE9r",
@@ -3424,10 +3452,7 @@ class SpanishStemmer(_StandardStemmer):
             break
 
         # STEP 1: Standard suffix removal
-        for suffix in self.__step1_suffixes:
-            if not word.endswith(suffix):
-                continue
-
+        for suffix in self.__step1_suffixes.matches(word):
             if suffix == "amente" and r1.endswith(suffix):
                 step1_success = True
                 word = word[:-6]
@@ -3505,36 +3530,33 @@ class SpanishStemmer(_StandardStemmer):
 
         # STEP 2a: Verb suffixes beginning 'y'
         if not step1_success:
-            for suffix in self.__step2a_suffixes:
-                if (rv.endswith(suffix) and
-                        word[-len(suffix)-1:-len(suffix)] == "u"):
+            for suffix in self.__step2a_suffixes.matches(rv):
+                if word[-len(suffix)-1:-len(suffix)] == "u":
                     word = word[:-len(suffix)]
                     rv = rv[:-len(suffix)]
                     break
 
         # STEP 2b: Other verb suffixes
-            for suffix in self.__step2b_suffixes:
-                if rv.endswith(suffix):
-                    word = word[:-len(suffix)]
-                    rv = rv[:-len(suffix)]
-                    if suffix in ("en", "es", "\xE9is", "emos"):
-                        if word.endswith("gu"):
-                            word = word[:-1]
+            for suffix in self.__step2b_suffixes.matches(rv):
+                word = word[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+                if suffix in ("en", "es", "\xE9is", "emos"):
+                    if word.endswith("gu"):
+                        word = word[:-1]
 
-                        if rv.endswith("gu"):
-                            rv = rv[:-1]
-                    break
+                    if rv.endswith("gu"):
+                        rv = rv[:-1]
+                break
 
         # STEP 3: Residual suffix
-        for suffix in self.__step3_suffixes:
-            if rv.endswith(suffix):
-                word = word[:-len(suffix)]
-                if suffix in ("e", "\xE9"):
-                    rv = rv[:-len(suffix)]
+        for suffix in self.__step3_suffixes.matches(rv):
+            word = word[:-len(suffix)]
+            if suffix in ("e", "\xE9"):
+                rv = rv[:-len(suffix)]
 
-                    if word[-2:] == "gu" and rv.endswith("u"):
-                        word = word[:-1]
-                break
+                if word[-2:] == "gu" and rv.endswith("u"):
+                    word = word[:-1]
+            break
 
         word = self.__replace_accented(word)
 
@@ -3581,15 +3603,16 @@ class SwedishStemmer(_ScandinavianStemmer):
 
     __vowels = "aeiouy\xE4\xE5\xF6"
     __s_ending = "bcdfghjklmnoprtvy"
-    __step1_suffixes = ("heterna", "hetens", "heter", "heten",
-                        "anden", "arnas", "ernas", "ornas", "andes",
-                        "andet", "arens", "arna", "erna", "orna",
-                        "ande", "arne", "aste", "aren", "ades",
-                        "erns", "ade", "are", "ern", "ens", "het",
-                        "ast", "ad", "en", "ar", "er", "or", "as",
-                        "es", "at", "a", "e", "s")
-    __step2_suffixes = ("dd", "gd", "nn", "dt", "gt", "kt", "tt")
-    __step3_suffixes = ("fullt", "l\xF6st", "els", "lig", "ig")
+    __step1_suffixes = _SuffixTable(("heterna", "hetens", "heter", "heten",
+                                     "anden", "arnas", "ernas", "ornas",
+                                     "andes", "andet", "arens", "arna", "erna",
+                                     "orna", "ande", "arne", "aste", "aren",
+                                     "ades", "erns", "ade", "are", "ern",
+                                     "ens", "het", "ast", "ad", "en", "ar",
+                                     "er", "or", "as", "es", "at", "a", "e",
+                                     "s"))
+    __step2_suffixes = _SuffixTable(("dd", "gd", "nn", "dt", "gt", "kt", "tt"))
+    __step3_suffixes = _SuffixTable(("fullt", "l\xF6st", "els", "lig", "ig"))
 
     def stem(self, word):
         """
@@ -3609,32 +3632,29 @@ class SwedishStemmer(_ScandinavianStemmer):
         r1 = self._r1_scandinavian(word, self.__vowels)
 
         # STEP 1
-        for suffix in self.__step1_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "s":
-                    if word[-2] in self.__s_ending:
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                break
+        for suffix in self.__step1_suffixes.matches(r1):
+            if suffix == "s":
+                if word[-2] in self.__s_ending:
+                    word = word[:-1]
+                    r1 = r1[:-1]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+            break
 
         # STEP 2
-        for suffix in self.__step2_suffixes:
-            if r1.endswith(suffix):
-                word = word[:-1]
-                r1 = r1[:-1]
-                break
+        for suffix in self.__step2_suffixes.matches(r1):
+            word = word[:-1]
+            r1 = r1[:-1]
+            break
 
         # STEP 3
-        for suffix in self.__step3_suffixes:
-            if r1.endswith(suffix):
-                if suffix in ("els", "lig", "ig"):
-                    word = word[:-len(suffix)]
-                elif suffix in ("fullt", "l\xF6st"):
-                    word = word[:-1]
-                break
+        for suffix in self.__step3_suffixes.matches(r1):
+            if suffix in ("els", "lig", "ig"):
+                word = word[:-len(suffix)]
+            elif suffix in ("fullt", "l\xF6st"):
+                word = word[:-1]
+            break
 
         return word
 
@@ -40,6 +40,47 @@ class WordNetLemmatizer(object):
         lemmas = wordnet._morphy(word, pos)
         return min(lemmas, key=len) if lemmas else word
 
+    def lemmatize_many(self, words, pos=NOUN):
+        """
+        Lemmatize a sequence of words, all with the part of speech
+        ``pos``.  Each distinct word is only looked up once.
+
+            >>> wnl = WordNetLemmatizer()
+            >>> print(' '.join(wnl.lemmatize_many(['dogs', 'churches', 'dogs'])))
+            dog church dog
+
+        :rtype: list(str)
+        """
+        words = list(words)
+        lemmas = dict((word, self.lemmatize(word, pos)) for word in set(words))
+        return [lemmas[word] for word in words]
+
+    def lemmatize_sents(self, sents, pos=NOUN):
+        """
+        Lemmatize a sequence of tokenized sentences, all with the part of
+        speech ``pos``.  Each distinct word is only looked up once, across
+        all of the sentences.
+
+            >>> wnl = WordNetLemmatizer()
+            >>> for sent in wnl.lemmatize_sents([['the', 'dogs'], ['two', 'dogs']]):
+            ...     print(' '.join(sent))
+            the dog
+            two dog
+
+        :rtype: list(list(str))
+        """
+        sents = [list(sent) for sent in sents]
+        vocab = set(word for sent in sents for word in sent)
+        lemmas = dict((word, self.lemmatize(word, pos)) for word in vocab)
+        return [[lemmas[word] for word in sent] for sent in sents]
+
+    def cache_info(self):
+        """
+        Return a ``CacheInfo`` tuple for WordNet's cache of morphological
+        analyses, which is shared by all lemmatizers.
+        """
+        return wordnet.morphy_cache_info()
+
     def __repr__(self):
         return '<WordNetLemmatizer>'
 
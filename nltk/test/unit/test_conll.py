@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the grid reading of ConllCorpusReader.
+"""
+from __future__ import absolute_import, unicode_literals
+import io
+import os
+
+from nltk.corpus.reader.conll import ConllCorpusReader, ConllGridView
+from nltk.test.unit.utils import TempDirTestCase
+
+DATA = '''-DOCSTART- -X- O
+
+EU NNP B-NP
+rejects VBZ B-VP
+German JJ B-NP
+call NN I-NP
+. . O
+  \t
+Peter NNP B-NP
+Blackburn NNP I-NP
+
+
+BRUSSELS NNP B-NP
+1996-08-22 CD I-NP
+'''
+
+
+class TestConllGrids(TempDirTestCase):
+
+    FILES = {'test.conll': DATA}
+
+    def reader(self, **kwargs):
+        return ConllCorpusReader(self.root, ['test.conll'],
+                                 ('words', 'pos', 'chunk'), **kwargs)
+
+    def test_sents(self):
+        expected = [[], ['EU', 'rejects', 'German', 'call', '.'],
+                    ['Peter', 'Blackburn'], ['BRUSSELS', '1996-08-22']]
+        self.assertEqual(list(self.reader().sents()), expected)
+        # Blocks that end in the middle of a sentence are extended to
+        # the next blank line.
+        default_size = ConllGridView.BLOCK_SIZE
+        for block_size in (1, 7, 30):
+            ConllGridView.BLOCK_SIZE = block_size
+            try:
+                reader = self.reader(grid_cache_size=2)
+                self.assertEqual(list(reader.sents()), expected)
+                self.assertEqual(reader.sents()[2], expected[2])
+                self.assertEqual(reader.sents()[1], expected[1])
+            finally:
+                ConllGridView.BLOCK_SIZE = default_size
+
+    def test_shared_view(self):
+        reader = self.reader()
+        self.assertEqual(reader.tagged_sents()[2],
+                         [('Peter', 'NNP'), ('Blackburn', 'NNP')])
+        # All of the data access methods read the same corpus view.
+        self.assertTrue(reader._grids() is reader._grids())
+        self.assertEqual(reader.iob_words()[:2],
+                         [('EU', 'NNP', 'B-NP'), ('rejects', 'VBZ', 'B-VP')])
+        self.assertEqual(str(reader.chunked_sents()[2]),
+                         '(S (NP Peter/NNP Blackburn/NNP))')
+
+    def test_inconsistent_columns(self):
+        with io.open(os.path.join(self.root, 'test.conll'), 'a',
+                     encoding='utf8') as outfile:
+            outfile.write('bad NN\n')
+        self.assertRaises(ValueError, list, self.reader().sents())
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for thread-safe loading and preloading in LazyCorpusLoader.
+"""
+from __future__ import absolute_import, unicode_literals
+import threading
+import time
+
+from nltk.corpus.reader import CorpusReader
+from nltk.corpus.util import LazyCorpusLoader, preload, load_times
+from nltk.test.unit.utils import TempDirTestCase
+
+
+class SlowCorpusReader(CorpusReader):
+    constructed = 0
+
+    def __init__(self, root, fileids):
+        SlowCorpusReader.constructed += 1
+        time.sleep(0.1)
+        CorpusReader.__init__(self, root, fileids)
+
+    def hello(self):
+        return 'hello'
+
+
+class TestLazyCorpusLoader(TempDirTestCase):
+
+    FILES = {'corpora/slow_corpus/README': 'A slow corpus.\n'}
+    DATA_PATH = True
+
+    def setUp(self):
+        super(TestLazyCorpusLoader, self).setUp()
+        SlowCorpusReader.constructed = 0
+
+    def test_concurrent_first_access(self):
+        corpus = LazyCorpusLoader('slow_corpus', SlowCorpusReader, 'README')
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(corpus.hello()))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['hello'] * 8)
+        self.assertEqual(SlowCorpusReader.constructed, 1)
+        self.assertTrue(load_times()['slow_corpus'] >= 0.1)
+
+    def test_preload(self):
+        corpus = LazyCorpusLoader('slow_corpus', SlowCorpusReader, 'README')
+        times = preload(corpus)
+        self.assertEqual(list(times), ['slow_corpus'])
+        self.assertTrue(isinstance(corpus, SlowCorpusReader))
+        # Loaded corpora are skipped.
+        self.assertEqual(preload(corpus), {})
+        self.assertEqual(SlowCorpusReader.constructed, 1)
+        corpus._unload()
+        self.assertTrue(isinstance(corpus, LazyCorpusLoader))
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for parallel and resumable downloads in nltk.downloader, using a
+local HTTP server that serves a fake data index.
+"""
+from __future__ import absolute_import, unicode_literals
+import io
+import os
+import shutil
+import threading
+import zipfile
+from hashlib import md5
+
+try:
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+except ImportError:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+
+from nltk.downloader import Downloader, ErrorMessage
+from nltk.test.unit.utils import TempDirTestCase
+
+PACKAGE_IDS = ['alpha', 'beta', 'gamma']
+
+
+def _make_zip(pkg_id):
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, 'w') as zf:
+        zf.writestr('%s/README' % pkg_id, 'Package %s\n' % pkg_id)
+        zf.writestr('%s/data.txt' % pkg_id, ('%s ' % pkg_id) * 20000)
+    return data.getvalue()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    files = {}
+    ranges = []
+
+    def do_GET(self):
+        path = self.path.lstrip('/')
+        if path not in self.files:
+            self.send_error(404)
+            return
+        body = self.files[path]
+        byte_range = self.headers.get('Range')
+        if byte_range:
+            self.ranges.append((path, byte_range))
+            start = int(byte_range.split('=')[1].rstrip('-'))
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes %d-%d/%d' %
+                             (start, len(body)-1, len(body)))
+            body = body[start:]
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDownloader(TempDirTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(('127.0.0.1', 0), _Handler)
+        cls.base_url = 'http://127.0.0.1:%d/' % cls.server.server_port
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.daemon = True
+        cls.thread.start()
+
+        files = {}
+        packages = []
+        for pkg_id in PACKAGE_IDS:
+            data = _make_zip(pkg_id)
+            files['%s.zip' % pkg_id] = data
+            unzipped_size = len('Package %s\n' % pkg_id) + len(('%s ' % pkg_id) * 20000)
+            packages.append(
+                '<package id="%s" url="%s%s.zip" subdir="corpora" size="%d" '
+                'unzipped_size="%d" checksum="%s" unzip="1" />' %
+                (pkg_id, cls.base_url, pkg_id, len(data), unzipped_size,
+                 md5(data).hexdigest()))
+        packages.append(
+            '<package id="broken" url="%sbroken.zip" subdir="corpora" size="10" '
+            'unzipped_size="0" checksum="0" unzip="1" />' % cls.base_url)
+        files['broken.zip'] = b'0123456789'
+        items = ''.join('<item ref="%s" />' % pkg_id for pkg_id in PACKAGE_IDS)
+        files['index.xml'] = (
+            '<?xml version="1.0"?><nltk_data><packages>%s</packages>'
+            '<collections><collection id="all">%s</collection></collections>'
+            '</nltk_data>' % (''.join(packages), items)).encode('ascii')
+        _Handler.files = files
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        super(TestDownloader, self).setUp()
+        del _Handler.ranges[:]
+
+    def downloader(self, num_workers):
+        return Downloader(self.base_url + 'index.xml', self.root,
+                          num_workers=num_workers)
+
+    def test_parallel_collection(self):
+        downloader = self.downloader(num_workers=3)
+        messages = list(downloader.incr_download('all'))
+        self.assertFalse([msg for msg in messages
+                          if isinstance(msg, ErrorMessage)])
+        for pkg_id in PACKAGE_IDS:
+            self.assertEqual(downloader.status(pkg_id), downloader.INSTALLED)
+            self.assertTrue(os.path.exists(os.path.join(
+                self.root, 'corpora', pkg_id, 'README')))
+            self.assertFalse(os.path.exists(os.path.join(
+                self.root, 'corpora', pkg_id + '.zip.part')))
+
+    def test_parallel_matches_serial(self):
+        serial = [type(msg).__name__ for msg in
+                  self.downloader(num_workers=1).incr_download(PACKAGE_IDS[:])]
+        shutil.rmtree(self.root)
+        parallel = [type(msg).__name__ for msg in
+                    self.downloader(num_workers=2).incr_download(PACKAGE_IDS[:])]
+        self.assertEqual(serial, parallel)
+
+    def test_resume(self):
+        data = _Handler.files['beta.zip']
+        os.mkdir(os.path.join(self.root, 'corpora'))
+        partpath = os.path.join(self.root, 'corpora', 'beta.zip.part')
+        with open(partpath, 'wb') as outfile:
+            outfile.write(data[:1000])
+        downloader = self.downloader(num_workers=1)
+        self.assertTrue(downloader.download('beta', quiet=True))
+        self.assertEqual(_Handler.ranges, [('beta.zip', 'bytes=1000-')])
+        self.assertEqual(downloader.status('beta'), downloader.INSTALLED)
+
+    def test_checksum_mismatch(self):
+        downloader = self.downloader(num_workers=2)
+        messages = list(downloader.incr_download(['alpha', 'broken']))
+        errors = [msg for msg in messages if isinstance(msg, ErrorMessage)]
+        self.assertEqual(len(errors), 1)
+        self.assertTrue('checksum' in errors[0].message)
+        self.assertFalse(os.path.exists(os.path.join(
+            self.root, 'corpora', 'broken.zip.part')))
+        self.assertEqual(downloader.status('alpha'), downloader.INSTALLED)
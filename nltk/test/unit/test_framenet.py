@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the index cache and frame cache of FramenetCorpusReader, on a
+small corpus in the FrameNet 1.5 format.
+"""
+from __future__ import absolute_import, unicode_literals
+import io
+import os
+import time
+
+from nltk.corpus.reader.framenet import FramenetCorpusReader
+from nltk.test.unit.utils import TempDirTestCase
+
+NS = 'xmlns="http://framenet.icsi.berkeley.edu"'
+
+CORPUS_FILES = {
+    'semTypes.xml': '''<?xml version="1.0" encoding="UTF-8"?>
+<semTypes %s>
+<semType ID="1" name="Ontological_type" abbrev="Ont"><definition>Root.</definition></semType>
+<semType ID="2" name="Sentient" abbrev="Sent"><definition>Sentient.</definition>
+<superType superTypeName="Ontological_type" supID="1"/></semType>
+</semTypes>
+''',
+    'frameIndex.xml': '''<?xml version="1.0" encoding="UTF-8"?>
+<frameIndex %s>
+<frame ID="10" name="Motion"/>
+<frame ID="11" name="Self_motion"/>
+</frameIndex>
+''',
+    'luIndex.xml': '''<?xml version="1.0" encoding="UTF-8"?>
+<luIndex %s>
+<lu ID="100" name="move.v" frameID="10" frameName="Motion" status="Finished_Initial"/>
+<lu ID="101" name="drift.v" frameID="10" frameName="Motion" status="Problem"/>
+<lu ID="110" name="walk.v" frameID="11" frameName="Self_motion" status="Finished_Initial"/>
+</luIndex>
+''',
+    'fulltextIndex.xml': '''<?xml version="1.0" encoding="UTF-8"?>
+<fulltextIndex %s>
+<corpus ID="1" name="Test"><document ID="5" name="Doc" description="Doc"/></corpus>
+</fulltextIndex>
+''',
+    'frRelation.xml': '''<?xml version="1.0" encoding="UTF-8"?>
+<frameRelations %s>
+<frameRelationType ID="1" name="Inheritance" superFrameName="Parent" subFrameName="Child">
+<frameRelation ID="500" subID="11" supID="10" subFrameName="Self_motion" superFrameName="Motion">
+<FERelation ID="900" subID="1101" supID="1001" subFEName="Self_mover" superFEName="Theme"/>
+</frameRelation>
+</frameRelationType>
+</frameRelations>
+''',
+    'frame/Motion.xml': '''<?xml version="1.0" encoding="UTF-8"?>
+<frame ID="10" name="Motion" %s>
+<definition>&lt;def-root&gt;Something moves.&lt;/def-root&gt;</definition>
+<FE ID="1001" name="Theme" abbrev="thm" coreType="Core"><definition>The theme.</definition></FE>
+<FE ID="1002" name="Path" abbrev="pth" coreType="Core"><definition>The path.</definition>
+<requiresFE ID="1001" name="Theme"/></FE>
+<FEcoreSet><memberFE ID="1001" name="Theme"/><memberFE ID="1002" name="Path"/></FEcoreSet>
+<lexUnit ID="100" name="move.v" POS="V" status="Finished_Initial">
+<definition>COD: go.</definition><sentenceCount annotated="2" total="3"/>
+<lexeme POS="V" name="move" order="1" headword="false" breakBefore="false"/></lexUnit>
+<lexUnit ID="101" name="drift.v" POS="V" status="Problem">
+<definition>COD: float.</definition><sentenceCount annotated="0" total="0"/>
+<lexeme POS="V" name="drift" order="1" headword="false" breakBefore="false"/></lexUnit>
+</frame>
+''',
+    'frame/Self_motion.xml': '''<?xml version="1.0" encoding="UTF-8"?>
+<frame ID="11" name="Self_motion" %s>
+<definition>&lt;def-root&gt;Someone moves.&lt;/def-root&gt;</definition>
+<FE ID="1101" name="Self_mover" abbrev="slf" coreType="Core">
+<definition>The mover.</definition><semType ID="2" name="Sentient"/></FE>
+<lexUnit ID="110" name="walk.v" POS="V" status="Finished_Initial">
+<definition>COD: go on foot.</definition><sentenceCount annotated="1" total="1"/>
+<lexeme POS="V" name="walk" order="1" headword="false" breakBefore="false"/></lexUnit>
+</frame>
+''',
+}
+
+FILEIDS = ['frRelation.xml', 'frameIndex.xml', 'fulltextIndex.xml',
+           'luIndex.xml', 'semTypes.xml']
+
+
+class NoXMLFramenetCorpusReader(FramenetCorpusReader):
+    """A reader that fails if it has to make records from the XML."""
+
+    def _handle_elt(self, elt, tagspec=None):
+        raise AssertionError('index file parsed')
+
+    def _handle_frame_elt(self, elt, tagspec=None):
+        raise AssertionError('frame file parsed')
+
+    def _handle_framerelationtype_elt(self, elt, *args):
+        raise AssertionError('relation file parsed')
+
+    def _handle_semtype_elt(self, elt, tagspec=None):
+        raise AssertionError('semantic type file parsed')
+
+
+class TestFramenetCache(TempDirTestCase):
+
+    FILES = dict((fileid, data % NS) for fileid, data in CORPUS_FILES.items())
+
+    def setUp(self):
+        super(TestFramenetCache, self).setUp()
+        self.index_dir = self.mkdtemp()
+
+    def reader(self, **kwargs):
+        return FramenetCorpusReader(self.root, FILEIDS, **kwargs)
+
+    def check_reader(self, fn):
+        self.assertEqual(sorted(f.name for f in fn.frames()),
+                         ['Motion', 'Self_motion'])
+        motion = fn.frame('Motion')
+        self.assertEqual(motion.ID, 10)
+        self.assertEqual(motion.definition, 'Something moves.')
+        self.assertTrue(motion.FE['Path'].requiresFE is motion.FE['Theme'])
+        self.assertEqual(sorted(motion.lexUnit), ['move.v'])
+        self.assertTrue(fn.lu(100).frame is fn.frame(10))
+        self.assertEqual(fn.lu(101).name, 'drift.v')
+        self.assertEqual(sorted(lu.name for lu in fn.lus()),
+                         ['drift.v', 'move.v', 'walk.v'])
+        self.assertEqual(sorted(fe.name for fe in fn.fes()),
+                         ['Path', 'Self_mover', 'Theme'])
+        self.assertEqual(fn.frame('Self_motion').FE['Self_mover'].semType.name,
+                         'Sentient')
+        rels = fn.frame_relations('Motion')
+        self.assertEqual(len(rels), 1)
+        self.assertEqual(rels[0].subFrame.name, 'Self_motion')
+        self.assertEqual(fn.fe_relations()[0].superFE.name, 'Theme')
+        self.assertEqual([doc.filename for doc in fn.documents()],
+                         ['Test__Doc.xml'])
+
+    def test_index_cache(self):
+        self.check_reader(self.reader(index_dir=self.index_dir))
+        self.assertTrue(os.path.exists(os.path.join(
+            self.index_dir, FramenetCorpusReader._INDEX_CACHE_FILE)))
+        # A second reader builds everything from the cached records,
+        # without reading any of the XML files.
+        self.check_reader(NoXMLFramenetCorpusReader(
+            self.root, FILEIDS, index_dir=self.index_dir))
+
+    def test_out_of_date_cache(self):
+        self.assertEqual(self.reader(index_dir=self.index_dir)
+                         .frame('Motion').definition, 'Something moves.')
+        filename = os.path.join(self.root, 'frame', 'Motion.xml')
+        with io.open(filename, 'w', encoding='utf-8') as outfile:
+            outfile.write(self.FILES['frame/Motion.xml'].replace(
+                'Something moves.', 'Something changes place.'))
+        mtime = time.time() + 10
+        os.utime(filename, (mtime, mtime))
+        self.assertEqual(self.reader(index_dir=self.index_dir)
+                         .frame('Motion').definition,
+                         'Something changes place.')
+
+    def test_no_index_dir(self):
+        # Without an index_dir, nothing is written to disk.
+        self.check_reader(self.reader())
+        self.assertEqual(sorted(os.listdir(self.root)),
+                         sorted(['frame'] + FILEIDS))
+        self.assertEqual(os.listdir(self.index_dir), [])
+
+    def test_frame_cache_size(self):
+        fn = self.reader(frame_cache_size=1)
+        motion = fn.frame('Motion')
+        self.assertTrue(fn.frame(10) is motion)
+        fn.frame('Self_motion')
+        # The first frame has been discarded, and is built again.
+        self.assertFalse(fn.frame('Motion') is motion)
+        self.assertEqual(sorted(fn.frame('Motion').FE), sorted(motion.FE))
+        self.check_reader(fn)
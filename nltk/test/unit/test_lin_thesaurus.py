@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the compiled indexes of LinThesaurusCorpusReader.
+"""
+from __future__ import absolute_import, unicode_literals
+import io
+import os
+
+from nltk.corpus.reader.lin import LinThesaurusCorpusReader
+from nltk.test.unit.utils import TempDirTestCase
+
+SIM_N = '''("business" (desc 0.3))
+"enterprise"\t0.25
+"company"\t0.125
+))
+("enterprise" (desc 0.2))
+"business"\t0.25
+))
+("lonely" (desc 0.1))
+))
+'''
+
+SIM_V = '''("run" (desc 0.3))
+"walk"\t0.3
+))
+'''
+
+
+class TestLinThesaurus(TempDirTestCase):
+
+    FILES = {'simN.lsp': SIM_N, 'simV.lsp': SIM_V}
+
+    def setUp(self):
+        super(TestLinThesaurus, self).setUp()
+        self.index_dir = self.mkdtemp()
+
+    def check_lookups(self, thes):
+        self.assertEqual(thes.scored_synonyms('business', 'simN.lsp'),
+                         [('enterprise', 0.25), ('company', 0.125)])
+        self.assertEqual(thes.synonyms('business'),
+                         [('simN.lsp', ['enterprise', 'company']),
+                          ('simV.lsp', [])])
+        self.assertEqual(thes.similarity('business', 'company', 'simN.lsp'), 0.125)
+        self.assertEqual(thes.similarity('business', 'run'),
+                         [('simN.lsp', 0.0), ('simV.lsp', 0.0)])
+        self.assertEqual(thes.similarity('run', 'run', 'simV.lsp'), 1.0)
+        self.assertTrue('lonely' in thes)
+        self.assertFalse('missing' in thes)
+
+    def test_index_dir(self):
+        self.check_lookups(LinThesaurusCorpusReader(self.root, index_dir=self.index_dir))
+        self.assertTrue(os.path.exists(os.path.join(self.index_dir, 'simN.lsp.idx')))
+        # A second reader uses the existing index.
+        self.check_lookups(LinThesaurusCorpusReader(self.root, index_dir=self.index_dir))
+
+    def test_index_in_memory(self):
+        self.check_lookups(LinThesaurusCorpusReader(self.root))
+        # Nothing is written without an index directory.
+        self.assertEqual(sorted(os.listdir(self.root)), ['simN.lsp', 'simV.lsp'])
+        self.assertEqual(os.listdir(self.index_dir), [])
+
+    def test_out_of_date_index(self):
+        thes = LinThesaurusCorpusReader(self.root, index_dir=self.index_dir)
+        thes.synonyms('run', 'simV.lsp')
+        with io.open(os.path.join(self.root, 'simV.lsp'), 'a') as outfile:
+            outfile.write('("walk" (desc 0.3))\n"run"\t0.3\n))\n')
+        thes = LinThesaurusCorpusReader(self.root, index_dir=self.index_dir)
+        self.assertEqual(thes.synonyms('walk', 'simV.lsp'), ['run'])
+
+    def test_same_size_edit(self):
+        thes = LinThesaurusCorpusReader(self.root, index_dir=self.index_dir)
+        thes.synonyms('run', 'simV.lsp')
+        path = os.path.join(self.root, 'simV.lsp')
+        with io.open(path, 'w') as outfile:
+            outfile.write(SIM_V.replace('walk', 'jogs'))
+        # Make sure the edit is seen even where mtimes are coarse.
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        thes = LinThesaurusCorpusReader(self.root, index_dir=self.index_dir)
+        self.assertEqual(thes.synonyms('run', 'simV.lsp'), ['jogs'])
+
+    def test_entry_cache(self):
+        thes = LinThesaurusCorpusReader(self.root, cache_size=1)
+        for i in range(3):
+            self.assertEqual(thes.similarity('business', 'enterprise', 'simN.lsp'), 0.25)
+            self.assertEqual(thes.similarity('business', 'lonely', 'simN.lsp'), 0.0)
+        self.assertEqual(thes._entry_cache.info().hits, 5)
+        self.assertEqual(thes.similarity('run', 'walk', 'simV.lsp'), 0.3)
+        self.assertEqual(len(thes._entry_cache), 1)
+        # Changing the returned list does not change the cached entry.
+        thes.scored_synonyms('run', 'simV.lsp').append(('fly', 1.0))
+        self.assertEqual(thes.synonyms('run', 'simV.lsp'), ['walk'])
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for NKJPCorpusReader, on a small document in the NKJP format.
+"""
+from __future__ import absolute_import, unicode_literals
+import os
+
+from nltk.corpus.reader.nkjp import NKJPCorpusReader
+from nltk.test.unit.utils import TempDirTestCase
+
+NS = ('xmlns="http://www.tei-c.org/ns/1.0" '
+      'xmlns:nkjp="http://www.nkjp.pl/ns/1.0" '
+      'xmlns:xi="http://www.w3.org/2001/XInclude"')
+
+# The files of the document Doc1.
+DOC1 = {
+    'header.xml': '''<?xml version="1.0" encoding="UTF-8"?>
+<teiHeader %s><fileDesc><sourceDesc><bibl>
+<title> Tytuł </title><author> Autor </author>
+</bibl></sourceDesc></fileDesc></teiHeader>
+''',
+    'text.xml': '''<?xml version="1.0" encoding="UTF-8"?>
+<teiCorpus %s><TEI><xi:include href="header.xml"/><text><body>
+<div xml:id="txt_1-div"><ab n="p-1" xml:id="txt_1-ab">Ala ma kota.</ab></div>
+</body></text></TEI></teiCorpus>
+''',
+    'ann_segmentation.xml': '''<?xml version="1.0" encoding="UTF-8"?>
+<teiCorpus %s><TEI><text><body>
+<p corresp="text.xml#txt_1-ab" xml:id="segm_1-p"><s xml:id="segm_1.1-s">
+<seg corresp="text.xml#string-range(txt_1-ab,0,3)" xml:id="s1"/>
+<choice><seg corresp="text.xml#string-range(txt_1-ab,4,2)" nkjp:nps="true" xml:id="s2"/>
+<nkjp:paren><seg corresp="text.xml#string-range(txt_1-ab,4,1)" xml:id="s2a"/>
+<seg corresp="text.xml#string-range(txt_1-ab,5,1)" xml:id="s2b"/></nkjp:paren></choice>
+<seg corresp="text.xml#string-range(txt_1-ab,7,4)" xml:id="s3"/>
+<seg corresp="text.xml#string-range(txt_1-ab,11,1)" nkjp:nps="true" xml:id="s4"/>
+</s></p></body></text></TEI></teiCorpus>
+''',
+    'ann_morphosyntax.xml': '''<?xml version="1.0" encoding="UTF-8"?>
+<teiCorpus %s><TEI><text><body><p><s>
+<seg><fs type="morph"><f name="orth"><string>Ala</string></f>
+<f name="interps"><fs type="lex"><f name="ctag"><symbol value="subst"/></f></fs></f></fs></seg>
+<seg nkjp:rejected="true"><fs type="morph"><f name="orth"><string>ma</string></f>
+<f name="interps"><fs type="lex"><f name="ctag"><symbol value="fin"/></f></fs></f></fs></seg>
+<seg><fs type="morph"><f name="orth"><string>kota</string></f>
+<f name="interps"><fs type="lex"><f name="ctag"><symbol value="subst"/></f></fs></f></fs></seg>
+<seg><fs type="morph"><f name="orth"><string>.</string></f>
+<f name="interps"><fs type="lex"><f name="ctag"><symbol value="interp"/></f></fs></f></fs></seg>
+</s></p></body></text></TEI></teiCorpus>
+''',
+}
+
+
+class TestNKJPCorpusReader(TempDirTestCase):
+
+    FILES = dict(('Doc1/' + filename, data % NS)
+                 for filename, data in DOC1.items())
+
+    def setUp(self):
+        super(TestNKJPCorpusReader, self).setUp()
+        self.reader = NKJPCorpusReader(self.root + os.sep, 'Doc1')
+
+    def test_header(self):
+        header = list(self.reader.header())
+        self.assertEqual(header[0]['title'], 'Tytuł')
+        self.assertEqual(header[0]['author'], 'Autor')
+
+    def test_raw(self):
+        self.assertEqual(list(self.reader.raw()), ['Ala ma kota.'])
+
+    def test_words(self):
+        self.assertEqual(list(self.reader.words()), ['Ala', 'ma', 'kota'])
+        self.assertEqual(list(self.reader.tagged_words(tags=['subst'])),
+                         ['Ala', 'kota'])
+
+    def test_sents(self):
+        self.assertEqual(list(self.reader.sents()), ['Ala ma kota.'])
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for PanLexLiteCorpusReader, using a small database with the PanLex Lite
+schema.
+"""
+from __future__ import absolute_import, unicode_literals
+import os
+import sqlite3
+import threading
+
+from nltk.corpus.reader.panlex_lite import PanLexLiteCorpusReader
+from nltk.test.unit.utils import TempDirTestCase
+
+LANGUAGE_VARIETIES = [(1, 'eng-000', 'English', 'eng'),
+                      (2, 'fra-000', 'français', 'fra'),
+                      (3, 'deu-000', 'Deutsch', 'deu')]
+
+EXPRESSIONS = [(1, 1, 'dog'), (2, 1, 'hound'), (3, 2, 'chien'),
+               (4, 3, 'Hund'), (5, 1, 'cat'), (6, 2, 'chat'), (7, 3, 'Katze'),
+               (8, 2, 'toutou')]
+
+# (meaning, expression, source quality, source, source group)
+DENOTATIONS = [(1, 1, 5, 10, 100), (1, 3, 5, 10, 100), (1, 4, 5, 10, 100),
+               (2, 1, 7, 11, 101), (2, 2, 7, 11, 101), (2, 8, 7, 11, 101),
+               (3, 5, 6, 10, 100), (3, 6, 6, 10, 100), (3, 7, 6, 10, 100),
+               (4, 1, 3, 12, 102), (4, 3, 3, 12, 102)]
+
+
+class TestPanLexLite(TempDirTestCase):
+
+    def setUp(self):
+        super(TestPanLexLite, self).setUp()
+        db = sqlite3.connect(os.path.join(self.root, 'db.sqlite'))
+        db.execute('CREATE TABLE lv (lv integer, uid text, tt text, lc text)')
+        db.execute('CREATE TABLE ex (ex integer, lv integer, tt text)')
+        db.execute('CREATE TABLE dnx (mn integer, ex integer, uq integer, '
+                   'ap integer, ui integer)')
+        db.executemany('INSERT INTO lv VALUES (?, ?, ?, ?)', LANGUAGE_VARIETIES)
+        db.executemany('INSERT INTO ex VALUES (?, ?, ?)', EXPRESSIONS)
+        db.executemany('INSERT INTO dnx VALUES (?, ?, ?, ?, ?)', DENOTATIONS)
+        db.commit()
+        db.close()
+
+    def test_translations(self):
+        reader = PanLexLiteCorpusReader(self.root)
+        self.assertEqual(reader.translations('eng-000', 'dog', 'fra-000'),
+                         [('chien', 8), ('toutou', 7)])
+        self.assertEqual(reader.translations('eng-000', 'cow', 'fra-000'), [])
+        reader.close()
+
+    def test_batch_queries_match_single_queries(self):
+        reader = PanLexLiteCorpusReader(self.root)
+        words = ['dog', 'cat', 'hound', 'cow']
+        translations = reader.translations_many('eng-000', words, 'fra-000')
+        meanings = reader.meanings_many('eng-000', words)
+        for word in words:
+            self.assertEqual(translations[word],
+                             reader.translations('eng-000', word, 'fra-000'))
+            self.assertEqual(meanings[word], reader.meanings('eng-000', word))
+        reader.close()
+
+    def test_cache(self):
+        reader = PanLexLiteCorpusReader(self.root, cache_size=10)
+        first = reader.translations('eng-000', 'dog', 'deu-000')
+        self.assertEqual(reader.translations('eng-000', 'dog', 'deu-000'), first)
+        reader.translations_many('eng-000', ['dog', 'cat'], 'deu-000')
+        info = reader.cache_info()
+        self.assertEqual((info.hits, info.currsize), (2, 2))
+        reader.close()
+
+    def test_threads(self):
+        reader = PanLexLiteCorpusReader(self.root)
+        expected = reader.translations('eng-000', 'cat', 'deu-000')
+        results = []
+
+        def translate():
+            results.append(reader.translations('eng-000', 'cat', 'deu-000'))
+
+        threads = [threading.Thread(target=translate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [expected] * 4)
+        reader.close()
+
+    def test_connection_pool(self):
+        reader = PanLexLiteCorpusReader(self.root, pool_size=2)
+        expected = reader.translations('eng-000', 'dog', 'fra-000')
+        results = []
+
+        def translate():
+            results.append(reader.translations('eng-000', 'dog', 'fra-000'))
+
+        # Threads that each run one query and exit do not leave their own
+        # connections behind.
+        for _ in range(10):
+            threads = [threading.Thread(target=translate) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(results, [expected] * 50)
+        self.assertTrue(1 <= len(reader._connections) <= 2)
+
+        # close() closes the connections opened by every thread.
+        connections = list(reader._connections)
+        reader.close()
+        self.assertEqual(len(reader._connections), 0)
+        for connection in connections:
+            self.assertRaises(sqlite3.ProgrammingError,
+                              connection.execute, 'SELECT 1')
+        self.assertEqual(reader.translations('eng-000', 'dog', 'fra-000'),
+                         expected)
+        reader.close()
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function, unicode_literals
+import pickle
 import unittest
-from nltk.stem.snowball import SnowballStemmer
+from nltk.stem import CachedStemmer, LancasterStemmer, PorterStemmer
+from nltk.stem.snowball import SnowballStemmer, _SuffixTable
+from nltk.util import LRUCache
 
 
 class SnowballTest(unittest.TestCase):
@@ -34,3 +37,56 @@ class SnowballTest(unittest.TestCase):
     def test_short_strings_bug(self):
         stemmer = SnowballStemmer('english')
         assert stemmer.stem("y's") == 'y'
+
+    def test_suffix_table(self):
+        table = _SuffixTable(("ov", "ami", "i", "ovi"))
+        # Matches are given in table order, not by length.
+        self.assertEqual(table.matches("domovi"), ["i", "ovi"])
+        self.assertEqual(table.matches("ami"), ["ami", "i"])
+        self.assertEqual(table.matches("i"), ["i"])
+        self.assertEqual(table.matches("dom"), [])
+        self.assertEqual(table.matches(""), [])
+        self.assertEqual(table, ("ov", "ami", "i", "ovi"))
+
+        # Suffixes that match but are rejected by a step's conditions
+        # fall through to the shorter suffixes after them.
+        for language, word, stem in [
+                ('finnish', 'taloissaan', 'talo'),
+                ('finnish', 'kahvia', 'kahv'),
+                ('russian', 'красивейшими', 'красив'),
+                ('russian', 'прочитавшись', 'прочита'),
+                ('french', 'gracieusement', 'gracieux'),
+                ('italian', 'abbandonata', 'abbandon')]:
+            self.assertEqual(SnowballStemmer(language).stem(word), stem)
+
+
+class CachedStemmerTest(unittest.TestCase):
+
+    WORDS = ('running runs ran generously generous cats cat caresses '
+             'running cats').split()
+
+    def test_stem_many(self):
+        for stemmer in (PorterStemmer(), LancasterStemmer(),
+                        SnowballStemmer('english')):
+            expected = [stemmer.stem(word) for word in self.WORDS]
+            assert stemmer.stem_many(iter(self.WORDS)) == expected
+            cached = CachedStemmer(stemmer, maxsize=3)
+            assert [cached.stem(word) for word in self.WORDS] == expected
+            assert cached.stem_many(self.WORDS) == expected
+            assert len(cached.cache) == 3
+
+    def test_shared_cache(self):
+        cache = LRUCache()
+        stemmers = [CachedStemmer(PorterStemmer(), cache=cache)
+                    for i in range(2)]
+        assert stemmers[0].stem('running') == 'run'
+        assert stemmers[1].stem('running') == 'run'
+        assert cache.info().hits == 1
+
+        # The cache goes with a pickled stemmer, and can be merged back.
+        worker = pickle.loads(pickle.dumps(stemmers[0]))
+        assert worker.stem_many(['running', 'cats']) == ['run', 'cat']
+        assert worker.cache.info().hits == 2
+        cache.update(worker.cache)
+        assert sorted(cache) == ['cats', 'running']
+
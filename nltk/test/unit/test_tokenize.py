@@ -5,7 +5,23 @@ See also nltk/test/tokenize.doctest
 """
 
 from __future__ import unicode_literals
-from nltk.tokenize import TweetTokenizer
+import os
+import pickle
+import random
+from collections import Counter
+
+from nltk.compat import PY3
+from nltk.tokenize import (BlanklineTokenizer, LineTokenizer, MWETokenizer,
+                           SExprTokenizer, SpaceTokenizer, TabTokenizer,
+                           TextTilingTokenizer, TreebankWordTokenizer,
+                           TweetTokenizer, WhitespaceTokenizer,
+                           WordPunctTokenizer, sent_tokenize, word_tokenize,
+                           sent_tokenize_many, word_tokenize_many)
+from nltk.tokenize.simple import CharTokenizer
+from nltk.tokenize.mwe import MWEAutomaton
+from nltk.tokenize.punkt import (PunktParameters, PunktSentenceTokenizer,
+                                 PunktTrainer)
+from nltk.test.unit.utils import TempDirTestCase
 import unittest
 
 class TestTokenize(unittest.TestCase):
@@ -21,3 +37,341 @@ class TestTokenize(unittest.TestCase):
         expected = [':', "Let's", 'test', 'these', 'words', ':', 'resumé',
                     'España', 'München', 'français']
         self.assertEqual(tokens, expected)
+
+    def test_tweet_tokenize_many(self):
+        """
+        Test that TweetTokenizer.tokenize_many gives the tokens of tokenize.
+        """
+        tweets = ['@remy: This is waaaaayyyy too much :D &amp; more!!',
+                  'Call 555 123 4567 or (555) 123-4567 . . . NOW', '',
+                  'Ellipsis .  . and 3 . 5 and http://t.co/x ;-)'] * 3
+        for kwargs in ({}, {'preserve_case': False},
+                       {'strip_handles': True, 'reduce_len': True}):
+            tokenizer = TweetTokenizer(**kwargs)
+            expected = [tokenizer.tokenize(tweet) for tweet in tweets]
+            self.assertEqual(list(tokenizer.tokenize_many(iter(tweets))),
+                             expected)
+            tokenizer.SEGMENT_CACHE_SIZE = 2
+            self.assertEqual(list(tokenizer.tokenize_many(tweets, 2, 5)),
+                             expected)
+        self.assertTrue('555 123 4567' in expected[1])
+
+
+class TestSpanTokenize(unittest.TestCase):
+
+    TEXT = ("Good muffins cost $3.88\nin New York.  Please (buy me)\n"
+            "two\tof them.\n\nThanks, @remy :-) (a (b c)) d")
+
+    def check_spans(self, tokenizer, text, tokens=None):
+        if tokens is None:
+            tokens = tokenizer.tokenize(text)
+        spans = list(tokenizer.span_tokenize(text))
+        self.assertEqual([text[start:end] for start, end in spans], tokens)
+        offsets = tokenizer.span_tokenize_array(text)
+        self.assertEqual(list(zip(offsets[::2], offsets[1::2])), spans)
+
+    def test_string_tokenizers(self):
+        for tokenizer in (WhitespaceTokenizer(), WordPunctTokenizer(),
+                          BlanklineTokenizer(), SpaceTokenizer(),
+                          TabTokenizer(), CharTokenizer(),
+                          LineTokenizer(blanklines='keep'),
+                          SExprTokenizer(strict=False),
+                          TweetTokenizer()):
+            self.check_spans(tokenizer, self.TEXT)
+        tokenizer = TreebankWordTokenizer()
+        self.check_spans(tokenizer, self.TEXT.replace('\n', ' '))
+
+    def test_tweet_tokenizer(self):
+        tokenizer = TweetTokenizer(strip_handles=True, reduce_len=True,
+                                   preserve_case=False)
+        text = "@remy: It's waaaaayyyy too &lt;3 &amp;&amp; SO much!!!!!!"
+        self.check_spans(tokenizer, text, [
+            ':', "It's", 'waaaaayyyy', 'too', '&lt;3', '&amp;', '&amp;',
+            'SO', 'much', '!', '!', '!!!!'])
+        self.assertEqual(tokenizer.tokenize(text)[2], 'waaayyy')
+
+    def test_mwe_tokenizer(self):
+        tokenizer = MWETokenizer([('New', 'York'), ('a', 'b', 'c')])
+        tokens = 'in New York a b c d'.split()
+        self.assertEqual(list(tokenizer.span_tokenize(tokens)),
+                         [(0, 1), (1, 3), (3, 6), (6, 7)])
+        self.assertEqual(list(tokenizer.span_tokenize_array(tokens)),
+                         [0, 1, 1, 3, 3, 6, 6, 7])
+
+
+class TestMWETokenizer(unittest.TestCase):
+
+    MWES = [('a', 'b'), ('a', 'b', 'c', 'd'), ('b', 'c', 'e'), ('c',)]
+
+    def test_longest_match(self):
+        tokenizer = MWETokenizer(self.MWES)
+        # The longest MWE is merged, falling back to a shorter one where a
+        # longer one is not completed.
+        self.assertEqual(tokenizer.tokenize('a b c d a b c x'.split()),
+                         ['a_b_c_d', 'a_b', 'c', 'x'])
+        self.assertEqual(tokenizer.tokenize('a b c e'.split()),
+                         ['a_b', 'c', 'e'])
+        self.assertEqual(tokenizer.tokenize([]), [])
+
+    def test_matches(self):
+        automaton = MWEAutomaton(self.MWES)
+        self.assertEqual(len(automaton), 4)
+        self.assertEqual(sorted(automaton.mwes()), sorted(self.MWES))
+        tokens = 'x a b c e'.split()
+        self.assertEqual(list(automaton.matches(tokens)),
+                         [(1, 3), (3, 4), (2, 5)])
+        self.assertEqual(automaton.longest_matches(tokens),
+                         {1: 3, 2: 5, 3: 4})
+        self.assertEqual(automaton.leftmost_longest(tokens), [(1, 3), (3, 4)])
+
+    def test_leftmost_longest(self):
+        # Compare with merging the longest MWE at each position, found by
+        # trying every span.
+        random.seed(0)
+        for i in range(2000):
+            mwes = set(tuple(random.choice('abc')
+                             for _ in range(random.randint(1, 4)))
+                       for _ in range(random.randint(0, 6)))
+            tokens = [random.choice('abcd') for _ in range(random.randint(0, 12))]
+            expected = []
+            start = 0
+            while start < len(tokens):
+                ends = [end for end in range(start + 1, len(tokens) + 1)
+                        if tuple(tokens[start:end]) in mwes]
+                if ends:
+                    expected.append((start, max(ends)))
+                    start = max(ends)
+                else:
+                    start += 1
+            self.assertEqual(MWEAutomaton(mwes).leftmost_longest(tokens),
+                             expected, (mwes, tokens))
+
+    def test_pickle(self):
+        tokenizer = MWETokenizer(self.MWES, separator='+')
+        tokenizer = pickle.loads(pickle.dumps(tokenizer))
+        self.assertEqual(tokenizer.tokenize('a b c x'.split()),
+                         ['a+b', 'c', 'x'])
+        tokenizer.add_mwe(('c', 'x'))
+        self.assertEqual(tokenizer.tokenize('a b c x'.split()),
+                         ['a+b', 'c+x'])
+
+
+class TestTextTiling(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            import numpy
+        except ImportError:
+            from nose import SkipTest
+            raise SkipTest("numpy is required for TextTilingTokenizer")
+
+    def test_block_comparison(self):
+        random.seed(0)
+        words = ['alpha', 'beta', 'gamma', 'delta', 'epsilon', 'zeta']
+        text = '\n\n'.join(' '.join(random.choice(words[i % 3:i % 3 + 4])
+                                    for _ in range(150))
+                           for i in range(8))
+        tt = TextTilingTokenizer(w=5, k=4, stopwords=['zeta'])
+        tt.GAP_CHUNK_SIZE = 7
+        tokseqs = tt._divide_to_tokensequences(text)
+        for ts in tokseqs:
+            ts.wrdindex_list = [wi for wi in ts.wrdindex_list
+                                if wi[0] not in tt.stopwords]
+        token_table = tt._create_token_table(
+            tokseqs, tt._mark_paragraph_breaks(text))
+        gap_scores = tt._block_comparison(tokseqs, token_table)
+
+        def block(start, end):
+            return Counter(word for ts in tokseqs[max(start, 0):end]
+                           for word, index in ts.wrdindex_list)
+
+        numgaps = len(tokseqs) - 1
+        self.assertEqual(len(gap_scores), numgaps)
+        for gap, score in enumerate(gap_scores):
+            window_size = min(gap + 1, tt.k, numgaps - gap)
+            b1 = block(gap - window_size + 1, gap + 1)
+            b2 = block(gap + 1, gap + window_size + 1)
+            expected = (sum(b1[word] * b2[word] for word in b1) /
+                        (sum(f ** 2 for f in b1.values()) *
+                         sum(f ** 2 for f in b2.values())) ** 0.5)
+            self.assertAlmostEqual(score, expected)
+
+    def test_depth_scores(self):
+        tt = TextTilingTokenizer(stopwords=[])
+        scores = [0.2, 0.5, 0.3, 0.3, 0.1, 0.4, 0.6, 0.6, 0.2, 0.1, 0.3, 0.2]
+        depth_scores = tt._depth_scores(scores)
+        self.assertEqual([round(d, 6) for d in depth_scores],
+                         [0, 0, 0.2, 0.2, 0.9, 0.2, 0, 0, 0.4, 0.7, 0, 0])
+        self.assertEqual(tt._identify_boundaries(
+            [0, 0, 0.3, 0.3, 0.7, 0.7, 0.2, 0.1, 0.5, 0, 0, 0]),
+            [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0])
+
+
+class TestPunkt(unittest.TestCase):
+
+    TEXT = ("Mr. Smith met J. S. Bach at 3 p.m. today. (Really?) Yes.  "
+            "\"It was Mr.\n\nSmith,\" he said... and left. U.S.A. is big."
+            "  3. Hello... Then e.g. this one?! x.y.z")
+
+    def tokenizer(self):
+        params = PunktParameters()
+        params.abbrev_types.update(['mr', 'p.m', 'e.g', 'u.s.a'])
+        params.sent_starters.add('then')
+        params.collocations.add(('j', 's'))
+        return PunktSentenceTokenizer(params)
+
+    def test_sentences(self):
+        self.assertEqual(self.tokenizer().tokenize(self.TEXT), [
+            'Mr. Smith met J. S. Bach at 3 p.m. today.', '(Really?)',
+            'Yes.', '"It was Mr.\n\nSmith," he said... and left.',
+            'U.S.A. is big.', '3.', 'Hello...', 'Then e.g. this one?!',
+            'x.y.z'])
+
+    def test_shared_decisions(self):
+        # The decisions shared by the candidate contexts of a document
+        # agree with those made for each context on its own.
+        tokenizer = self.tokenizer()
+        contains_sentbreak = tokenizer._sentbreak_finder()
+        period_context_re = tokenizer._lang_vars.period_context_re()
+        contexts = [match.group() + match.group('after_tok')
+                    for match in period_context_re.finditer(self.TEXT * 2)]
+        self.assertEqual(len(contexts), 32)
+        for context in contexts:
+            self.assertEqual(contains_sentbreak(context),
+                             tokenizer.text_contains_sentbreak(context))
+
+
+class TestPunktTrainer(unittest.TestCase):
+
+    TEXTS = ['Dr. Watson met the captain of the ship.  They talked for '
+             'an hour.\n\nThe captain saw Dr. Hill on Jan. 3 at the dock.',
+             'It rained.  Mr. Brown and Dr. Green left early.  They went '
+             'home.\n\nThe ship sailed in Jan. of that year.'] * 3
+
+    def test_train_texts(self):
+        trainer = PunktTrainer()
+        trainer.train_texts(iter(self.TEXTS))
+        whole = PunktTrainer('\n\n'.join(self.TEXTS))
+        self.assertEqual(trainer._type_fdist, whole._type_fdist)
+        self.assertEqual(trainer.get_params().abbrev_types,
+                         whole.get_params().abbrev_types)
+        self.assertTrue('dr' in trainer.get_params().abbrev_types)
+
+    def test_max_types(self):
+        trainer = PunktTrainer()
+        trainer.train_texts(self.TEXTS, max_types=10)
+        # Types seen once are forgotten, but the number of tokens is kept.
+        self.assertTrue(len(trainer._type_fdist) < 10)
+        self.assertEqual(trainer._type_fdist.N(),
+                         PunktTrainer('\n\n'.join(self.TEXTS))._type_fdist.N())
+        self.assertTrue('dr' in trainer.get_params().abbrev_types)
+
+    def test_max_frequent_types(self):
+        # Every type, collocation and sentence starter is seen more than
+        # once, so it takes higher thresholds to stay within max_types.
+        sizes = []
+        prunes = []
+
+        class Trainer(PunktTrainer):
+            INCLUDE_ALL_COLLOCS = True
+
+            def _size_threshold(self, fdist, max_size):
+                prunes.append(len(fdist))
+                return PunktTrainer._size_threshold(self, fdist, max_size)
+
+        def word(n):
+            return ''.join('abcdefghij'[int(digit)] for digit in str(n))
+
+        def texts(trainer):
+            for i in range(50):
+                sents = ['The end%s. Then%s came.' % (word(i * 10 + j),
+                                                      word(i * 10 + j))
+                         for j in range(10)]
+                yield ' '.join(sents * 2)
+                sizes.append((len(trainer._type_fdist),
+                              len(trainer._collocation_fdist),
+                              len(trainer._sent_starter_fdist)))
+
+        unbounded = Trainer()
+        unbounded.train_texts(texts(unbounded), finalize=False)
+        for size in zip(*sizes):
+            self.assertTrue(max(size) > 200)
+        del sizes[:]
+
+        trainer = Trainer()
+        trainer.train_texts(texts(trainer), max_types=40, finalize=False)
+        for size in zip(*sizes):
+            self.assertTrue(max(size) <= 40)
+        # Each pruning leaves room for several more texts.
+        self.assertTrue(len(prunes) <= 3 * 25)
+        self.assertTrue('the' in trainer._type_fdist)
+        for fdist in ('_type_fdist', '_collocation_fdist',
+                      '_sent_starter_fdist'):
+            self.assertEqual(getattr(trainer, fdist).N(),
+                             getattr(unbounded, fdist).N())
+
+    def test_freq_threshold(self):
+        trainer = PunktTrainer()
+        trainer.train('a a a b b c. d d d d.', finalize=False)
+        trainer.freq_threshold(type_thresh=3)
+        # The number of types removed is recorded.
+        self.assertEqual(dict(trainer._type_fdist.items()),
+                         {'a': 3, 'd': 3, None: 3})
+
+    def test_merge(self):
+        shards = [PunktTrainer(), PunktTrainer()]
+        shards[0].train_texts(self.TEXTS[:3], finalize=False)
+        shards[1].train_texts(self.TEXTS[3:], finalize=False)
+        # Shards may be trained by other processes.
+        shard = pickle.loads(pickle.dumps(shards[1]))
+        shards[0].merge(shard)
+        whole = PunktTrainer()
+        whole.train_texts(self.TEXTS)
+        self.assertEqual(shards[0]._type_fdist, whole._type_fdist)
+        self.assertEqual(shards[0]._num_period_toks, whole._num_period_toks)
+        self.assertEqual(shards[0].get_params().abbrev_types,
+                         whole.get_params().abbrev_types)
+        tokenizer = PunktSentenceTokenizer(shards[0].get_params())
+        self.assertEqual(tokenizer.tokenize('Dr. Hill left.  It rained.'),
+                         ['Dr. Hill left.', 'It rained.'])
+
+
+class TestTokenizeMany(TempDirTestCase):
+
+    DATA_PATH = True
+
+    TEXTS = ['Mr. Smith arrived.  He sat down.', '', 'Hello!  Bye now.',
+             'Is it "good"? Yes, it\'s $3.88.'] * 5
+
+    def setUp(self):
+        super(TestTokenizeMany, self).setUp()
+        # Python 3 pickles of the Punkt models are kept in a subdirectory.
+        model_dir = os.path.join(self.root, 'tokenizers', 'punkt',
+                                 'PY3' if PY3 else '')
+        os.makedirs(model_dir)
+        params = PunktParameters()
+        params.abbrev_types.add('mr')
+        with open(os.path.join(model_dir, 'test.pickle'), 'wb') as outfile:
+            pickle.dump(PunktSentenceTokenizer(params), outfile)
+
+    def test_sent_tokenize_many(self):
+        expected = [sent_tokenize(text, 'test') for text in self.TEXTS]
+        self.assertEqual(expected[0], ['Mr. Smith arrived.', 'He sat down.'])
+        for num_workers, chunk_size in ((1, 64), (1, 3), (2, 1), (3, 4)):
+            self.assertEqual(
+                list(sent_tokenize_many(iter(self.TEXTS), 'test',
+                                        num_workers, chunk_size)),
+                expected)
+
+    def test_word_tokenize_many(self):
+        expected = [word_tokenize(text, 'test') for text in self.TEXTS]
+        for num_workers, chunk_size in ((1, 2), (2, 3)):
+            self.assertEqual(
+                list(word_tokenize_many(self.TEXTS, 'test', num_workers,
+                                        chunk_size)),
+                expected)
+        self.assertEqual(list(word_tokenize_many([], 'test', 2)), [])
+
+    def test_missing_model(self):
+        self.assertRaises(LookupError, list,
+                          word_tokenize_many(self.TEXTS, 'no-such-model', 2))
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the compiled indexes of WordNetCorpusReader.
+"""
+from __future__ import absolute_import, unicode_literals
+import os
+import shutil
+
+import nltk.data
+from nltk.corpus.reader.wordnet import WordNetCorpusReader, WordNetError
+from nltk.test.unit.utils import TempDirTestCase
+
+
+class TestCompiledIndex(TempDirTestCase):
+
+    def setUp(self):
+        try:
+            wordnet_dir = nltk.data.find('corpora/wordnet')
+        except LookupError as e:
+            from nose import SkipTest
+            raise SkipTest(str(e))
+        super(TestCompiledIndex, self).setUp()
+        self.wordnet_dir = os.path.join(self.root, 'wordnet')
+        shutil.copytree(wordnet_dir.path, self.wordnet_dir)
+        self.index_file = os.path.join(self.root, 'wordnet.idx')
+        WordNetCorpusReader(self.wordnet_dir, None).compile_index(self.index_file)
+
+    def test_compiled_index(self):
+        wn = WordNetCorpusReader(self.wordnet_dir, None,
+                                 index_file=self.index_file)
+        self.assertEqual(wn.synsets('dogs')[0].name(), 'dog.n.01')
+
+    def test_same_size_edit(self):
+        # Touching a source file makes the index out of date, even though
+        # its size is unchanged.
+        path = os.path.join(self.wordnet_dir, 'data.noun')
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        self.assertRaises(WordNetError, WordNetCorpusReader, self.wordnet_dir,
+                          None, index_file=self.index_file)
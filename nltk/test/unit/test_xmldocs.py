@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for StreamingXMLCorpusView, which should read the same elements
+as XMLCorpusView, and for XMLCorpusReader.
+"""
+from __future__ import absolute_import, unicode_literals
+import os
+
+from nltk.corpus.reader.xmldocs import (XMLCorpusReader, XMLCorpusView,
+                                        StreamingXMLCorpusView)
+from nltk.test.unit.utils import TempDirTestCase, write_files
+
+DOC = '''<?xml version="1.0" encoding="%s"?>
+<doc><head><title>Café</title></head>
+<body><p><s n="1"><w pos="DT">the</w><w pos="NN">cat</w></s>
+<!-- a comment --><s n="2"><w pos="NN">naïve</w><pb/><w pos="NN">x &amp; y</w></s></p>
+<p><s n="3"><w pos="NN">über</w></s></p></body></doc>
+'''
+
+
+def _word(elt):
+    return (elt.text, elt.get('pos'))
+
+
+def _tree(elt):
+    return (elt.tag, sorted(elt.attrib.items()), elt.text, elt.tail,
+            [_tree(child) for child in elt])
+
+
+def _write(root, encoding):
+    write_files(root, {encoding + '.xml': DOC % encoding}, encoding)
+    return os.path.join(root, encoding + '.xml')
+
+
+class TestXMLCorpusReader(TempDirTestCase):
+
+    def test_words(self):
+        _write(self.root, 'utf-8')
+        reader = XMLCorpusReader(self.root, ['utf-8.xml'])
+        self.assertEqual(reader.words(),
+                         ['Café', 'the', 'cat', 'naïve', 'x', '&', 'y', 'über'])
+        # Only one file can be read at a time.
+        _write(self.root, 'iso-8859-1')
+        self.assertRaises(TypeError, XMLCorpusReader(self.root, '.*').words)
+
+
+class TestStreamingXMLCorpusView(TempDirTestCase):
+
+    def test_same_elements(self):
+        filename = _write(self.root, 'utf-8')
+        for tagspec in ('.*/w', '.*/s', '.*/title', 'doc/body/p'):
+            expected = [_tree(elt) for elt in
+                        XMLCorpusView(filename, tagspec)]
+            view = StreamingXMLCorpusView(filename, tagspec)
+            view._BLOCK_SIZE = 16
+            self.assertEqual([_tree(elt) for elt in view], expected)
+
+    def test_random_access(self):
+        filename = _write(self.root, 'iso-8859-1')
+        expected = [_word(elt) for elt in XMLCorpusView(filename, '.*/w')]
+        view = StreamingXMLCorpusView(filename, '.*/w')
+        view._BLOCK_SIZE = 8
+        self.assertEqual(_word(view[3]), expected[3])
+        self.assertEqual(_word(view[1]), expected[1])
+        self.assertEqual([_word(elt) for elt in view], expected)
+        self.assertEqual(_word(view[-1]), expected[-1])
+        self.assertEqual(len(view), 5)
+
+    def test_elt_handler(self):
+        filename = _write(self.root, 'utf-8')
+        view = StreamingXMLCorpusView(
+            filename, '.*/s', lambda elt, context: (elt.get('n'), context))
+        self.assertEqual(list(view), [('1', 'doc/body/p/s'),
+                                      ('2', 'doc/body/p/s'),
+                                      ('3', 'doc/body/p/s')])
@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
+import io
+import os
+import shutil
+import tempfile
 from unittest import TestCase
 from functools import wraps
 from nose.plugins.skip import SkipTest
+import nltk.data
 from nltk.util import py26
 
 def skip(reason):
@@ -39,4 +44,51 @@ def skipIf(condition, reason):
     """
     if condition:
         return skip(reason)
-    return lambda obj: obj
\ No newline at end of file
+    return lambda obj: obj
+
+
+def write_files(root, files, encoding='utf-8'):
+    """
+    Write each text in the dictionary ``files`` to the file below the
+    directory ``root`` named by its key, whose path components are
+    separated by forward slashes.  Missing directories are created.
+    """
+    for path, text in files.items():
+        filename = os.path.join(root, *path.split('/'))
+        if not os.path.isdir(os.path.dirname(filename)):
+            os.makedirs(os.path.dirname(filename))
+        with io.open(filename, 'w', encoding=encoding) as outfile:
+            outfile.write(text)
+
+
+class TempDirTestCase(TestCase):
+    """
+    A test case that runs each test with a new temporary directory,
+    ``self.root``, holding the files in ``FILES`` (see ``write_files()``).
+    If ``DATA_PATH`` is true, ``self.root`` is put at the front of
+    ``nltk.data.path`` while the test runs.  Any other directories made
+    with ``mkdtemp()`` are also removed after the test.
+    """
+    FILES = {}
+    DATA_PATH = False
+
+    def setUp(self):
+        self._temp_dirs = []
+        self.root = self.mkdtemp()
+        write_files(self.root, self.FILES)
+        if self.DATA_PATH:
+            nltk.data.path.insert(0, self.root)
+
+    def tearDown(self):
+        if self.DATA_PATH:
+            nltk.data.path.remove(self.root)
+        for path in self._temp_dirs:
+            shutil.rmtree(path)
+
+    def mkdtemp(self):
+        """
+        Return a new temporary directory, which is removed after the test.
+        """
+        path = tempfile.mkdtemp()
+        self._temp_dirs.append(path)
+        return path
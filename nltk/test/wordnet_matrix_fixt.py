@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import numpy
+    except ImportError:
+        raise SkipTest("wordnet_matrix.doctest requires numpy")
+
+def teardown_module(module=None):
+    from nltk.corpus import wordnet
+    wordnet._unload()
@@ -53,12 +53,34 @@ of tokenizers.  (These methods are implemented as generators.)
     [(0, 4), (5, 12), (13, 17), (18, 23), (24, 26), (27, 30), (31, 36), (38, 44),
     (45, 48), (49, 51), (52, 55), (56, 58), (59, 64), (66, 73)]
 
+The same offsets can be given as a flat array of integers, which is
+much smaller than a list of tokens or of spans.  The tokens can be
+sliced from the text as they are needed:
+
+    >>> offsets = WhitespaceTokenizer().span_tokenize_array(s)
+    >>> offsets[:6]
+    array('i', [0, 4, 5, 12, 13, 17])
+    >>> s[offsets[4]:offsets[5]]
+    'cost'
+
 There are numerous ways to tokenize text.  If you need more control over
 tokenization, see the other methods provided in this package.
 
+To tokenize many documents, ``sent_tokenize_many()`` and
+``word_tokenize_many()`` load the tokenizer once, and can share the
+work between several processes.  Results are generated in the order
+of the input documents:
+
+    >>> from nltk.tokenize import word_tokenize_many
+    >>> docs = ['Good muffins cost $3.88.', 'Thanks.']
+    >>> list(word_tokenize_many(docs, num_workers=2))
+    [['Good', 'muffins', 'cost', '$', '3.88', '.'], ['Thanks', '.']]
+
 For further information, please see Chapter 3 of the NLTK book.
 """
 
+from itertools              import islice
+
 from nltk.data              import load
 from nltk.tokenize.simple   import (SpaceTokenizer, TabTokenizer, LineTokenizer,
                                     line_tokenize)
@@ -73,7 +95,8 @@ from nltk.tokenize.stanford import StanfordTokenizer
 from nltk.tokenize.texttiling import TextTilingTokenizer
 from nltk.tokenize.casual   import (TweetTokenizer, casual_tokenize)
 from nltk.tokenize.mwe      import MWETokenizer
-from nltk.tokenize.util     import string_span_tokenize, regexp_span_tokenize
+from nltk.tokenize.util     import (string_span_tokenize, regexp_span_tokenize,
+                                    spans_to_array)
 
 # Standard sentence tokenizer.
 def sent_tokenize(text, language='english'):
@@ -105,3 +128,77 @@ def word_tokenize(text, language='english'):
     return [token for sent in sent_tokenize(text, language)
             for token in _treebank_word_tokenize(sent)]
 
+
+def sent_tokenize_many(texts, language='english', num_workers=1,
+                       chunk_size=64):
+    """
+    Generate a sentence-tokenized copy of each text in *texts*, in
+    order, using the same tokenizer as :func:`sent_tokenize`.
+
+    :param texts: an iterable of texts to split into sentences
+    :param language: the model name in the Punkt corpus
+    :param num_workers: the number of processes that tokenize the
+        texts.  Each process loads the tokenizer once.
+    :param chunk_size: the number of texts that are sent to a process
+        at a time
+    """
+    return _tokenize_many(_sent_tokenize_texts, texts, language,
+                          num_workers, chunk_size)
+
+def word_tokenize_many(texts, language='english', num_workers=1,
+                       chunk_size=64):
+    """
+    Generate a tokenized copy of each text in *texts*, in order, using
+    the same tokenizers as :func:`word_tokenize`.
+
+    :param texts: an iterable of texts to tokenize
+    :param language: the model name in the Punkt corpus
+    :param num_workers: the number of processes that tokenize the
+        texts.  Each process loads the tokenizer once.
+    :param chunk_size: the number of texts that are sent to a process
+        at a time
+    """
+    return _tokenize_many(_word_tokenize_texts, texts, language,
+                          num_workers, chunk_size)
+
+def _sent_tokenize_texts(sent_tokenizer, texts):
+    return [sent_tokenizer.tokenize(text) for text in texts]
+
+def _word_tokenize_texts(sent_tokenizer, texts):
+    return [[token for sent in sent_tokenizer.tokenize(text)
+             for token in _treebank_word_tokenize(sent)]
+            for text in texts]
+
+def _tokenize_many(tokenize_texts, texts, language, num_workers, chunk_size):
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+    texts = iter(texts)
+    chunks = iter(lambda: list(islice(texts, chunk_size)), [])
+    # The model is loaded here, so that a missing model is reported
+    # rather than failing in each worker process.
+    sent_tokenizer = load('tokenizers/punkt/{0}.pickle'.format(language))
+    if num_workers > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(num_workers, _init_worker,
+                                    (tokenize_texts, sent_tokenizer))
+        try:
+            for results in pool.imap(_tokenize_chunk, chunks):
+                for result in results:
+                    yield result
+        finally:
+            pool.terminate()
+            pool.join()
+    else:
+        for chunk in chunks:
+            for result in tokenize_texts(sent_tokenizer, chunk):
+                yield result
+
+# The state of a worker process of _tokenize_many().
+_worker = {}
+
+def _init_worker(tokenize_texts, sent_tokenizer):
+    _worker['tokenize_texts'] = tokenize_texts
+    _worker['sent_tokenizer'] = sent_tokenizer
+
+def _tokenize_chunk(texts):
+    return _worker['tokenize_texts'](_worker['sent_tokenizer'], texts)
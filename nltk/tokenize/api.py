@@ -14,7 +14,7 @@ from abc import ABCMeta, abstractmethod
 from six import add_metaclass
 
 from nltk.internals import overridden
-from nltk.tokenize.util import string_span_tokenize
+from nltk.tokenize.util import string_span_tokenize, spans_to_array
 
 @add_metaclass(ABCMeta)
 class TokenizerI(object):
@@ -41,6 +41,18 @@ class TokenizerI(object):
         """
         raise NotImplementedError()
 
+    def span_tokenize_array(self, s):
+        """
+        Identify the tokens using a flat array of integer offsets,
+        ``[start_0, end_0, start_1, end_1, ...]``, where
+        ``s[start_i:end_i]`` is the corresponding token.  See
+        ``nltk.tokenize.util.spans_to_array()``.
+
+        :rtype: array
+        """
+        typecode = 'i' if len(s) < 2**31 else 'l'
+        return spans_to_array(self.span_tokenize(s), typecode)
+
     def tokenize_sents(self, strings):
         """
         Apply ``self.tokenize()`` to each element of ``strings``.  I.e.:
@@ -30,6 +30,11 @@ domains and tasks. The basic logic is this:
    False, then the tokenizer will downcase everything except for
    emoticons.
 
+5. To tokenize many tweets, the tokenize_many() method of the class
+   Tokenizer splits each one at whitespace that no token can span,
+   and remembers the tokens of each piece, so that the pieces which
+   recur from tweet to tweet are only tokenized once.
+
 """
 
 
@@ -38,7 +43,10 @@ domains and tasks. The basic logic is this:
 
 from __future__ import unicode_literals
 import re
+from itertools import islice
+
 from nltk.compat import htmlentitydefs, int2byte, unichr
+from nltk.tokenize.api import TokenizerI
 
 
 ######################################################################
@@ -183,6 +191,20 @@ EMOTICON_RE = re.compile(EMOTICONS, re.VERBOSE | re.I | re.UNICODE)
 # These are for regularizing HTML entities to Unicode:
 ENT_RE = re.compile(r'&(#?(x?))([^&;\s]+);')
 
+# These are for the normalization functions:
+HANDLES_RE = re.compile(r"(^|(?<=[^\w.-]))@[A-Za-z_]+\w+")
+LENGTHENING_RE = re.compile(r"(.)\1{2,}")
+
+# Only phone numbers and ellipsis dots can contain whitespace, and then
+# only between digits, dots, dashes or parentheses.  The text can be
+# split at any other run of whitespace without changing its tokens:
+SPANNED_SPACE_RE = re.compile(r"[\d.()\-]\s+[\d.()\-]", re.UNICODE)
+SEGMENT_SPACE_RE = re.compile(r"""
+    (?<![\s\d.()\-])\s+(?!\s)     # whitespace after another character
+    |
+    (?<!\s)\s+(?![\s\d.()\-])     # whitespace before another character
+    """, re.VERBOSE | re.UNICODE)
+
 
 ######################################################################
 # Functions for converting html entities
@@ -252,12 +274,15 @@ def _replace_html_entities(text, keep=(), remove_illegal=True, encoding='utf-8')
 
         return "" if remove_illegal else match.group(0)
 
-    return ENT_RE.sub(_convert_entity, _str_to_unicode(text, encoding))
+    text = _str_to_unicode(text, encoding)
+    if '&' not in text:
+        return text
+    return ENT_RE.sub(_convert_entity, text)
 
 
 ######################################################################
 
-class TweetTokenizer:
+class TweetTokenizer(TokenizerI):
     r"""
     Tokenizer for tweets.
 
@@ -273,8 +298,18 @@ class TweetTokenizer:
         >>> s1 = '@remy: This is waaaaayyyy too much for you!!!!!!'
         >>> tknzr.tokenize(s1)
         [':', 'This', 'is', 'waaayyy', 'too', 'much', 'for', 'you', '!', '!', '!']
+
+    Many tweets can be tokenized at once with `tokenize_many`, which
+    gives the same tokens as `tokenize`:
+
+        >>> tweets = ['Gooo BAILEY! :)', '@remy: waaaaayyyy too much!!!']
+        >>> list(tknzr.tokenize_many(tweets))
+        [['Gooo', 'BAILEY', '!', ':)'], [':', 'waaayyy', 'too', 'much', '!', '!', '!']]
     """
 
+    # The number of segments whose tokens are kept by tokenize_many():
+    SEGMENT_CACHE_SIZE = 100000
+
     def __init__(self, preserve_case=True, reduce_len=False, strip_handles=False):
         self.preserve_case = preserve_case
         self.reduce_len = reduce_len
@@ -287,6 +322,81 @@ class TweetTokenizer:
         :return: a tokenized list of strings; concatenating this list returns\
         the original string if `preserve_case=False`
         """
+        # Tokenize:
+        words = WORD_RE.findall(self._normalize(text))
+        # Possibly alter the case, but avoid changing emoticons like :D into :d:
+        if not self.preserve_case:
+            words = list(map((lambda x : x if EMOTICON_RE.search(x) else
+                              x.lower()), words))
+        return words
+
+    def span_tokenize(self, text):
+        """
+        Identify the tokens using integer offsets ``(start_i, end_i)``
+        into *text*.  Where the text of a token was changed by the
+        tokenizer (HTML entities, handles, lengthening or case), its
+        span is that of the text it was made from:
+
+            >>> tknzr = TweetTokenizer(reduce_len=True)
+            >>> s = 'waaaaayyyy too much &lt;3'
+            >>> tknzr.tokenize(s)
+            ['waaayyy', 'too', 'much', '<3']
+            >>> [s[start:end] for start, end in tknzr.span_tokenize(s)]
+            ['waaaaayyyy', 'too', 'much', '&lt;3']
+
+        :param text: str
+        :rtype: iter(tuple(int, int))
+        """
+        text = _str_to_unicode(text)
+        substitutions = [(ENT_RE, lambda m: _replace_html_entities(m.group()))]
+        if self.strip_handles:
+            substitutions.append((HANDLES_RE, lambda m: ''))
+        if self.reduce_len:
+            substitutions.append((LENGTHENING_RE, lambda m: m.group(1) * 3))
+        offsets = None
+        for pattern, replace in substitutions:
+            text, offsets = _substitute_offsets(pattern, replace, text, offsets)
+        for m in WORD_RE.finditer(text):
+            start, end = m.span()
+            if offsets is None:
+                yield start, end
+            else:
+                yield offsets[0][start], offsets[1][end-1]
+
+    def tokenize_many(self, texts, num_workers=1, chunk_size=64):
+        """
+        Generate the tokens of each text in *texts*, in order.  The
+        tokens are the same as those given by `tokenize`, but the
+        pieces of text which recur from one text to the next are only
+        tokenized once.
+
+        :param texts: an iterable of texts to tokenize
+        :param num_workers: the number of processes that tokenize the
+            texts
+        :param chunk_size: the number of texts that are sent to a
+            process at a time
+        :rtype: iter(list(str))
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        if num_workers > 1:
+            import multiprocessing
+            texts = iter(texts)
+            chunks = iter(lambda: list(islice(texts, chunk_size)), [])
+            pool = multiprocessing.Pool(num_workers, _init_worker, (self,))
+            try:
+                for results in pool.imap(_tokenize_chunk, chunks):
+                    for words in results:
+                        yield words
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            segments = {}
+            for text in texts:
+                yield self._tokenize_segments(text, segments)
+
+    def _normalize(self, text):
         # Fix HTML character entities:
         text = _replace_html_entities(text)
         # Remove username handles
@@ -295,32 +405,88 @@ class TweetTokenizer:
         # Normalize word lengthening
         if self.reduce_len:
             text = reduce_lengthening(text)
-        # Tokenize:
-        words = WORD_RE.findall(text)
-        # Possibly alter the case, but avoid changing emoticons like :D into :d:
-        if not self.preserve_case:
-            words = list(map((lambda x : x if EMOTICON_RE.search(x) else
-                              x.lower()), words))
+        return text
+
+    def _tokenize_segments(self, text, segments):
+        """
+        Tokenize *text* one segment at a time, where *segments* maps
+        each segment that has been seen to its tokens.
+        """
+        text = self._normalize(text)
+        if SPANNED_SPACE_RE.search(text):
+            pieces = SEGMENT_SPACE_RE.split(text)
+        else:
+            pieces = text.split()
+        if len(segments) > self.SEGMENT_CACHE_SIZE:
+            segments.clear()
+        words = []
+        for piece in pieces:
+            try:
+                words.extend(segments[piece])
+            except KeyError:
+                segment_words = WORD_RE.findall(piece)
+                if not self.preserve_case:
+                    segment_words = [word if EMOTICON_RE.search(word) else
+                                     word.lower() for word in segment_words]
+                segments[piece] = segment_words
+                words.extend(segment_words)
         return words
 
 ######################################################################
 # Normalization Functions
 ######################################################################
 
+def _substitute_offsets(pattern, replace, text, offsets=None):
+    """
+    Return ``pattern.sub(replace, text)``, along with the offsets in the
+    original text of the start and the end of each of its characters.
+    The characters of a replacement are given the offsets of the
+    characters they replace, in order, and the last one is given the
+    rest of the replaced text.
+
+    :param offsets: the offsets of the characters of *text* in the
+        original text, as a pair of lists, or None if *text* is the
+        original text
+    """
+    matches = list(pattern.finditer(text))
+    if not matches:
+        return text, offsets
+    if offsets is None:
+        offsets = (list(range(len(text))), list(range(1, len(text) + 1)))
+    starts, ends = offsets
+    pieces, new_starts, new_ends = [], [], []
+    pos = 0
+    for m in matches:
+        replacement = replace(m)
+        pieces += [text[pos:m.start()], replacement]
+        new_starts += starts[pos:m.start()]
+        new_ends += ends[pos:m.start()]
+        for i in range(m.start(), m.start() + len(replacement)):
+            i = min(i, m.end() - 1)
+            new_starts.append(starts[i])
+            new_ends.append(ends[i])
+        if replacement:
+            new_ends[-1] = ends[m.end()-1]
+        pos = m.end()
+    pieces.append(text[pos:])
+    new_starts += starts[pos:]
+    new_ends += ends[pos:]
+    return ''.join(pieces), (new_starts, new_ends)
+
 def reduce_lengthening(text):
     """
     Replace repeated character sequences of length 3 or greater with sequences
     of length 3.
     """
-    pattern = re.compile(r"(.)\1{2,}")
-    return pattern.sub(r"\1\1\1", text)
+    return LENGTHENING_RE.sub(r"\1\1\1", text)
 
 def remove_handles(text):
     """
     Remove Twitter username handles from text.
     """
-    pattern = re.compile(r"(^|(?<=[^\w.-]))@[A-Za-z_]+\w+")
-    return pattern.sub('', text)
+    if '@' not in text:
+        return text
+    return HANDLES_RE.sub('', text)
 
 ######################################################################
 # Tokenization Function
@@ -333,5 +499,16 @@ def casual_tokenize(text, preserve_case=True, reduce_len=False, strip_handles=Fa
     return TweetTokenizer(preserve_case=preserve_case, reduce_len=reduce_len,
                           strip_handles=strip_handles).tokenize(text)
 
+# The state of a worker process of TweetTokenizer.tokenize_many().
+_worker = {}
+
+def _init_worker(tokenizer):
+    _worker['tokenizer'] = tokenizer
+    _worker['segments'] = {}
+
+def _tokenize_chunk(texts):
+    tokenizer, segments = _worker['tokenizer'], _worker['segments']
+    return [tokenizer._tokenize_segments(text, segments) for text in texts]
+
 ###############################################################################
 
@@ -27,7 +27,27 @@ of MWEs:
     >>> tokenizer.tokenize('In a little or a little bit or a lot in spite of'.split())
     ['In', 'a_little', 'or', 'a_little_bit', 'or', 'a_lot', 'in_spite_of']
 
+The longest MWE starting at each position is merged, and the text is
+read from left to right:
+
+    >>> tokenizer = MWETokenizer([('a', 'b'), ('a', 'b', 'c', 'd'), ('c', 'x')])
+    >>> tokenizer.tokenize('a b c x a b c d'.split())
+    ['a_b', 'c_x', 'a_b_c_d']
+
+The MWEs are found with an ``MWEAutomaton``, an Aho-Corasick automaton
+compiled from the lexicon, which finds every MWE in a single pass over
+the text.  A tokenizer can be pickled, which stores the compiled
+automaton, so that a tokenizer for a large lexicon only needs to be
+compiled once:
+
+    >>> import pickle
+    >>> tokenizer = pickle.loads(pickle.dumps(tokenizer))
+    >>> tokenizer.tokenize('a b c d'.split())
+    ['a_b_c_d']
 """
+from array import array
+from collections import deque
+
 from nltk.util import Trie
 
 from nltk.tokenize.api import TokenizerI
@@ -52,9 +72,27 @@ class MWETokenizer(TokenizerI):
         """
         if not mwes:
             mwes = []
-        self._mwes = Trie(mwes)
+        # The lexicon is compiled into an automaton straight away; the
+        # trie is only built if more MWEs are added.
+        self._automaton = MWEAutomaton(mwes)
+        self._mwes = None
         self._separator = separator
 
+    def __getstate__(self):
+        # Store the automaton, which is much faster to unpickle than the
+        # trie.
+        return {'_separator': self._separator,
+                '_automaton': self._compiled_automaton()}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._mwes = None
+
+    def _compiled_automaton(self):
+        if self._automaton is None:
+            self._automaton = MWEAutomaton(_trie_mwes(self._mwes))
+        return self._automaton
+
     def add_mwe(self, mwe):
         """Add a multi-word expression to the lexicon (stored as a word trie)
 
@@ -74,7 +112,10 @@ class MWETokenizer(TokenizerI):
         {'a': {'x': {True: None}, 'b': {True: None, 'c': {True: None}}}}
 
         """
+        if self._mwes is None:
+            self._mwes = Trie(self._automaton.mwes())
         self._mwes.insert(mwe)
+        self._automaton = None
 
     def tokenize(self, text):
         """
@@ -91,29 +132,256 @@ class MWETokenizer(TokenizerI):
         ['An', "hors+d'oeuvre", 'tonight,', 'sir?']
         
         """
-        i = 0
-        n = len(text)
         result = []
+        i = 0
+        for start, end in self._compiled_automaton().leftmost_longest(text):
+            result.extend(text[i:start])
+            result.append(self._separator.join(text[start:end]))
+            i = end
+        result.extend(text[i:])
+        return result
 
-        while i < n:
-            if text[i] in self._mwes:
-                # possible MWE match
-                j = i
-                trie = self._mwes
-                while j < n and text[j] in trie:
-                    trie = trie[text[j]]
-                    j = j + 1
-                else:
-                    if Trie.LEAF in trie:
-                        # success!
-                        result.append(self._separator.join(text[i:j]))
-                        i = j
-                    else:
-                        # no match, so backtrack
-                        result.append(text[i])
-                        i += 1
-            else:
-                result.append(text[i])
-                i += 1
+    def span_tokenize(self, text):
+        """
+        Identify the tokens using offsets ``(start, end)`` into the list
+        of tokens *text*, where ``text[start:end]`` are the words which
+        make up the corresponding token.
 
-        return result
+        >>> tokenizer = MWETokenizer([('hors', "d'oeuvre")], separator='+')
+        >>> list(tokenizer.span_tokenize("An hors d'oeuvre tonight, sir?".split()))
+        [(0, 1), (1, 3), (3, 4), (4, 5)]
+
+        :param text: A list containing tokenized text
+        :type text: list(str)
+        :rtype: iter(tuple(int, int))
+        """
+        i = 0
+        for start, end in self._compiled_automaton().leftmost_longest(text):
+            for j in range(i, start):
+                yield j, j + 1
+            yield start, end
+            i = end
+        for j in range(i, len(text)):
+            yield j, j + 1
+
+
+def _trie_mwes(trie, prefix=()):
+    """Generate the MWEs stored in a ``util.Trie``."""
+    for key, child in trie.items():
+        if key is Trie.LEAF:
+            if prefix:
+                yield prefix
+        else:
+            for mwe in _trie_mwes(child, prefix + (key,)):
+                yield mwe
+
+
+class MWEAutomaton(object):
+    """
+    An Aho-Corasick automaton which finds all of the occurrences of a
+    set of multi-word expressions in a sequence of tokens, in a single
+    pass over the tokens.
+
+    States are numbered from 0, the start state.  Each state stands for
+    the tokens on the path to it from the start state; these are a
+    prefix of one or more MWEs.  The automaton is stored in flat arrays
+    indexed by state, and can be pickled.
+
+        >>> automaton = MWEAutomaton([('a', 'b'), ('a', 'b', 'c', 'd'),
+        ...                           ('b', 'c')])
+        >>> sorted(automaton.matches('x a b c d'.split()))
+        [(1, 3), (1, 5), (2, 4)]
+        >>> automaton.longest_matches('x a b c d'.split())
+        {1: 5, 2: 4}
+        >>> automaton.leftmost_longest('x a b c d'.split())
+        [(1, 5)]
+    """
+
+    def __init__(self, mwes=()):
+        """
+        Build an automaton for the given MWEs.
+
+        :type mwes: iter(tuple(str))
+        :param mwes: the multi-word expressions, each a sequence of tokens
+        """
+        # The transitions out of each state, mapping a token to a state.
+        gotos = [{}]
+        # The number of tokens on the path to each state.
+        depth = [0]
+        # Whether each state is the end of an MWE.
+        final = [False]
+        for mwe in mwes:
+            state = 0
+            for tok in mwe:
+                goto = gotos[state]
+                if tok not in goto:
+                    goto[tok] = len(gotos)
+                    gotos.append({})
+                    depth.append(depth[state] + 1)
+                    final.append(False)
+                state = goto[tok]
+            if state:
+                final[state] = True
+
+        # The failure link of each state points to the state for the
+        # longest proper suffix of its tokens that is also a state; the
+        # output link points to the state for the longest proper suffix
+        # that is an MWE (or to 0 if there is none).  Both are found by a
+        # breadth-first traversal, so that the links of shorter paths are
+        # known first.
+        fail = [0] * len(gotos)
+        output = [0] * len(gotos)
+        queue = deque(gotos[0].values())
+        while queue:
+            state = queue.popleft()
+            for tok, child in gotos[state].items():
+                link = fail[state]
+                while link and tok not in gotos[link]:
+                    link = fail[link]
+                link = gotos[link].get(tok, 0)
+                fail[child] = link
+                output[child] = link if final[link] else output[link]
+                queue.append(child)
+
+        # Renumber the states so that those which pass the end of a shorter
+        # MWE come after the others, and those which end an MWE come last;
+        # leftmost_longest() can then tell them apart by their numbers.
+        # The start state keeps the number 0.
+        states = range(len(gotos))
+        passing = [state for state in states
+                   if output[state] and not final[state]]
+        order = ([state for state in states
+                  if not (output[state] or final[state])] +
+                 passing + [state for state in states if final[state]])
+        self._first_final = len(order) - sum(final)
+        self._first_passing = self._first_final - len(passing)
+        number = [0] * len(order)
+        for new_state, state in enumerate(order):
+            number[state] = new_state
+        for goto in gotos:
+            for tok, child in goto.items():
+                goto[tok] = number[child]
+        self._goto = [gotos[state] for state in order]
+
+        self._depth = array('i', [depth[state] for state in order])
+        self._final = array('b', [final[state] for state in order])
+        self._fail = array('i', [number[fail[state]] for state in order])
+        self._output = array('i', [number[output[state]] for state in order])
+        # The state for the longest MWE that is a suffix of each state's
+        # tokens, or 0 if there is none.
+        self._match = array('i', [number[state] if final[state]
+                                  else number[output[state]]
+                                  for state in order])
+
+    def __len__(self):
+        """The number of MWEs recognised by this automaton."""
+        return sum(self._final)
+
+    def mwes(self):
+        """
+        Generate the MWEs recognised by this automaton.
+
+        :rtype: iter(tuple(str))
+        """
+        stack = [(0, ())]
+        while stack:
+            state, prefix = stack.pop()
+            if self._final[state]:
+                yield prefix
+            for tok, child in self._goto[state].items():
+                stack.append((child, prefix + (tok,)))
+
+    def matches(self, tokens):
+        """
+        Generate a pair ``(start, end)`` for each occurrence of an MWE in
+        *tokens*, where ``tokens[start:end]`` is the MWE.  The pairs are
+        ordered by their end offsets.
+
+        :type tokens: iter(str)
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        depth, first_match = self._depth, self._match
+        state = 0
+        for end, tok in enumerate(tokens, 1):
+            # Follow failure links until a state has a transition for tok.
+            next_state = goto[state].get(tok)
+            while next_state is None and state:
+                state = fail[state]
+                next_state = goto[state].get(tok)
+            state = next_state or 0
+            match = first_match[state]
+            while match:
+                yield end - depth[match], end
+                match = output[match]
+
+    def longest_matches(self, tokens):
+        """
+        Return a dictionary mapping each start offset of an MWE in
+        *tokens* to the end offset of the longest MWE starting there.
+
+        :type tokens: iter(str)
+        :rtype: dict(int, int)
+        """
+        # Matches are found in order of their end offsets, so a later
+        # match with the same start offset is longer.
+        return dict(self.matches(tokens))
+
+    def leftmost_longest(self, tokens):
+        """
+        Return the list of pairs ``(start, end)`` of the MWEs that are
+        merged when *tokens* is read from left to right, taking the
+        longest MWE that starts at each position and skipping the tokens
+        that it covers.
+
+        Only the matches that are merged are looked for: each position
+        is matched by following the transitions from the start state.
+        When such a walk fails without having passed the end of any
+        MWE, the failure link of the state it reached gives the next
+        position worth trying, so that long prefixes which are never
+        completed are not read again from each of their tokens.
+
+        :type tokens: list(str)
+        :rtype: list(tuple(int, int))
+        """
+        goto, fail, depth = self._goto, self._fail, self._depth
+        first_passing, first_final = self._first_passing, self._first_final
+        n = len(tokens)
+        spans = []
+        # tokens[pos:end] are the tokens on the path to state; best is the
+        # end of the longest MWE starting at pos that has been found, and
+        # seen is whether an MWE starting after pos ends before end.
+        pos = end = best = state = 0
+        seen = False
+        while pos < n:
+            if end < n:
+                row = goto[state]
+                tok = tokens[end]
+                if tok in row:
+                    state = row[tok]
+                    end += 1
+                    if state >= first_passing:
+                        if state >= first_final:
+                            best = end
+                        else:
+                            seen = True
+                    continue
+            # The walk from pos can go no further.
+            if best:
+                spans.append((pos, best))
+                pos = end = best
+                best = state = 0
+                seen = False
+            elif not state:
+                pos = end = pos + 1
+            elif seen:
+                # Start again from the next position, so as not to miss
+                # the MWE that was passed.
+                pos = end = pos + 1
+                state = 0
+                seen = False
+            else:
+                # No MWE starts before the suffix of tokens[pos:end] that
+                # is the path to the failure state.
+                state = fail[state]
+                pos = end - depth[state]
+        return spans
@@ -260,6 +260,7 @@ class PunktLanguageVars(object):
         return self._word_tokenizer_re().findall(s)
 
     _period_context_fmt = r"""
+        (?<!\S)                      # at the start of the word
         \S*                          # some word material
         %(SentEndChars)s             # a potential sentence ending
         (?=(?P<after_tok>
@@ -714,6 +715,32 @@ class PunktTrainer(PunktBaseClass):
         if finalize:
             self.finalize_training(verbose)
 
+    def train_texts(self, texts, verbose=False, finalize=True,
+                    max_types=None):
+        """
+        Collects training data from each of the given texts in turn, so
+        that a large training corpus can be read a piece at a time
+        (e.g. a file or a few paragraphs at a time) rather than being held
+        in memory.  The pieces should be split at paragraph boundaries.
+
+        If max_types is given, it bounds the number of entries in each of
+        the trainer's frequency distributions: of types, of collocations
+        and of sentence starters.  Whenever one of them has more than
+        max_types entries, its rarest entries are removed, leaving at most
+        half that many.  This bounds the memory used by training on a very
+        large corpus, at the cost of forgetting about rare types and
+        collocations, and as each pruning makes room for many new entries,
+        the time spent pruning stays proportional to the size of the
+        corpus.  The counts of the removed entries are kept under None, so
+        that the total number of tokens is unchanged.
+        """
+        for text in texts:
+            self.train(text, verbose, finalize=False)
+            if max_types is not None:
+                self._prune(max_types)
+        if finalize:
+            self.finalize_training(verbose)
+
     def train_tokens(self, tokens, verbose=False, finalize=True):
         """
         Collects training data from a given list of tokens.
@@ -737,20 +764,7 @@ class PunktTrainer(PunktBaseClass):
                 self._num_period_toks += 1
 
         # Look for new abbreviations, and for types that no longer are
-        unique_types = self._unique_types(tokens)
-        for abbr, score, is_add in self._reclassify_abbrev_types(unique_types):
-            if score >= self.ABBREV:
-                if is_add:
-                    self._params.abbrev_types.add(abbr)
-                    if verbose:
-                        print(('  Abbreviation: [%6.4f] %s' %
-                               (score, abbr)))
-            else:
-                if not is_add:
-                    self._params.abbrev_types.remove(abbr)
-                    if verbose:
-                        print(('  Removed abbreviation: [%6.4f] %s' %
-                               (score, abbr)))
+        self._update_abbrev_types(self._unique_types(tokens), verbose)
 
         # Make a preliminary pass through the document, marking likely
         # sentence breaks, abbreviations, and ellipsis tokens.
@@ -787,6 +801,57 @@ class PunktTrainer(PunktBaseClass):
     def _unique_types(self, tokens):
         return set(aug_tok.type for aug_tok in tokens)
 
+    def _update_abbrev_types(self, types, verbose):
+        for abbr, score, is_add in self._reclassify_abbrev_types(types):
+            if score >= self.ABBREV:
+                if is_add:
+                    self._params.abbrev_types.add(abbr)
+                    if verbose:
+                        print(('  Abbreviation: [%6.4f] %s' %
+                               (score, abbr)))
+            else:
+                if not is_add:
+                    self._params.abbrev_types.remove(abbr)
+                    if verbose:
+                        print(('  Removed abbreviation: [%6.4f] %s' %
+                               (score, abbr)))
+
+    def merge(self, other, verbose=False):
+        """
+        Adds the training data collected by another trainer to the data
+        collected by this one, and reclassifies abbreviations given the
+        combined type frequencies.  This allows shards of a training
+        corpus to be trained separately (trainers can be pickled, so
+        shards can be trained in parallel by separate processes) before
+        the parameters are found from all of them together:
+
+            >>> texts = ['Dr. Watson met the captain.  They talked.',
+            ...          'The captain saw Dr. Hill.  It rained.']
+            >>> shards = [PunktTrainer(), PunktTrainer()]
+            >>> for trainer, text in zip(shards, texts):
+            ...     trainer.train(text, finalize=False)
+            >>> shards[0].merge(shards[1])
+            >>> sorted(shards[0].get_params().abbrev_types)
+            ['dr']
+
+        Abbreviations, collocations and sentence starters found from
+        merged shards may differ a little from those found by training
+        on the shards in turn, since the abbreviations known while
+        training each shard are used to decide which tokens are
+        sentence breaks.
+        """
+        self._type_fdist.update(other._type_fdist)
+        self._num_period_toks += other._num_period_toks
+        self._collocation_fdist.update(other._collocation_fdist)
+        self._sent_starter_fdist.update(other._sent_starter_fdist)
+        self._sentbreak_count += other._sentbreak_count
+        for typ, flag in other._params.ortho_context.items():
+            self._params.add_ortho_context(typ, flag)
+        self._params.abbrev_types.update(other._params.abbrev_types)
+        self._update_abbrev_types(
+            (typ for typ in self._type_fdist if typ), verbose)
+        self._finalized = False
+
     def finalize_training(self, verbose=False):
         """
         Uses data that has been gathered in training to determine likely
@@ -833,10 +898,52 @@ class PunktTrainer(PunktBaseClass):
         self._sent_starter_fdist = self._freq_threshold(
                 self._sent_starter_fdist, sentstart_thresh)
 
-    def _freq_threshold(self, fdist, threshold):
+    def _prune(self, max_size):
+        """
+        Remove the rarest entries of each frequency distribution that has
+        more than max_size entries, leaving at most half that many.
+        """
+        if len(self._type_fdist) > max_size:
+            threshold = self._size_threshold(self._type_fdist, max_size // 2)
+            old_oc = self._params.ortho_context
+            self._params.clear_ortho_context()
+            for tok in self._type_fdist:
+                if self._type_fdist[tok] >= threshold:
+                    self._params.ortho_context[tok] = old_oc[tok]
+            self._type_fdist = self._freq_threshold(
+                self._type_fdist, threshold, keep_total=True)
+        if len(self._collocation_fdist) > max_size:
+            self._collocation_fdist = self._freq_threshold(
+                self._collocation_fdist,
+                self._size_threshold(self._collocation_fdist, max_size // 2),
+                keep_total=True)
+        if len(self._sent_starter_fdist) > max_size:
+            self._sent_starter_fdist = self._freq_threshold(
+                self._sent_starter_fdist,
+                self._size_threshold(self._sent_starter_fdist, max_size // 2),
+                keep_total=True)
+
+    def _size_threshold(self, fdist, max_size):
+        """
+        Returns the lowest threshold, no lower than 2, for which
+        ``_freq_threshold()`` leaves at most max_size entries in fdist
+        (counting the entry for removed data).
+        """
+        counts = sorted((count for key, count in fdist.items()
+                         if key is not None), reverse=True)
+        # Keep the entries that are more frequent than the most frequent
+        # one that there is no room for.
+        room = max(max_size - 1, 0)
+        if len(counts) > room:
+            return max(2, counts[room] + 1)
+        return 2
+
+    def _freq_threshold(self, fdist, threshold, keep_total=False):
         """
         Returns a FreqDist containing only data with counts below a given
-        threshold, as well as a mapping (None -> count_removed).
+        threshold, as well as a mapping (None -> count_removed).  The
+        count removed is the number of entries removed, or if keep_total
+        is True, the sum of their counts, so that ``N()`` is unchanged.
         """
         # We assume that there is more data below the threshold than above it
         # and so create a new FreqDist rather than working in place.
@@ -845,7 +952,7 @@ class PunktTrainer(PunktBaseClass):
         for tok in fdist:
             count = fdist[tok]
             if count < threshold:
-                num_removed += 1
+                num_removed += count if keep_total else 1
             else:
                 res[tok] += count
         res[None] += num_removed
@@ -921,6 +1028,7 @@ class PunktTrainer(PunktBaseClass):
         # every iteration, in cases requiring efficiency, the number of tokens
         # in the present training document will be much less.)
 
+        N = self._type_fdist.N()
         for typ in types:
             # Check some basic conditions, to rule out words that are
             # clearly not abbrev_types.
@@ -951,8 +1059,7 @@ class PunktTrainer(PunktBaseClass):
             count_without_period = self._type_fdist[typ]
             ll = self._dunning_log_likelihood(
                 count_with_period + count_without_period,
-                self._num_period_toks, count_with_period,
-                self._type_fdist.N())
+                self._num_period_toks, count_with_period, N)
 
             # Apply three scaling factors to 'tweak' the basic log
             # likelihood ratio:
@@ -1106,6 +1213,7 @@ class PunktTrainer(PunktBaseClass):
         """
         Generates likely collocations and their log-likelihood.
         """
+        N = self._type_fdist.N()
         for types in self._collocation_fdist:
             try:
                 typ1, typ2 = types
@@ -1123,10 +1231,10 @@ class PunktTrainer(PunktBaseClass):
                         col_count <= min(typ1_count, typ2_count)):
 
                 ll = self._col_log_likelihood(typ1_count, typ2_count,
-                                              col_count, self._type_fdist.N())
+                                              col_count, N)
                 # Filter out the not-so-collocative
                 if (ll >= self.COLLOCATION and
-                    (self._type_fdist.N()/typ1_count >
+                    (N/typ1_count >
                      typ2_count/col_count)):
                     yield (typ1, typ2), ll
 
@@ -1151,6 +1259,7 @@ class PunktTrainer(PunktBaseClass):
         Uses collocation heuristics for each candidate token to
         determine if it frequently starts sentences.
         """
+        N = self._type_fdist.N()
         for typ in self._sent_starter_fdist:
             if not typ:
                 continue
@@ -1162,11 +1271,10 @@ class PunktTrainer(PunktBaseClass):
                 continue
 
             ll = self._col_log_likelihood(self._sentbreak_count, typ_count,
-                                         typ_at_break_count,
-                                          self._type_fdist.N())
+                                         typ_at_break_count, N)
 
             if (ll >= self.SENT_STARTER and
-                self._type_fdist.N()/self._sentbreak_count >
+                N/self._sentbreak_count >
                 typ_count/typ_at_break_count):
 
                 yield typ, ll
@@ -1275,9 +1383,10 @@ class PunktSentenceTokenizer(PunktBaseClass,TokenizerI):
 
     def _slices_from_text(self, text):
         last_break = 0
+        contains_sentbreak = self._sentbreak_finder()
         for match in self._lang_vars.period_context_re().finditer(text):
             context = match.group() + match.group('after_tok')
-            if self.text_contains_sentbreak(context):
+            if contains_sentbreak(context):
                 yield slice(last_break, match.end())
                 if match.group('next_tok'):
                     # next sentence starts after whitespace
@@ -1317,6 +1426,50 @@ class PunktSentenceTokenizer(PunktBaseClass,TokenizerI):
                 if text[sl1]:
                     yield sl1
 
+    def _sentbreak_finder(self):
+        """
+        Returns a function which gives the same result as
+        ``text_contains_sentbreak``, for use on the many candidate
+        contexts of a single document.
+
+        Annotation decides whether a token is a sentence break from the
+        text of that token and of the token that follows it, so the
+        decision for each distinct pair of adjacent tokens is made once
+        and shared by all of the contexts in which the pair occurs.
+        ``PunktToken`` objects are only built for new pairs, and only
+        new contexts are word tokenized.
+        """
+        word_tokenize = self._lang_vars.word_tokenize
+        context_decisions = {}
+        pair_decisions = {}
+
+        def contains_sentbreak(text):
+            try:
+                return context_decisions[text]
+            except KeyError:
+                pass
+            toks = [tok for line in text.split('\n')
+                    for tok in word_tokenize(line)]
+            context_decisions[text] = result = any_sentbreak(toks)
+            return result
+
+        def any_sentbreak(toks):
+            # As in text_contains_sentbreak, the last token is ignored.
+            for pair in zip(toks, toks[1:]):
+                try:
+                    is_sentbreak = pair_decisions[pair]
+                except KeyError:
+                    aug_tok1, aug_tok2 = self._annotate_first_pass(
+                        self._Token(tok) for tok in pair)
+                    self._second_pass_annotation(aug_tok1, aug_tok2)
+                    is_sentbreak = bool(aug_tok1.sentbreak)
+                    pair_decisions[pair] = is_sentbreak
+                if is_sentbreak:
+                    return True
+            return False
+
+        return contains_sentbreak
+
     def text_contains_sentbreak(self, text):
         """
         Returns True if the given text includes a sentence break.
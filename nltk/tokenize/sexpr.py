@@ -53,6 +53,9 @@ import re
 
 from nltk.tokenize.api import TokenizerI
 
+# The words between s-expressions:
+_WORD_RE = re.compile(r'\S+', re.UNICODE)
+
 class SExprTokenizer(TokenizerI):
     """
     A tokenizer that divides strings into s-expressions.
@@ -111,13 +114,28 @@ class SExprTokenizer(TokenizerI):
         :type text: str or iter(str)
         :rtype: iter(str)
         """
-        result = []
+        return [text[start:end] for start, end in self.span_tokenize(text)]
+
+    def span_tokenize(self, text):
+        """
+        Identify the s-expressions in *text* using integer offsets
+        ``(start, end)``, where ``text[start:end]`` is the corresponding
+        s-expression.
+
+            >>> list(SExprTokenizer().span_tokenize('(a b (c d)) e f (g)'))
+            [(0, 11), (12, 13), (14, 15), (16, 19)]
+
+        :param text: the string to be tokenized
+        :type text: str
+        :rtype: iter(tuple(int, int))
+        """
         pos = 0
         depth = 0
         for m in self._paren_regexp.finditer(text):
             paren = m.group()
             if depth == 0:
-                result += text[pos:m.start()].split()
+                for word in _WORD_RE.finditer(text, pos, m.start()):
+                    yield word.span()
                 pos = m.start()
             if paren == self._open_paren:
                 depth += 1
@@ -127,13 +145,12 @@ class SExprTokenizer(TokenizerI):
                                      % m.start())
                 depth = max(0, depth-1)
                 if depth == 0:
-                    result.append(text[pos:m.end()])
+                    yield pos, m.end()
                     pos = m.end()
         if self._strict and depth > 0:
             raise ValueError('Un-matched open paren at char %d' % pos)
         if pos < len(text):
-            result.append(text[pos:])
-        return result
+            yield pos, len(text)
 
 sexpr_tokenize = SExprTokenizer().tokenize
 
@@ -118,7 +118,7 @@ class LineTokenizer(TokenizerI):
     # discard-eof not implemented
     def span_tokenize(self, s):
         if self._blanklines == 'keep':
-            for span in string_span_tokenize(s, r'\n'):
+            for span in string_span_tokenize(s, '\n'):
                 yield span
         else:
             for span in regexp_span_tokenize(s, r'\n(\s+\n)*'):
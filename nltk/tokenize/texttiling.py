@@ -7,7 +7,6 @@
 # For license information, see LICENSE.TXT
 
 import re
-import math
 
 try:
     import numpy
@@ -63,6 +62,9 @@ class TextTilingTokenizer(TokenizerI):
      0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0]
     """
 
+    # The number of gaps whose block comparison scores are found at once
+    GAP_CHUNK_SIZE = 100
+
     def __init__(self,
                  w=20,
                  k=10,
@@ -85,6 +87,23 @@ class TextTilingTokenizer(TokenizerI):
         """Return a tokenized copy of *text*, where each "token" represents
         a separate topic."""
 
+        spans, scores = self._segment(text)
+        if self.demo_mode:
+            return scores
+        return [text[start:end] for start, end in spans]
+
+    def span_tokenize(self, text):
+        """Identify the topical sections of *text* using integer offsets
+        ``(start, end)``, where ``text[start:end]`` is the corresponding
+        section."""
+
+        spans, scores = self._segment(text)
+        return iter(spans)
+
+    def _segment(self, text):
+        """Return the spans of the sections of *text*, and the gap scores,
+        smoothed scores, depth scores and boundaries they were found from"""
+
         lowercase_text = text.lower()
         paragraph_breaks = self._mark_paragraph_breaks(text)
         text_length = len(lowercase_text)
@@ -131,39 +150,33 @@ class TextTilingTokenizer(TokenizerI):
                                                            segment_boundaries,
                                                            paragraph_breaks)
         # End of Boundary Identification
-        segmented_text = []
+        segment_spans = []
         prevb = 0
 
         for b in normalized_boundaries:
             if b == 0:
                 continue
-            segmented_text.append(text[prevb:b])
+            segment_spans.append((prevb, b))
             prevb = b
 
         if prevb < text_length: # append any text that may be remaining
-            segmented_text.append(text[prevb:])
+            segment_spans.append((prevb, len(text)))
 
-        if not segmented_text:
-            segmented_text = [text]
+        if not segment_spans:
+            segment_spans = [(0, len(text))]
 
-        if self.demo_mode:
-            return gap_scores, smooth_scores, depth_scores, segment_boundaries
-        return segmented_text
+        return segment_spans, (gap_scores, smooth_scores, depth_scores,
+                               segment_boundaries)
 
     def _block_comparison(self, tokseqs, token_table):
         "Implements the block comparison method"
-        def blk_frq(tok, block):
-            ts_occs = filter(lambda o: o[0] in block,
-                             token_table[tok].ts_occurences)
-            freq = sum([tsocc[1] for tsocc in ts_occs])
-            return freq
-
-        gap_scores = []
-        numgaps = len(tokseqs)-1
+        numseqs = len(tokseqs)
+        numgaps = numseqs-1
 
+        # The blocks on either side of each gap, as ranges of token
+        # sequences
+        blocks = []
         for curr_gap in range(numgaps):
-            score_dividend, score_divisor_b1, score_divisor_b2 = 0.0, 0.0, 0.0
-            score = 0.0
             #adjust window size for boundary conditions
             if curr_gap < self.k-1:
                 window_size = curr_gap + 1
@@ -172,22 +185,47 @@ class TextTilingTokenizer(TokenizerI):
             else:
                 window_size = self.k
 
-            b1 = [ts.index
-                  for ts in tokseqs[curr_gap-window_size+1 : curr_gap+1]]
-            b2 = [ts.index
-                  for ts in tokseqs[curr_gap+1 : curr_gap+window_size+1]]
-
-            for t in token_table:
-                score_dividend += blk_frq(t, b1)*blk_frq(t, b2)
-                score_divisor_b1 += blk_frq(t, b1)**2
-                score_divisor_b2 += blk_frq(t, b2)**2
-            try:
-                score = score_dividend/math.sqrt(score_divisor_b1*
-                                                 score_divisor_b2)
-            except ZeroDivisionError:
-                pass # score += 0.0
-
-            gap_scores.append(score)
+            b1 = slice(curr_gap-window_size+1, curr_gap+1).indices(numseqs)
+            b2 = slice(curr_gap+1, curr_gap+window_size+1).indices(numseqs)
+            blocks.append((min(b1[:2]), b1[1], min(b2[:2]), b2[1]))
+        blocks = numpy.array(blocks, dtype=int).reshape(-1, 4)
+
+        # The token table as a sparse matrix of the frequency of each
+        # token in each token sequence, ordered by token sequence
+        occurrences = [(tokseq, tok, freq)
+                       for tok, field in enumerate(token_table.values())
+                       for tokseq, freq in field.ts_occurences]
+        occurrences.sort()
+        occurrences = numpy.array(occurrences, dtype=int).reshape(-1, 3)
+        seq_starts = numpy.searchsorted(occurrences[:, 0],
+                                        numpy.arange(numseqs+1))
+
+        # The gaps are scored a few at a time, so that the frequencies
+        # of the blocks are only held for the tokens near those gaps.
+        gap_scores = []
+        for start in range(0, numgaps, self.GAP_CHUNK_SIZE):
+            chunk = blocks[start:start+self.GAP_CHUNK_SIZE]
+            first, last = chunk.min(), chunk.max()
+            occs = occurrences[seq_starts[first]:seq_starts[last]]
+            toks, tok_columns = numpy.unique(occs[:, 1], return_inverse=True)
+
+            # Cumulative frequencies, from which the frequencies of any
+            # block are found by a single subtraction
+            freqs = numpy.zeros((last-first+1, len(toks)), dtype=int)
+            freqs[occs[:, 0]-first+1, tok_columns] = occs[:, 2]
+            freqs = freqs.cumsum(axis=0)
+            chunk = chunk - first
+            b1 = freqs[chunk[:, 1]] - freqs[chunk[:, 0]]
+            b2 = freqs[chunk[:, 3]] - freqs[chunk[:, 2]]
+
+            score_dividend = (b1*b2).sum(axis=1).astype(float)
+            score_divisor = ((b1**2).sum(axis=1).astype(float) *
+                             (b2**2).sum(axis=1).astype(float))
+            scores = numpy.zeros(len(chunk))
+            nonzero = score_divisor != 0
+            scores[nonzero] = (score_dividend[nonzero] /
+                               numpy.sqrt(score_divisor[nonzero]))
+            gap_scores.extend(scores.tolist())
 
         return gap_scores
 
@@ -296,11 +334,11 @@ class TextTilingTokenizer(TokenizerI):
         hp = list(filter(lambda x:x[0]>cutoff, depth_tuples))
 
         for dt in hp:
-            boundaries[dt[1]] = 1
-            for dt2 in hp: #undo if there is a boundary close already
-                if dt[1] != dt2[1] and abs(dt2[1]-dt[1]) < 4 \
-                       and boundaries[dt2[1]] == 1:
-                    boundaries[dt[1]] = 0
+            #skip if there is a boundary close already
+            near = (boundaries[max(dt[1]-3, 0):dt[1]] +
+                    boundaries[dt[1]+1:dt[1]+4])
+            if 1 not in near:
+                boundaries[dt[1]] = 1
         return boundaries
 
     def _depth_scores(self, scores):
@@ -312,25 +350,22 @@ class TextTilingTokenizer(TokenizerI):
         #that a section shouldn't be smaller than at least 2
         #pseudosentences for small texts and around 5 for larger ones.
 
-        clip = min(max(len(scores)/10, 2), 5)
-        index = clip
-
-        for gapscore in scores[clip:-clip]:
-            lpeak = gapscore
-            for score in scores[index::-1]:
-                if score >= lpeak:
-                    lpeak = score
-                else:
-                    break
-            rpeak = gapscore
-            for score in scores[index:]:
-                if score >= rpeak:
-                    rpeak = score
-                else:
-                    break
-            depth_scores[index] = lpeak + rpeak - 2 * gapscore
-            index += 1
-
+        clip = min(max(len(scores)//10, 2), 5)
+
+        #the left peak of a gap is the top of the run of scores that
+        #rises to its left, and the right peak the top of the run that
+        #rises to its right
+        scores = numpy.asarray(scores, dtype=float)
+        positions = numpy.arange(len(scores))
+        lpeaks = positions.copy()
+        lpeaks[1:][scores[:-1] >= scores[1:]] = 0
+        lpeaks = numpy.maximum.accumulate(lpeaks)
+        rpeaks = positions.copy()
+        rpeaks[:-1][scores[1:] >= scores[:-1]] = len(scores)-1
+        rpeaks = numpy.minimum.accumulate(rpeaks[::-1])[::-1]
+        depths = scores[lpeaks] + scores[rpeaks] - 2 * scores
+
+        depth_scores[clip:-clip] = depths[clip:-clip].tolist()
         return depth_scores
 
     def _normalize_boundaries(self, text, boundaries, paragraph_breaks):
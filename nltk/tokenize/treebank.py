@@ -93,32 +93,90 @@ class TreebankWordTokenizer(TokenizerI):
     CONTRACTIONS4 = [re.compile(r"(?i)\b(whad)(dd)(ya)\b"),
                      re.compile(r"(?i)\b(wha)(t)(cha)\b")]
 
-    def tokenize(self, text):
-        for regexp, substitution in self.STARTING_QUOTES:
-            text = regexp.sub(substitution, text)
-
-        for regexp, substitution in self.PUNCTUATION:
-            text = regexp.sub(substitution, text)
+    # Regexps which match every string that the substitutions of the rule
+    # lists above could change, so that tokenize() can skip a rule list
+    # that would not change a sentence after a single search.  They are
+    # only used with the rule lists defined here.
+    _TRIGGERS = {
+        'STARTING_QUOTES': re.compile(r'["`]'),
+        'PARENS_BRACKETS': re.compile(r'[\]\[\(\)\{\}\<\>]|--'),
+        'ENDING_QUOTES': re.compile(r'["\']'),
+        'CONTRACTIONS2': re.compile(
+            r"(?i)[cdglmw](?:annot|'ye|imme|onna|otta|emme|or'n|anna)"),
+        'CONTRACTIONS3': re.compile(r"'"),
+    }
+
+    def _compiled_stages(self):
+        """
+        Returns the substitutions made by ``tokenize()``, as a list of
+        ``(trigger, rules)`` stages, where *rules* is a list of
+        ``(regexp, substitution)`` pairs and *trigger* is a regexp from
+        ``_TRIGGERS``, or None if the rules must always be tried.
+        """
+        try:
+            return self._stages
+        except AttributeError:
+            self._stages = []
+            for name in ('STARTING_QUOTES', 'PUNCTUATION', 'PARENS_BRACKETS',
+                         'ENDING_QUOTES', 'CONTRACTIONS2', 'CONTRACTIONS3'):
+                rules = getattr(self, name)
+                if rules is getattr(TreebankWordTokenizer, name):
+                    trigger = self._TRIGGERS.get(name)
+                else:
+                    trigger = None
+                if name.startswith('CONTRACTIONS'):
+                    rules = [(regexp, r' \1 \2 ') for regexp in rules]
+                self._stages.append((trigger, rules))
+            # We are not using CONTRACTIONS4 since
+            # they are also commented out in the SED scripts
+            return self._stages
 
-        for regexp, substitution in self.PARENS_BRACKETS:
-            text = regexp.sub(substitution, text)
+    def tokenize(self, text):
+        stages = self._compiled_stages()
+        # starting quotes, punctuation, parens and brackets
+        text = _substitute(stages[:3], text)
 
         #add extra space to make things easier
         text = " " + text + " "
 
-        for regexp, substitution in self.ENDING_QUOTES:
-            text = regexp.sub(substitution, text)
-
-        for regexp in self.CONTRACTIONS2:
-            text = regexp.sub(r' \1 \2 ', text)
-        for regexp in self.CONTRACTIONS3:
-            text = regexp.sub(r' \1 \2 ', text)
-
-        # We are not using CONTRACTIONS4 since
-        # they are also commented out in the SED scripts
-        # for regexp in self.CONTRACTIONS4:
-        #     text = regexp.sub(r' \1 \2 \3 ', text)
+        # ending quotes and contractions
+        text = _substitute(stages[3:], text)
 
         return text.split()
 
-
+    def span_tokenize(self, text):
+        """
+        Identify the tokens returned by ``tokenize()`` using integer
+        offsets ``(start_i, end_i)`` into *text*.  The opening and closing
+        quote tokens which replace a double quote are given the span of
+        the double quote.
+
+            >>> s = '''They said "don't" (twice).'''
+            >>> list(TreebankWordTokenizer().span_tokenize(s))
+            [(0, 4), (5, 9), (10, 11), (11, 13), (13, 16), (16, 17),
+            (18, 19), (19, 24), (24, 25), (25, 26)]
+        """
+        pos = 0
+        for tok in self.tokenize(text):
+            pos = _WHITESPACE.match(text, pos).end()
+            if text.startswith(tok, pos):
+                end = pos + len(tok)
+            elif tok in ('``', "''") and text.startswith('"', pos):
+                end = pos + 1
+            else:
+                raise ValueError('Token %r not found at offset %d' %
+                                 (tok, pos))
+            yield pos, end
+            pos = end
+
+
+_WHITESPACE = re.compile(r'\s*', re.UNICODE)
+
+def _substitute(stages, text):
+    for trigger, rules in stages:
+        # The substitutions of a stage are made one after the other, but
+        # if none of them matches the text, none of them changes it.
+        if trigger is None or trigger.search(text):
+            for regexp, substitution in rules:
+                text = regexp.sub(substitution, text)
+    return text
@@ -5,6 +5,8 @@
 # URL: <http://nltk.sourceforge.net>
 # For license information, see LICENSE.TXT
 
+from array import array
+from itertools import chain
 from re import finditer
 
 def string_span_tokenize(s, sep):
@@ -55,10 +57,10 @@ def regexp_span_tokenize(s, regexp):
     :param s: the string to be tokenized
     :type s: str
     :param regexp: regular expression that matches token separators
-    :type regexp: str
+    :type regexp: str or regexp
     :rtype: iter(tuple(int, int))
     """
-    if len(regexp) == 0:
+    if len(getattr(regexp, 'pattern', regexp)) == 0:
         raise ValueError("regexp must not be empty")
     left = 0
     for m in finditer(regexp, s):
@@ -89,4 +91,26 @@ def spans_to_relative(spans):
         yield left - prev, right - left
         prev = right
 
+def spans_to_array(spans, typecode='i'):
+    r"""
+    Return the offsets in a sequence of spans as a flat array of
+    integers, ``[start_0, end_0, start_1, end_1, ...]``.  The array takes
+    much less memory than the tokens or the tuples of their spans, and
+    each token can still be found by slicing the text.
+
+        >>> from nltk.tokenize import WhitespaceTokenizer
+        >>> from nltk.tokenize.util import spans_to_array
+        >>> s = "Good muffins cost $3.88\nin New York."
+        >>> offsets = spans_to_array(WhitespaceTokenizer().span_tokenize(s))
+        >>> offsets
+        array('i', [0, 4, 5, 12, 13, 17, 18, 23, 24, 26, 27, 30, 31, 36])
+        >>> s[offsets[6]:offsets[7]]
+        '$3.88'
 
+    :param spans: a sequence of (start, end) offsets of the tokens
+    :type spans: iter(tuple(int, int))
+    :param typecode: the type code of the array
+    :type typecode: str
+    :rtype: array
+    """
+    return array(typecode, chain.from_iterable(spans))
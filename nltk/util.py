@@ -13,10 +13,12 @@ import textwrap
 import pydoc
 import bisect
 import os
+import threading
 
 from itertools import islice, chain, combinations
 from pprint import pprint
-from collections import defaultdict, deque
+from collections import defaultdict, deque, namedtuple
+import collections
 from sys import version_info
 
 from nltk.internals import slice_bounds, raise_unorderable_types
@@ -654,6 +656,120 @@ class OrderedDict(dict):
         # returns iterator under python 3
         return map(self.get, self._keys)
 
+######################################################################
+# Bounded LRU Cache
+######################################################################
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+class LRUCache(object):
+    """
+    A thread-safe mapping that holds at most ``maxsize`` entries,
+    discarding the least recently used entry when it is full.  If
+    ``maxsize`` is None, then the cache is unbounded.  Lookups made
+    with ``get()`` are counted as hits or misses, and reported by
+    ``info()``.
+
+        >>> from nltk.util import LRUCache
+        >>> cache = LRUCache(2)
+        >>> cache['a'] = 1
+        >>> cache['b'] = 2
+        >>> cache.get('a')
+        1
+        >>> cache['c'] = 3
+        >>> 'b' in cache, 'a' in cache
+        (False, True)
+        >>> cache.get('b')
+        >>> cache.info()
+        CacheInfo(hits=1, misses=1, maxsize=2, currsize=2)
+
+    Caches can be pickled (e.g. to send them to worker processes);
+    their contents and counters are preserved.
+    """
+    def __init__(self, maxsize=None):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('maxsize must be None or non-negative')
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return the value stored for ``key`` (marking it as recently
+        used), or ``default`` if there is no such entry.
+        """
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = self._data.pop(key)
+            self._data[key] = value
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            if self.maxsize is not None:
+                if self.maxsize == 0:
+                    return
+                while len(self._data) >= self.maxsize:
+                    self._data.popitem(last=False)
+            self._data[key] = value
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(list(self._data))
+
+    def clear(self):
+        """Remove all entries, and reset the hit and miss counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def update(self, other):
+        for key, value in other.items():
+            self[key] = value
+
+    def items(self):
+        with self._lock:
+            return list(self._data.items())
+
+    def info(self):
+        """
+        Return a ``CacheInfo`` tuple with the number of hits and
+        misses, and the maximum and current size of the cache.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __getstate__(self):
+        return (self.maxsize, self.hits, self.misses, self.items())
+
+    def __setstate__(self, state):
+        self.maxsize, self.hits, self.misses, items = state
+        self._data = collections.OrderedDict(items)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<LRUCache with %d/%s entries>' % (len(self._data), self.maxsize)
+
 ######################################################################
 # Lazy Sequences
 ######################################################################
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+#
+# Natural Language Toolkit: BNC Corpus Reader Benchmark
+#
+# Copyright (C) 2001-2015 NLTK Project
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+r"""
+This command-line tool times the ways that ``BNCCorpusReader`` can read
+a corpus: with the streaming (expat) corpus views that it uses by
+default, with ``XMLCorpusView``'s regular expression tag scanner, and
+by parsing whole files (``lazy=False``).  It checks that all of them
+read the same words and sentences.
+
+Usage::
+
+    python tools/bnc_benchmark.py [BNC_ROOT [FILEIDS]]
+
+``BNC_ROOT`` is a directory such as ``BNC/Texts/``, and ``FILEIDS`` a
+regular expression for the files to read, by default
+``[A-K]/\w*/\w*\.xml``.  Without arguments, a synthetic BNC-style file
+is generated in a temporary directory and read instead.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from nltk.corpus.reader import bnc
+from nltk.corpus.reader.bnc import BNCCorpusReader, BNCWordView
+
+WORDS = ['the', 'cat', 'sat', 'on', 'mat', 'dog', '&amp;', 'caf\xe9']
+
+class ScannerWordView(BNCWordView):
+    """A ``BNCWordView`` that always uses the tag scanner."""
+    _EXPAT_ENCODINGS = {}
+
+def write_bnc_file(filename, num_sents, seed=0):
+    """
+    Write a BNC-style file with ``num_sents`` sentences of random words.
+    """
+    rng = random.Random(seed)
+    lines = ['<?xml version="1.0" encoding="utf-8"?>',
+             '<bncDoc xml:id="A00"><teiHeader><titleStmt>'
+             '<title>Synthetic text</title><author>NLTK</author>'
+             '</titleStmt></teiHeader>',
+             '<wText type="OTHERPUB"><div level="1">']
+    for n in range(num_sents):
+        words = ''.join('<w c5="NN1" hw="%s" pos="SUBST">%s </w>' % (word, word)
+                        for word in (rng.choice(WORDS)
+                                     for i in range(rng.randint(3, 25))))
+        lines.append('<p><s n="%d">%s<c c5="PUN">.</c></s></p>' % (n, words))
+    lines.append('</div></wText></bncDoc>')
+    with open(filename, 'wb') as outfile:
+        outfile.write('\n'.join(lines).encode('utf-8'))
+
+def read_all(reader):
+    return (list(reader.tagged_words(c5=True)),
+            list(reader.sents(strip_space=False)))
+
+def benchmark(root, fileids):
+    results = {}
+    for name, view, lazy in (('streaming view', BNCWordView, True),
+                             ('tag scanner view', ScannerWordView, True),
+                             ('whole files', BNCWordView, False)):
+        bnc.BNCWordView = view
+        try:
+            start = time.time()
+            results[name] = read_all(BNCCorpusReader(root, fileids, lazy))
+            print('%-18s %8.2fs' % (name, time.time() - start))
+        finally:
+            bnc.BNCWordView = BNCWordView
+    words, sents = results['streaming view']
+    print('%d words, %d sentences' % (len(words), len(sents)))
+    for name in results:
+        if results[name] != (words, sents):
+            print('%s read different words or sentences' % name)
+
+def main(args):
+    if args:
+        benchmark(args[0], args[1] if len(args) > 1 else r'[A-K]/\w*/\w*\.xml')
+        return
+    root = tempfile.mkdtemp()
+    try:
+        write_bnc_file(os.path.join(root, 'A00.xml'), 20000)
+        benchmark(root, r'A00\.xml')
+    finally:
+        shutil.rmtree(root)
+
+if __name__ == '__main__':
+    main(sys.argv[1:])